@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Benchmark the single-pass dashboard artifact scan on a synthetic tree.
+
+Builds a temporary artifacts tree (100k files by default, mostly RPA evidence
+spread over nested run/task directories) and times ``scan_artifacts`` against
+the per-category recursive globs the dashboard index used before.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(ROOT / "src"))
+
+from orxaq_autonomy.artifact_index import scan_artifacts  # noqa: E402
+
+
+def build_tree(root: Path, files: int, *, files_per_dir: int = 50) -> int:
+    """Create about *files* files; returns the exact number written."""
+    written = 0
+    for index in range(max(1, files // 500)):
+        block = root / "autonomy" / f"block-{index:04d}"
+        block.mkdir(parents=True, exist_ok=True)
+        (block / "health.json").write_text('{"ok": true}\n', encoding="utf-8")
+        (block / f"W{index}_run.json").write_text("{}\n", encoding="utf-8")
+        (block / f"W{index}_summary.md").write_text("# run\n", encoding="utf-8")
+        written += 3
+    task = 0
+    while written < files:
+        task_dir = root / "rpa_evidence" / f"run-{task // 40:04d}" / f"task-{task % 40:03d}"
+        task_dir.mkdir(parents=True, exist_ok=True)
+        for item in range(min(files_per_dir, files - written)):
+            (task_dir / f"step-{item:03d}.json").write_text("{}\n", encoding="utf-8")
+            written += 1
+        task += 1
+    return written
+
+
+def legacy_glob_index(root: Path) -> dict[str, Any]:
+    """The former collect_dashboard_index globbing strategy, kept for comparison."""
+    out = {
+        "health_json": [p for p in root.glob("**/health.json")],
+        "health_md": [p for p in root.glob("**/health.md")],
+        "run_reports": [p for p in root.glob("**/W*_run.json")],
+        "run_summaries": [p for p in root.glob("**/W*_summary.md")],
+        "pr_review_snapshots": [p for p in root.glob("**/pr_review_snapshot.json")],
+        "evidence_dirs": [p for p in root.glob("rpa_evidence/*/*") if p.is_dir()],
+        "evidence_files": [p for p in root.glob("rpa_evidence/**/*") if p.is_file()][:200],
+    }
+    candidates = list(root.glob("**/health.json"))
+    if candidates:
+        newest = max(candidates, key=lambda p: p.stat().st_mtime)
+        out["newest_health_mtime"] = newest.stat().st_mtime
+    return out
+
+
+def _time(fn: Callable[[], Any], repeat: int) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000.0)
+    return samples
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--skip-legacy", action="store_true", help="Only time scan_artifacts.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="orxaq-artifact-bench-") as td:
+        root = Path(td)
+        written = build_tree(root, args.files)
+        scan_ms = _time(lambda: scan_artifacts(root), args.repeat)
+        report: dict[str, Any] = {
+            "files": written,
+            "repeat": args.repeat,
+            "scan_artifacts_ms": {"median": round(statistics.median(scan_ms), 1), "min": round(min(scan_ms), 1)},
+        }
+        if not args.skip_legacy:
+            legacy_ms = _time(lambda: legacy_glob_index(root), args.repeat)
+            report["legacy_glob_ms"] = {"median": round(statistics.median(legacy_ms), 1), "min": round(min(legacy_ms), 1)}
+            report["speedup"] = round(statistics.median(legacy_ms) / max(statistics.median(scan_ms), 0.001), 2)
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Load-test the threaded and asyncio dashboard engines side by side.
+
+Serves the same synthetic artifacts tree with each engine, optionally parks
+idle ``/api/stream`` viewers on it (the wall-screen case), then runs
+concurrent clients against ``/api/index``, ``/`` and a small artifact and
+reports requests/sec and latency percentiles.  Clients reuse their
+connection whenever the server keeps it open.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from http import client as http_client
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(ROOT / "src"))
+
+from orxaq_autonomy.artifact_index import ArtifactIndexer  # noqa: E402
+from orxaq_autonomy.dashboard import make_dashboard_handler  # noqa: E402
+from orxaq_autonomy.dashboard_async import AsyncDashboardServer  # noqa: E402
+from orxaq_autonomy.dashboard_stream import DashboardEventHub  # noqa: E402
+
+PATHS = ("/api/index", "/", "/file/autonomy/health.json")
+
+
+def build_tree(root: Path, runs: int) -> None:
+    (root / "autonomy").mkdir(parents=True, exist_ok=True)
+    (root / "autonomy" / "health.json").write_text('{"ok": true}\n', encoding="utf-8")
+    for index in range(runs):
+        (root / "autonomy" / f"W{index}_run.json").write_text("{}\n", encoding="utf-8")
+        task = root / "rpa_evidence" / f"run-{index:03d}" / "task-1"
+        task.mkdir(parents=True, exist_ok=True)
+        (task / "step.json").write_text("{}\n", encoding="utf-8")
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))]
+
+
+def _client(port: int, requests: int, latencies: list[float], errors: list[str]) -> None:
+    conn = http_client.HTTPConnection("127.0.0.1", port, timeout=30)
+    try:
+        for index in range(requests):
+            started = time.perf_counter()
+            try:
+                conn.request("GET", PATHS[index % len(PATHS)])
+                resp = conn.getresponse()
+                resp.read()
+                if resp.status != 200:
+                    errors.append(f"HTTP {resp.status}")
+                if resp.will_close:
+                    conn.close()
+            except (OSError, http_client.HTTPException) as exc:
+                errors.append(type(exc).__name__)
+                conn.close()
+            latencies.append((time.perf_counter() - started) * 1000.0)
+    finally:
+        conn.close()
+
+
+def _park_viewers(port: int, count: int) -> list[socket.socket]:
+    viewers = []
+    for _ in range(count):
+        sock = socket.create_connection(("127.0.0.1", port), timeout=30)
+        sock.sendall(b"GET /api/stream HTTP/1.1\r\nHost: bench\r\n\r\n")
+        viewers.append(sock)
+    return viewers
+
+
+def run_engine(engine: str, root: Path, args: argparse.Namespace) -> dict[str, Any]:
+    indexer = ArtifactIndexer(root)
+    indexer.start()
+    hub = DashboardEventHub(indexer)
+    handler = make_dashboard_handler(root, indexer=indexer, event_hub=hub)
+    server: Any
+    if engine == "async":
+        server = AsyncDashboardServer(
+            ("127.0.0.1", 0),
+            handler,
+            event_hub=hub,
+            max_connections=args.clients + args.viewers + 16,
+            workers=args.workers,
+        )
+    else:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    viewers = _park_viewers(server.server_port, args.viewers)
+    latencies: list[float] = []
+    errors: list[str] = []
+    try:
+        started = time.perf_counter()
+        clients = [
+            threading.Thread(target=_client, args=(server.server_port, args.requests, latencies, errors))
+            for _ in range(args.clients)
+        ]
+        for client in clients:
+            client.start()
+        for client in clients:
+            client.join()
+        elapsed = time.perf_counter() - started
+        active_threads = threading.active_count()
+    finally:
+        for sock in viewers:
+            sock.close()
+        hub.close()
+        server.shutdown()
+        server.server_close()
+        thread.join(timeout=5)
+        indexer.close()
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "requests_per_sec": round(len(latencies) / max(elapsed, 1e-9), 1),
+        "latency_ms": {
+            "p50": round(statistics.median(latencies), 2),
+            "p99": round(_percentile(latencies, 99), 2),
+            "max": round(max(latencies), 2),
+        },
+        "threads_during_run": active_threads,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=200, help="Requests per client.")
+    parser.add_argument("--viewers", type=int, default=100, help="Idle /api/stream connections held open.")
+    parser.add_argument("--runs", type=int, default=200, help="Synthetic run reports in the artifacts tree.")
+    parser.add_argument("--workers", type=int, default=8, help="Async engine worker threads.")
+    parser.add_argument("--engine", choices=["threaded", "async", "both"], default="both")
+    args = parser.parse_args()
+
+    engines = ["threaded", "async"] if args.engine == "both" else [args.engine]
+    report: dict[str, Any] = {"clients": args.clients, "requests_per_client": args.requests, "viewers": args.viewers}
+    with tempfile.TemporaryDirectory(prefix="orxaq-dashboard-bench-") as td:
+        root = Path(td)
+        build_tree(root, args.runs)
+        for engine in engines:
+            report[engine] = run_engine(engine, root, args)
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,435 @@
+"""Single-pass artifact tree scan and in-memory index for the dashboard.
+
+The dashboard used to run one recursive glob per artifact category plus extra
+globs for RPA evidence and health staleness.  ``scan_artifacts`` walks the
+tree once with ``os.scandir`` and classifies every file on the way:
+
+- ``scan_artifacts``: one depth-limited walk that returns every dashboard
+  category, the newest ``health.json`` mtime and walk statistics.
+- ``ArtifactIndexer``: keeps that result in memory and refreshes it from a
+  background thread.  Refreshes are incremental -- a directory is only
+  re-listed when its mtime changed -- and are triggered by inotify on Linux
+  or by a periodic timer elsewhere.  Every change bumps ``generation``.
+- ``DEFAULT_IGNORE``: directory/file name patterns that are never descended
+  into or listed (VCS metadata, caches, temp files).
+
+Entries are visited in sorted order, so capped lists such as
+``evidence_files`` are deterministic.  Directory symlinks are not followed.
+
+Zero external dependencies -- uses only Python stdlib.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import fnmatch
+import os
+import select
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+
+DEFAULT_MAX_DEPTH = 16
+DEFAULT_EVIDENCE_FILE_LIMIT = 200
+DEFAULT_IGNORE: tuple[str, ...] = (".git", "__pycache__", "node_modules", ".venv", ".search", "*.tmp")
+DEFAULT_REFRESH_SEC = 2.0
+EVIDENCE_DIR = "rpa_evidence"
+MAX_SCAN_ERRORS = 20
+# Quiet period after the first inotify event, so a burst of writes costs one rescan.
+_EVENT_SETTLE_SEC = 0.25
+# A directory modified this recently may change again within the same mtime
+# tick, so its cached listing is not trusted on the next refresh.
+_RACY_MTIME_NS = 2_000_000_000
+
+# Exact file names mapped to their index category.
+_NAMED_CATEGORIES = {
+    "health.json": "health_json",
+    "health.md": "health_md",
+    "pr_review_snapshot.json": "pr_review_snapshots",
+}
+CATEGORIES = (
+    "health_json",
+    "health_md",
+    "run_reports",
+    "run_summaries",
+    "pr_review_snapshots",
+    "evidence_dirs",
+    "evidence_files",
+)
+
+
+def _ignore_matcher(patterns: Iterable[str]) -> Callable[[str], bool]:
+    exact = {pattern for pattern in patterns if not any(ch in pattern for ch in "*?[")}
+    wildcards = [pattern for pattern in patterns if pattern not in exact]
+
+    def _ignored(name: str) -> bool:
+        return name in exact or any(fnmatch.fnmatchcase(name, pattern) for pattern in wildcards)
+
+    return _ignored
+
+
+def _category_for(name: str) -> str:
+    category = _NAMED_CATEGORIES.get(name)
+    if category:
+        return category
+    if name.startswith("W"):
+        # Same matches as the former ``W*_run.json`` / ``W*_summary.md`` globs.
+        if name.endswith("_run.json") and len(name) >= len("W_run.json"):
+            return "run_reports"
+        if name.endswith("_summary.md") and len(name) >= len("W_summary.md"):
+            return "run_summaries"
+    return ""
+
+
+@dataclass
+class _DirListing:
+    """Classified contents of one directory, reusable while its mtime is unchanged."""
+
+    mtime_ns: int
+    trusted: bool
+    classified: list[tuple[str, str]] = field(default_factory=list)
+    evidence_files: list[str] = field(default_factory=list)
+    evidence_dirs: list[str] = field(default_factory=list)
+    subdirs: list[tuple[str, str]] = field(default_factory=list)
+    files: int = 0
+    dirs: int = 0
+    skipped_dirs: int = 0
+
+
+def _list_directory(
+    directory: str,
+    prefix: str,
+    depth: int,
+    *,
+    max_depth: int,
+    ignored: Callable[[str], bool],
+    evidence_file_limit: int,
+) -> _DirListing:
+    # Stat before listing: an entry added mid-scan then changes the mtime again.
+    mtime_ns = os.stat(directory).st_mtime_ns
+    with os.scandir(directory) as iterator:
+        entries = sorted(iterator, key=lambda entry: entry.name)
+    listing = _DirListing(mtime_ns=mtime_ns, trusted=time.time_ns() - mtime_ns > _RACY_MTIME_NS)
+    in_evidence = prefix.startswith(f"{EVIDENCE_DIR}/")
+    for entry in entries:
+        name = entry.name
+        if ignored(name):
+            continue
+        rel = prefix + name
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                listing.dirs += 1
+                if depth == 3 and in_evidence:
+                    listing.evidence_dirs.append(rel)
+                if depth >= max_depth:
+                    listing.skipped_dirs += 1
+                else:
+                    listing.subdirs.append((entry.path, rel + "/"))
+                continue
+            if not entry.is_file():
+                continue
+        except OSError:
+            continue
+        listing.files += 1
+        if in_evidence and len(listing.evidence_files) < evidence_file_limit:
+            listing.evidence_files.append(rel)
+        category = _category_for(name)
+        if category:
+            listing.classified.append((category, rel))
+    return listing
+
+
+def _walk(
+    root: Path,
+    *,
+    max_depth: int,
+    ignore: Iterable[str],
+    evidence_file_limit: int,
+    cache: dict[str, _DirListing] | None = None,
+) -> dict[str, Any]:
+    """Walk *root*; with *cache*, unchanged directories are reused instead of re-listed.
+
+    *cache* is replaced in place by the listings seen in this walk, so deleted
+    directories drop out of it.
+    """
+    started = time.perf_counter()
+    ignored = _ignore_matcher(tuple(ignore))
+    found: dict[str, list[str]] = {category: [] for category in CATEGORIES}
+    errors: list[str] = []
+    files_seen = dirs_seen = skipped_dirs = relisted = 0
+    seen: dict[str, _DirListing] = {}
+
+    # (absolute path, relative prefix, depth of entries inside it)
+    stack: list[tuple[str, str, int]] = [(str(root), "", 1)]
+    while stack:
+        directory, prefix, depth = stack.pop()
+        listing = cache.get(directory) if cache is not None else None
+        if listing is not None:
+            try:
+                unchanged = listing.trusted and os.stat(directory).st_mtime_ns == listing.mtime_ns
+            except OSError:
+                unchanged = False
+            listing = listing if unchanged else None
+        if listing is None:
+            try:
+                listing = _list_directory(
+                    directory,
+                    prefix,
+                    depth,
+                    max_depth=max_depth,
+                    ignored=ignored,
+                    evidence_file_limit=evidence_file_limit,
+                )
+            except OSError as exc:
+                if len(errors) < MAX_SCAN_ERRORS:
+                    errors.append(f"scan {prefix or '.'}: {exc.strerror or exc}")
+                continue
+            relisted += 1
+        seen[directory] = listing
+        files_seen += listing.files
+        dirs_seen += listing.dirs
+        skipped_dirs += listing.skipped_dirs
+        for category, rel in listing.classified:
+            found[category].append(rel)
+        found["evidence_dirs"].extend(listing.evidence_dirs)
+        room = evidence_file_limit - len(found["evidence_files"])
+        if room > 0:
+            found["evidence_files"].extend(listing.evidence_files[:room])
+        # Reverse so the stack pops subdirectories in sorted order.
+        stack.extend((path, rel, depth + 1) for path, rel in reversed(listing.subdirs))
+
+    if cache is not None:
+        cache.clear()
+        cache.update(seen)
+
+    # health.json may be rewritten in place without touching its directory's
+    # mtime, so the (few) candidates are always stat'ed.
+    newest_health_mtime: float | None = None
+    for rel in found["health_json"]:
+        try:
+            mtime = os.stat(os.path.join(root, rel)).st_mtime
+        except OSError:
+            continue
+        if newest_health_mtime is None or mtime > newest_health_mtime:
+            newest_health_mtime = mtime
+
+    return {
+        **{category: sorted(paths) for category, paths in found.items()},
+        "newest_health_mtime": newest_health_mtime,
+        "errors": errors,
+        "stats": {
+            "files": files_seen,
+            "dirs": dirs_seen,
+            "skipped_dirs": skipped_dirs,
+            "relisted_dirs": relisted,
+            "max_depth": max_depth,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000.0, 3),
+        },
+    }
+
+
+def scan_artifacts(
+    root: Path,
+    *,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+    ignore: Iterable[str] = DEFAULT_IGNORE,
+    evidence_file_limit: int = DEFAULT_EVIDENCE_FILE_LIMIT,
+) -> dict[str, Any]:
+    """Walk *root* once and classify artifacts into the dashboard categories.
+
+    Files directly in *root* are depth 1; directories deeper than
+    *max_depth* are counted in ``stats["skipped_dirs"]`` but not entered.
+    """
+    return _walk(root, max_depth=max_depth, ignore=ignore, evidence_file_limit=evidence_file_limit)
+
+
+class _Inotify:
+    """Minimal ctypes inotify binding used only as a change wake-up signal."""
+
+    # IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF.
+    # IN_MODIFY is left out so long-lived appenders such as runner.log do not
+    # wake the indexer on every write.
+    MASK = 0x8 | 0x40 | 0x80 | 0x100 | 0x200 | 0x400 | 0x800
+
+    def __init__(self) -> None:
+        libc = ctypes.CDLL(None, use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._watched: set[str] = set()
+
+    def watch(self, directories: Iterable[str]) -> None:
+        for directory in directories:
+            if directory in self._watched:
+                continue
+            if self._add_watch(self.fd, os.fsencode(directory), self.MASK) >= 0:
+                self._watched.add(directory)
+
+    def forget(self, directories: set[str]) -> None:
+        # The kernel drops watches of deleted directories by itself.
+        self._watched &= directories
+
+    def drain(self) -> None:
+        while True:
+            try:
+                if not os.read(self.fd, 65536):
+                    return
+            except (BlockingIOError, InterruptedError):
+                return
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def _open_inotify() -> _Inotify | None:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        return _Inotify()
+    except (OSError, AttributeError):
+        return None
+
+
+class ArtifactIndexer:
+    """In-memory artifact index kept current by a background thread.
+
+    ``snapshot()`` never touches the filesystem; it returns the last scan plus
+    ``generation``, which increases whenever the classified contents (or the
+    newest ``health.json`` mtime) change.  ``wait_for_change`` blocks until
+    the generation moves past a given value.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        refresh_sec: float = DEFAULT_REFRESH_SEC,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        ignore: Iterable[str] = DEFAULT_IGNORE,
+        evidence_file_limit: int = DEFAULT_EVIDENCE_FILE_LIMIT,
+        use_inotify: bool = True,
+    ) -> None:
+        self.root = root
+        self.refresh_sec = max(0.05, float(refresh_sec))
+        self.max_depth = max_depth
+        self.ignore = tuple(ignore)
+        self.evidence_file_limit = evidence_file_limit
+        self.use_inotify = use_inotify
+        self.generation = 0
+        self.watch_mode = "none"
+        self._cache: dict[str, _DirListing] = {}
+        self._scan: dict[str, Any] | None = None
+        self._condition = threading.Condition()
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._inotify: _Inotify | None = None
+        self._wake: tuple[int, int] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def refresh(self) -> bool:
+        """Incrementally rescan; returns ``True`` (and bumps ``generation``) if anything changed."""
+        with self._refresh_lock:
+            scan = _walk(
+                self.root,
+                max_depth=self.max_depth,
+                ignore=self.ignore,
+                evidence_file_limit=self.evidence_file_limit,
+                cache=self._cache,
+            )
+            if self._inotify is not None:
+                directories = set(self._cache)
+                self._inotify.forget(directories)
+                self._inotify.watch(directories)
+            previous = self._scan
+            changed = previous is None or any(
+                scan[key] != previous[key] for key in (*CATEGORIES, "newest_health_mtime", "errors")
+            )
+            with self._condition:
+                if changed:
+                    self.generation += 1
+                    scan["generation"] = self.generation
+                    self._scan = scan
+                    self._condition.notify_all()
+                else:
+                    # Keep the last change's payload; only walk stats moved.
+                    previous["stats"] = scan["stats"]
+            return changed
+
+    def snapshot(self) -> dict[str, Any]:
+        """Latest index (built synchronously on first use when the thread has not run yet)."""
+        with self._condition:
+            scan = self._scan
+        if scan is None:
+            self.refresh()
+            with self._condition:
+                scan = self._scan
+        assert scan is not None
+        return scan
+
+    def wait_for_change(self, generation: int, timeout: float | None = None) -> int:
+        """Block until ``generation`` exceeds *generation* or *timeout* passes; returns the current value."""
+        with self._condition:
+            self._condition.wait_for(lambda: self.generation > generation or self._stop.is_set(), timeout)
+            return self.generation
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        if self.use_inotify and self._inotify is None:
+            self._inotify = _open_inotify()
+        self.watch_mode = "inotify" if self._inotify is not None else "poll"
+        if self._inotify is not None and self._wake is None:
+            self._wake = os.pipe()
+        self.refresh()
+        self._thread = threading.Thread(target=self._loop, name="artifact-indexer", daemon=True)
+        self._thread.start()
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            if self._inotify is not None and self._wake is not None:
+                # Wake on the first event (or a slow fallback interval), then let
+                # a burst of writes settle before rescanning once.
+                try:
+                    ready, _, _ = select.select([self._inotify.fd, self._wake[0]], [], [], self.refresh_sec * 5)
+                except (OSError, ValueError):
+                    ready = []
+                if self._stop.is_set():
+                    return
+                if ready and not self._stop.wait(_EVENT_SETTLE_SEC):
+                    self._inotify.drain()
+            elif self._stop.wait(self.refresh_sec):
+                return
+            try:
+                self.refresh()
+            except Exception:  # Keep serving the last good index.
+                continue
+
+    def close(self) -> None:
+        self._stop.set()
+        with self._condition:
+            self._condition.notify_all()
+        if self._wake is not None:
+            os.write(self._wake[1], b"x")
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout=self.refresh_sec * 5 + 1)
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+        if self._wake is not None:
+            for fd in self._wake:
+                os.close(fd)
+            self._wake = None
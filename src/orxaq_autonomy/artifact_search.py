@@ -0,0 +1,328 @@
+"""Incremental full-text search over run artifacts (SQLite FTS5).
+
+Finding which task failed with a given error used to mean grepping every
+summary, task report and log.  ``ArtifactSearchIndex`` keeps an FTS5 index
+of the text artifacts under an artifacts root and brings it up to date with
+a stat-only walk:
+
+- ``.md`` (run summaries, task reports written by ``summarize_run``, health
+  and swarm health markdown), ``.txt`` and ``W*_run.json`` run reports are
+  indexed whole and re-indexed when their mtime or size changes.
+- ``.log`` files are indexed in line-aligned chunks; an appended log only
+  indexes its new tail, and each hit carries the byte ``offset`` of its
+  chunk so the dashboard viewer can open that page (``?offset=``).
+- ``search``: ranked (bm25) hits with highlighted snippets, read through
+  a separate read-only connection so it never waits for a running ``sync``
+  (WAL lets readers proceed during the write transaction).
+- ``start``: keep the index current from a background thread (the
+  dashboard uses this, so no request ever runs the walk itself).
+
+The database lives in ``SEARCH_DIRNAME`` under the root, which the walk (and
+the dashboard's artifact indexer) never descends into.
+
+Zero external dependencies -- uses only Python stdlib.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from .artifact_index import DEFAULT_IGNORE, EVIDENCE_DIR
+
+
+SEARCH_DIRNAME = ".search"
+DB_FILENAME = "artifacts.sqlite3"
+LOG_CHUNK_BYTES = 64 * 1024
+MAX_DOCUMENT_BYTES = 4 * 1024 * 1024
+DEFAULT_LIMIT = 20
+# The dashboard re-walks (stat-only) at most this often before answering a search.
+DEFAULT_SYNC_SEC = 5.0
+MAX_LIMIT = 200
+KINDS = ("summary", "report", "health", "log", "text")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    inode INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    indexed_bytes INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS chunks (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL,
+    offset INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS chunks_path ON chunks (path);
+CREATE VIRTUAL TABLE IF NOT EXISTS docs USING fts5(body, tokenize = 'porter unicode61');
+"""
+
+
+def artifact_kind(rel_path: str) -> str:
+    """Search kind for an artifact path, or ``""`` when it is not indexed."""
+    name = rel_path.rsplit("/", 1)[-1]
+    if name.endswith(".log"):
+        return "log"
+    if name.endswith(".md"):
+        if "health" in name:
+            return "health"
+        return "summary" if name.endswith("_summary.md") else "report"
+    if name.startswith("W") and name.endswith("_run.json"):
+        return "report"
+    if name.endswith(".txt"):
+        return "text"
+    return ""
+
+
+def fts_query(text: str) -> str:
+    """Turn free text into an FTS5 query: every term required, ``term*`` as a prefix."""
+    terms = []
+    for raw in text.split():
+        prefix = raw.endswith("*")
+        term = raw.rstrip("*").replace('"', '""')
+        if term:
+            terms.append(f'"{term}"' + ("*" if prefix else ""))
+    return " ".join(terms)
+
+
+class ArtifactSearchIndex:
+    """FTS5 index of the text artifacts under *root*, refreshed by ``sync``."""
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        db_path: Path | None = None,
+        ignore: tuple[str, ...] = DEFAULT_IGNORE,
+    ) -> None:
+        self.root = root.resolve()
+        self.db_path = db_path or self.root / SEARCH_DIRNAME / DB_FILENAME
+        # RPA evidence is DOM snapshots and screenshots, not searchable text.
+        self.ignore = (*ignore, SEARCH_DIRNAME, EVIDENCE_DIR)
+        # _lock guards the writer connection; searches use _reader under _read_lock.
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._read_lock = threading.Lock()
+        self._reader: sqlite3.Connection | None = None
+        self.synced_at = 0.0
+        self.sync_errors = 0
+        self._synced = threading.Event()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _connect_reader(self) -> sqlite3.Connection:
+        if self._reader is None:
+            if not self.db_path.exists():
+                with self._lock:
+                    self._connect()  # Creates the database and its schema.
+            self._reader = sqlite3.connect(
+                f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False
+            )
+        return self._reader
+
+    def close(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout=5)
+        with self._read_lock:
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # -- indexing ----------------------------------------------------------
+
+    def _walk(self) -> dict[str, tuple[str, os.stat_result]]:
+        found: dict[str, tuple[str, os.stat_result]] = {}
+        for directory, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = sorted(
+                name for name in dirnames if not any(fnmatch.fnmatchcase(name, pattern) for pattern in self.ignore)
+            )
+            prefix = os.path.relpath(directory, self.root).replace(os.sep, "/")
+            for name in filenames:
+                rel = name if prefix == "." else f"{prefix}/{name}"
+                kind = artifact_kind(rel)
+                if not kind or any(fnmatch.fnmatchcase(name, pattern) for pattern in self.ignore):
+                    continue
+                try:
+                    found[rel] = (kind, os.stat(os.path.join(directory, name)))
+                except OSError:
+                    continue
+        return found
+
+    def sync(self) -> dict[str, int]:
+        """Index new and changed files and drop deleted ones; returns counts."""
+        with self._lock:
+            conn = self._connect()
+            known = {
+                row[0]: row[1:]
+                for row in conn.execute("SELECT path, inode, mtime_ns, size, indexed_bytes FROM files")
+            }
+            found = self._walk()
+            stats = {"files": len(found), "indexed": 0, "appended": 0, "removed": 0}
+            conn.execute("BEGIN")
+            try:
+                for rel in known.keys() - found.keys():
+                    self._drop(conn, rel)
+                    stats["removed"] += 1
+                for rel, (kind, stat) in found.items():
+                    previous = known.get(rel)
+                    if previous is not None and previous[1:3] == (stat.st_mtime_ns, stat.st_size):
+                        continue
+                    appended = (
+                        kind == "log"
+                        and previous is not None
+                        and previous[0] == stat.st_ino
+                        and stat.st_size >= previous[2]
+                    )
+                    if not appended:
+                        self._drop(conn, rel)
+                    start = previous[3] if appended else 0
+                    indexed = self._index_file(conn, rel, kind, start, stat.st_size)
+                    conn.execute(
+                        "INSERT OR REPLACE INTO files (path, kind, inode, mtime_ns, size, indexed_bytes)"
+                        " VALUES (?, ?, ?, ?, ?, ?)",
+                        (rel, kind, stat.st_ino, stat.st_mtime_ns, stat.st_size, indexed),
+                    )
+                    stats["appended" if appended else "indexed"] += 1
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            self.synced_at = time.monotonic()
+            return stats
+
+    def sync_if_stale(self, max_age_sec: float = DEFAULT_SYNC_SEC) -> None:
+        if time.monotonic() - self.synced_at >= max_age_sec:
+            self.sync()
+
+    # -- background sync ---------------------------------------------------
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, interval_sec: float = DEFAULT_SYNC_SEC) -> None:
+        """Sync now and then every *interval_sec* (or on ``request_sync``) on a daemon thread."""
+        with self._thread_lock:
+            if self.running or self._stop.is_set():
+                return
+            self._thread = threading.Thread(
+                target=self._loop, args=(max(0.05, float(interval_sec)),), name="artifact-search-sync", daemon=True
+            )
+            self._thread.start()
+
+    def request_sync(self) -> None:
+        """Wake the background thread for an early sync."""
+        self._wake.set()
+
+    def wait_synced(self, timeout: float | None = None) -> bool:
+        """Block until the first sync attempt has finished; ``False`` on timeout."""
+        return self._synced.wait(timeout)
+
+    def _loop(self, interval_sec: float) -> None:
+        while not self._stop.is_set():
+            self._wake.clear()
+            try:
+                self.sync()
+            except (sqlite3.Error, OSError):
+                # A locked or unreadable database; keep serving the last good index.
+                self.sync_errors += 1
+            self._synced.set()
+            self._wake.wait(interval_sec)
+
+    @staticmethod
+    def _drop(conn: sqlite3.Connection, rel: str) -> None:
+        conn.execute("DELETE FROM docs WHERE rowid IN (SELECT id FROM chunks WHERE path = ?)", (rel,))
+        conn.execute("DELETE FROM chunks WHERE path = ?", (rel,))
+        conn.execute("DELETE FROM files WHERE path = ?", (rel,))
+
+    @staticmethod
+    def _insert(conn: sqlite3.Connection, rel: str, offset: int, body: bytes) -> None:
+        chunk_id = conn.execute("INSERT INTO chunks (path, offset) VALUES (?, ?)", (rel, offset)).lastrowid
+        conn.execute("INSERT INTO docs (rowid, body) VALUES (?, ?)", (chunk_id, body.decode("utf-8", errors="replace")))
+
+    def _index_file(self, conn: sqlite3.Connection, rel: str, kind: str, start: int, size: int) -> int:
+        """Insert documents for ``[start, size)`` of *rel*; returns the bytes now covered."""
+        try:
+            handle = open(self.root / rel, "rb")
+        except OSError:
+            return start
+        with handle:
+            if kind != "log":
+                self._insert(conn, rel, 0, handle.read(MAX_DOCUMENT_BYTES))
+                return size
+            handle.seek(start)
+            offset = start
+            while offset < size:
+                chunk = handle.read(min(LOG_CHUNK_BYTES, size - offset))
+                if not chunk:
+                    break
+                cut = chunk.rfind(b"\n") + 1
+                if cut == 0:
+                    if len(chunk) < LOG_CHUNK_BYTES:
+                        break  # A line still being written; picked up once the log grows.
+                    cut = len(chunk)
+                chunk = chunk[:cut]
+                handle.seek(offset + cut)
+                self._insert(conn, rel, offset, chunk)
+                offset += cut
+            return offset
+
+    # -- queries -----------------------------------------------------------
+
+    def search(self, query: str, *, limit: int = DEFAULT_LIMIT, kind: str = "") -> dict[str, Any]:
+        """Ranked hits for *query*, best first, with ``[`` ``]``-highlighted snippets."""
+        match = fts_query(query)
+        limit = max(1, min(MAX_LIMIT, int(limit)))
+        started = time.perf_counter()
+        hits: list[dict[str, Any]] = []
+        if match:
+            sql = (
+                "SELECT chunks.path, files.kind, chunks.offset, snippet(docs, 0, '[', ']', '...', 16), bm25(docs)"
+                " FROM docs JOIN chunks ON chunks.id = docs.rowid JOIN files ON files.path = chunks.path"
+                " WHERE docs MATCH ?"
+            )
+            params: list[Any] = [match]
+            if kind:
+                sql += " AND files.kind = ?"
+                params.append(kind)
+            sql += " ORDER BY bm25(docs) LIMIT ?"
+            params.append(limit)
+            with self._read_lock:
+                rows = self._connect_reader().execute(sql, params).fetchall()
+            hits = [
+                {"path": path, "kind": hit_kind, "offset": offset, "snippet": snippet, "score": round(-rank, 4)}
+                for path, hit_kind, offset, snippet, rank in rows
+            ]
+        return {
+            "query": query,
+            "kind": kind,
+            "hits": hits,
+            "count": len(hits),
+            "took_ms": round((time.perf_counter() - started) * 1000.0, 2),
+        }
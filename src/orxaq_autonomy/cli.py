@@ -1,25 +1,21 @@
-"""CLI entrypoint for reusable Orxaq autonomy package."""
+"""CLI entrypoint for reusable Orxaq autonomy package.
+
+Only ``manager`` is imported at module load because every subcommand builds a
+``ManagerConfig``.  Everything else (dashboard, gitops, router, providers, ...)
+is imported inside the handler that needs it, so hot keepalive commands such
+as ``status``, ``ensure`` and ``health`` do not pay for the whole package.
+``import-profile`` reports the per-module import cost of any subcommand.
+"""
 
 from __future__ import annotations
 
 import argparse
 import json
+import re
+import shlex
 import sys
 from pathlib import Path
 
-from .autopilot_cleanup import cleanup_on_startup, detect_orphans
-from .context import write_default_skill_protocol
-from .dashboard import run_dashboard_server
-from .gitops import (
-    GitOpsError,
-    detect_head_branch,
-    detect_repo,
-    merge_pr,
-    open_pr,
-    read_swarm_health_score,
-    wait_for_pr,
-)
-from .ide import generate_workspace, open_in_ide
 from .manager import (
     ManagerConfig,
     autonomy_stop,
@@ -31,20 +27,16 @@ from .manager import (
     reset_state,
     resilience_audit,
     run_foreground,
+    standby_foreground,
     start_background,
     status_snapshot,
     stop_background,
     supervise_foreground,
     tail_logs,
     uninstall_keepalive,
+    worker_config,
+    worktree_pool_report,
 )
-from .health_monitor import CollaborationHealthMonitor, dashboard_health_status
-from .profile import profile_apply
-from .providers import run_providers_check
-from .router import apply_router_profile, run_lanes_status, run_router_check
-from .rpa_scheduler import run_rpa_schedule_from_config
-from .task_queue import validate_task_queue_file
-from .watchdog_log_doctor import diagnose_watchdog_logs, doctor_report, fix_watchdog_logs
 
 
 def _config_from_args(args: argparse.Namespace) -> ManagerConfig:
@@ -59,7 +51,10 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument("--env-file", default="", help="optional path to .env.autonomy")
 
     sub = parser.add_subparsers(dest="command", required=True)
-    sub.add_parser("run")
+    run_cmd = sub.add_parser("run")
+    run_cmd.add_argument("--worker", default="", help="Run as this runner-pool worker (see ORXAQ_AUTONOMY_RUNNER_LANES).")
+    standby_cmd = sub.add_parser("standby")
+    standby_cmd.add_argument("--worker", default="", help="Stand by for this runner-pool worker.")
     sub.add_parser("supervise")
     sub.add_parser("start")
     stop_cmd = sub.add_parser("stop")
@@ -80,15 +75,43 @@ def main(argv: list[str] | None = None) -> int:
     )
     sub.add_parser("ensure")
     sub.add_parser("status")
-    sub.add_parser("health")
+    health_cmd = sub.add_parser("health")
+    health_cmd.add_argument(
+        "--skip-unchanged-write",
+        action="store_true",
+        help="Only touch health.json when the snapshot matches the file apart from its timestamp.",
+    )
     pre = sub.add_parser("preflight")
     pre.add_argument("--allow-dirty", action="store_true")
     sub.add_parser("reset")
-    sub.add_parser("logs")
+    logs_cmd = sub.add_parser("logs")
+    logs_cmd.add_argument("--lines", type=int, default=200)
+    logs_cmd.add_argument("--from-line", type=int, default=None, help="Zero-based line to start reading at.")
+    logs_cmd.add_argument("--search", default="", help="Search the active log and its rotated segments.")
+    logs_cmd.add_argument("--regex", action="store_true", help="Treat --search as a regular expression.")
+    logs_cmd.add_argument("--ignore-case", action="store_true")
+    logs_cmd.add_argument("--max-results", type=int, default=200)
+    logs_cmd.add_argument("--rotate", action="store_true", help="Rotate the active log now.")
+    import_profile = sub.add_parser("import-profile")
+    import_profile.add_argument(
+        "--command",
+        dest="profile_command",
+        default="status",
+        help="Subcommand (with arguments) to profile, e.g. 'health --skip-unchanged-write'.",
+    )
+    import_profile.add_argument("--top", type=int, default=20, help="Number of slowest modules to list.")
     sub.add_parser("install-keepalive")
     sub.add_parser("uninstall-keepalive")
     sub.add_parser("keepalive-status")
     sub.add_parser("resilience-audit")
+    worktrees = sub.add_parser("worktrees")
+    worktrees.add_argument("--action", choices=["status", "warm", "heal", "cleanup"], default="status")
+    worktrees.add_argument(
+        "--size",
+        type=int,
+        default=-1,
+        help="Pool size override (defaults to ORXAQ_AUTONOMY_WORKTREE_POOL_SIZE).",
+    )
 
     autopilot_cleanup = sub.add_parser("autopilot-cleanup")
     autopilot_cleanup.add_argument(
@@ -173,6 +196,28 @@ def main(argv: list[str] | None = None) -> int:
     dashboard.add_argument("--artifacts-dir", default="./artifacts")
     dashboard.add_argument("--host", default="127.0.0.1")
     dashboard.add_argument("--port", type=int, default=8787)
+    dashboard.add_argument(
+        "--peer",
+        action="append",
+        default=[],
+        help="Peer dashboard URL whose todos join /api/todos (repeatable)",
+    )
+    dashboard.add_argument("--peer-timeout-sec", type=float, default=2.0)
+    dashboard.add_argument(
+        "--engine",
+        choices=["threaded", "async"],
+        default="threaded",
+        help="threaded: one thread per connection; async: asyncio keep-alive server with a worker pool",
+    )
+    dashboard.add_argument("--max-connections", type=int, default=512)
+    dashboard.add_argument("--workers", type=int, default=8, help="Worker threads for the async engine")
+
+    search_cmd = sub.add_parser("search", help="Full-text search over run artifacts and logs")
+    search_cmd.add_argument("query")
+    search_cmd.add_argument("--artifacts-dir", default="./artifacts")
+    search_cmd.add_argument("--kind", choices=["summary", "report", "health", "log", "text"], default="")
+    search_cmd.add_argument("--limit", type=int, default=20)
+    search_cmd.add_argument("--json", action="store_true", help="Print the full result payload as JSON.")
 
     dashboard_status = sub.add_parser("dashboard-status")
     dashboard_status.add_argument("--output", default="", help="Optional output file path for health JSON")
@@ -244,7 +289,9 @@ def main(argv: list[str] | None = None) -> int:
     cfg = _config_from_args(args)
 
     if args.command == "run":
-        return run_foreground(cfg)
+        return run_foreground(worker_config(cfg, args.worker) if args.worker else cfg)
+    if args.command == "standby":
+        return standby_foreground(worker_config(cfg, args.worker) if args.worker else cfg)
     if args.command == "supervise":
         return supervise_foreground(cfg)
     if args.command == "start":
@@ -272,7 +319,7 @@ def main(argv: list[str] | None = None) -> int:
             print(logs)
         return 0
     if args.command == "health":
-        print(json.dumps(health_snapshot(cfg), indent=2, sort_keys=True))
+        print(json.dumps(health_snapshot(cfg, skip_unchanged_write=args.skip_unchanged_write), indent=2, sort_keys=True))
         return 0
     if args.command == "preflight":
         payload = preflight(cfg, require_clean=not args.allow_dirty)
@@ -283,8 +330,38 @@ def main(argv: list[str] | None = None) -> int:
         print(f"cleared state file: {cfg.state_file}")
         return 0
     if args.command == "logs":
-        print(tail_logs(cfg, lines=200))
+        from .log_segments import rotate_log, search_logs
+
+        if args.rotate:
+            segment = rotate_log(cfg.log_file, keep_segments=cfg.log_keep_segments)
+            print(json.dumps({"rotated": str(segment) if segment else ""}, sort_keys=True))
+            return 0
+        if args.search:
+            try:
+                matches = search_logs(
+                    cfg.log_file,
+                    args.search,
+                    regex=args.regex,
+                    ignore_case=args.ignore_case,
+                    max_results=args.max_results,
+                )
+            except re.error as exc:
+                print(json.dumps({"ok": False, "error": f"invalid regex: {exc}"}, sort_keys=True))
+                return 2
+            for match in matches:
+                print(f"{match['file']}:{match['line']}: {match['text']}")
+            return 0
+        print(tail_logs(cfg, lines=args.lines, from_line=args.from_line))
         return 0
+    if args.command == "import-profile":
+        from .import_profile import profile_cli_imports
+
+        profiled = ["--root", str(cfg.root_dir)]
+        if args.env_file:
+            profiled.extend(["--env-file", str(cfg.env_file)])
+        report = profile_cli_imports([*profiled, *shlex.split(args.profile_command)], cwd=cfg.root_dir, top=args.top)
+        print(json.dumps(report, indent=2, sort_keys=True))
+        return 0 if report.get("returncode") == 0 else 1
     if args.command == "install-keepalive":
         label = install_keepalive(cfg)
         print(f"installed keepalive: {label}")
@@ -300,8 +377,12 @@ def main(argv: list[str] | None = None) -> int:
         report = resilience_audit(cfg)
         print(json.dumps(report, indent=2, sort_keys=True))
         return 0 if report.get("ok", False) else 1
+    if args.command == "worktrees":
+        report = worktree_pool_report(cfg, action=args.action, size=args.size if args.size >= 0 else None)
+        print(json.dumps(report, indent=2, sort_keys=True))
+        return 0 if report.get("ok", False) else 1
     if args.command == "autopilot-cleanup":
-        from .autopilot_cleanup import DEFAULT_DB_PATH
+        from .autopilot_cleanup import DEFAULT_DB_PATH, cleanup_on_startup, detect_orphans
 
         db = Path(args.db_path).expanduser().resolve() if args.db_path else DEFAULT_DB_PATH
         threshold = max(60, int(args.threshold_sec))
@@ -313,6 +394,8 @@ def main(argv: list[str] | None = None) -> int:
             print(json.dumps({"cleaned": cleaned, "count": len(cleaned), "dry_run": False}, indent=2))
         return 0
     if args.command == "watchdog-doctor":
+        from .watchdog_log_doctor import doctor_report, fix_watchdog_logs
+
         if args.fix:
             actions = fix_watchdog_logs()
             print(json.dumps({"actions": actions, "count": len(actions)}, indent=2))
@@ -321,22 +404,30 @@ def main(argv: list[str] | None = None) -> int:
             print(json.dumps(report, indent=2, sort_keys=True))
         return 0
     if args.command == "init-skill-protocol":
+        from .context import write_default_skill_protocol
+
         out = (cfg.root_dir / args.output).resolve()
         write_default_skill_protocol(out)
         print(f"wrote skill protocol: {out}")
         return 0
     if args.command == "workspace":
+        from .ide import generate_workspace
+
         out = (cfg.root_dir / args.output).resolve()
         created = generate_workspace(cfg.root_dir, cfg.impl_repo, cfg.test_repo, out)
         print(f"workspace generated: {created}")
         return 0
     if args.command == "open-ide":
+        from .ide import generate_workspace, open_in_ide
+
         ws = (cfg.root_dir / args.workspace).resolve()
         if not ws.exists() and args.ide in {"vscode", "cursor"}:
             generate_workspace(cfg.root_dir, cfg.impl_repo, cfg.test_repo, ws)
         print(open_in_ide(ide=args.ide, root=cfg.root_dir, workspace_file=ws))
         return 0
     if args.command == "providers-check":
+        from .providers import run_providers_check
+
         payload = run_providers_check(
             root=str(cfg.root_dir),
             config_path=args.config,
@@ -349,6 +440,8 @@ def main(argv: list[str] | None = None) -> int:
             return 1
         return 0
     if args.command == "task-queue-validate":
+        from .task_queue import validate_task_queue_file
+
         task_file = (cfg.root_dir / args.tasks_file).resolve()
         errors = validate_task_queue_file(task_file)
         print(
@@ -360,10 +453,14 @@ def main(argv: list[str] | None = None) -> int:
         )
         return 0 if not errors else 1
     if args.command == "profile-apply":
+        from .profile import profile_apply
+
         destination = profile_apply(root=cfg.root_dir, name=args.name)
         print(f"applied profile: {args.name} -> {destination}")
         return 0
     if args.command == "router-check":
+        from .router import run_router_check
+
         report = run_router_check(
             root=str(cfg.root_dir),
             config_path=args.config,
@@ -379,6 +476,8 @@ def main(argv: list[str] | None = None) -> int:
             return 1
         return 0
     if args.command == "lanes-status":
+        from .router import run_lanes_status
+
         report = run_lanes_status(
             root=str(cfg.root_dir),
             config_path=args.config,
@@ -390,6 +489,8 @@ def main(argv: list[str] | None = None) -> int:
             return 1
         return 0
     if args.command == "router-profile-apply":
+        from .router import apply_router_profile
+
         try:
             payload = apply_router_profile(
                 root=str(cfg.root_dir),
@@ -404,6 +505,8 @@ def main(argv: list[str] | None = None) -> int:
         print(json.dumps(payload, indent=2, sort_keys=True))
         return 0
     if args.command == "rpa-schedule":
+        from .rpa_scheduler import run_rpa_schedule_from_config
+
         payload = run_rpa_schedule_from_config(
             root=str(cfg.root_dir),
             config_path=args.config,
@@ -414,18 +517,58 @@ def main(argv: list[str] | None = None) -> int:
             return 1
         return 0
     if args.command == "dashboard":
+        from .dashboard import run_dashboard_server
+        from .health_history import HISTORY_DIRNAME
+        from .health_monitor import dashboard_health_status
+
         run_dashboard_server(
             artifacts_root=Path(args.artifacts_dir).expanduser().resolve(),
             host=str(args.host),
             port=int(args.port),
+            status_provider=lambda: status_snapshot(cfg),
+            state_file=cfg.state_file,
+            health_provider=lambda: dashboard_health_status(
+                state_file=cfg.state_file,
+                heartbeat_age_sec=int(status_snapshot(cfg).get("heartbeat_age_sec", -1)),
+                output_dir=cfg.artifacts_dir,
+            ),
+            budget_file=cfg.budget_report_file,
+            health_history_dir=cfg.artifacts_dir / HISTORY_DIRNAME,
+            peers=list(args.peer),
+            peer_timeout_sec=float(args.peer_timeout_sec),
+            engine=str(args.engine),
+            max_connections=int(args.max_connections),
+            workers=int(args.workers),
         )
         return 0
+    if args.command == "search":
+        import sqlite3
+
+        from .artifact_search import ArtifactSearchIndex
+
+        index = ArtifactSearchIndex(Path(args.artifacts_dir).expanduser())
+        try:
+            index.sync()
+            payload = index.search(args.query, limit=args.limit, kind=args.kind)
+        except sqlite3.OperationalError as exc:
+            print(json.dumps({"ok": False, "error": f"search index unavailable: {exc}"}, sort_keys=True))
+            return 1
+        finally:
+            index.close()
+        if args.json:
+            print(json.dumps(payload, indent=2, sort_keys=True))
+            return 0
+        for hit in payload["hits"]:
+            location = f"{hit['path']}@{hit['offset']}" if hit["kind"] == "log" else hit["path"]
+            print(f"{location}: {' '.join(hit['snippet'].split())}")
+        return 0
     if args.command == "dashboard-status":
-        from .manager import _heartbeat_age_sec
+        from .health_monitor import dashboard_health_status
 
         payload = dashboard_health_status(
             state_file=cfg.state_file,
-            heartbeat_age_sec=_heartbeat_age_sec(cfg),
+            heartbeat_age_sec=int(status_snapshot(cfg).get("heartbeat_age_sec", -1)),
+            output_dir=cfg.artifacts_dir,
         )
         result = json.dumps(payload, indent=2, sort_keys=True)
         print(result)
@@ -435,6 +578,8 @@ def main(argv: list[str] | None = None) -> int:
             out.write_text(result + "\n", encoding="utf-8")
         return 0
     if args.command == "pr-open":
+        from .gitops import GitOpsError, detect_head_branch, detect_repo, open_pr
+
         try:
             repo = args.repo.strip() or detect_repo(cfg.root_dir)
             head = args.head.strip() or detect_head_branch(cfg.root_dir)
@@ -452,6 +597,8 @@ def main(argv: list[str] | None = None) -> int:
         print(json.dumps(payload, indent=2, sort_keys=True))
         return 0
     if args.command == "pr-wait":
+        from .gitops import GitOpsError, detect_repo, wait_for_pr
+
         try:
             repo = args.repo.strip() or detect_repo(cfg.root_dir)
             payload = wait_for_pr(
@@ -469,6 +616,8 @@ def main(argv: list[str] | None = None) -> int:
         print(json.dumps(payload, indent=2, sort_keys=True))
         return 0
     if args.command == "pr-merge":
+        from .gitops import GitOpsError, detect_repo, merge_pr, read_swarm_health_score
+
         try:
             repo = args.repo.strip() or detect_repo(cfg.root_dir)
             swarm_score = args.swarm_health_score
@@ -0,0 +1,153 @@
+"""Local Unix-domain-socket control API for live runner and supervisor status.
+
+`status`, `health` and the dashboard used to rebuild state by re-reading pid
+files, ``heartbeat.json``, ``state.json`` and the budget report.  Runners and
+the supervisor now answer those questions from memory over a socket next to
+their pid file:
+
+- ``ControlServer``: serve JSON commands from a background thread.
+- ``query_control_socket``: one request/response round trip; ``None`` when the
+  socket is missing, unsupported or does not answer, so callers fall back to
+  the files.
+
+Protocol: the client sends one JSON object per line (``{"cmd": "status"}``)
+and receives one JSON line ``{"ok": true, "data": ...}`` or
+``{"ok": false, "error": "..."}``.  The socket is created with mode ``0600``.
+
+Zero external dependencies -- uses only Python stdlib.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import socketserver
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+
+CONTROL_SOCKET_SUPPORTED = hasattr(socket, "AF_UNIX")
+# AF_UNIX paths are limited to ~104 bytes on macOS and 108 on Linux.
+MAX_SOCKET_PATH_BYTES = 100
+MAX_REQUEST_BYTES = 65536
+
+ControlHandler = Callable[[dict[str, Any]], Any]
+
+
+def socket_path_usable(path: Path) -> bool:
+    return CONTROL_SOCKET_SUPPORTED and len(os.fsencode(str(path))) <= MAX_SOCKET_PATH_BYTES
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    timeout = 2.0
+
+    def handle(self) -> None:
+        raw = self.rfile.readline(MAX_REQUEST_BYTES)
+        try:
+            request = json.loads(raw.decode("utf-8") or "{}")
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            request = None
+        if not isinstance(request, dict):
+            response: dict[str, Any] = {"ok": False, "error": "invalid_request"}
+        else:
+            cmd = str(request.get("cmd", "")).strip()
+            handler = self.server.handlers.get(cmd)  # type: ignore[attr-defined]
+            if handler is None:
+                response = {"ok": False, "error": f"unknown_command: {cmd}"}
+            else:
+                try:
+                    response = {"ok": True, "cmd": cmd, "data": handler(request)}
+                except Exception as err:  # Never let a status probe kill the server thread.
+                    response = {"ok": False, "error": str(err)}
+        try:
+            self.wfile.write(json.dumps(response, sort_keys=True, default=str).encode("utf-8") + b"\n")
+        except OSError:
+            pass
+
+
+class ControlServer:
+    """Background JSON control server bound to a Unix socket path."""
+
+    def __init__(self, path: Path, handlers: dict[str, ControlHandler]) -> None:
+        self.path = path
+        self.handlers: dict[str, ControlHandler] = {"ping": lambda _request: {"pid": os.getpid()}, **handlers}
+        self._server: socketserver.BaseServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._server is not None
+
+    def start(self) -> bool:
+        """Bind and serve; returns ``False`` (status stays file-based) when the socket cannot be used."""
+        if self._server is not None:
+            return True
+        if not socket_path_usable(self.path):
+            return False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Callers own the matching pid/lock file, so a leftover socket is stale.
+        self.path.unlink(missing_ok=True)
+        try:
+            server = socketserver.ThreadingUnixStreamServer(str(self.path), _RequestHandler)
+        except OSError:
+            return False
+        server.daemon_threads = True
+        server.handlers = self.handlers  # type: ignore[attr-defined]
+        try:
+            os.chmod(self.path, 0o600)
+        except OSError:
+            pass
+        self._server = server
+        self._thread = threading.Thread(
+            target=server.serve_forever,
+            kwargs={"poll_interval": 0.5},
+            name=f"control-{self.path.name}",
+            daemon=True,
+        )
+        self._thread.start()
+        return True
+
+    def close(self) -> None:
+        server, self._server = self._server, None
+        if server is None:
+            return
+        server.shutdown()
+        server.server_close()
+        self.path.unlink(missing_ok=True)
+
+
+def query_control_socket(
+    path: Path,
+    cmd: str = "status",
+    *,
+    timeout_sec: float = 0.5,
+    **params: Any,
+) -> Any | None:
+    """Send one command; returns the response ``data`` or ``None`` if unavailable."""
+    if not socket_path_usable(path) or not path.exists():
+        return None
+    payload = json.dumps({"cmd": cmd, **params}).encode("utf-8") + b"\n"
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(timeout_sec)
+            client.connect(str(path))
+            client.sendall(payload)
+            chunks: list[bytes] = []
+            while True:
+                chunk = client.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                if chunk.endswith(b"\n"):
+                    break
+    except OSError:
+        return None
+    try:
+        response = json.loads(b"".join(chunks).decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    if not isinstance(response, dict) or not response.get("ok"):
+        return None
+    return response.get("data")
@@ -2,17 +2,55 @@
 
 from __future__ import annotations
 
+import gzip
 import html
 import json
 import mimetypes
 import os
+import queue
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
 from datetime import datetime, timezone
+from email.utils import formatdate, parsedate_to_datetime
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 from urllib import parse as urllib_parse
 
+from .artifact_index import ArtifactIndexer, scan_artifacts
+from .artifact_search import ArtifactSearchIndex
+from .dashboard_async import DEFAULT_MAX_CONNECTIONS, DEFAULT_WORKERS, AsyncDashboardServer
+from .dashboard_metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE
+from .dashboard_metrics import DashboardMetrics
+from .dashboard_stream import STREAM_KEEPALIVE_SEC, STREAM_RETRY_MS, DashboardEventHub
+from .health_history import HISTORY_DIRNAME, HealthHistory
+from .log_segments import LogIndex
+from .todo_federation import DEFAULT_PEER_TIMEOUT_SEC, TodoFederation
+
+# Responses smaller than this are sent as-is; compressing them costs more than it saves.
+COMPRESS_MIN_BYTES = 1024
+COMPRESSIBLE_TYPES = {"text/html", "text/plain", "application/json"}
+# RPA evidence is written once per run and never rewritten in place.
+IMMUTABLE_PREFIXES = ("rpa_evidence/",)
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# The text viewer escapes and renders at most this much of a file per page.
+VIEWER_PAGE_BYTES = 256 * 1024
+# Rendered sections kept for reuse; the page itself is reused for a few seconds
+# per index generation so its timestamp and stale age do not drift far.
+SECTION_CACHE_SIZE = 128
+# In-memory line indexes kept for the log viewer's ?tail= / ?line= windows.
+LOG_INDEX_CACHE_SIZE = 32
+PAGE_CACHE_TTL_SEC = 5.0
+# /api/search never syncs itself; the first search waits this long for the index thread.
+SEARCH_FIRST_SYNC_WAIT_SEC = 5.0
+
+_section_cache: OrderedDict[tuple[Any, str], str] = OrderedDict()
+_section_cache_lock = threading.Lock()
+
 TEXT_SUFFIXES = {
     ".json",
     ".md",
@@ -73,26 +111,55 @@ def tail_log_file(path: Path, max_bytes: int = 65536) -> list[str]:
     return lines
 
 
-def _utc_now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+def read_text_window(path: Path, offset: int | None = None, max_bytes: int = VIEWER_PAGE_BYTES) -> dict[str, Any]:
+    """Read one page of whole lines starting near byte *offset*.
 
+    The seekable counterpart of :func:`tail_log_file` for the paginated
+    viewer: at most *max_bytes* are read, a partial first line is skipped when
+    *offset* lands mid-line, and a partial last line is left for the next
+    page.  ``offset=None`` returns the last page.  Returns ``lines`` plus the
+    ``start``/``end`` byte offsets of the page and the file ``size``.
+    """
+    size = path.stat().st_size
+    if offset is None:
+        offset = max(0, size - max_bytes)
+    offset = min(max(0, offset), size)
+    with open(path, "rb") as fh:
+        # Read one byte early to tell whether offset already sits on a line start.
+        fh.seek(max(0, offset - 1))
+        raw = fh.read(max_bytes + (1 if offset else 0))
+    start = offset
+    if offset:
+        # Inside a line longer than a page there is no line start to align to.
+        newline = raw.find(b"\n")
+        start = offset + newline if newline != -1 else offset
+        raw = raw[newline + 1 :] if newline != -1 else raw[1:]
+    if start + len(raw) < size:
+        last_newline = raw.rfind(b"\n")
+        # Likewise a single line longer than a page is cut rather than never shown.
+        if last_newline != -1:
+            raw = raw[: last_newline + 1]
+    return {
+        "lines": raw.decode("utf-8", errors="replace").splitlines(),
+        "start": start,
+        "end": start + len(raw),
+        "size": size,
+    }
 
-def _rel_paths(paths: list[Path], root: Path) -> list[str]:
-    out: list[str] = []
-    for path in paths:
-        try:
-            out.append(path.resolve().relative_to(root).as_posix())
-        except ValueError:
-            continue
-    return sorted(out)
 
+def _utc_now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
 
-def _safe_glob(root: Path, pattern: str) -> list[Path]:
-    """Glob with fallback to empty list on permission or filesystem errors."""
-    try:
-        return list(root.glob(pattern))
-    except (OSError, ValueError):
-        return []
+
+def _health_staleness(newest_mtime: float | None, stale_threshold_sec: int = 600) -> dict[str, Any]:
+    if newest_mtime is None:
+        return {"stale": True, "reason": "no_health_artifact", "age_sec": -1}
+    age_sec = int(datetime.now(timezone.utc).timestamp() - newest_mtime)
+    return {
+        "stale": age_sec > stale_threshold_sec,
+        "reason": "age_exceeded" if age_sec > stale_threshold_sec else "ok",
+        "age_sec": age_sec,
+    }
 
 
 def _detect_stale_health(root: Path, stale_threshold_sec: int = 600) -> dict[str, Any]:
@@ -101,72 +168,153 @@ def _detect_stale_health(root: Path, stale_threshold_sec: int = 600) -> dict[str
     If no health.json exists or it was last modified more than *stale_threshold_sec*
     ago, the ``stale`` flag is set to ``True`` with explanatory detail.
     """
-    candidates = _safe_glob(root, "**/health.json")
-    if not candidates:
-        return {"stale": True, "reason": "no_health_artifact", "age_sec": -1}
-    # Pick most recently modified
-    newest = max(candidates, key=lambda p: p.stat().st_mtime, default=None)
-    if newest is None:
-        return {"stale": True, "reason": "no_health_artifact", "age_sec": -1}
-    try:
-        age_sec = int(datetime.now(timezone.utc).timestamp() - newest.stat().st_mtime)
-    except OSError:
-        return {"stale": True, "reason": "stat_failed", "age_sec": -1}
-    return {
-        "stale": age_sec > stale_threshold_sec,
-        "reason": "age_exceeded" if age_sec > stale_threshold_sec else "ok",
-        "age_sec": age_sec,
-    }
+    return _health_staleness(scan_artifacts(root)["newest_health_mtime"], stale_threshold_sec)
 
 
 def collect_dashboard_index(artifacts_root: Path) -> dict[str, Any]:
     root = artifacts_root.resolve()
     root.mkdir(parents=True, exist_ok=True)
+    # One scandir walk classifies every category and finds the newest health.json.
+    return _index_payload(root, scan_artifacts(root))
 
-    errors: list[str] = []
-
-    health_json = _rel_paths(_safe_glob(root, "**/health.json"), root)
-    health_md = _rel_paths(_safe_glob(root, "**/health.md"), root)
-    run_reports = _rel_paths(_safe_glob(root, "**/W*_run.json"), root)
-    run_summaries = _rel_paths(_safe_glob(root, "**/W*_summary.md"), root)
-    pr_review_snapshots = _rel_paths(_safe_glob(root, "**/pr_review_snapshot.json"), root)
-
-    try:
-        evidence_dirs = _rel_paths(
-            [path for path in root.glob("rpa_evidence/*/*") if path.is_dir()], root
-        )
-    except (OSError, ValueError) as exc:
-        evidence_dirs = []
-        errors.append(f"evidence_dirs: {exc}")
-
-    try:
-        evidence_files = _rel_paths(
-            [path for path in root.glob("rpa_evidence/**/*") if path.is_file()][:200],
-            root,
-        )
-    except (OSError, ValueError) as exc:
-        evidence_files = []
-        errors.append(f"evidence_files: {exc}")
-
-    staleness = _detect_stale_health(root)
 
+def _index_payload(root: Path, scan: dict[str, Any]) -> dict[str, Any]:
+    """Dashboard index payload for a scan; timestamps and staleness are computed now."""
     payload: dict[str, Any] = {
         "generated_at_utc": _utc_now_iso(),
         "artifacts_root": str(root),
-        "health_json": health_json,
-        "health_md": health_md,
-        "run_reports": run_reports,
-        "run_summaries": run_summaries,
-        "pr_review_snapshots": pr_review_snapshots,
-        "evidence_dirs": evidence_dirs,
-        "evidence_files": evidence_files,
-        "staleness": staleness,
+        "health_json": scan["health_json"],
+        "health_md": scan["health_md"],
+        "run_reports": scan["run_reports"],
+        "run_summaries": scan["run_summaries"],
+        "pr_review_snapshots": scan["pr_review_snapshots"],
+        "evidence_dirs": scan["evidence_dirs"],
+        "evidence_files": scan["evidence_files"],
+        "staleness": _health_staleness(scan["newest_health_mtime"]),
+        "scan": scan["stats"],
     }
-    if errors:
-        payload["errors"] = errors
+    if "generation" in scan:
+        payload["generation"] = scan["generation"]
+    if scan["errors"]:
+        payload["errors"] = list(scan["errors"])
     return payload
 
 
+# Index generations restart at 1 in every process; the nonce keeps a browser's
+# tag from a previous dashboard process from matching different content.
+_ETAG_NONCE = os.urandom(4).hex()
+
+
+def _index_etag(payload: dict[str, Any]) -> str:
+    """Weak validator for index views: same generation and staleness render equivalently."""
+    staleness = payload.get("staleness", {})
+    reason = staleness.get("reason", "") if isinstance(staleness, dict) else ""
+    return f'W/"index-{_ETAG_NONCE}-{payload.get("generation", 0)}-{reason}"'
+
+
+def _file_etag(stat: os.stat_result, variant: str = "") -> str:
+    suffix = f"-{zlib.crc32(variant.encode('utf-8')):x}" if variant else ""
+    return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}{suffix}"'
+
+
+def _etag_opaque(tag: str) -> str:
+    tag = tag.strip()
+    if tag.startswith("W/"):
+        tag = tag[2:]
+    tag = tag.strip('"')
+    for encoding in ("gzip", "deflate"):
+        if tag.endswith(f"-{encoding}"):
+            return tag[: -len(encoding) - 1]
+    return tag
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison (RFC 9110 13.1.2), ignoring the content-coding suffix."""
+    if if_none_match.strip() == "*":
+        return True
+    wanted = _etag_opaque(etag)
+    return any(_etag_opaque(candidate) == wanted for candidate in if_none_match.split(","))
+
+
+def _negotiate_encoding(accept_encoding: str) -> str | None:
+    """Pick gzip or deflate from an Accept-Encoding header, honouring ``q=0``."""
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        weight = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[name] = weight
+    for encoding in ("gzip", "deflate"):
+        if weights.get(encoding, weights.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+def _compress(data: bytes, encoding: str) -> bytes:
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=6, mtime=0)
+    return zlib.compress(data, 6)
+
+
+def _parse_byte_range(header: str, size: int) -> tuple[int, int] | None:
+    """Parse a single ``bytes=`` range into inclusive offsets.
+
+    Returns ``None`` for headers to ignore (other units, multiple ranges,
+    malformed), so the whole file is served; raises ``ValueError`` when the
+    range cannot be satisfied.
+    """
+    unit, _, spec = header.strip().partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first_raw, dash, last_raw = (part.strip() for part in spec.partition("-"))
+    if not dash or not (first_raw or last_raw) or not all(part.isdigit() for part in (first_raw, last_raw) if part):
+        return None
+    if not first_raw:
+        suffix = int(last_raw)
+        if suffix == 0 or size == 0:
+            raise ValueError("unsatisfiable suffix range")
+        return max(0, size - suffix), size - 1
+    first = int(first_raw)
+    last = int(last_raw) if last_raw else size - 1
+    if last_raw and last < first:
+        return None
+    if first >= size:
+        raise ValueError("range starts past end of file")
+    return first, min(last, size - 1)
+
+
+def _render_viewer_nav(rel: str, window: dict[str, Any]) -> str:
+    base = "/file/" + urllib_parse.quote(rel)
+    start, end, size = window["start"], window["end"], window["size"]
+    links = []
+    if start > 0:
+        links.append(f"<a href='{base}?offset=0'>First</a>")
+        links.append(f"<a href='{base}?offset={max(0, start - VIEWER_PAGE_BYTES)}' rel='prev'>Previous</a>")
+    if end < size:
+        links.append(f"<a href='{base}?offset={end}' rel='next'>Next</a>")
+        links.append(f"<a href='{base}?offset={max(0, size - VIEWER_PAGE_BYTES)}'>Last</a>")
+    links.append(f"<a href='{base}?raw=1'>Raw</a>")
+    return (
+        "<nav aria-label='Pages'>"
+        f"<span>bytes {start}-{end} of {size}</span> "
+        + "".join(links)
+        + "</nav>"
+    )
+
+
+def _artifact_cache_control(rel: str) -> str:
+    return IMMUTABLE_CACHE_CONTROL if rel.startswith(IMMUTABLE_PREFIXES) else "no-cache"
+
+
 def resolve_artifact_path(artifacts_root: Path, raw_relative_path: str) -> Path | None:
     root = artifacts_root.resolve()
     candidate = (root / Path(raw_relative_path)).resolve()
@@ -518,15 +666,88 @@ def render_conversation_events_section(
     )
 
 
+# Keeps the page current from /api/stream: status lines update in place and a
+# new artifacts generation swaps in a freshly rendered <main>.
+_LIVE_STREAM_SCRIPT = """
+(function () {
+  if (!window.EventSource) { return; }
+  function show(id, text) {
+    var el = document.getElementById(id);
+    if (el) { el.textContent = text; el.className = ''; }
+  }
+  function heartbeat(d) {
+    if (!d) { return; }
+    var age = d.heartbeat_age_sec < 0 ? 'none' : d.heartbeat_age_sec + 's ago';
+    show('live-heartbeat', 'Heartbeat: ' + age + ' | runner ' + (d.runner_running ? 'up' : 'down') +
+      ' | supervisor ' + (d.supervisor_running ? 'up' : 'down') + (d.stale ? ' | STALE' : ''));
+  }
+  function health(d) {
+    if (!d || !d.grade) { return; }
+    show('live-health', 'Health: ' + d.grade + ' (' + d.score + ')');
+  }
+  var source = new EventSource('/api/stream');
+  source.addEventListener('hello', function (e) {
+    var d = JSON.parse(e.data);
+    heartbeat(d.heartbeat);
+    health(d.health);
+  });
+  source.addEventListener('heartbeat', function (e) { heartbeat(JSON.parse(e.data)); });
+  source.addEventListener('health', function (e) { health(JSON.parse(e.data)); });
+  source.addEventListener('task', function (e) {
+    var d = JSON.parse(e.data);
+    var last = d.transitions[d.transitions.length - 1];
+    var more = d.total_transitions > 1 ? ' (+' + (d.total_transitions - 1) + ' more)' : '';
+    show('live-tasks', 'Tasks: ' + last.task_id + ' ' + (last.from || 'new') + ' -> ' + (last.to || 'removed') + more);
+  });
+  source.addEventListener('artifacts', function () {
+    fetch('/', { cache: 'no-store' }).then(function (r) { return r.text(); }).then(function (body) {
+      var doc = new DOMParser().parseFromString(body, 'text/html');
+      var fresh = doc.getElementById('main-content');
+      var current = document.getElementById('main-content');
+      if (!fresh || !current) { return; }
+      var freshLive = doc.getElementById('live-status');
+      var live = document.getElementById('live-status');
+      if (freshLive && live) { freshLive.replaceWith(live); }
+      current.replaceWith(fresh);
+    });
+  });
+})();
+"""
+
+
+def _render_cached(render: Callable[..., str], *args: Any) -> str:
+    """Memoize a pure section renderer on its arguments.
+
+    The key is the renderer plus a JSON dump of its inputs, so a section is
+    only re-rendered when what it shows changed; other sections of the page
+    come from the cache.
+    """
+    key = (render, json.dumps(args, sort_keys=True, default=str))
+    with _section_cache_lock:
+        cached = _section_cache.get(key)
+        if cached is not None:
+            _section_cache.move_to_end(key)
+            return cached
+    rendered = render(*args)
+    with _section_cache_lock:
+        _section_cache[key] = rendered
+        while len(_section_cache) > SECTION_CACHE_SIZE:
+            _section_cache.popitem(last=False)
+    return rendered
+
+
 def render_dashboard_html(index_payload: dict[str, Any]) -> str:
     sections = [
-        _render_file_links("Health JSON", list(index_payload.get("health_json", []))),
-        _render_file_links("Health Markdown", list(index_payload.get("health_md", []))),
-        _render_file_links("Run Reports", list(index_payload.get("run_reports", []))),
-        _render_file_links("Run Summaries", list(index_payload.get("run_summaries", []))),
-        _render_file_links("PR Review Snapshots", list(index_payload.get("pr_review_snapshots", []))),
-        _render_file_links("Evidence Directories", list(index_payload.get("evidence_dirs", []))),
-        _render_file_links("Evidence Files", list(index_payload.get("evidence_files", []))),
+        _render_cached(_render_file_links, title, list(index_payload.get(key, [])))
+        for title, key in (
+            ("Health JSON", "health_json"),
+            ("Health Markdown", "health_md"),
+            ("Run Reports", "run_reports"),
+            ("Run Summaries", "run_summaries"),
+            ("PR Review Snapshots", "pr_review_snapshots"),
+            ("Evidence Directories", "evidence_dirs"),
+            ("Evidence Files", "evidence_files"),
+        )
     ]
     generated = html.escape(str(index_payload.get("generated_at_utc", "")))
     artifacts_root = html.escape(str(index_payload.get("artifacts_root", "")))
@@ -542,15 +763,15 @@ def render_dashboard_html(index_payload: dict[str, Any]) -> str:
     # Render todo activity widget from task_state if present
     task_state = index_payload.get("task_state", {})
     task_state_dict = task_state if isinstance(task_state, dict) else {}
-    todo_activity = render_todo_activity_widget(task_state_dict)
+    todo_activity = _render_cached(render_todo_activity_widget, task_state_dict)
 
     # Render lane status section if payload contains lane_status
     lane_status_html = ""
     if "lane_status" in index_payload:
         try:
             lane_data = index_payload["lane_status"]
-            lane_status_html = render_lane_status_section(
-                lane_data if isinstance(lane_data, list) else []
+            lane_status_html = _render_cached(
+                render_lane_status_section, lane_data if isinstance(lane_data, list) else []
             )
         except Exception:
             lane_status_html = (
@@ -564,8 +785,8 @@ def render_dashboard_html(index_payload: dict[str, Any]) -> str:
     if "conversation_events" in index_payload:
         try:
             events = index_payload["conversation_events"]
-            conversation_events_html = render_conversation_events_section(
-                events if isinstance(events, list) else []
+            conversation_events_html = _render_cached(
+                render_conversation_events_section, events if isinstance(events, list) else []
             )
         except Exception:
             conversation_events_html = (
@@ -712,6 +933,12 @@ def render_dashboard_html(index_payload: dict[str, Any]) -> str:
       <p>Artifacts root: <code>{artifacts_root}</code></p>
       <p>API index: <a href="/api/index">/api/index</a></p>
     </header>
+    <section id="live-status" aria-label="Live Status" aria-live="polite">
+      <h2>Live Status</h2>
+      <p id="live-heartbeat" class="empty">Heartbeat: waiting for stream</p>
+      <p id="live-health" class="empty">Health: waiting for stream</p>
+      <p id="live-tasks" class="empty">Tasks: no transitions yet</p>
+    </section>
     {stale_banner}
     {error_banner}
     {todo_activity}
@@ -719,45 +946,413 @@ def render_dashboard_html(index_payload: dict[str, Any]) -> str:
     {conversation_events_html}
     {''.join(sections)}
   </main>
+  <script>{_LIVE_STREAM_SCRIPT}</script>
 </body>
 </html>
 """
 
 
-def make_dashboard_handler(artifacts_root: Path) -> type[BaseHTTPRequestHandler]:
+def _metrics_route(path: str) -> str:
+    """Bounded route label for request metrics; artifact paths collapse to ``/file``."""
+    if path.startswith("/file/"):
+        return "/file"
+    if path in ("/", "/api/index", "/api/status", "/api/todos", "/api/search", "/api/health/history", "/metrics"):
+        return path
+    return "other"
+
+
+def make_dashboard_handler(
+    artifacts_root: Path,
+    status_provider: Callable[[], dict[str, Any]] | None = None,
+    indexer: ArtifactIndexer | None = None,
+    event_hub: DashboardEventHub | None = None,
+    *,
+    state_file: Path | None = None,
+    todo_federation: TodoFederation | None = None,
+    metrics: DashboardMetrics | None = None,
+    health_history: HealthHistory | None = None,
+    search_index: ArtifactSearchIndex | None = None,
+) -> type[BaseHTTPRequestHandler]:
+    """Build the request handler class.
+
+    Index routes are served from *indexer* (an ``ArtifactIndexer`` over the
+    artifacts root).  Without one, the handler creates its own and starts its
+    background refresh on the first index request.  ``/api/stream`` viewers
+    all share *event_hub*, which defaults to a hub over the same indexer and
+    status provider.  ``/api/todos`` merges the local *state_file* with the
+    peers of *todo_federation*.  ``/metrics`` is rendered by *metrics*, which
+    defaults to one over the hub and the budget report and routing log under
+    ``autonomy/``.  ``/api/health/history`` reads *health_history*, by default
+    the series under ``autonomy/health_history``.  ``/api/search`` queries
+    *search_index*, created over the artifacts root on first use and kept
+    current by its background sync thread.
+    """
     root = artifacts_root.resolve()
+    index_source = indexer if indexer is not None else ArtifactIndexer(root)
+    hub = event_hub if event_hub is not None else DashboardEventHub(index_source, status_provider=status_provider)
+    metrics = metrics if metrics is not None else DashboardMetrics(
+        hub,
+        budget_file=root / "autonomy" / "budget.json",
+        routing_log=root / "autonomy" / "swarm_routing_decisions.ndjson",
+    )
+    search: dict[str, ArtifactSearchIndex] = {"index": search_index} if search_index is not None else {}
+    search_lock = threading.Lock()
+    # Last rendered page, shared by every request this handler class serves.
+    page_cache: dict[str, Any] = {}
+    page_lock = threading.Lock()
+    # The viewer is read-only: its log indexes never write sidecars into the tree.
+    # log_index_lock guards only the cache; each index is scanned under its own lock.
+    log_indexes: OrderedDict[Path, tuple[LogIndex, threading.Lock]] = OrderedDict()
+    log_index_lock = threading.Lock()
 
     class DashboardHandler(BaseHTTPRequestHandler):
         _artifacts_root = root
+        _status_provider = staticmethod(status_provider) if status_provider is not None else None
+        _indexer = index_source
+        _event_hub = hub
+        _state_file = state_file
+        _todo_federation = todo_federation
+        _metrics = metrics
+        _health_history = health_history if health_history is not None else HealthHistory(
+            root / "autonomy" / HISTORY_DIRNAME
+        )
+
+        def _local_task_state(self) -> dict[str, Any]:
+            if self._state_file is not None:
+                try:
+                    raw = json.loads(self._state_file.read_text(encoding="utf-8"))
+                except (OSError, json.JSONDecodeError):
+                    raw = {}
+                return raw if isinstance(raw, dict) else {}
+            task_state = self._index().get("task_state", {})
+            return task_state if isinstance(task_state, dict) else {}
+
+        def _index(self) -> dict[str, Any]:
+            if not self._indexer.running:
+                self._indexer.start()
+            return _index_payload(self._artifacts_root, self._indexer.snapshot())
+
+        def _rendered_page(self, payload: dict[str, Any], etag: str) -> dict[str | None, bytes]:
+            """HTML bodies for this index generation, keyed by content coding.
+
+            Reused for ``PAGE_CACHE_TTL_SEC`` so concurrent viewers share one
+            render (and one compression per coding); after that the page is
+            rebuilt to refresh its generated time and stale age.
+            """
+            now = time.monotonic()
+            with page_lock:
+                if page_cache.get("etag") == etag and now - page_cache["rendered_at"] < PAGE_CACHE_TTL_SEC:
+                    return page_cache["bodies"]
+            bodies: dict[str | None, bytes] = {None: render_dashboard_html(payload).encode("utf-8")}
+            with page_lock:
+                page_cache.update(etag=etag, rendered_at=now, bodies=bodies)
+            return bodies
+
+        def _log_window(self, target: Path, qs: dict[str, list[str]]) -> list[str]:
+            with log_index_lock:
+                entry = log_indexes.pop(target, None) or (LogIndex(target, persist=False), threading.Lock())
+                log_indexes[target] = entry
+                while len(log_indexes) > LOG_INDEX_CACHE_SIZE:
+                    log_indexes.popitem(last=False)
+            index, lock = entry
+            with lock:
+                if "tail" in qs:
+                    return index.tail(max(0, int(qs["tail"][0])))
+                count = int(qs.get("count", ["200"])[0])
+                return index.read_lines(max(0, int(qs["line"][0])), max(0, count))
+
+        def _search_index(self) -> ArtifactSearchIndex:
+            with search_lock:
+                if "index" not in search:
+                    search["index"] = ArtifactSearchIndex(self._artifacts_root)
+            return search["index"]
 
         def log_message(self, format: str, *args: Any) -> None:  # noqa: A003
             return
 
-        def _send_bytes(self, status: int, data: bytes, content_type: str) -> None:
+        def _send_validators(self, etag: str | None, last_modified: float | None, cache_control: str | None) -> None:
+            if etag:
+                self.send_header("ETag", etag)
+            if last_modified is not None:
+                self.send_header("Last-Modified", formatdate(last_modified, usegmt=True))
+            if cache_control:
+                self.send_header("Cache-Control", cache_control)
+
+        def _send_not_modified(
+            self,
+            *,
+            etag: str | None = None,
+            last_modified: float | None = None,
+            cache_control: str | None = None,
+        ) -> bool:
+            """Answer 304 when the client's validators still match; returns whether it did."""
+            if_none_match = self.headers.get("If-None-Match")
+            if if_none_match is not None:
+                fresh = etag is not None and _etag_matches(if_none_match, etag)
+            else:
+                fresh = False
+                if_modified_since = self.headers.get("If-Modified-Since")
+                if if_modified_since and last_modified is not None:
+                    try:
+                        fresh = int(last_modified) <= parsedate_to_datetime(if_modified_since).timestamp()
+                    except (TypeError, ValueError):
+                        fresh = False
+            if not fresh:
+                return False
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self._send_validators(etag, last_modified, cache_control)
+            self.end_headers()
+            return True
+
+        def _send_bytes(
+            self,
+            status: int,
+            data: bytes,
+            content_type: str,
+            *,
+            etag: str | None = None,
+            last_modified: float | None = None,
+            cache_control: str | None = None,
+            variants: dict[str | None, bytes] | None = None,
+        ) -> None:
+            """Send *data*, compressed when the client accepts it.
+
+            *variants* memoizes encoded bodies by coding across requests.
+            """
+            compressible = content_type.split(";", 1)[0].strip() in COMPRESSIBLE_TYPES
+            encoding = None
+            if compressible and len(data) >= COMPRESS_MIN_BYTES:
+                encoding = _negotiate_encoding(self.headers.get("Accept-Encoding", ""))
+            if encoding is not None:
+                encoded = variants.get(encoding) if variants is not None else None
+                if encoded is None:
+                    encoded = _compress(data, encoding)
+                    if variants is not None:
+                        variants[encoding] = encoded
+                data = encoded
+                if etag and not etag.startswith("W/"):
+                    # A strong validator names exact bytes, so each coding gets its own.
+                    etag = f'{etag[:-1]}-{encoding}"'
             self.send_response(status)
             self.send_header("Content-Type", content_type)
             self.send_header("Content-Length", str(len(data)))
+            if compressible:
+                self.send_header("Vary", "Accept-Encoding")
+            if encoding is not None:
+                self.send_header("Content-Encoding", encoding)
+            self._send_validators(etag, last_modified, cache_control)
             self.end_headers()
             self.wfile.write(data)
 
-        def _send_text(self, status: int, text: str, content_type: str = "text/plain; charset=utf-8") -> None:
-            self._send_bytes(status, text.encode("utf-8"), content_type)
+        def _send_file(self, target: Path, size: int, content_type: str, validators: dict[str, Any]) -> None:
+            """Stream *target* (or one requested byte range of it) without buffering it in memory."""
+            first, last = 0, size - 1
+            status = HTTPStatus.OK
+            range_header = self.headers.get("Range")
+            if range_header and self._if_range_matches(validators):
+                try:
+                    requested = _parse_byte_range(range_header, size)
+                except ValueError:
+                    self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                    self.send_header("Content-Range", f"bytes */{size}")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                if requested is not None:
+                    first, last = requested
+                    status = HTTPStatus.PARTIAL_CONTENT
+            length = max(0, last - first + 1)
+            with target.open("rb") as handle:
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(length))
+                self.send_header("Accept-Ranges", "bytes")
+                if status == HTTPStatus.PARTIAL_CONTENT:
+                    self.send_header("Content-Range", f"bytes {first}-{last}/{size}")
+                self._send_validators(validators.get("etag"), validators.get("last_modified"), validators.get("cache_control"))
+                self.end_headers()
+                if not length:
+                    return
+                self.wfile.flush()
+                try:
+                    # socket.sendfile uses os.sendfile where available and falls back to send().
+                    self.connection.sendfile(handle, first, length)
+                except (BrokenPipeError, ConnectionResetError):
+                    self.close_connection = True
+
+        def _if_range_matches(self, validators: dict[str, Any]) -> bool:
+            """A Range only applies while If-Range (when sent) still names the current file."""
+            if_range = self.headers.get("If-Range")
+            if not if_range:
+                return True
+            if_range = if_range.strip()
+            if if_range.startswith(("W/", '"')):
+                # If-Range requires strong comparison.
+                return not if_range.startswith("W/") and if_range == validators.get("etag")
+            try:
+                return int(validators["last_modified"]) == int(parsedate_to_datetime(if_range).timestamp())
+            except (KeyError, TypeError, ValueError):
+                return False
+
+        def _send_text(
+            self,
+            status: int,
+            text: str,
+            content_type: str = "text/plain; charset=utf-8",
+            **validators: Any,
+        ) -> None:
+            self._send_bytes(status, text.encode("utf-8"), content_type, **validators)
+
+        def _stream_events(self) -> None:
+            try:
+                last_event_id: int | None = int(self.headers.get("Last-Event-ID", ""))
+            except ValueError:
+                last_event_id = None
+            subscription = self._event_hub.subscribe(last_event_id)
+            try:
+                self.send_response(HTTPStatus.OK)
+                self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("X-Accel-Buffering", "no")
+                self.end_headers()
+                self.wfile.write(f"retry: {STREAM_RETRY_MS}\n\n".encode("ascii"))
+                self.wfile.flush()
+                while True:
+                    try:
+                        event = subscription.get(timeout=STREAM_KEEPALIVE_SEC)
+                    except queue.Empty:
+                        event = b": keepalive\n\n"
+                    if event is None:
+                        break
+                    self.wfile.write(event)
+                    self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+            finally:
+                self._event_hub.unsubscribe(subscription)
+                self.close_connection = True
 
         def do_GET(self) -> None:  # noqa: N802
+            path = urllib_parse.urlparse(self.path).path
+            if path == "/api/stream":
+                # Open for as long as the viewer stays; not a request latency.
+                self._route_get()
+                return
+            started = time.perf_counter()
+            try:
+                self._route_get()
+            finally:
+                self._metrics.observe_request(_metrics_route(path), time.perf_counter() - started)
+
+        def _route_get(self) -> None:
             parsed = urllib_parse.urlparse(self.path)
             path = parsed.path
 
             if path == "/":
-                payload = collect_dashboard_index(self._artifacts_root)
-                self._send_text(HTTPStatus.OK, render_dashboard_html(payload), "text/html; charset=utf-8")
+                payload = self._index()
+                etag = _index_etag(payload)
+                if self._send_not_modified(etag=etag, cache_control="no-cache"):
+                    return
+                bodies = self._rendered_page(payload, etag)
+                self._send_bytes(
+                    HTTPStatus.OK,
+                    bodies[None],
+                    "text/html; charset=utf-8",
+                    etag=etag,
+                    cache_control="no-cache",
+                    variants=bodies,
+                )
                 return
 
             if path == "/api/index":
-                payload = collect_dashboard_index(self._artifacts_root)
+                payload = self._index()
+                etag = _index_etag(payload)
+                if self._send_not_modified(etag=etag, cache_control="no-cache"):
+                    return
                 self._send_text(
                     HTTPStatus.OK,
                     json.dumps(payload, sort_keys=True, indent=2) + "\n",
                     "application/json; charset=utf-8",
+                    etag=etag,
+                    cache_control="no-cache",
+                )
+                return
+
+            if path == "/api/stream":
+                self._stream_events()
+                return
+
+            if path == "/metrics":
+                self._send_text(HTTPStatus.OK, self._metrics.render(), METRICS_CONTENT_TYPE, cache_control="no-store")
+                return
+
+            if path == "/api/health/history":
+                params = urllib_parse.parse_qs(parsed.query)
+                metric = params.get("metric", [""])[0]
+                if not metric:
+                    self._send_text(
+                        HTTPStatus.OK,
+                        json.dumps({"metrics": self._health_history.metrics()}, sort_keys=True) + "\n",
+                        "application/json; charset=utf-8",
+                        cache_control="no-cache",
+                    )
+                    return
+                try:
+                    bounds = {key: float(params[key][0]) for key in ("start", "end") if key in params}
+                    # A negative start is relative to end (or now): start=-86400 is the last day.
+                    if bounds.get("start", 0) < 0:
+                        bounds["start"] += bounds.get("end", time.time())
+                    series = self._health_history.query(
+                        metric, resolution=params.get("resolution", ["auto"])[0], **bounds
+                    )
+                except ValueError as exc:
+                    self._send_text(HTTPStatus.BAD_REQUEST, f"{exc}\n")
+                    return
+                self._send_text(
+                    HTTPStatus.OK,
+                    json.dumps(series, sort_keys=True, separators=(",", ":")) + "\n",
+                    "application/json; charset=utf-8",
+                    cache_control="no-cache",
+                )
+                return
+
+            if path == "/api/search":
+                params = urllib_parse.parse_qs(parsed.query)
+                query = params.get("q", [""])[0]
+                if not query.strip():
+                    self._send_text(HTTPStatus.BAD_REQUEST, "Missing search query (q=)\n")
+                    return
+                try:
+                    limit = int(params.get("limit", ["20"])[0])
+                except ValueError:
+                    limit = 20
+                index = self._search_index()
+                # Indexing runs on the index's own thread; only the first search waits for it.
+                index.start()
+                index.wait_synced(SEARCH_FIRST_SYNC_WAIT_SEC)
+                try:
+                    result = index.search(query, limit=limit, kind=params.get("kind", [""])[0])
+                except sqlite3.OperationalError as exc:
+                    self._send_text(HTTPStatus.SERVICE_UNAVAILABLE, f"Search index unavailable: {exc}\n")
+                    return
+                self._send_text(
+                    HTTPStatus.OK,
+                    json.dumps(result, sort_keys=True) + "\n",
+                    "application/json; charset=utf-8",
+                    cache_control="no-cache",
+                )
+                return
+
+            if path == "/api/status":
+                # Live supervisor/runner status; the provider prefers the control
+                # sockets and falls back to pid/heartbeat files on its own.
+                if self._status_provider is None:
+                    self._send_text(HTTPStatus.NOT_FOUND, "Status provider not configured\n")
+                    return
+                self._send_text(
+                    HTTPStatus.OK,
+                    json.dumps(self._status_provider(), sort_keys=True, indent=2) + "\n",
+                    "application/json; charset=utf-8",
                 )
                 return
 
@@ -768,12 +1363,24 @@ def make_dashboard_handler(artifacts_root: Path) -> type[BaseHTTPRequestHandler]
                     threshold = int(qs.get("stale_threshold_sec", ["3600"])[0])
                 except (ValueError, IndexError):
                     threshold = 3600
-                # Collect task state from distributed sources (currently
-                # the dashboard index's task_state; extensible to remote).
-                index_payload = collect_dashboard_index(self._artifacts_root)
-                task_state = index_payload.get("task_state", {})
-                sources: list[dict[str, Any]] = [task_state] if isinstance(task_state, dict) and task_state else []
+                # Local task state first, then every peer's (fetched concurrently,
+                # falling back to its last good payload).  Peers ask with
+                # scope=local so federated dashboards never fetch each other in a loop.
+                task_state = self._local_task_state()
+                sources: list[dict[str, Any]] = [task_state] if task_state else []
+                nodes: list[dict[str, Any]] = [
+                    {"node": "local", "ok": True, "stale": False, "error": "", "task_count": len(task_state)}
+                ]
+                if self._todo_federation is not None and qs.get("scope", [""])[0] != "local":
+                    for row in self._todo_federation.collect():
+                        peer_tasks = row.pop("tasks")
+                        if peer_tasks:
+                            sources.append(peer_tasks)
+                        nodes.append(row)
                 result = aggregate_distributed_todos(sources, stale_threshold_sec=threshold)
+                result["nodes"] = nodes
+                # A peer whose first fetch is still in flight has not failed.
+                result["degraded"] = any(not row["ok"] and not row.get("pending") for row in nodes)
                 self._send_text(
                     HTTPStatus.OK,
                     json.dumps(result, sort_keys=True, indent=2) + "\n",
@@ -791,23 +1398,51 @@ def make_dashboard_handler(artifacts_root: Path) -> type[BaseHTTPRequestHandler]
                     self._send_text(HTTPStatus.NOT_FOUND, "Artifact not found\n")
                     return
 
+                stat = target.stat()
                 suffix = target.suffix.lower()
-                if suffix in TEXT_SUFFIXES:
-                    content = target.read_text(encoding="utf-8", errors="replace")
+                validators = {
+                    # The viewer page differs per line window, so the query joins the validator.
+                    "etag": _file_etag(stat, parsed.query if suffix in TEXT_SUFFIXES else ""),
+                    "last_modified": stat.st_mtime,
+                    "cache_control": _artifact_cache_control(rel),
+                }
+                if self._send_not_modified(**validators):
+                    return
+                qs = urllib_parse.parse_qs(parsed.query)
+                if suffix in TEXT_SUFFIXES and "raw" not in qs:
+                    nav = ""
+                    try:
+                        if suffix == ".log" and ("tail" in qs or "line" in qs):
+                            # Jump straight to a window of a large log through its line index.
+                            lines = self._log_window(target, qs)
+                        else:
+                            # Logs open on their last page, everything else on its first.
+                            default_offset = None if suffix == ".log" else 0
+                            offset = int(qs["offset"][0]) if "offset" in qs else default_offset
+                            window = read_text_window(target, offset)
+                            lines = window["lines"]
+                            nav = _render_viewer_nav(rel, window)
+                    except ValueError:
+                        self._send_text(HTTPStatus.BAD_REQUEST, "Invalid line window\n")
+                        return
                     body = (
                         "<!doctype html><html><head><meta charset='utf-8' />"
                         "<meta name='viewport' content='width=device-width, initial-scale=1' />"
                         "<title>Artifact Viewer</title>"
                         "<style>body{font-family:ui-monospace,monospace;margin:0;padding:16px;background:#f8f8f8;}"
                         "pre{white-space:pre-wrap;word-break:break-word;background:#fff;border:1px solid #ddd;"
-                        "padding:12px;border-radius:6px;}</style></head><body>"
-                        f"<h1>{html.escape(rel)}</h1><pre>{html.escape(content)}</pre></body></html>"
+                        "padding:12px;border-radius:6px;}nav a{margin-right:12px;}</style></head><body>"
+                        f"<h1>{html.escape(rel)}</h1>{nav}<pre>{html.escape(chr(10).join(lines))}</pre>{nav}</body></html>"
                     )
-                    self._send_text(HTTPStatus.OK, body, "text/html; charset=utf-8")
+                    self._send_text(HTTPStatus.OK, body, "text/html; charset=utf-8", **validators)
                     return
 
-                content_type = mimetypes.guess_type(target.name)[0] or "application/octet-stream"
-                self._send_bytes(HTTPStatus.OK, target.read_bytes(), content_type)
+                if suffix in TEXT_SUFFIXES:
+                    # Raw text is never rendered as HTML from the dashboard origin.
+                    content_type = "text/plain; charset=utf-8"
+                else:
+                    content_type = mimetypes.guess_type(target.name)[0] or "application/octet-stream"
+                self._send_file(target, stat.st_size, content_type, validators)
                 return
 
             self._send_text(HTTPStatus.NOT_FOUND, "Not found\n")
@@ -820,16 +1455,62 @@ def run_dashboard_server(
     artifacts_root: Path,
     host: str = "127.0.0.1",
     port: int = 8787,
+    status_provider: Callable[[], dict[str, Any]] | None = None,
+    state_file: Path | None = None,
+    health_provider: Callable[[], dict[str, Any]] | None = None,
+    budget_file: Path | None = None,
+    health_history_dir: Path | None = None,
+    peers: list[str] | None = None,
+    peer_timeout_sec: float = DEFAULT_PEER_TIMEOUT_SEC,
+    engine: str = "threaded",
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    workers: int = DEFAULT_WORKERS,
 ) -> None:
     resolved_root = artifacts_root.resolve()
     resolved_root.mkdir(parents=True, exist_ok=True)
-    handler = make_dashboard_handler(resolved_root)
-    server = ThreadingHTTPServer((host, int(port)), handler)
+    # Build the index once up front; requests then read it from memory.
+    indexer = ArtifactIndexer(resolved_root)
+    indexer.start()
+    hub = DashboardEventHub(
+        indexer,
+        status_provider=status_provider,
+        state_file=state_file,
+        health_provider=health_provider,
+    )
+    federation = TodoFederation(peers, timeout_sec=peer_timeout_sec) if peers else None
+    metrics = DashboardMetrics(
+        hub,
+        budget_file=budget_file if budget_file is not None else resolved_root / "autonomy" / "budget.json",
+        routing_log=resolved_root / "autonomy" / "swarm_routing_decisions.ndjson",
+    )
+    handler = make_dashboard_handler(
+        resolved_root,
+        status_provider,
+        indexer,
+        hub,
+        state_file=state_file,
+        todo_federation=federation,
+        metrics=metrics,
+        health_history=HealthHistory(health_history_dir) if health_history_dir is not None else None,
+    )
+    server: ThreadingHTTPServer | AsyncDashboardServer
+    if engine == "async":
+        server = AsyncDashboardServer(
+            (host, int(port)),
+            handler,
+            event_hub=hub,
+            max_connections=max_connections,
+            workers=workers,
+        )
+    else:
+        server = ThreadingHTTPServer((host, int(port)), handler)
     url = f"http://{host}:{server.server_port}/"
-    print(f"dashboard serving {resolved_root} at {url}")
+    print(f"dashboard serving {resolved_root} at {url} (engine: {engine}, index updates: {indexer.watch_mode})")
     try:
         server.serve_forever()
     except KeyboardInterrupt:
         pass
     finally:
+        hub.close()
         server.server_close()
+        indexer.close()
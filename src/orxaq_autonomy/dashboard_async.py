@@ -0,0 +1,275 @@
+"""asyncio engine for the dashboard server.
+
+``ThreadingHTTPServer`` spends a thread per connection and closes after
+every response, so each open dashboard and each SSE viewer pins a thread.
+``AsyncDashboardServer`` keeps connections on one event loop instead:
+
+- HTTP/1.1 keep-alive with an idle timeout; at most ``max_connections``
+  sockets are served, extra ones get ``503`` with ``Retry-After``.
+- Ordinary requests run the existing ``DashboardHandler`` on a bounded
+  worker pool (index, file and todo routes touch the filesystem), against
+  in-memory buffers; ``sendfile`` requests are replayed on the loop with
+  ``loop.sendfile`` so large artifacts are never buffered.
+- ``/api/stream`` is served on the loop itself: an idle viewer costs a
+  queue, not a thread.
+
+It mirrors the ``socketserver`` surface used by ``run_dashboard_server``:
+``server_port``, ``serve_forever()``, ``shutdown()``, ``server_close()``.
+
+Zero external dependencies -- uses only Python stdlib.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import http.client
+import io
+import os
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler
+from typing import Any
+from urllib import parse as urllib_parse
+
+from .dashboard_stream import STREAM_KEEPALIVE_SEC, STREAM_RETRY_MS, DashboardEventHub
+
+
+DEFAULT_MAX_CONNECTIONS = 512
+DEFAULT_WORKERS = 8
+DEFAULT_KEEPALIVE_SEC = 15.0
+MAX_REQUEST_HEAD_BYTES = 64 * 1024
+
+
+class _DeferredSendfile:
+    """Stands in for the client socket while a handler runs on a worker thread.
+
+    ``DashboardHandler._send_file`` calls ``connection.sendfile``; the file
+    descriptor is duplicated so the event loop can stream it after the
+    handler (and its ``with open(...)``) has returned.
+    """
+
+    def __init__(self) -> None:
+        self.pending: tuple[int, int, int | None] | None = None
+
+    def sendfile(self, file: Any, offset: int = 0, count: int | None = None) -> int:
+        self.pending = (os.dup(file.fileno()), offset, count)
+        return count or 0
+
+
+class _LoopSubscription:
+    """Hub subscription that hands events to an ``asyncio.Queue`` on *loop*."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, maxsize: int) -> None:
+        self._loop = loop
+        self._maxsize = maxsize
+        self.inbox: asyncio.Queue[bytes | None] = asyncio.Queue()
+
+    def _deliver(self, item: bytes | None) -> None:
+        # Same policy as the hub's thread queues: a slow viewer loses its oldest events.
+        while item is not None and self.inbox.qsize() >= self._maxsize:
+            self.inbox.get_nowait()
+        self.inbox.put_nowait(item)
+
+    def put_nowait(self, item: bytes | None) -> None:
+        # Never raises queue.Full, so the hub never needs get_nowait/full from us.
+        with contextlib.suppress(RuntimeError):  # Loop already closed during shutdown.
+            self._loop.call_soon_threadsafe(self._deliver, item)
+
+
+def _close_deferred(future: Any) -> None:
+    """Close the descriptor of a dispatch result nobody is waiting for."""
+    if future.cancelled() or future.exception() is not None:
+        return
+    deferred = future.result()[2]
+    if deferred is not None:
+        with contextlib.suppress(OSError):
+            os.close(deferred[0])
+
+
+def _status_response(status: int, reason: str, *, retry_after: int | None = None) -> bytes:
+    body = f"{reason}\n".encode("utf-8")
+    extra = f"Retry-After: {retry_after}\r\n" if retry_after is not None else ""
+    return (
+        f"HTTP/1.1 {status} {reason}\r\nContent-Type: text/plain; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n{extra}Connection: close\r\n\r\n"
+    ).encode("ascii") + body
+
+
+class AsyncDashboardServer:
+    """Serve a dashboard handler class from one asyncio event loop."""
+
+    def __init__(
+        self,
+        server_address: tuple[str, int],
+        handler_class: type[BaseHTTPRequestHandler],
+        *,
+        event_hub: DashboardEventHub | None = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        workers: int = DEFAULT_WORKERS,
+        keepalive_sec: float = DEFAULT_KEEPALIVE_SEC,
+    ) -> None:
+        # Keep-alive needs HTTP/1.1 framing; every dashboard response sets Content-Length.
+        self.handler_class = type(handler_class.__name__, (handler_class,), {"protocol_version": "HTTP/1.1"})
+        self.event_hub = event_hub if event_hub is not None else getattr(handler_class, "_event_hub", None)
+        self.max_connections = max(1, int(max_connections))
+        self.keepalive_sec = max(0.1, float(keepalive_sec))
+        self.socket = socket.create_server(server_address, backlog=min(self.max_connections, 1024))
+        self.server_address = self.socket.getsockname()[:2]
+        self.server_port = int(self.server_address[1])
+        self._executor = ThreadPoolExecutor(max_workers=max(1, int(workers)), thread_name_prefix="dashboard-worker")
+        self._connections: set[asyncio.Task[Any]] = set()
+        self._shutdown_request = threading.Event()
+        self._stopped = threading.Event()
+        self.active_connections = 0
+
+    # -- lifecycle ---------------------------------------------------------
+
+    def serve_forever(self, poll_interval: float = 0.1) -> None:
+        self._stopped.clear()
+        try:
+            asyncio.run(self._main(poll_interval))
+        finally:
+            self._stopped.set()
+
+    def shutdown(self) -> None:
+        """Stop ``serve_forever`` from another thread and wait for it to return."""
+        self._shutdown_request.set()
+        self._stopped.wait(timeout=10)
+
+    def server_close(self) -> None:
+        self.socket.close()
+        self._executor.shutdown(wait=False)
+
+    async def _main(self, poll_interval: float) -> None:
+        server = await asyncio.start_server(self._handle_connection, sock=self.socket, limit=MAX_REQUEST_HEAD_BYTES)
+        try:
+            # Polled like socketserver, so shutdown() works from any thread at any time.
+            while not self._shutdown_request.is_set():
+                await asyncio.sleep(poll_interval)
+        finally:
+            server.close()
+            for task in list(self._connections):
+                task.cancel()
+            await asyncio.gather(*self._connections, return_exceptions=True)
+
+    # -- connections -------------------------------------------------------
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        if self.active_connections >= self.max_connections:
+            writer.write(_status_response(503, "Service Unavailable", retry_after=1))
+            await self._close(writer)
+            return
+        self.active_connections += 1
+        if task is not None:
+            self._connections.add(task)
+        peer = writer.get_extra_info("peername") or ("", 0)
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout=self.keepalive_sec)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    writer.write(_status_response(431, "Request Header Fields Too Large"))
+                    break
+                parts = head.split(b"\r\n", 1)[0].split()
+                target = parts[1].decode("latin-1") if len(parts) == 3 else ""
+                if parts[:1] == [b"GET"] and urllib_parse.urlsplit(target).path == "/api/stream" and self.event_hub:
+                    await self._stream_events(head, writer)
+                    break
+                response, close, deferred = await self._dispatch_request(head, peer)
+                lowered = head.lower()
+                # Dashboard routes take no request body; never try to parse one as the next request.
+                close = close or b"\r\ncontent-length:" in lowered or b"\r\ntransfer-encoding:" in lowered
+                # Own the duplicated descriptor before the first await so every exit closes it.
+                body = os.fdopen(deferred[0], "rb") if deferred is not None else None
+                try:
+                    writer.write(response)
+                    if body is not None:
+                        await writer.drain()
+                        await asyncio.get_running_loop().sendfile(writer.transport, body, deferred[1], deferred[2])
+                    await writer.drain()
+                finally:
+                    if body is not None:
+                        body.close()
+                if close:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            self.active_connections -= 1
+            if task is not None:
+                self._connections.discard(task)
+            await self._close(writer)
+
+    async def _offload(self, fn: Any, *args: Any, **kwargs: Any) -> Any:
+        """Run blocking work on the bounded worker pool."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+    async def _dispatch_request(
+        self, head: bytes, peer: tuple[Any, ...]
+    ) -> tuple[bytes, bool, tuple[int, int, int | None] | None]:
+        """``_dispatch`` on the worker pool; a cancelled wait still closes its descriptor."""
+        future = self._executor.submit(self._dispatch, head, peer)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            future.add_done_callback(_close_deferred)
+            raise
+
+    def _dispatch(self, head: bytes, peer: tuple[Any, ...]) -> tuple[bytes, bool, tuple[int, int, int | None] | None]:
+        """Run one request through the handler class against in-memory buffers."""
+        handler = self.handler_class.__new__(self.handler_class)
+        connection = _DeferredSendfile()
+        handler.request = handler.connection = connection
+        handler.client_address = tuple(peer[:2])
+        handler.server = self
+        handler.rfile = io.BytesIO(head)
+        handler.wfile = io.BytesIO()
+        handler.close_connection = True
+        try:
+            handler.handle_one_request()
+        except Exception:
+            if connection.pending is not None:
+                os.close(connection.pending[0])
+            return _status_response(500, "Internal Server Error"), True, None
+        return handler.wfile.getvalue(), bool(handler.close_connection), connection.pending
+
+    async def _stream_events(self, head: bytes, writer: asyncio.StreamWriter) -> None:
+        assert self.event_hub is not None
+        headers = http.client.parse_headers(io.BytesIO(head.split(b"\r\n", 1)[1]))
+        try:
+            last_event_id: int | None = int(headers.get("Last-Event-ID", ""))
+        except ValueError:
+            last_event_id = None
+        subscription = _LoopSubscription(asyncio.get_running_loop(), self.event_hub.subscriber_queue)
+        # The first subscribe may start the hub and run its initial poll; keep that off the loop.
+        await self._offload(self.event_hub.subscribe, last_event_id, subscription=subscription)
+        try:
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream; charset=utf-8\r\n"
+                b"Cache-Control: no-cache\r\nX-Accel-Buffering: no\r\nConnection: close\r\n\r\n"
+                + f"retry: {STREAM_RETRY_MS}\n\n".encode("ascii")
+            )
+            await writer.drain()
+            while True:
+                try:
+                    event = await asyncio.wait_for(subscription.inbox.get(), timeout=STREAM_KEEPALIVE_SEC)
+                except asyncio.TimeoutError:
+                    event = b": keepalive\n\n"
+                if event is None:
+                    break
+                writer.write(event)
+                await writer.drain()
+        finally:
+            self.event_hub.unsubscribe(subscription)
+
+    @staticmethod
+    async def _close(writer: asyncio.StreamWriter) -> None:
+        writer.close()
+        with contextlib.suppress(Exception):
+            await writer.wait_closed()
@@ -0,0 +1,243 @@
+"""Prometheus text exposition for the dashboard server.
+
+``/metrics`` is rendered from state the dashboard already holds in memory,
+so a scrape never walks the artifacts tree:
+
+- task counts by status, task retries, heartbeat age and health score come
+  from the ``DashboardEventHub`` watcher;
+- budget usage and validation durations come from the runner's budget
+  report, re-parsed only when its (inode, mtime, size) changes;
+- routing decisions per tier come from the swarm routing NDJSON log, read
+  incrementally from the last offset;
+- request latency is observed by the dashboard handler itself.
+
+- ``DashboardMetrics``: owns the request histogram and renders a scrape.
+- ``LatencyHistogram``: cumulative-bucket histogram keyed by route.
+
+Zero external dependencies -- uses only Python stdlib.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+from typing import Any
+
+from .dashboard_stream import DashboardEventHub
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+LATENCY_BUCKETS_SEC = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+def _escape_label(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def _sample(name: str, value: float, labels: dict[str, Any] | None = None) -> str:
+    if labels:
+        rendered = ",".join(f'{key}="{_escape_label(val)}"' for key, val in labels.items())
+        return f"{name}{{{rendered}}} {_format_value(value)}"
+    return f"{name} {_format_value(value)}"
+
+
+def _fingerprint(path: Path) -> tuple[int, int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+class LatencyHistogram:
+    """Request durations per route, in Prometheus cumulative buckets."""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS_SEC) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._series: dict[str, list[float]] = {}
+
+    def observe(self, route: str, seconds: float) -> None:
+        with self._lock:
+            series = self._series.setdefault(route, [0.0] * (len(self.buckets) + 2))
+            for index, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    series[index] += 1
+            series[-2] += 1
+            series[-1] += seconds
+
+    def render(self, name: str) -> list[str]:
+        with self._lock:
+            series = {route: list(values) for route, values in self._series.items()}
+        lines = []
+        for route in sorted(series):
+            values = series[route]
+            for bound, count in zip(self.buckets, values):
+                lines.append(_sample(f"{name}_bucket", count, {"route": route, "le": _format_value(bound)}))
+            lines.append(_sample(f"{name}_bucket", values[-2], {"route": route, "le": "+Inf"}))
+            lines.append(_sample(f"{name}_count", values[-2], {"route": route}))
+            lines.append(_sample(f"{name}_sum", round(values[-1], 6), {"route": route}))
+        return lines
+
+
+class DashboardMetrics:
+    """Renders ``/metrics`` from the event hub, budget report and routing log."""
+
+    def __init__(
+        self,
+        event_hub: DashboardEventHub | None = None,
+        *,
+        budget_file: Path | None = None,
+        routing_log: Path | None = None,
+    ) -> None:
+        self.event_hub = event_hub
+        self.budget_file = budget_file
+        self.routing_log = routing_log
+        self.requests = LatencyHistogram()
+        self._lock = threading.Lock()
+        self._budget_fingerprint: tuple[int, int, int] | None = None
+        self._budget: dict[str, Any] = {}
+        self._routing_inode: int | None = None
+        self._routing_offset = 0
+        self._routing_tiers: dict[tuple[str, bool], int] = {}
+
+    def observe_request(self, route: str, seconds: float) -> None:
+        self.requests.observe(route, seconds)
+
+    def _budget_report(self) -> dict[str, Any]:
+        if self.budget_file is None:
+            return {}
+        fingerprint = _fingerprint(self.budget_file)
+        if fingerprint != self._budget_fingerprint:
+            self._budget_fingerprint = fingerprint
+            try:
+                raw = json.loads(self.budget_file.read_text(encoding="utf-8")) if fingerprint else {}
+            except (OSError, json.JSONDecodeError):
+                raw = {}
+            self._budget = raw if isinstance(raw, dict) else {}
+        return self._budget
+
+    def _routing_counts(self) -> dict[tuple[str, bool], int]:
+        if self.routing_log is None:
+            return {}
+        fingerprint = _fingerprint(self.routing_log)
+        if fingerprint is None:
+            return self._routing_tiers
+        inode, _, size = fingerprint
+        if inode != self._routing_inode or size < self._routing_offset:
+            # Rotated or truncated: count the new file from the start.
+            self._routing_inode, self._routing_offset, self._routing_tiers = inode, 0, {}
+        if size == self._routing_offset:
+            return self._routing_tiers
+        with open(self.routing_log, "rb") as handle:
+            handle.seek(self._routing_offset)
+            chunk = handle.read(size - self._routing_offset)
+        # Only whole lines; a decision still being appended is counted next scrape.
+        complete = chunk[: chunk.rfind(b"\n") + 1]
+        self._routing_offset += len(complete)
+        for line in complete.splitlines():
+            try:
+                decision = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(decision, dict):
+                continue
+            key = (str(decision.get("selected_tier") or "none"), bool(decision.get("deferred")))
+            self._routing_tiers[key] = self._routing_tiers.get(key, 0) + 1
+        return self._routing_tiers
+
+    def render(self) -> str:
+        """One scrape in the Prometheus text exposition format."""
+        out: list[str] = []
+
+        def family(name: str, kind: str, help_text: str, samples: list[str]) -> None:
+            if samples:
+                out.extend([f"# HELP {name} {help_text}", f"# TYPE {name} {kind}", *samples])
+
+        hub: dict[str, Any] = {}
+        if self.event_hub is not None:
+            self.event_hub.start()
+            hub = self.event_hub.snapshot()
+        counts = hub.get("task_counts")
+        family(
+            "orxaq_tasks",
+            "gauge",
+            "Tasks in the state file by status.",
+            [_sample("orxaq_tasks", count, {"status": status}) for status, count in sorted((counts or {}).items())],
+        )
+        if counts is not None:
+            family("orxaq_task_retries", "gauge", "Task attempts beyond the first, summed over tasks.", [
+                _sample("orxaq_task_retries", hub.get("task_retries", 0)),
+            ])
+        heartbeat = hub.get("heartbeat")
+        if heartbeat is not None:
+            family("orxaq_heartbeat_age_seconds", "gauge", "Age of the stalest runner heartbeat (-1 when none).", [
+                _sample("orxaq_heartbeat_age_seconds", heartbeat.get("heartbeat_age_sec", -1)),
+            ])
+            family("orxaq_runner_up", "gauge", "Whether a runner process is running.", [
+                _sample("orxaq_runner_up", int(bool(heartbeat.get("runner_running")))),
+            ])
+        health = hub.get("health")
+        if health is not None and health.get("score") is not None:
+            family("orxaq_health_score", "gauge", "Collaboration health score, 0-100.", [
+                _sample("orxaq_health_score", float(health["score"]), {"grade": health.get("grade") or "unknown"}),
+            ])
+        if self.event_hub is not None:
+            family("orxaq_dashboard_index_generation", "gauge", "Artifact index generation.", [
+                _sample("orxaq_dashboard_index_generation", hub.get("generation", 0)),
+            ])
+            family("orxaq_dashboard_stream_subscribers", "gauge", "Open /api/stream connections.", [
+                _sample("orxaq_dashboard_stream_subscribers", hub.get("subscribers", 0)),
+            ])
+
+        with self._lock:
+            budget = self._budget_report()
+            routing = dict(self._routing_counts())
+        totals = budget.get("totals") if isinstance(budget.get("totals"), dict) else {}
+        limits = budget.get("limits") if isinstance(budget.get("limits"), dict) else {}
+        usage = [
+            ("tokens", totals.get("tokens"), limits.get("max_total_tokens")),
+            ("cost_usd", totals.get("cost_usd"), limits.get("max_total_cost_usd")),
+            ("runtime_sec", budget.get("elapsed_sec"), limits.get("max_runtime_sec")),
+            ("retries", totals.get("retry_events"), limits.get("max_total_retries")),
+        ]
+        family("orxaq_budget_used", "gauge", "Budget consumed by the current run.", [
+            _sample("orxaq_budget_used", float(used), {"resource": resource})
+            for resource, used, _ in usage
+            if isinstance(used, (int, float))
+        ])
+        family("orxaq_budget_limit", "gauge", "Budget limit for the current run (0 disables).", [
+            _sample("orxaq_budget_limit", float(limit), {"resource": resource})
+            for resource, _, limit in usage
+            if isinstance(limit, (int, float))
+        ])
+        if isinstance(totals.get("retry_events"), int):
+            family("orxaq_retry_events_total", "counter", "Task retries scheduled by the runner.", [
+                _sample("orxaq_retry_events_total", totals["retry_events"]),
+            ])
+        if isinstance(totals.get("validation_runs"), int):
+            family("orxaq_validation_duration_seconds", "summary", "Wall time of validation command runs.", [
+                _sample("orxaq_validation_duration_seconds_sum", float(totals.get("validation_sec", 0.0))),
+                _sample("orxaq_validation_duration_seconds_count", totals["validation_runs"]),
+            ])
+            family("orxaq_validation_failures_total", "counter", "Validation runs that failed.", [
+                _sample("orxaq_validation_failures_total", int(totals.get("validation_failures", 0))),
+            ])
+        family("orxaq_routing_decisions_total", "counter", "Swarm routing decisions by selected tier.", [
+            _sample("orxaq_routing_decisions_total", count, {"tier": tier, "deferred": str(deferred).lower()})
+            for (tier, deferred), count in sorted(routing.items())
+        ])
+        family(
+            "orxaq_dashboard_request_duration_seconds",
+            "histogram",
+            "Dashboard request latency by route.",
+            self.requests.render("orxaq_dashboard_request_duration_seconds"),
+        )
+        return "\n".join(out) + "\n"
@@ -0,0 +1,345 @@
+"""Server-Sent Events fan-out for live dashboard updates.
+
+A dashboard left open used to poll by reloading, and every reload rescanned
+the artifacts tree.  ``DashboardEventHub`` runs one watcher thread per
+dashboard server and pushes pre-encoded events to every ``/api/stream``
+connection:
+
+- ``artifacts``: the artifact index generation moved; lists added and
+  removed paths per category.
+- ``heartbeat``: a runner wrote a new heartbeat, or the runner/supervisor
+  running or stale flags flipped.
+- ``task``: tasks in the state file changed status (``transitions``).
+- ``health``: the health grade or score changed.
+
+New connections first receive a ``hello`` event with the current generation,
+heartbeat and health, then any buffered events after their
+``Last-Event-ID``.
+
+Zero external dependencies -- uses only Python stdlib.
+"""
+
+from __future__ import annotations
+
+import json
+import queue
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable
+
+from .artifact_index import CATEGORIES, ArtifactIndexer
+
+
+STREAM_RETRY_MS = 3000
+STREAM_KEEPALIVE_SEC = 15.0
+DEFAULT_POLL_SEC = 1.0
+DEFAULT_HEALTH_INTERVAL_SEC = 30.0
+DEFAULT_REPLAY_EVENTS = 200
+DEFAULT_SUBSCRIBER_QUEUE = 256
+MAX_LISTED_CHANGES = 50
+
+
+def format_sse(event_id: int, event: str, data: dict[str, Any]) -> bytes:
+    """Encode one event in ``text/event-stream`` framing."""
+    payload = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return f"id: {event_id}\nevent: {event}\ndata: {payload}\n\n".encode("utf-8")
+
+
+def _load_task_statuses(path: Path) -> tuple[dict[str, str], int] | None:
+    """Task id to normalized status, plus retries (attempts past the first) over all tasks."""
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(raw, dict):
+        return None
+    statuses: dict[str, str] = {}
+    retries = 0
+    for task_id, entry in raw.items():
+        entry = entry if isinstance(entry, dict) else {}
+        statuses[str(task_id)] = str(entry.get("status") or "").strip().lower() or "unknown"
+        try:
+            retries += max(0, int(entry.get("attempts", 0)) - 1)
+        except (TypeError, ValueError):
+            pass
+    return statuses, retries
+
+
+class DashboardEventHub:
+    """One change watcher shared by all live dashboard viewers."""
+
+    def __init__(
+        self,
+        indexer: ArtifactIndexer | None = None,
+        *,
+        status_provider: Callable[[], dict[str, Any]] | None = None,
+        state_file: Path | None = None,
+        health_provider: Callable[[], dict[str, Any]] | None = None,
+        poll_sec: float = DEFAULT_POLL_SEC,
+        health_interval_sec: float = DEFAULT_HEALTH_INTERVAL_SEC,
+        replay_events: int = DEFAULT_REPLAY_EVENTS,
+        subscriber_queue: int = DEFAULT_SUBSCRIBER_QUEUE,
+    ) -> None:
+        self.indexer = indexer
+        self.status_provider = status_provider
+        self.state_file = state_file
+        self.health_provider = health_provider
+        self.poll_sec = max(0.05, float(poll_sec))
+        self.health_interval_sec = health_interval_sec
+        self.subscriber_queue = max(1, subscriber_queue)
+        self._lock = threading.Lock()
+        self._poll_lock = threading.Lock()
+        self._subscribers: set[Any] = set()
+        self._history: deque[tuple[int, bytes]] = deque(maxlen=max(0, replay_events))
+        self._next_id = 1
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._baselined = False
+        self._generation = 0
+        self._artifacts: dict[str, set[str]] = {}
+        self._heartbeat: dict[str, Any] | None = None
+        self._state_fingerprint: tuple[int, int] | None = None
+        self._tasks: dict[str, str] | None = None
+        self._task_retries = 0
+        self._health: dict[str, Any] | None = None
+        self._health_checked = 0.0
+
+    # -- subscribers -------------------------------------------------------
+
+    def subscribe(self, last_event_id: int | None = None, *, subscription: Any = None) -> Any:
+        """Register a viewer; its queue yields encoded events and ``None`` on shutdown.
+
+        *subscription* may be any object with ``queue.Queue``'s ``put_nowait``;
+        ``full`` and ``get_nowait`` are only needed if ``put_nowait`` can raise
+        ``queue.Full`` (the asyncio server passes one that hands events to its
+        event loop and bounds itself there); by default a bounded
+        ``queue.Queue`` is made.
+        """
+        self.start()
+        if subscription is None:
+            subscription = queue.Queue(maxsize=self.subscriber_queue)
+        full = getattr(subscription, "full", None)
+        with self._lock:
+            hello = {
+                "generation": self._generation,
+                "heartbeat": self._heartbeat,
+                "health": self._health,
+                "subscribers": len(self._subscribers) + 1,
+            }
+            subscription.put_nowait(format_sse(self._next_id - 1, "hello", hello))
+            if last_event_id is not None:
+                for event_id, encoded in self._history:
+                    if event_id > last_event_id and not (full is not None and full()):
+                        subscription.put_nowait(encoded)
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Any) -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def publish(self, event: str, data: dict[str, Any]) -> int:
+        """Encode once and fan out; a full viewer queue drops its oldest event."""
+        with self._lock:
+            event_id = self._next_id
+            self._next_id += 1
+            encoded = format_sse(event_id, event, data)
+            self._history.append((event_id, encoded))
+            for subscription in self._subscribers:
+                self._offer(subscription, encoded)
+        return event_id
+
+    @staticmethod
+    def _offer(subscription: Any, item: bytes | None) -> None:
+        while True:
+            try:
+                subscription.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    subscription.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def snapshot(self) -> dict[str, Any]:
+        """What the watcher last saw: generation, heartbeat, health and task counts."""
+        with self._lock:
+            counts: dict[str, int] = {}
+            for status in (self._tasks or {}).values():
+                counts[status] = counts.get(status, 0) + 1
+            return {
+                "generation": self._generation,
+                "heartbeat": dict(self._heartbeat) if self._heartbeat is not None else None,
+                "health": dict(self._health) if self._health is not None else None,
+                "task_counts": counts if self._tasks is not None else None,
+                "task_retries": self._task_retries,
+                "subscribers": len(self._subscribers),
+            }
+
+    # -- watcher -----------------------------------------------------------
+
+    def poll_once(self) -> int:
+        """Check every source once and publish what changed; returns the number of events."""
+        with self._poll_lock:
+            baseline = not self._baselined
+            self._baselined = True
+            published = self._poll_artifacts(baseline)
+            heartbeat_changed = self._poll_heartbeat(baseline)
+            tasks_changed = self._poll_tasks(baseline)
+            published += int(heartbeat_changed) + int(tasks_changed)
+            now = time.monotonic()
+            if baseline or heartbeat_changed or tasks_changed or now - self._health_checked >= self.health_interval_sec:
+                self._health_checked = now
+                published += int(self._poll_health(baseline))
+            return published
+
+    def _poll_artifacts(self, baseline: bool) -> int:
+        if self.indexer is None:
+            return 0
+        snapshot = self.indexer.snapshot()
+        generation = int(snapshot.get("generation", 0))
+        if generation == self._generation and not baseline:
+            return 0
+        current = {category: set(snapshot.get(category, [])) for category in CATEGORIES}
+        previous, self._artifacts = self._artifacts, current
+        self._generation = generation
+        if baseline:
+            return 0
+        added = {key: sorted(current[key] - previous.get(key, set()))[:MAX_LISTED_CHANGES] for key in CATEGORIES}
+        removed = {key: sorted(previous.get(key, set()) - current[key])[:MAX_LISTED_CHANGES] for key in CATEGORIES}
+        self.publish(
+            "artifacts",
+            {
+                "generation": generation,
+                "added": {key: paths for key, paths in added.items() if paths},
+                "removed": {key: paths for key, paths in removed.items() if paths},
+            },
+        )
+        return 1
+
+    def _poll_heartbeat(self, baseline: bool) -> bool:
+        if self.status_provider is None:
+            return False
+        try:
+            status = self.status_provider()
+        except Exception:
+            return False
+        age = int(status.get("heartbeat_age_sec", -1))
+        threshold = int(status.get("heartbeat_stale_threshold_sec", 0) or 0)
+        current = {
+            "heartbeat_age_sec": age,
+            "runner_running": bool(status.get("runner_running")),
+            "supervisor_running": bool(status.get("supervisor_running")),
+            "stale": age != -1 and threshold > 0 and age > threshold,
+        }
+        previous = self._heartbeat
+        with self._lock:
+            self._heartbeat = current
+        if baseline or previous is None:
+            return False
+        flags = ("runner_running", "supervisor_running", "stale")
+        # A younger heartbeat than last time means the runner wrote a new one.
+        new_beat = age != -1 and (previous["heartbeat_age_sec"] == -1 or age < previous["heartbeat_age_sec"])
+        if not new_beat and all(current[key] == previous[key] for key in flags):
+            return False
+        self.publish("heartbeat", current)
+        return True
+
+    def _poll_tasks(self, baseline: bool) -> bool:
+        if self.state_file is None:
+            return False
+        try:
+            stat = self.state_file.stat()
+            fingerprint: tuple[int, int] | None = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            fingerprint = None
+        if fingerprint == self._state_fingerprint and not baseline:
+            return False
+        self._state_fingerprint = fingerprint
+        loaded = _load_task_statuses(self.state_file) if fingerprint is not None else ({}, 0)
+        if loaded is None:
+            return False
+        statuses, retries = loaded
+        with self._lock:
+            previous, self._tasks = self._tasks, statuses
+            self._task_retries = retries
+        if baseline or previous is None:
+            return False
+        transitions = [
+            {"task_id": task_id, "from": previous.get(task_id, ""), "to": status}
+            for task_id, status in sorted(statuses.items())
+            if previous.get(task_id) != status
+        ]
+        transitions.extend(
+            {"task_id": task_id, "from": status, "to": ""}
+            for task_id, status in sorted(previous.items())
+            if task_id not in statuses
+        )
+        if not transitions:
+            return False
+        counts: dict[str, int] = {}
+        for status in statuses.values():
+            counts[status] = counts.get(status, 0) + 1
+        self.publish(
+            "task",
+            {"transitions": transitions[:MAX_LISTED_CHANGES], "total_transitions": len(transitions), "counts": counts},
+        )
+        return True
+
+    def _poll_health(self, baseline: bool) -> bool:
+        if self.health_provider is None:
+            return False
+        try:
+            health = self.health_provider()
+        except Exception:
+            return False
+        current = {"grade": health.get("grade"), "score": health.get("score")}
+        previous = self._health
+        with self._lock:
+            self._health = current
+        if baseline or previous is None or previous == current:
+            return False
+        self.publish("health", {**current, "previous_grade": previous.get("grade")})
+        return True
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            if self.indexer is not None:
+                self.indexer.wait_for_change(self._generation, timeout=self.poll_sec)
+            else:
+                self._stop.wait(self.poll_sec)
+            if self._stop.is_set():
+                return
+            try:
+                self.poll_once()
+            except Exception:  # One bad source must not end the stream for everyone.
+                continue
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._loop, name="dashboard-events", daemon=True)
+        if self.indexer is not None and not self.indexer.running:
+            self.indexer.start()
+        self.poll_once()
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop the watcher and end every open stream."""
+        self._stop.set()
+        with self._lock:
+            thread, self._thread = self._thread, None
+            for subscription in self._subscribers:
+                self._offer(subscription, None)
+            self._subscribers.clear()
+        if thread is not None and thread.is_alive():
+            thread.join(timeout=self.poll_sec + 1)
@@ -9,16 +9,29 @@ Zero external dependencies -- uses only Python stdlib.
 
 from __future__ import annotations
 
+import contextlib
 import hashlib
+import itertools
 import json
 import os
+import queue
 import subprocess
+import threading
 import time
+from collections import deque
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from .mesh_event_log import MeshEventLog
 
 
 # ---------------------------------------------------------------------------
@@ -96,35 +109,322 @@ def _now_iso() -> str:
 
 EventHandler = Callable[[MeshEvent], None]
 
+DISPATCH_MODES = ("sync", "async")
+OVERFLOW_POLICIES = ("drop_oldest", "block")
+
+
+def _type_key(event_type: Any) -> str:
+    return str(getattr(event_type, "value", event_type))
+
+
+class _Subscription:
+    """One handler's registration, with its queue and worker in async mode."""
+
+    def __init__(self, event_type: str, handler: EventHandler, queue_size: int) -> None:
+        self.event_type = _type_key(event_type)
+        self.handler = handler
+        self.name = f"{self.event_type}:{getattr(handler, '__qualname__', type(handler).__name__)}"
+        self.queue: queue.Queue[MeshEvent | None] = queue.Queue(maxsize=max(1, queue_size))
+        self.worker: threading.Thread | None = None
+        self.delivered = 0
+        self.dropped = 0
+        self.errors = 0
+        self.last_error = ""
+        self.latency_total_sec = 0.0
+        self.latency_max_sec = 0.0
+        self._lock = threading.Lock()
+
+    def dispatch(self, event: MeshEvent) -> None:
+        started = time.perf_counter()
+        try:
+            self.handler(event)
+            error = ""
+        except Exception as exc:  # Fault-tolerant dispatch, but counted.
+            error = f"{type(exc).__name__}: {exc}"[:200]
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.delivered += 1
+            self.latency_total_sec += elapsed
+            self.latency_max_sec = max(self.latency_max_sec, elapsed)
+            if error:
+                self.errors += 1
+                self.last_error = error
+
+    def run(self) -> None:
+        while True:
+            event = self.queue.get()
+            try:
+                if event is None:
+                    return
+                self.dispatch(event)
+            finally:
+                self.queue.task_done()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "event_type": self.event_type,
+                "queue_depth": self.queue.qsize(),
+                "delivered": self.delivered,
+                "dropped": self.dropped,
+                "errors": self.errors,
+                "last_error": self.last_error,
+                "latency_avg_ms": round(self.latency_total_sec / self.delivered * 1000.0, 3) if self.delivered else 0.0,
+                "latency_max_ms": round(self.latency_max_sec * 1000.0, 3),
+            }
+
+
+class EventHistory:
+    """Bounded, sequence-numbered event ring with per-type and per-node indexes.
+
+    Every appended event gets the next sequence number.  The ring and its
+    indexes are deques; since the evicted event is always the oldest overall,
+    it is also the oldest in its type and node deques, so eviction is O(1).
+    Readers ask for what they need -- ``since(cursor)`` or ``last(k, ...)`` --
+    and pay for those events only, never for a copy of the whole ring.
+    """
+
+    def __init__(self, maxlen: int = 500) -> None:
+        self.maxlen = max(1, int(maxlen))
+        self._events: deque[tuple[int, MeshEvent]] = deque()
+        self._by_type: dict[str, deque[tuple[int, MeshEvent]]] = {}
+        self._by_node: dict[str, deque[tuple[int, MeshEvent]]] = {}
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    @property
+    def last_sequence(self) -> int:
+        """Sequence number of the newest event (``0`` before the first)."""
+        return self._seq
+
+    def append(self, event: MeshEvent) -> int:
+        with self._lock:
+            self._seq += 1
+            item = (self._seq, event)
+            if len(self._events) >= self.maxlen:
+                _, evicted = self._events.popleft()
+                self._evict(self._by_type, _type_key(evicted.event_type))
+                self._evict(self._by_node, evicted.source_node)
+            self._events.append(item)
+            self._by_type.setdefault(_type_key(event.event_type), deque()).append(item)
+            self._by_node.setdefault(event.source_node, deque()).append(item)
+            return self._seq
+
+    @staticmethod
+    def _evict(index: dict[str, deque[tuple[int, MeshEvent]]], key: str) -> None:
+        bucket = index[key]
+        bucket.popleft()
+        if not bucket:
+            del index[key]
+
+    def _scan(self, event_type: str | None, node: str | None) -> Iterator[tuple[int, MeshEvent]]:
+        """Newest-first walk over the smallest matching index."""
+        if event_type is not None:
+            bucket = self._by_type.get(_type_key(event_type), deque())
+        elif node is not None:
+            bucket = self._by_node.get(node, deque())
+        else:
+            bucket = self._events
+        for item in reversed(bucket):
+            if event_type is not None and node is not None and item[1].source_node != node:
+                continue
+            yield item
+
+    def since(
+        self,
+        cursor: int,
+        *,
+        event_type: str | None = None,
+        node: str | None = None,
+        limit: int | None = None,
+    ) -> list[tuple[int, MeshEvent]]:
+        """``(seq, event)`` pairs newer than *cursor*, oldest first.
+
+        Pass the last sequence seen as the next cursor.  Events evicted before
+        the reader caught up are simply missing; compare the first returned
+        sequence with ``cursor + 1`` to detect the gap.
+        """
+        with self._lock:
+            newer = list(itertools.takewhile(lambda item: item[0] > cursor, self._scan(event_type, node)))
+        newer.reverse()
+        return newer if limit is None else newer[: max(0, limit)]
+
+    def last(self, k: int, *, event_type: str | None = None, node: str | None = None) -> list[MeshEvent]:
+        """The newest *k* events (optionally of one type and/or node), oldest first."""
+        with self._lock:
+            found = [event for _, event in itertools.islice(self._scan(event_type, node), max(0, k))]
+        found.reverse()
+        return found
+
+    def counts_by_type(self) -> dict[str, int]:
+        with self._lock:
+            return {key: len(bucket) for key, bucket in self._by_type.items()}
+
+    def events(self) -> list[MeshEvent]:
+        """Copy of every retained event, oldest first."""
+        with self._lock:
+            return [event for _, event in self._events]
+
 
 class EventBus:
     """In-process pub/sub event bus for mesh events.
 
-    Nodes register handlers for specific event types.  Events are dispatched
-    synchronously to keep the implementation simple and dependency-free.
+    Nodes register handlers for specific event types.  By default events are
+    dispatched synchronously on the publisher's thread.  With
+    ``dispatch="async"`` every subscription gets a bounded queue and its own
+    worker thread, so a slow handler (ledger writes) never stalls publishers
+    such as heartbeats; when a queue is full, ``overflow="drop_oldest"``
+    discards its oldest event and ``"block"`` waits up to
+    ``block_timeout_sec`` (forever when ``None``) before dropping the new one.
+    ``stats()`` reports queue depth, drops, errors and handler latency per
+    subscription in either mode.  After ``close()`` the bus rejects new
+    subscriptions, and async events published to it are counted as dropped.
     """
 
-    def __init__(self) -> None:
-        self._handlers: dict[str, list[EventHandler]] = {}
-        self._history: list[MeshEvent] = []
-        self._max_history: int = 500
+    def __init__(
+        self,
+        *,
+        dispatch: str = "sync",
+        queue_size: int = 1024,
+        overflow: str = "drop_oldest",
+        block_timeout_sec: float | None = None,
+        max_history: int = 500,
+    ) -> None:
+        if dispatch not in DISPATCH_MODES:
+            raise ValueError(f"unknown dispatch mode: {dispatch}")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"unknown overflow policy: {overflow}")
+        self._dispatch = dispatch
+        self._queue_size = queue_size
+        self._overflow = overflow
+        self._block_timeout = block_timeout_sec
+        self._handlers: dict[str, list[_Subscription]] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+        self._history = EventHistory(max_history)
+
+    @property
+    def dispatch_mode(self) -> str:
+        return self._dispatch
 
     def subscribe(self, event_type: str, handler: EventHandler) -> None:
-        self._handlers.setdefault(event_type, []).append(handler)
+        subscription = _Subscription(event_type, handler, self._queue_size)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("event bus is closed")
+            if self._dispatch == "async":
+                subscription.worker = threading.Thread(
+                    target=subscription.run, name=f"event-bus-{subscription.name}", daemon=True
+                )
+                subscription.worker.start()
+            self._handlers.setdefault(event_type, []).append(subscription)
 
     def publish(self, event: MeshEvent) -> None:
         self._history.append(event)
-        if len(self._history) > self._max_history:
-            self._history = self._history[-self._max_history:]
-        for handler in self._handlers.get(event.event_type, []):
+        with self._lock:
+            subscriptions = list(self._handlers.get(event.event_type, []))
+        for subscription in subscriptions:
+            if self._dispatch == "sync":
+                subscription.dispatch(event)
+            elif self._closed:
+                # Its worker has stopped; nothing would ever handle the event.
+                with subscription._lock:
+                    subscription.dropped += 1
+            else:
+                self._enqueue(subscription, event)
+
+    def _enqueue(self, subscription: _Subscription, event: MeshEvent) -> None:
+        if self._overflow == "block":
+            try:
+                subscription.queue.put(event, timeout=self._block_timeout)
+            except queue.Full:
+                with subscription._lock:
+                    subscription.dropped += 1
+            return
+        while True:
             try:
-                handler(event)
-            except Exception:
-                pass  # Fault-tolerant dispatch
+                subscription.queue.put_nowait(event)
+                return
+            except queue.Full:
+                try:
+                    subscription.queue.get_nowait()
+                except queue.Empty:
+                    continue
+                subscription.queue.task_done()
+                with subscription._lock:
+                    subscription.dropped += 1
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every queued event has been handled; ``False`` on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            subscriptions = [item for items in self._handlers.values() for item in items]
+        for subscription in subscriptions:
+            # Queue.join() has no timeout; wait on the condition it uses instead.
+            done = subscription.queue.all_tasks_done
+            with done:
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                if not done.wait_for(lambda: not subscription.queue.unfinished_tasks, remaining):
+                    return False
+        return True
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        """Stop async workers once their queued events are handled."""
+        with self._lock:
+            self._closed = True
+            subscriptions = [item for items in self._handlers.values() for item in items]
+        for subscription in subscriptions:
+            if subscription.worker is not None:
+                subscription.queue.put(None)
+        for subscription in subscriptions:
+            if subscription.worker is not None:
+                subscription.worker.join(timeout=timeout)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Per-subscription counters keyed by ``<event_type>:<handler name>``."""
+        with self._lock:
+            subscriptions = [item for items in self._handlers.values() for item in items]
+        out: dict[str, dict[str, Any]] = {}
+        for subscription in subscriptions:
+            key = subscription.name
+            suffix = 2
+            while key in out:
+                key = f"{subscription.name}#{suffix}"
+                suffix += 1
+            out[key] = subscription.stats()
+        return out
 
     @property
     def history(self) -> list[MeshEvent]:
-        return list(self._history)
+        """Full copy of the retained events; prefer ``events_since`` / ``last_events``."""
+        return self._history.events()
+
+    @property
+    def history_size(self) -> int:
+        return len(self._history)
+
+    @property
+    def last_sequence(self) -> int:
+        return self._history.last_sequence
+
+    def events_since(
+        self,
+        cursor: int,
+        *,
+        event_type: str | None = None,
+        node: str | None = None,
+        limit: int | None = None,
+    ) -> list[tuple[int, MeshEvent]]:
+        return self._history.since(cursor, event_type=event_type, node=node, limit=limit)
+
+    def last_events(self, k: int, *, event_type: str | None = None, node: str | None = None) -> list[MeshEvent]:
+        return self._history.last(k, event_type=event_type, node=node)
+
+    def event_counts(self) -> dict[str, int]:
+        return self._history.counts_by_type()
 
 
 # ---------------------------------------------------------------------------
@@ -145,57 +445,160 @@ class LedgerEntry:
 
 
 class GitHubLedger:
-    """Shared coordination ledger backed by a JSON file in the repository.
-
-    Uses file-based append operations.  In a real deployment, each write
-    would be committed and pushed to the shared repository so all nodes
-    converge on the same state.
+    """Shared coordination ledger backed by an append-only NDJSON file.
+
+    Each ``append`` writes one JSON line under an advisory lock on a sidecar
+    ``<ledger>.lock`` file, so concurrent nodes on one host never interleave
+    or lose entries and an append costs O(1) regardless of ledger size.  Once
+    the file holds more than twice ``max_entries`` lines (judged under the
+    lock from its size and the line length at its head, so every writer
+    agrees), it is atomically rewritten to its newest ``max_entries`` entries.
+    ``read(last=N)`` reads backwards from the end of the file.  A ledger in
+    the previous pretty-printed JSON-array format is still readable and is
+    rewritten as NDJSON on the next write.
+
+    In a real deployment, each write would be committed and pushed to the
+    shared repository so all nodes converge on the same state.
     """
 
+    _TAIL_BLOCK = 64 * 1024
+    _HEAD_PROBE = 8 * 1024
+
     def __init__(self, ledger_path: Path, *, max_entries: int = 200) -> None:
         self._path = ledger_path
         self._max_entries = max_entries
+        # flock does not exclude threads sharing this object's process; this does.
+        self._lock = threading.Lock()
 
     @property
     def path(self) -> Path:
         return self._path
 
-    def read(self) -> list[LedgerEntry]:
-        if not self._path.exists():
-            return []
+    @contextlib.contextmanager
+    def _locked(self) -> Iterator[None]:
+        with self._lock:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            # Lock a sidecar: compaction replaces the ledger file itself.
+            with open(self._path.with_name(self._path.name + ".lock"), "a") as handle:
+                if fcntl is not None:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+                yield
+
+    @staticmethod
+    def _entry(item: Any) -> LedgerEntry | None:
+        if not isinstance(item, dict):
+            return None
+        return LedgerEntry(
+            entry_id=str(item.get("entry_id", "")),
+            node_id=str(item.get("node_id", "")),
+            action=str(item.get("action", "")),
+            timestamp=str(item.get("timestamp", "")),
+            details=item.get("details", {}) if isinstance(item.get("details"), dict) else {},
+        )
+
+    @staticmethod
+    def _line(entry: LedgerEntry) -> bytes:
+        return (json.dumps(entry.to_dict(), sort_keys=True, separators=(",", ":")) + "\n").encode("utf-8")
+
+    def _read_legacy(self) -> list[LedgerEntry] | None:
+        """Entries of a JSON-array ledger, or ``None`` when the file is NDJSON."""
         try:
-            raw = json.loads(self._path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
+            with open(self._path, "rb") as handle:
+                head = handle.read(64).lstrip()
+                if not head.startswith(b"["):
+                    return None
+                handle.seek(0)
+                raw = json.loads(handle.read().decode("utf-8"))
+        except (json.JSONDecodeError, UnicodeDecodeError):
             return []
+        except OSError:
+            return None
         if not isinstance(raw, list):
             return []
+        return [entry for entry in map(self._entry, raw) if entry is not None]
+
+    def _tail_lines(self, count: int) -> list[bytes]:
+        """The last *count* complete lines, read backwards in blocks."""
+        try:
+            handle = open(self._path, "rb")
+        except OSError:
+            return []
+        with handle:
+            position = handle.seek(0, os.SEEK_END)
+            data = b""
+            while position > 0 and data.count(b"\n") <= count:
+                step = min(self._TAIL_BLOCK, position)
+                position -= step
+                handle.seek(position)
+                data = handle.read(step) + data
+        if not data.endswith(b"\n"):
+            data = data[: data.rfind(b"\n") + 1]  # An append still being written.
+        lines = data.splitlines()
+        if position > 0:
+            lines = lines[1:]  # The first line may have been cut by the block boundary.
+        return lines[-count:] if count > 0 else []
+
+    def read(self, *, last: int | None = None) -> list[LedgerEntry]:
+        """The newest ``last`` entries (default ``max_entries``), oldest first."""
+        count = self._max_entries if last is None else min(max(0, last), self._max_entries)
+        if not self._path.exists() or count == 0:
+            return []
+        legacy = self._read_legacy()
+        if legacy is not None:
+            return legacy[-count:]
         entries: list[LedgerEntry] = []
-        for item in raw:
-            if not isinstance(item, dict):
+        # Over-read a little so undecodable lines do not shorten the result.
+        for line in self._tail_lines(count * 2):
+            try:
+                entry = self._entry(json.loads(line))
+            except (json.JSONDecodeError, UnicodeDecodeError):
                 continue
-            entries.append(LedgerEntry(
-                entry_id=str(item.get("entry_id", "")),
-                node_id=str(item.get("node_id", "")),
-                action=str(item.get("action", "")),
-                timestamp=str(item.get("timestamp", "")),
-                details=item.get("details", {}) if isinstance(item.get("details"), dict) else {},
-            ))
-        return entries
+            if entry is not None:
+                entries.append(entry)
+        return entries[-count:]
+
+    def count(self) -> int:
+        """Number of entries ``read()`` would return."""
+        return len(self.read())
 
     def append(self, entry: LedgerEntry) -> None:
-        entries = self.read()
-        entries.append(entry)
-        if len(entries) > self._max_entries:
-            entries = entries[-self._max_entries:]
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-        self._path.write_text(
-            json.dumps([e.to_dict() for e in entries], indent=2, sort_keys=True) + "\n",
-            encoding="utf-8",
-        )
+        with self._locked():
+            if self._read_legacy() is not None:
+                self._rewrite(self.read())
+            with open(self._path, "ab") as handle:
+                handle.write(self._line(entry))
+                size = handle.tell()
+            if self._over_capacity(size):
+                self._rewrite(self.read())
+
+    def _over_capacity(self, size: int) -> bool:
+        """Whether a *size*-byte ledger holds more than ``2 * max_entries`` lines."""
+        try:
+            with open(self._path, "rb") as handle:
+                head = handle.read(self._HEAD_PROBE)
+        except OSError:
+            return False
+        lines = head.count(b"\n")
+        if size <= len(head):
+            return lines > 2 * self._max_entries
+        # Estimate the line count from the average length of the lines at the head.
+        average = (head.rfind(b"\n") + 1) / lines if lines else len(head)
+        return size > 2 * self._max_entries * average
+
+    def compact(self) -> None:
+        """Rewrite the file as NDJSON holding only the newest ``max_entries``."""
+        with self._locked():
+            self._rewrite(self.read())
+
+    def _rewrite(self, entries: list[LedgerEntry]) -> None:
+        tmp = self._path.with_name(f".{self._path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(b"".join(self._line(entry) for entry in entries))
+        os.replace(tmp, self._path)
 
     def clear(self) -> None:
-        if self._path.exists():
-            self._path.write_text("[]\n", encoding="utf-8")
+        with self._locked():
+            if self._path.exists():
+                self._path.write_bytes(b"")
 
 
 # ---------------------------------------------------------------------------
@@ -214,8 +617,14 @@ class MeshCoordinator:
         *,
         ledger_path: Path,
         stale_threshold_sec: int = 300,
+        bus: EventBus | None = None,
+        event_log: MeshEventLog | None = None,
     ) -> None:
-        self._bus = EventBus()
+        self._bus = bus if bus is not None else EventBus()
+        # Emitted events are also appended here for other processes to tail.
+        self._event_log = event_log
+        self._event_log_errors = 0
+        self._event_log_last_error = ""
         self._ledger = GitHubLedger(ledger_path)
         self._nodes: dict[str, MeshNode] = {}
         self._stale_threshold = stale_threshold_sec
@@ -235,6 +644,10 @@ class MeshCoordinator:
     def ledger(self) -> GitHubLedger:
         return self._ledger
 
+    @property
+    def event_log(self) -> MeshEventLog | None:
+        return self._event_log
+
     @property
     def nodes(self) -> dict[str, MeshNode]:
         return dict(self._nodes)
@@ -251,7 +664,7 @@ class MeshCoordinator:
             timestamp=_now_iso(),
             payload=node.to_dict(),
         )
-        self._bus.publish(event)
+        self.emit(event)
 
     def deregister_node(self, node_id: str) -> None:
         self._nodes.pop(node_id, None)
@@ -260,7 +673,7 @@ class MeshCoordinator:
             source_node=node_id,
             timestamp=_now_iso(),
         )
-        self._bus.publish(event)
+        self.emit(event)
 
     def heartbeat(self, node_id: str, payload: dict[str, Any] | None = None) -> None:
         node = self._nodes.get(node_id)
@@ -273,15 +686,22 @@ class MeshCoordinator:
             timestamp=_now_iso(),
             payload=payload or {},
         )
-        self._bus.publish(event)
+        self.emit(event)
 
     # -- event emission helpers -----------------------------------------------
 
     def emit(self, event: MeshEvent) -> None:
+        if self._event_log is not None:
+            try:
+                self._event_log.append(event)
+            except OSError as exc:
+                # A full disk must not stop in-process delivery; count it instead.
+                self._event_log_errors += 1
+                self._event_log_last_error = f"{type(exc).__name__}: {exc}"[:200]
         self._bus.publish(event)
 
     def emit_task_claimed(self, node_id: str, task_id: str) -> None:
-        self._bus.publish(MeshEvent(
+        self.emit(MeshEvent(
             event_type=EventType.TASK_CLAIMED,
             source_node=node_id,
             timestamp=_now_iso(),
@@ -289,7 +709,7 @@ class MeshCoordinator:
         ))
 
     def emit_task_completed(self, node_id: str, task_id: str, summary: str = "") -> None:
-        self._bus.publish(MeshEvent(
+        self.emit(MeshEvent(
             event_type=EventType.TASK_COMPLETED,
             source_node=node_id,
             timestamp=_now_iso(),
@@ -297,7 +717,7 @@ class MeshCoordinator:
         ))
 
     def emit_task_failed(self, node_id: str, task_id: str, error: str = "") -> None:
-        self._bus.publish(MeshEvent(
+        self.emit(MeshEvent(
             event_type=EventType.TASK_FAILED,
             source_node=node_id,
             timestamp=_now_iso(),
@@ -321,8 +741,12 @@ class MeshCoordinator:
             "active_nodes": len(active),
             "stale_nodes": len(stale),
             "nodes": {nid: n.to_dict() for nid, n in self._nodes.items()},
-            "event_history_size": len(self._bus.history),
-            "ledger_entries": len(self._ledger.read()),
+            "event_history_size": self._bus.history_size,
+            "last_event_sequence": self._bus.last_sequence,
+            "event_counts": self._bus.event_counts(),
+            "ledger_entries": self._ledger.count(),
+            "event_log_errors": self._event_log_errors,
+            "event_log_last_error": self._event_log_last_error,
         }
 
     # -- internal handlers ----------------------------------------------------
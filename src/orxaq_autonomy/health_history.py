@@ -0,0 +1,258 @@
+"""Append-only health time series in fixed-size ring-buffer files.
+
+``health.json``, ``collaboration_health.json`` and ``swarm_health.json`` are
+rewritten on every check, so their history used to be lost.  Writers now
+also record their headline numbers here, one file per metric
+(``<metric>.ring``), each holding three rings of fixed-size records:
+
+- ``raw``: every recorded sample;
+- ``minute`` / ``hour``: buckets (min, max, sum, count) updated in place as
+  samples arrive, so downsampling costs nothing extra and long ranges stay
+  cheap to read.
+
+A ring overwrites its oldest record when full; the file never grows past its
+initial size.  Records are time-ordered, so a range query reads one ring and
+bisects it.
+
+- ``HealthHistory``: ``record`` / ``record_many`` / ``query`` / ``metrics``.
+- ``record_health_history``: best-effort recording for the health writers.
+- ``RESOLUTIONS``: bucket width in seconds per ring.
+
+Zero external dependencies -- uses only Python stdlib.
+"""
+
+from __future__ import annotations
+
+import bisect
+import contextlib
+import os
+import re
+import struct
+import time
+from pathlib import Path
+from typing import Any, Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+
+RESOLUTIONS = {"raw": 0, "minute": 60, "hour": 3600}
+DEFAULT_CAPACITY = {"raw": 4096, "minute": 1440, "hour": 24 * 90}
+HISTORY_DIRNAME = "health_history"
+
+_MAGIC = b"OXTS"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHH")
+_RING_HEADER = struct.Struct("<III")  # capacity, next write slot, stored records
+# bucket start (epoch seconds), min, max, sum, count
+_RECORD = struct.Struct("<ddddQ")
+_METRIC_NAME = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+def metric_filename(metric: str) -> str:
+    name = _METRIC_NAME.sub("_", metric.strip()).strip("._")
+    if not name:
+        raise ValueError(f"invalid metric name: {metric!r}")
+    return f"{name}.ring"
+
+
+class _RingFile:
+    """The three rings of one metric file, addressed by resolution name."""
+
+    def __init__(self, handle: Any) -> None:
+        self.handle = handle
+        handle.seek(0)
+        magic, version, rings = _HEADER.unpack(handle.read(_HEADER.size))
+        if magic != _MAGIC or version != _VERSION or rings != len(RESOLUTIONS):
+            raise ValueError("not a health history file")
+        self.rings: dict[str, list[int]] = {}
+        offset = _HEADER.size + _RING_HEADER.size * len(RESOLUTIONS)
+        for index, name in enumerate(RESOLUTIONS):
+            handle.seek(_HEADER.size + _RING_HEADER.size * index)
+            capacity, head, count = _RING_HEADER.unpack(handle.read(_RING_HEADER.size))
+            self.rings[name] = [capacity, head, count, offset]
+            offset += capacity * _RECORD.size
+
+    @staticmethod
+    def create(path: Path, capacity: dict[str, int]) -> None:
+        header = _HEADER.pack(_MAGIC, _VERSION, len(RESOLUTIONS))
+        header += b"".join(_RING_HEADER.pack(max(1, int(capacity[name])), 0, 0) for name in RESOLUTIONS)
+        size = len(header) + sum(max(1, int(capacity[name])) for name in RESOLUTIONS) * _RECORD.size
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as handle:
+            handle.write(header)
+            handle.truncate(size)
+        try:
+            # Never clobber a file another writer created first.
+            os.link(tmp, path)
+        except FileExistsError:
+            pass
+        finally:
+            tmp.unlink()
+
+    def _slot_offset(self, name: str, slot: int) -> int:
+        capacity, _, _, base = self.rings[name]
+        return base + (slot % capacity) * _RECORD.size
+
+    def _store_header(self, name: str) -> None:
+        capacity, head, count, _ = self.rings[name]
+        self.handle.seek(_HEADER.size + _RING_HEADER.size * list(RESOLUTIONS).index(name))
+        self.handle.write(_RING_HEADER.pack(capacity, head, count))
+
+    def first(self, name: str) -> tuple[float, float, float, float, int] | None:
+        capacity, head, count, _ = self.rings[name]
+        if not count:
+            return None
+        self.handle.seek(self._slot_offset(name, head if count == capacity else 0))
+        return _RECORD.unpack(self.handle.read(_RECORD.size))
+
+    def last(self, name: str) -> tuple[float, float, float, float, int] | None:
+        capacity, head, count, _ = self.rings[name]
+        if not count:
+            return None
+        self.handle.seek(self._slot_offset(name, head - 1 + capacity))
+        return _RECORD.unpack(self.handle.read(_RECORD.size))
+
+    def append(self, name: str, record: tuple[float, float, float, float, int]) -> None:
+        capacity, head, count, _ = self.rings[name]
+        self.handle.seek(self._slot_offset(name, head))
+        self.handle.write(_RECORD.pack(*record))
+        self.rings[name][1] = (head + 1) % capacity
+        self.rings[name][2] = min(capacity, count + 1)
+        self._store_header(name)
+
+    def replace_last(self, name: str, record: tuple[float, float, float, float, int]) -> None:
+        capacity, head, _, _ = self.rings[name]
+        self.handle.seek(self._slot_offset(name, head - 1 + capacity))
+        self.handle.write(_RECORD.pack(*record))
+
+    def records(self, name: str) -> list[tuple[float, float, float, float, int]]:
+        """Every stored record of ring *name*, oldest first, from one read."""
+        capacity, head, count, base = self.rings[name]
+        self.handle.seek(base)
+        raw = self.handle.read(capacity * _RECORD.size)
+        rows = list(_RECORD.iter_unpack(raw))
+        if count < capacity:
+            return rows[:count]
+        return rows[head:] + rows[:head]
+
+
+class HealthHistory:
+    """Per-metric ring-buffer files under one directory."""
+
+    def __init__(self, directory: Path, *, capacity: dict[str, int] | None = None) -> None:
+        self.directory = directory
+        self.capacity = {**DEFAULT_CAPACITY, **(capacity or {})}
+
+    def path_for(self, metric: str) -> Path:
+        return self.directory / metric_filename(metric)
+
+    @contextlib.contextmanager
+    def _open(self, metric: str, *, write: bool) -> Iterator[_RingFile | None]:
+        path = self.path_for(metric)
+        if write and not path.exists():
+            self.directory.mkdir(parents=True, exist_ok=True)
+            _RingFile.create(path, self.capacity)
+        try:
+            handle = open(path, "r+b" if write else "rb")
+        except FileNotFoundError:
+            yield None
+            return
+        with handle:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX if write else fcntl.LOCK_SH)
+            yield _RingFile(handle)
+
+    def record(self, metric: str, value: float, *, timestamp: float | None = None) -> None:
+        """Append one sample and fold it into its minute and hour buckets."""
+        self.record_many({metric: value}, timestamp=timestamp)
+
+    def record_many(self, values: dict[str, float], *, timestamp: float | None = None) -> None:
+        ts = time.time() if timestamp is None else float(timestamp)
+        for metric, raw_value in values.items():
+            try:
+                value = float(raw_value)
+            except (TypeError, ValueError):
+                continue
+            with self._open(metric, write=True) as ring:
+                assert ring is not None
+                ring.append("raw", (ts, value, value, value, 1))
+                for name, width in RESOLUTIONS.items():
+                    if not width:
+                        continue
+                    start = ts - ts % width
+                    last = ring.last(name)
+                    if last is not None and last[0] == start:
+                        _, low, high, total, count = last
+                        ring.replace_last(name, (start, min(low, value), max(high, value), total + value, count + 1))
+                    elif last is None or start > last[0]:
+                        ring.append(name, (start, value, value, value, 1))
+                    # A sample older than the open bucket only lands in the raw ring.
+
+    def metrics(self) -> list[str]:
+        try:
+            return sorted(path.name[: -len(".ring")] for path in self.directory.glob("*.ring"))
+        except OSError:
+            return []
+
+    def query(
+        self,
+        metric: str,
+        *,
+        start: float | None = None,
+        end: float | None = None,
+        resolution: str = "auto",
+    ) -> dict[str, Any]:
+        """Records in ``[start, end]`` as ``[t, min, max, avg, count]`` rows.
+
+        ``auto`` picks the finest ring that still reaches back to *start*
+        (defaulting to the last hour); a ring that has not wrapped yet holds
+        the whole history, so it always qualifies.
+        """
+        now = time.time()
+        end = now if end is None else float(end)
+        start = end - 3600 if start is None else float(start)
+        if resolution != "auto" and resolution not in RESOLUTIONS:
+            raise ValueError(f"unknown resolution: {resolution}")
+        result: dict[str, Any] = {
+            "metric": metric,
+            "resolution": resolution,
+            "start": start,
+            "end": end,
+            "fields": ["t", "min", "max", "avg", "count"],
+            "points": [],
+        }
+        with self._open(metric, write=False) as ring:
+            if ring is None:
+                return result
+            if resolution == "auto":
+                resolution = "hour"
+                for name in RESOLUTIONS:
+                    capacity, _, count, _ = ring.rings[name]
+                    oldest = ring.first(name)
+                    if oldest is not None and (count < capacity or oldest[0] <= start):
+                        resolution = name
+                        break
+            rows = ring.records(resolution)
+        width = RESOLUTIONS[resolution]
+        starts = [row[0] for row in rows]
+        # A bucket that began before *start* still overlaps the range.
+        lo = bisect.bisect_right(starts, start - width) if width else bisect.bisect_left(starts, start)
+        hi = bisect.bisect_right(starts, end)
+        result["resolution"] = resolution
+        result["points"] = [
+            [row[0], row[1], row[2], round(row[3] / row[4], 6) if row[4] else 0.0, row[4]] for row in rows[lo:hi]
+        ]
+        return result
+
+
+def record_health_history(directory: Path, values: dict[str, Any], *, timestamp: float | None = None) -> None:
+    """Best-effort ``record_many`` for health writers: history never fails a check."""
+    try:
+        HealthHistory(directory).record_many(
+            {key: value for key, value in values.items() if isinstance(value, (int, float))}, timestamp=timestamp
+        )
+    except (OSError, ValueError):
+        pass
@@ -17,6 +17,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from .health_history import HISTORY_DIRNAME, record_health_history
 
 # ---------------------------------------------------------------------------
 # Signal classification
@@ -412,6 +413,10 @@ class CollaborationHealthMonitor:
             json.dumps(status.to_dict(), indent=2, sort_keys=True) + "\n",
             encoding="utf-8",
         )
+        record_health_history(
+            self._output_dir / HISTORY_DIRNAME,
+            {"collaboration.score": status.score, "collaboration.diagnoses": len(status.diagnoses)},
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -423,8 +428,13 @@ def dashboard_health_status(
     state_file: Path,
     heartbeat_age_sec: int = -1,
     budget: dict[str, Any] | None = None,
+    output_dir: Path | None = None,
 ) -> dict[str, Any]:
-    """Produce a health status payload suitable for dashboard display."""
+    """Produce a health status payload suitable for dashboard display.
+
+    With *output_dir* the status is also written there and its score is
+    appended to the health history under ``output_dir / HISTORY_DIRNAME``.
+    """
     state: dict[str, Any] = {}
     if state_file.exists():
         try:
@@ -434,6 +444,6 @@ def dashboard_health_status(
         except Exception:
             pass
 
-    monitor = CollaborationHealthMonitor()
+    monitor = CollaborationHealthMonitor(output_dir=output_dir)
     status = monitor.check(state=state, heartbeat_age_sec=heartbeat_age_sec, budget=budget)
     return status.to_dict()
@@ -0,0 +1,102 @@
+"""Per-module import cost of ``orxaq-autonomy`` subcommands.
+
+Runs a subcommand in a fresh interpreter under ``python -X importtime`` and
+turns the timing lines written to stderr into a report:
+
+- ``parse_importtime``: parse ``-X importtime`` stderr into per-module rows.
+- ``profile_cli_imports``: run ``orxaq_autonomy.cli`` with the given
+  arguments and summarize the import cost of what it loaded.
+
+Zero external dependencies -- uses only Python stdlib.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+
+_IMPORTTIME_PREFIX = "import time:"
+PACKAGE_NAME = "orxaq_autonomy"
+
+
+def parse_importtime(stderr: str) -> list[dict[str, Any]]:
+    """Return ``{"module", "self_us", "cumulative_us", "depth"}`` rows in import order."""
+    rows: list[dict[str, Any]] = []
+    for line in stderr.splitlines():
+        if not line.startswith(_IMPORTTIME_PREFIX):
+            continue
+        parts = line[len(_IMPORTTIME_PREFIX) :].split("|", 2)
+        if len(parts) != 3:
+            continue
+        try:
+            self_us = int(parts[0].strip())
+            cumulative_us = int(parts[1].strip())
+        except ValueError:
+            continue  # the column header line
+        raw_name = parts[2].rstrip()
+        name = raw_name.lstrip()
+        rows.append(
+            {
+                "module": name,
+                "self_us": self_us,
+                "cumulative_us": cumulative_us,
+                # importtime indents nested imports by two spaces per level.
+                "depth": (len(raw_name) - len(name) - 1) // 2,
+            }
+        )
+    return rows
+
+
+def _package_pythonpath(env: dict[str, str]) -> str:
+    src = str(Path(__file__).resolve().parents[1])
+    existing = env.get("PYTHONPATH", "")
+    return src if not existing else os.pathsep.join([src, existing])
+
+
+def profile_cli_imports(
+    argv: list[str],
+    *,
+    python: str = sys.executable,
+    cwd: Path | None = None,
+    env: dict[str, str] | None = None,
+    top: int = 20,
+    timeout_sec: int = 120,
+) -> dict[str, Any]:
+    """Run ``orxaq_autonomy.cli <argv>`` under ``-X importtime`` and summarize its imports."""
+    run_env = dict(os.environ if env is None else env)
+    run_env["PYTHONPATH"] = _package_pythonpath(run_env)
+    command = [python, "-X", "importtime", "-m", f"{PACKAGE_NAME}.cli", *argv]
+    result = subprocess.run(
+        command,
+        cwd=str(cwd) if cwd else None,
+        env=run_env,
+        capture_output=True,
+        text=True,
+        timeout=timeout_sec,
+        check=False,
+    )
+    rows = parse_importtime(result.stderr)
+    total_us = sum(row["cumulative_us"] for row in rows if row["depth"] == 0)
+    package_rows = [row for row in rows if row["module"].split(".")[0] == PACKAGE_NAME]
+    top_rows = sorted(rows, key=lambda row: row["self_us"], reverse=True)[: max(0, top)]
+    return {
+        "argv": list(argv),
+        "returncode": result.returncode,
+        "module_count": len(rows),
+        "modules": [row["module"] for row in rows],
+        "package_modules": [row["module"] for row in package_rows],
+        "total_ms": round(total_us / 1000.0, 3),
+        "package_self_ms": round(sum(row["self_us"] for row in package_rows) / 1000.0, 3),
+        "top_modules": [
+            {
+                "module": row["module"],
+                "self_ms": round(row["self_us"] / 1000.0, 3),
+                "cumulative_ms": round(row["cumulative_us"] / 1000.0, 3),
+            }
+            for row in top_rows
+        ],
+    }
@@ -0,0 +1,336 @@
+"""Rotated, indexed autonomy logs.
+
+The supervisor and every runner append to one log file through inherited file
+descriptors, so rotation has to be copy-then-truncate: the active file keeps
+its inode and ``O_APPEND`` writers simply continue at the new end.
+
+- ``rotate_log`` / ``maybe_rotate``: gzip the active log into a timestamped
+  segment (``runner.log.<UTC stamp>.gz``), truncate it and prune old segments.
+- ``LogIndex``: sparse line-offset sidecar (``runner.log.idx``) recording the
+  byte offset of every ``stride``-th line (or, with ``persist=False``, the
+  same index held in memory only).  It is refreshed incrementally from
+  the last scanned offset, so reading line N or the last N lines costs one
+  seek plus at most ``stride`` skipped lines.
+- ``search_logs``: substring/regex search across rotated segments and the
+  active log.
+
+Zero external dependencies -- uses only Python stdlib.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import re
+import time
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+
+DEFAULT_INDEX_STRIDE = 256
+_SCAN_CHUNK_BYTES = 1 << 20
+_HEAD_PROBE_BYTES = 64
+
+
+def index_path_for(log_path: Path) -> Path:
+    return log_path.with_name(log_path.name + ".idx")
+
+
+def list_segments(log_path: Path) -> list[Path]:
+    """Rotated segments for *log_path*, oldest first."""
+    try:
+        return sorted(log_path.parent.glob(f"{log_path.name}.*.gz"))
+    except OSError:
+        return []
+
+
+def _read_head(handle: Any) -> str:
+    handle.seek(0)
+    return handle.read(_HEAD_PROBE_BYTES).hex()
+
+
+class LogIndex:
+    """Incrementally maintained sparse line index for one append-only log file."""
+
+    def __init__(
+        self,
+        log_path: Path,
+        *,
+        stride: int = DEFAULT_INDEX_STRIDE,
+        index_path: Path | None = None,
+        persist: bool = True,
+    ) -> None:
+        self.log_path = log_path
+        self.stride = max(1, int(stride))
+        self.index_path = index_path or index_path_for(log_path)
+        # A non-persistent index lives only in this object (read-only viewers).
+        self.persist = persist
+        self._data: dict[str, Any] = {}
+        self._partial_tail = False
+
+    def _empty(self, inode: int, head: str) -> dict[str, Any]:
+        return {
+            "version": 1,
+            "stride": self.stride,
+            "inode": inode,
+            "head": head,
+            "started_at": time.time(),
+            "scanned_offset": 0,
+            "lines": 0,
+            "offsets": [0],
+        }
+
+    def _load(self) -> dict[str, Any]:
+        if not self.persist:
+            return self._data
+        try:
+            payload = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+        return payload if isinstance(payload, dict) else {}
+
+    def _save(self, data: dict[str, Any]) -> None:
+        if not self.persist:
+            return
+        tmp = self.index_path.with_name(f".{self.index_path.name}.{os.getpid()}.tmp")
+        try:
+            tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, self.index_path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+
+    def refresh(self) -> dict[str, Any]:
+        """Scan bytes appended since the last refresh; rebuild after rotation or truncation."""
+        try:
+            handle = self.log_path.open("rb")
+        except OSError:
+            self._data = self._empty(0, "")
+            self._partial_tail = False
+            return self._data
+        with handle:
+            stat = os.fstat(handle.fileno())
+            head = _read_head(handle) if stat.st_size else ""
+            data = self._load()
+            scanned = int(data.get("scanned_offset", 0) or 0)
+            reusable = (
+                data.get("version") == 1
+                and data.get("stride") == self.stride
+                and data.get("inode") == stat.st_ino
+                and scanned <= stat.st_size
+                # A truncated-and-regrown file starts with different bytes.
+                and head.startswith(str(data.get("head", "")))
+            )
+            if not reusable:
+                data = self._empty(stat.st_ino, head)
+                scanned = 0
+            changed = not reusable or data["head"] != head
+            data["head"] = head
+
+            lines = int(data["lines"])
+            offsets: list[int] = data["offsets"]
+            handle.seek(scanned)
+            position = scanned
+            while position < stat.st_size:
+                chunk = handle.read(min(_SCAN_CHUNK_BYTES, stat.st_size - position))
+                if not chunk:
+                    break
+                start = 0
+                while True:
+                    newline = chunk.find(b"\n", start)
+                    if newline < 0:
+                        break
+                    lines += 1
+                    scanned = position + newline + 1
+                    if lines % self.stride == 0:
+                        offsets.append(scanned)
+                    start = newline + 1
+                position += len(chunk)
+            if scanned != data["scanned_offset"]:
+                changed = True
+            data["lines"] = lines
+            data["scanned_offset"] = scanned
+            self._partial_tail = stat.st_size > scanned
+        if changed:
+            self._save(data)
+        self._data = data
+        return data
+
+    def line_count(self) -> int:
+        """Lines in the active log, counting an unterminated last line."""
+        data = self.refresh()
+        return int(data["lines"]) + (1 if self._partial_tail else 0)
+
+    def read_lines(self, start: int, count: int) -> list[str]:
+        """Return up to *count* lines starting at zero-based line *start*."""
+        total = self.line_count()
+        if count <= 0 or start >= total:
+            return []
+        start = max(0, start)
+        offsets: list[int] = self._data["offsets"]
+        checkpoint = min(start // self.stride, len(offsets) - 1)
+        out: list[str] = []
+        try:
+            with self.log_path.open("rb") as handle:
+                handle.seek(offsets[checkpoint])
+                for _ in range(start - checkpoint * self.stride):
+                    if not handle.readline():
+                        return []
+                while len(out) < count:
+                    raw = handle.readline()
+                    if not raw:
+                        break
+                    out.append(raw.decode("utf-8", errors="replace").rstrip("\r\n"))
+        except OSError:
+            return []
+        return out
+
+    def tail(self, count: int) -> list[str]:
+        if count <= 0:
+            return []
+        total = self.line_count()
+        return self.read_lines(max(0, total - count), count)
+
+    def started_at(self) -> float:
+        return float(self.refresh().get("started_at", time.time()))
+
+
+def _prune_segments(log_path: Path, keep_segments: int) -> list[Path]:
+    segments = list_segments(log_path)
+    excess = segments[: max(0, len(segments) - max(0, keep_segments))]
+    for segment in excess:
+        segment.unlink(missing_ok=True)
+    return excess
+
+
+def _append_bytes(log_path: Path, data: bytes) -> None:
+    fd = os.open(log_path, os.O_WRONLY | os.O_APPEND)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def _log_started_at(log_path: Path) -> float:
+    """When the active log generation began, from its sidecar without rescanning it.
+
+    Only a missing or outdated sidecar (a new log, or one rotated or
+    truncated since) is rebuilt, once per generation.
+    """
+    index = LogIndex(log_path)
+    data = index._load()
+    try:
+        stat = log_path.stat()
+    except OSError:
+        return time.time()
+    started = data.get("started_at")
+    if (
+        data.get("inode") == stat.st_ino
+        and isinstance(started, (int, float))
+        and int(data.get("scanned_offset", 0) or 0) <= stat.st_size
+    ):
+        return float(started)
+    return index.started_at()
+
+
+def rotate_log(log_path: Path, *, keep_segments: int = 5) -> Path | None:
+    """Gzip the active log into a new segment and truncate it in place (copytruncate).
+
+    Bytes appended while the segment is written are copied too and put back
+    with ``O_APPEND``, after anything writers appended since the truncate;
+    only a write racing the final read and the truncate can be lost.
+    """
+    try:
+        source = log_path.open("r+b")
+    except OSError:
+        return None
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+    segment = log_path.with_name(f"{log_path.name}.{stamp}.gz")
+    tmp = segment.with_name(f".{segment.name}.tmp")
+    with source:
+        copied = 0
+        with gzip.open(tmp, "wb") as out:
+            while True:
+                chunk = source.read(_SCAN_CHUNK_BYTES)
+                if chunk:
+                    out.write(chunk)
+                    copied += len(chunk)
+                    continue
+                if os.fstat(source.fileno()).st_size <= copied:
+                    break
+        if copied == 0:
+            tmp.unlink(missing_ok=True)
+            return None
+        os.replace(tmp, segment)
+        source.seek(copied)
+        late = source.read()
+        source.truncate(0)
+    if late:
+        _append_bytes(log_path, late)
+    index_path_for(log_path).unlink(missing_ok=True)
+    _prune_segments(log_path, keep_segments)
+    return segment
+
+
+def maybe_rotate(
+    log_path: Path,
+    *,
+    max_bytes: int = 0,
+    max_age_sec: int = 0,
+    keep_segments: int = 5,
+    now: float | None = None,
+) -> Path | None:
+    """Rotate when the active log reaches *max_bytes* or its segment is older than *max_age_sec*."""
+    try:
+        size = log_path.stat().st_size
+    except OSError:
+        return None
+    if size == 0:
+        return None
+    due = max_bytes > 0 and size >= max_bytes
+    if not due and max_age_sec > 0:
+        started = _log_started_at(log_path)
+        due = ((now if now is not None else time.time()) - started) >= max_age_sec
+    if not due:
+        return None
+    return rotate_log(log_path, keep_segments=keep_segments)
+
+
+def search_logs(
+    log_path: Path,
+    pattern: str,
+    *,
+    regex: bool = False,
+    ignore_case: bool = False,
+    max_results: int = 200,
+) -> list[dict[str, Any]]:
+    """Most recent *max_results* matching lines across segments (oldest first) and the active log."""
+    flags = re.IGNORECASE if ignore_case else 0
+    if regex:
+        compiled = re.compile(pattern, flags)
+        matches = compiled.search
+    elif ignore_case:
+        needle = pattern.lower()
+        matches = lambda text: needle in text.lower()  # noqa: E731
+    else:
+        matches = lambda text: pattern in text  # noqa: E731
+    found: deque[dict[str, Any]] = deque(maxlen=max(1, max_results))
+    for source in [*list_segments(log_path), log_path]:
+        try:
+            if source.suffix == ".gz":
+                handle = gzip.open(source, "rt", encoding="utf-8", errors="replace")
+            else:
+                handle = source.open("r", encoding="utf-8", errors="replace")
+        except OSError:
+            continue
+        try:
+            with handle:
+                for line_no, line in enumerate(handle, start=1):
+                    text = line.rstrip("\r\n")
+                    if matches(text):
+                        found.append({"file": source.name, "line": line_no, "text": text})
+        except (OSError, EOFError):
+            continue
+    return list(found)
@@ -5,15 +5,22 @@ from __future__ import annotations
 import datetime as dt
 import json
 import os
+import queue
 import re
+import select
 import shutil
 import signal
 import subprocess
 import sys
+import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+
+from .control_socket import ControlServer, query_control_socket
+from .health_history import HISTORY_DIRNAME, record_health_history
+from .log_segments import LogIndex, maybe_rotate
 
 
 def _now_utc() -> dt.datetime:
@@ -472,6 +479,7 @@ class ManagerConfig:
     checkpoint_dir: Path
     runner_pid_file: Path
     supervisor_pid_file: Path
+    standby_pid_file: Path
     log_file: Path
     run_id: str
     resume_run_id: str
@@ -482,6 +490,8 @@ class ManagerConfig:
     retry_backoff_max_sec: int
     git_lock_stale_sec: int
     validation_retries: int
+    batch_max_tasks: int
+    worktree_pool_size: int
     idle_sleep_sec: int
     agent_timeout_sec: int
     validate_timeout_sec: int
@@ -495,9 +505,20 @@ class ManagerConfig:
     supervisor_restart_delay_sec: int
     supervisor_max_backoff_sec: int
     supervisor_max_restarts: int
+    warm_standby: bool
+    control_socket: bool
+    log_max_bytes: int
+    log_max_age_sec: int
+    log_keep_segments: int
+    preflight_deadline_sec: int
+    preflight_cache_sec: int
     validate_commands: list[str]
     skill_protocol_file: Path
     mcp_context_file: Path | None
+    runner_lanes: tuple[str, ...] = ()
+    runner_workers: int = 1
+    worker_id: str = ""
+    worker_owners: tuple[str, ...] = ()
 
     @classmethod
     def from_root(cls, root: Path, env_file_override: Path | None = None) -> "ManagerConfig":
@@ -529,6 +550,12 @@ class ManagerConfig:
             except ValueError:
                 return default
 
+        def _bool(key: str, default: bool) -> bool:
+            raw = merged.get(key)
+            if raw is None:
+                return default
+            return raw.strip().lower() in {"1", "true", "yes", "on"}
+
         artifacts = _path("ORXAQ_AUTONOMY_ARTIFACTS_DIR", root / "artifacts" / "autonomy")
         skill_protocol = _path("ORXAQ_AUTONOMY_SKILL_PROTOCOL_FILE", root / "config" / "skill_protocol.json")
         mcp_context_raw = merged.get("ORXAQ_AUTONOMY_MCP_CONTEXT_FILE", "").strip()
@@ -536,6 +563,8 @@ class ManagerConfig:
 
         validate_raw = merged.get("ORXAQ_AUTONOMY_VALIDATE_COMMANDS", "make lint;make test")
         validate_commands = [chunk.strip() for chunk in validate_raw.split(";") if chunk.strip()]
+        lanes_raw = merged.get("ORXAQ_AUTONOMY_RUNNER_LANES", "")
+        runner_lanes = tuple(dict.fromkeys(chunk.strip() for chunk in lanes_raw.split(",") if chunk.strip()))
 
         return cls(
             root_dir=root,
@@ -552,6 +581,7 @@ class ManagerConfig:
             checkpoint_dir=_path("ORXAQ_AUTONOMY_CHECKPOINT_DIR", root / "artifacts" / "checkpoints"),
             runner_pid_file=_path("ORXAQ_AUTONOMY_RUNNER_PID_FILE", artifacts / "runner.pid"),
             supervisor_pid_file=_path("ORXAQ_AUTONOMY_SUPERVISOR_PID_FILE", artifacts / "supervisor.pid"),
+            standby_pid_file=_path("ORXAQ_AUTONOMY_STANDBY_PID_FILE", artifacts / "standby.pid"),
             log_file=_path("ORXAQ_AUTONOMY_LOG_FILE", artifacts / "runner.log"),
             run_id=merged.get("ORXAQ_AUTONOMY_RUN_ID", "").strip(),
             resume_run_id=merged.get("ORXAQ_AUTONOMY_RESUME_RUN_ID", "").strip(),
@@ -562,6 +592,8 @@ class ManagerConfig:
             retry_backoff_max_sec=_int("ORXAQ_AUTONOMY_RETRY_BACKOFF_MAX_SEC", 1800),
             git_lock_stale_sec=_int("ORXAQ_AUTONOMY_GIT_LOCK_STALE_SEC", 300),
             validation_retries=_int("ORXAQ_AUTONOMY_VALIDATION_RETRIES", 1),
+            batch_max_tasks=_int("ORXAQ_AUTONOMY_BATCH_MAX_TASKS", 1),
+            worktree_pool_size=_int("ORXAQ_AUTONOMY_WORKTREE_POOL_SIZE", 0),
             idle_sleep_sec=_int("ORXAQ_AUTONOMY_IDLE_SLEEP_SEC", 10),
             agent_timeout_sec=_int("ORXAQ_AUTONOMY_AGENT_TIMEOUT_SEC", 3600),
             validate_timeout_sec=_int("ORXAQ_AUTONOMY_VALIDATE_TIMEOUT_SEC", 1800),
@@ -575,23 +607,210 @@ class ManagerConfig:
             supervisor_restart_delay_sec=_int("ORXAQ_AUTONOMY_SUPERVISOR_RESTART_DELAY_SEC", 5),
             supervisor_max_backoff_sec=_int("ORXAQ_AUTONOMY_SUPERVISOR_MAX_BACKOFF_SEC", 300),
             supervisor_max_restarts=_int("ORXAQ_AUTONOMY_SUPERVISOR_MAX_RESTARTS", 0),
+            warm_standby=_bool("ORXAQ_AUTONOMY_WARM_STANDBY", False),
+            control_socket=_bool("ORXAQ_AUTONOMY_CONTROL_SOCKET", True),
+            log_max_bytes=max(0, _int("ORXAQ_AUTONOMY_LOG_MAX_BYTES", 20 * 1024 * 1024)),
+            log_max_age_sec=max(0, _int("ORXAQ_AUTONOMY_LOG_MAX_AGE_SEC", 0)),
+            log_keep_segments=max(0, _int("ORXAQ_AUTONOMY_LOG_KEEP_SEGMENTS", 5)),
+            preflight_deadline_sec=max(1, _int("ORXAQ_AUTONOMY_PREFLIGHT_DEADLINE_SEC", 30)),
+            preflight_cache_sec=max(0, _int("ORXAQ_AUTONOMY_PREFLIGHT_CACHE_SEC", 30)),
             validate_commands=validate_commands,
             skill_protocol_file=skill_protocol,
             mcp_context_file=mcp_context,
+            runner_lanes=runner_lanes,
+            runner_workers=max(1, _int("ORXAQ_AUTONOMY_RUNNER_WORKERS", 1)),
         )
 
 
-def ensure_runtime(config: ManagerConfig) -> None:
+def _worker_config(config: ManagerConfig, name: str, owners: tuple[str, ...]) -> ManagerConfig:
+    base = config.artifacts_dir / "workers" / name
+    return replace(
+        config,
+        worker_id=name,
+        worker_owners=owners,
+        heartbeat_file=base / "heartbeat.json",
+        lock_file=base / "runner.lock",
+        runner_pid_file=base / "runner.pid",
+        standby_pid_file=base / "standby.pid",
+        budget_report_file=base / "budget.json",
+    )
+
+
+def worker_configs(config: ManagerConfig) -> list[ManagerConfig]:
+    """Per-worker views of *config*, each with its own pid, heartbeat, lock and budget files.
+
+    ``ORXAQ_AUTONOMY_RUNNER_LANES`` yields one worker per owner lane; otherwise
+    ``ORXAQ_AUTONOMY_RUNNER_WORKERS`` > 1 yields that many generic workers.  With
+    neither set the single legacy runner (using the top-level files) is returned.
+    """
+    if config.worker_id:
+        return [config]
+    if config.runner_lanes:
+        return [_worker_config(config, lane, (lane,)) for lane in config.runner_lanes]
+    if config.runner_workers > 1:
+        return [_worker_config(config, f"w{index}", ()) for index in range(1, config.runner_workers + 1)]
+    return [config]
+
+
+def runner_socket_file(config: ManagerConfig) -> Path:
+    return config.runner_pid_file.with_suffix(".sock")
+
+
+def supervisor_socket_file(config: ManagerConfig) -> Path:
+    return config.supervisor_pid_file.with_suffix(".sock")
+
+
+def worker_config(config: ManagerConfig, name: str) -> ManagerConfig:
+    for worker in worker_configs(config):
+        if worker.worker_id == name:
+            return worker
+    raise ValueError(f"Unknown runner worker: {name}")
+
+
+@dataclass(frozen=True)
+class _PreflightCheck:
+    """One independent preflight check.
+
+    ``run`` returns ``(ok, message)``.  Checks with a ``cache_key`` reuse a
+    successful result for ``preflight_cache_sec`` while ``fingerprint()``
+    (evaluated after the check ran) still returns the same value; a ``None``
+    fingerprint disables caching for that run.
+    """
+
+    name: str
+    run: Callable[[], tuple[bool, str]]
+    cache_key: str = ""
+    fingerprint: Callable[[], Any] | None = None
+
+
+_PREFLIGHT_CACHE_LOCK = threading.Lock()
+
+
+def _preflight_cache_file(config: ManagerConfig) -> Path:
+    return config.artifacts_dir / "preflight_cache.json"
+
+
+def _load_preflight_cache(config: ManagerConfig) -> dict[str, Any]:
+    try:
+        payload = json.loads(_preflight_cache_file(config).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def _store_preflight_cache(config: ManagerConfig, entries: dict[str, Any]) -> None:
+    path = _preflight_cache_file(config)
+    with _PREFLIGHT_CACHE_LOCK:
+        merged = {**_load_preflight_cache(config), **entries}
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(merged, sort_keys=True), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+
+
+def _require(predicate: Callable[[], bool], failure: str) -> Callable[[], tuple[bool, str]]:
+    return lambda: (True, "ok") if predicate() else (False, failure)
+
+
+def _run_preflight_checks(config: ManagerConfig, checks: list[_PreflightCheck]) -> list[dict[str, Any]]:
+    """Run *checks* concurrently, bounded by ``preflight_deadline_sec``; rows keep the input order.
+
+    Checks run on daemon threads so one still blocked at the deadline (e.g. a
+    hung ``codex login status``) is reported as failed without holding up
+    the caller or interpreter exit.
+    """
+    deadline = time.monotonic() + config.preflight_deadline_sec
+    cache = _load_preflight_cache(config) if config.preflight_cache_sec > 0 else {}
+    rows: dict[str, dict[str, Any]] = {}
+    results: queue.Queue[tuple[str, bool, str, float]] = queue.Queue()
+
+    def _execute(check: _PreflightCheck) -> None:
+        started = time.monotonic()
+        try:
+            ok, message = check.run()
+        except Exception as err:  # A crashing check fails preflight; it must not hang it.
+            ok, message = False, f"{check.name} failed: {err}"
+        results.put((check.name, bool(ok), str(message), time.monotonic() - started))
+
+    pending: dict[str, _PreflightCheck] = {}
+    for check in checks:
+        entry = cache.get(check.cache_key) if check.cache_key else None
+        if (
+            isinstance(entry, dict)
+            and check.fingerprint is not None
+            and time.time() - float(entry.get("checked_at", 0)) <= config.preflight_cache_sec
+            and entry.get("fingerprint") is not None
+            and entry.get("fingerprint") == check.fingerprint()
+        ):
+            rows[check.name] = {
+                "name": check.name,
+                "ok": True,
+                "message": str(entry.get("message", "ok")),
+                "latency_ms": 0.0,
+                "cached": True,
+            }
+            continue
+        pending[check.name] = check
+        threading.Thread(target=_execute, args=(check,), name=f"preflight-{check.name}", daemon=True).start()
+
+    fresh: dict[str, Any] = {}
+    while pending:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            name, ok, message, elapsed = results.get(timeout=remaining)
+        except queue.Empty:
+            break
+        check = pending.pop(name)
+        rows[name] = {"name": name, "ok": ok, "message": message, "latency_ms": round(elapsed * 1000.0, 1), "cached": False}
+        if ok and check.cache_key and check.fingerprint is not None and config.preflight_cache_sec > 0:
+            fingerprint = check.fingerprint()
+            if fingerprint is not None:
+                fresh[check.cache_key] = {"checked_at": time.time(), "fingerprint": fingerprint, "message": message}
+    for name in pending:
+        rows[name] = {
+            "name": name,
+            "ok": False,
+            "message": f"{name} timed out after {config.preflight_deadline_sec}s",
+            "latency_ms": round(config.preflight_deadline_sec * 1000.0, 1),
+            "cached": False,
+        }
+    if fresh:
+        _store_preflight_cache(config, fresh)
+    return [rows[check.name] for check in checks]
+
+
+def ensure_runtime(config: ManagerConfig) -> list[dict[str, Any]]:
+    """Verify agent CLIs and auth concurrently; raises ``RuntimeError`` on the first failing check in order."""
     config.artifacts_dir.mkdir(parents=True, exist_ok=True)
-    if shutil.which("codex") is None:
-        raise RuntimeError("codex CLI not found in PATH")
-    if shutil.which("gemini") is None:
-        raise RuntimeError("gemini CLI not found in PATH")
     env = _load_env_file(config.env_file)
-    if not _has_codex_auth(env):
-        raise RuntimeError("Codex auth missing. Configure OPENAI_API_KEY or run `codex login`.")
-    if not _has_gemini_auth(env):
-        raise RuntimeError("Gemini auth missing. Configure GEMINI_API_KEY or ~/.gemini/settings.json.")
+    checks = [
+        _PreflightCheck("codex_cli", _require(lambda: shutil.which("codex") is not None, "codex CLI not found in PATH")),
+        _PreflightCheck("gemini_cli", _require(lambda: shutil.which("gemini") is not None, "gemini CLI not found in PATH")),
+        _PreflightCheck(
+            "codex_auth",
+            _require(lambda: _has_codex_auth(env), "Codex auth missing. Configure OPENAI_API_KEY or run `codex login`."),
+            # `codex login status` is a subprocess; reuse a recent success for the same binary.
+            cache_key="codex_auth",
+            fingerprint=lambda: [shutil.which("codex") or "", bool(env.get("OPENAI_API_KEY"))],
+        ),
+        _PreflightCheck(
+            "gemini_auth",
+            _require(
+                lambda: _has_gemini_auth(env),
+                "Gemini auth missing. Configure GEMINI_API_KEY or ~/.gemini/settings.json.",
+            ),
+        ),
+    ]
+    rows = _run_preflight_checks(config, checks)
+    for row in rows:
+        if not row["ok"]:
+            raise RuntimeError(row["message"])
+    return rows
 
 
 def _repo_is_clean(repo: Path) -> tuple[bool, str]:
@@ -609,20 +828,48 @@ def _repo_is_clean(repo: Path) -> tuple[bool, str]:
 
 
 def preflight(config: ManagerConfig, *, require_clean: bool = True) -> dict[str, Any]:
-    ensure_runtime(config)
+    """Runtime and repo-cleanliness checks, run concurrently under one deadline.
+
+    ``checks`` lists the repo checks and ``runtime_checks`` the agent CLI/auth
+    checks, each with ``latency_ms`` and ``cached``.
+    """
+    started = time.monotonic()
+    runtime_rows: list[dict[str, Any]] = []
+
+    def _runtime() -> tuple[bool, str]:
+        try:
+            runtime_rows.extend(ensure_runtime(config) or [])
+        except RuntimeError as err:
+            return False, str(err)
+        return True, "ok"
+
+    checks = [_PreflightCheck("runtime", _runtime)]
+    repos = (config.impl_repo, config.test_repo) if require_clean else ()
+    # Never cached: editing a tracked file changes neither .git/index nor HEAD.
+    for repo in repos:
+        checks.append(_PreflightCheck(str(repo), lambda repo=repo: _repo_is_clean(repo)))
+    rows = _run_preflight_checks(config, checks)
+    runtime_row, repo_rows = rows[0], rows[1:]
+    if not runtime_row["ok"]:
+        raise RuntimeError(str(runtime_row["message"]))
     result: dict[str, Any] = {
         "runtime": "ok",
         "impl_repo": str(config.impl_repo),
         "test_repo": str(config.test_repo),
-        "clean": True,
-        "checks": [],
+        "clean": all(row["ok"] for row in repo_rows),
+        "checks": [
+            {
+                "repo": row["name"],
+                "ok": row["ok"],
+                "message": row["message"],
+                "latency_ms": row["latency_ms"],
+                "cached": row["cached"],
+            }
+            for row in repo_rows
+        ],
+        "runtime_checks": runtime_rows,
+        "elapsed_ms": round((time.monotonic() - started) * 1000.0, 1),
     }
-    if require_clean:
-        for repo in (config.impl_repo, config.test_repo):
-            ok, message = _repo_is_clean(repo)
-            result["checks"].append({"repo": str(repo), "ok": ok, "message": message})
-            if not ok:
-                result["clean"] = False
     return result
 
 
@@ -662,6 +909,10 @@ def runner_argv(config: ManagerConfig) -> list[str]:
         str(config.git_lock_stale_sec),
         "--validation-retries",
         str(config.validation_retries),
+        "--batch-max-tasks",
+        str(config.batch_max_tasks),
+        "--worktree-pool-size",
+        str(config.worktree_pool_size),
         "--idle-sleep-sec",
         str(config.idle_sleep_sec),
         "--agent-timeout-sec",
@@ -689,6 +940,12 @@ def runner_argv(config: ManagerConfig) -> list[str]:
         args.extend(["--resume", config.resume_run_id])
     for cmd in config.validate_commands:
         args.extend(["--validate-command", cmd])
+    if config.control_socket:
+        args.extend(["--control-socket", str(runner_socket_file(config))])
+    if config.worker_id:
+        args.extend(["--worker-id", config.worker_id])
+        if config.worker_owners:
+            args.extend(["--owner-lanes", ",".join(config.worker_owners)])
     return args
 
 
@@ -708,8 +965,7 @@ def _heartbeat_age_sec(config: ManagerConfig) -> int:
         return -1
 
 
-def run_foreground(config: ManagerConfig) -> int:
-    ensure_runtime(config)
+def _run_runner(config: ManagerConfig) -> int:
     from . import runner
 
     _write_pid(config.runner_pid_file, os.getpid())
@@ -719,59 +975,389 @@ def run_foreground(config: ManagerConfig) -> int:
         config.runner_pid_file.unlink(missing_ok=True)
 
 
-def supervise_foreground(config: ManagerConfig) -> int:
+def run_foreground(config: ManagerConfig) -> int:
     ensure_runtime(config)
-    _write_pid(config.supervisor_pid_file, os.getpid())
+    return _run_runner(config)
+
+
+STANDBY_PROMOTE_COMMAND = "promote"
+# A runner that dies sooner than this is treated as crash-looping: the standby is
+# still promoted, but only after the normal restart backoff.
+STANDBY_MIN_HEALTHY_UPTIME_SEC = 30
+
+
+def standby_foreground(config: ManagerConfig) -> int:
+    """Wait as a pre-imported, pre-flighted runner until the supervisor promotes us.
+
+    The supervisor writes ``promote`` to our stdin; EOF means the supervisor is
+    gone and the standby exits.  Task and state files are re-parsed only when
+    they change, so promotion starts the run loop from warm caches.
+    """
+    ensure_runtime(config)
+    from . import runner
+
+    _write_pid(config.standby_pid_file, os.getpid())
+    promoted = threading.Event()
+    released = threading.Event()
+
+    def _wait_for_command() -> None:
+        for line in sys.stdin:
+            if line.strip() == STANDBY_PROMOTE_COMMAND:
+                promoted.set()
+                return
+        released.set()
+
+    threading.Thread(target=_wait_for_command, name="standby-command", daemon=True).start()
+    try:
+        while not promoted.is_set():
+            runner.preload_inputs(config.tasks_file, config.state_file)
+            if released.is_set():
+                return 0
+            promoted.wait(timeout=max(1, config.heartbeat_poll_sec))
+    finally:
+        config.standby_pid_file.unlink(missing_ok=True)
+    _log(f"warm standby promoted (pid={os.getpid()})")
+    return _run_runner(config)
+
+
+HEARTBEAT_FD_ENV = "ORXAQ_AUTONOMY_HEARTBEAT_FD"
+
+
+class HeartbeatChannel:
+    """Pipe carrying heartbeat ticks from one runner process to the supervisor.
+
+    The runner writes a short line per heartbeat to the inherited write end; the
+    supervisor blocks in ``select`` until a tick, EOF (runner exited) or the stale
+    deadline.  Windows has no ``select`` on pipes, so the channel is disabled there
+    and the supervisor falls back to polling the heartbeat file's mtime.
+    """
+
+    def __init__(self) -> None:
+        self.read_fd = -1
+        self.write_fd = -1
+        self.last_tick: float | None = None
+        self.closed = False
+        if os.name != "nt":
+            self.read_fd, self.write_fd = os.pipe()
+            os.set_blocking(self.read_fd, False)
+
+    @property
+    def active(self) -> bool:
+        return self.read_fd >= 0 and not self.closed
+
+    def popen_kwargs(self, env: dict[str, str]) -> dict[str, Any]:
+        if self.write_fd < 0:
+            return {}
+        env[HEARTBEAT_FD_ENV] = str(self.write_fd)
+        return {"pass_fds": (self.write_fd,)}
+
+    def detach_writer(self) -> None:
+        """Drop the supervisor's copy of the write end so runner exit shows up as EOF."""
+        if self.write_fd >= 0:
+            os.close(self.write_fd)
+            self.write_fd = -1
+
+    def wait(self, timeout_sec: float) -> bool:
+        """Block until a tick arrives (True), or timeout/EOF (False)."""
+        if not self.active:
+            return False
+        ready, _, _ = select.select([self.read_fd], [], [], max(0.0, timeout_sec))
+        if not ready:
+            return False
+        try:
+            data = os.read(self.read_fd, 4096)
+        except BlockingIOError:
+            return False
+        if not data:
+            self.closed = True
+            return False
+        self.last_tick = time.monotonic()
+        return True
+
+    def close(self) -> None:
+        self.detach_writer()
+        if self.read_fd >= 0:
+            os.close(self.read_fd)
+            self.read_fd = -1
+        self.closed = True
+
+
+class SupervisorLog:
+    """Supervisor log kept open for the supervisor's lifetime instead of reopened per message.
+
+    The handle is opened in append mode and shared with runner children, so
+    ``rotate_if_due`` rotates in place (copy, gzip, truncate) and every writer
+    continues at the new end of the same file.
+    """
+
+    def __init__(self, path: Path, *, max_bytes: int = 0, max_age_sec: int = 0, keep_segments: int = 5) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.handle = path.open("a", encoding="utf-8")
+        self.max_bytes = max_bytes
+        self.max_age_sec = max_age_sec
+        self.keep_segments = keep_segments
+        self._lock = threading.Lock()
+
+    def write(self, message: str, *, worker: str = "") -> None:
+        prefix = f"supervisor[{worker}]" if worker else "supervisor"
+        with self._lock:
+            self.handle.write(f"[{_now_iso()}] {prefix}: {message}\n")
+            self.handle.flush()
+
+    def rotate_if_due(self) -> Path | None:
+        if self.max_bytes <= 0 and self.max_age_sec <= 0:
+            return None
+        with self._lock:
+            self.handle.flush()
+            segment = maybe_rotate(
+                self.path,
+                max_bytes=self.max_bytes,
+                max_age_sec=self.max_age_sec,
+                keep_segments=self.keep_segments,
+            )
+        if segment is not None:
+            self.write(f"rotated log into {segment.name}")
+        return segment
+
+    def close(self) -> None:
+        self.handle.close()
+
+
+def _launch_runner(
+    config: ManagerConfig,
+    log: Any,
+    *,
+    standby: bool = False,
+    channel: HeartbeatChannel | None = None,
+) -> subprocess.Popen[Any]:
+    command = [sys.executable, "-m", "orxaq_autonomy.cli", "--root", str(config.root_dir), "standby" if standby else "run"]
+    if config.worker_id:
+        command.extend(["--worker", config.worker_id])
+    env = _runtime_env(_load_env_file(config.env_file))
+    extra = channel.popen_kwargs(env) if channel is not None else {}
+    try:
+        return subprocess.Popen(
+            command,
+            cwd=str(config.root_dir),
+            stdin=subprocess.PIPE if standby else subprocess.DEVNULL,
+            stdout=log,
+            stderr=log,
+            env=env,
+            text=standby,
+            **extra,
+        )
+    finally:
+        if channel is not None:
+            channel.detach_writer()
+
+
+def _promote_standby(standby: subprocess.Popen[Any]) -> bool:
+    if standby.poll() is not None or standby.stdin is None:
+        return False
+    try:
+        standby.stdin.write(f"{STANDBY_PROMOTE_COMMAND}\n")
+        standby.stdin.flush()
+        standby.stdin.close()
+    except (BrokenPipeError, OSError, ValueError):
+        return False
+    return True
+
+
+def _retire_standby(standby: subprocess.Popen[Any] | None) -> None:
+    if standby is None:
+        return
+    if standby.stdin is not None:
+        try:
+            standby.stdin.close()
+        except OSError:
+            pass
+    _terminate_pid(standby.pid)
+
+
+def _supervised_heartbeat_age_sec(config: ManagerConfig, channel: HeartbeatChannel | None) -> int:
+    """Heartbeat age from pipe ticks, falling back to the heartbeat file's mtime (no JSON parsing)."""
+    tick_age: float | None = None
+    if channel is not None and channel.last_tick is not None:
+        tick_age = time.monotonic() - channel.last_tick
+        if tick_age <= config.heartbeat_stale_sec:
+            return int(tick_age)
+    try:
+        file_age = time.time() - config.heartbeat_file.stat().st_mtime
+    except OSError:
+        return -1 if tick_age is None else int(tick_age)
+    return int(file_age if tick_age is None else min(tick_age, file_age))
+
+
+def _child_running(child: Any) -> bool:
+    if not _pid_running(child.pid):
+        return False
+    poll = getattr(child, "poll", None)
+    return poll is None or poll() is None
+
+
+def _supervise_runner(config: ManagerConfig, log: SupervisorLog, live: dict[str, Any] | None = None) -> int:
+    """Keep one runner worker alive with its own heartbeat, restart backoff and standby.
+
+    *live* is updated in place with this worker's in-memory state for the
+    supervisor control socket.
+    """
     restart_count = 0
     backoff = max(1, config.supervisor_restart_delay_sec)
+    child: Any = None
+    child_channel: HeartbeatChannel | None = None
+    standby: Any = None
+    standby_channel: HeartbeatChannel | None = None
+    worker = config.worker_id
+    live = live if live is not None else {}
 
     try:
         while True:
-            with config.log_file.open("a", encoding="utf-8") as log:
-                log.write(f"[{_now_iso()}] supervisor: launching runner\n")
-                log.flush()
-                child = subprocess.Popen(
-                    [sys.executable, "-m", "orxaq_autonomy.cli", "--root", str(config.root_dir), "run"],
-                    cwd=str(config.root_dir),
-                    stdin=subprocess.DEVNULL,
-                    stdout=log,
-                    stderr=log,
-                    env=_runtime_env(_load_env_file(config.env_file)),
-                )
+            if child is None:
+                log.write("launching runner", worker=worker)
+                child_channel = HeartbeatChannel()
+                child = _launch_runner(config, log.handle, channel=child_channel)
+            if config.warm_standby and (standby is None or standby.poll() is not None):
+                log.write("launching warm standby", worker=worker)
+                if standby_channel is not None:
+                    standby_channel.close()
+                standby_channel = HeartbeatChannel()
+                standby = _launch_runner(config, log.handle, standby=True, channel=standby_channel)
             _write_pid(config.runner_pid_file, child.pid)
-
-            while _pid_running(child.pid):
-                time.sleep(max(1, config.heartbeat_poll_sec))
-                age = _heartbeat_age_sec(config)
+            child_started = time.monotonic()
+            live.update(
+                state="running",
+                runner_pid=child.pid,
+                standby_pid=standby.pid if standby is not None else None,
+                restarts=restart_count,
+                started_monotonic=child_started,
+                last_tick_monotonic=None,
+            )
+
+            while _child_running(child):
+                if child_channel is not None and child_channel.active:
+                    last_seen = child_channel.last_tick or child_started
+                    remaining = config.heartbeat_stale_sec - (time.monotonic() - last_seen)
+                    child_channel.wait(min(max(1.0, remaining), max(1, config.heartbeat_stale_sec)))
+                else:
+                    time.sleep(max(1, config.heartbeat_poll_sec))
+                log.rotate_if_due()
+                if not _child_running(child):
+                    break
+                if child_channel is not None:
+                    live["last_tick_monotonic"] = child_channel.last_tick
+                age = _supervised_heartbeat_age_sec(config, child_channel)
                 if age != -1 and age > config.heartbeat_stale_sec:
-                    with config.log_file.open("a", encoding="utf-8") as log:
-                        log.write(
-                            f"[{_now_iso()}] supervisor: stale heartbeat ({age}s), restarting runner pid={child.pid}\n"
-                        )
+                    log.write(f"stale heartbeat ({age}s), restarting runner pid={child.pid}", worker=worker)
                     _terminate_pid(child.pid)
                     break
 
             rc = child.wait()
+            uptime = time.monotonic() - child_started
+            child = None
+            if child_channel is not None:
+                child_channel.close()
+                child_channel = None
             config.runner_pid_file.unlink(missing_ok=True)
+            live.update(state="exited", runner_pid=None, last_rc=rc)
 
             if rc == 0:
-                with config.log_file.open("a", encoding="utf-8") as log:
-                    log.write(f"[{_now_iso()}] supervisor: runner exited cleanly\n")
+                log.write("runner exited cleanly", worker=worker)
                 return 0
 
             restart_count += 1
-            with config.log_file.open("a", encoding="utf-8") as log:
-                log.write(f"[{_now_iso()}] supervisor: runner rc={rc}; restart={restart_count}\n")
+            live.update(state="restarting", restarts=restart_count)
+            log.write(f"runner rc={rc}; restart={restart_count}", worker=worker)
 
             if config.supervisor_max_restarts > 0 and restart_count >= config.supervisor_max_restarts:
                 return rc
 
+            if standby is not None and uptime >= STANDBY_MIN_HEALTHY_UPTIME_SEC and _promote_standby(standby):
+                child, child_channel, standby, standby_channel = standby, standby_channel, None, None
+                log.write(f"promoted warm standby pid={child.pid}", worker=worker)
+                continue
+
             time.sleep(backoff)
             backoff = min(config.supervisor_max_backoff_sec, backoff * 2)
+            if standby is not None and _promote_standby(standby):
+                child, child_channel, standby, standby_channel = standby, standby_channel, None, None
+                log.write(f"promoted warm standby pid={child.pid} after backoff", worker=worker)
     finally:
+        _retire_standby(standby)
+        for channel in (child_channel, standby_channel):
+            if channel is not None:
+                channel.close()
+
+
+def supervise_foreground(config: ManagerConfig) -> int:
+    """Supervise the runner pool: one monitoring thread per worker, each restarted independently.
+
+    Returns 0 once every worker has exited cleanly, otherwise the first
+    non-zero exit code of a worker that exhausted its restart budget.
+    """
+    ensure_runtime(config)
+    _write_pid(config.supervisor_pid_file, os.getpid())
+    log = SupervisorLog(
+        config.log_file,
+        max_bytes=config.log_max_bytes,
+        max_age_sec=config.log_max_age_sec,
+        keep_segments=config.log_keep_segments,
+    )
+    log.rotate_if_due()
+    workers = worker_configs(config)
+    live: dict[str, dict[str, Any]] = {
+        worker.worker_id: {"worker": worker.worker_id, "owners": list(worker.worker_owners), "state": "starting"}
+        for worker in workers
+    }
+    control: ControlServer | None = None
+    if config.control_socket:
+        control = ControlServer(
+            supervisor_socket_file(config),
+            {"status": lambda _request: _supervisor_live_status(workers, live)},
+        )
+        control.start()
+
+    try:
+        if len(workers) == 1:
+            return _supervise_runner(workers[0], log, live[workers[0].worker_id])
+
+        results: dict[str, int] = {}
+
+        def _run(worker: ManagerConfig) -> None:
+            try:
+                results[worker.worker_id] = _supervise_runner(worker, log, live[worker.worker_id])
+            except Exception as err:  # Keep sibling workers alive; report this one as failed.
+                log.write(f"worker supervision failed: {err}", worker=worker.worker_id)
+                results[worker.worker_id] = 1
+
+        threads = [
+            threading.Thread(target=_run, args=(worker,), name=f"supervise-{worker.worker_id}", daemon=True)
+            for worker in workers
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return next((results[w.worker_id] for w in workers if results.get(w.worker_id, 1) != 0), 0)
+    finally:
+        if control is not None:
+            control.close()
+        log.close()
         config.supervisor_pid_file.unlink(missing_ok=True)
 
 
+def _supervisor_live_status(workers: list[ManagerConfig], live: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    now = time.monotonic()
+    entries: list[dict[str, Any]] = []
+    for worker in workers:
+        entry = dict(live.get(worker.worker_id, {}))
+        last_seen = entry.pop("last_tick_monotonic", None) or entry.get("started_monotonic")
+        entry.pop("started_monotonic", None)
+        entry["tick_age_sec"] = int(now - last_seen) if last_seen is not None and entry.get("runner_pid") else -1
+        entries.append(entry)
+    return {"supervisor_pid": os.getpid(), "workers": entries}
+
+
 def start_background(config: ManagerConfig) -> None:
     if _pid_running(_read_pid(config.supervisor_pid_file)):
         _log(f"autonomy supervisor already running (pid={_read_pid(config.supervisor_pid_file)})")
@@ -804,13 +1390,17 @@ def start_background(config: ManagerConfig) -> None:
 
 def stop_background(config: ManagerConfig) -> None:
     supervisor_pid = _read_pid(config.supervisor_pid_file)
-    runner_pid = _read_pid(config.runner_pid_file)
     if supervisor_pid:
         _terminate_pid(supervisor_pid)
-    if runner_pid:
-        _terminate_pid(runner_pid)
     config.supervisor_pid_file.unlink(missing_ok=True)
-    config.runner_pid_file.unlink(missing_ok=True)
+    pid_files = [config.runner_pid_file, config.standby_pid_file]
+    for worker in worker_configs(config):
+        pid_files.extend([worker.runner_pid_file, worker.standby_pid_file])
+    for pid_file in dict.fromkeys(pid_files):
+        pid = _read_pid(pid_file)
+        if pid:
+            _terminate_pid(pid)
+        pid_file.unlink(missing_ok=True)
     _log("autonomy supervisor stopped")
 
 
@@ -857,26 +1447,100 @@ def ensure_background(config: ManagerConfig) -> None:
         start_background(config)
         return
 
-    runner_pid = _read_pid(config.runner_pid_file)
-    age = _heartbeat_age_sec(config)
-    if runner_pid and _pid_running(runner_pid) and age != -1 and age > config.heartbeat_stale_sec:
-        _log(f"runner heartbeat stale ({age}s); restarting runner pid={runner_pid}")
-        _terminate_pid(runner_pid)
-    else:
+    restarted = False
+    for worker in worker_configs(config):
+        runner_pid = _read_pid(worker.runner_pid_file)
+        age = _heartbeat_age_sec(worker)
+        if runner_pid and _pid_running(runner_pid) and age != -1 and age > worker.heartbeat_stale_sec:
+            label = f"runner {worker.worker_id}" if worker.worker_id else "runner"
+            _log(f"{label} heartbeat stale ({age}s); restarting runner pid={runner_pid}")
+            _terminate_pid(runner_pid)
+            restarted = True
+    if not restarted:
         _log("autonomy supervisor ensured")
 
 
-def status_snapshot(config: ManagerConfig) -> dict[str, Any]:
-    supervisor_pid = _read_pid(config.supervisor_pid_file)
-    runner_pid = _read_pid(config.runner_pid_file)
-    age = _heartbeat_age_sec(config)
+def _worker_status(worker: ManagerConfig) -> dict[str, Any]:
+    runner_pid = _read_pid(worker.runner_pid_file)
+    standby_pid = _read_pid(worker.standby_pid_file)
+    age = _heartbeat_age_sec(worker)
     return {
-        "supervisor_running": _pid_running(supervisor_pid),
-        "supervisor_pid": supervisor_pid,
+        "worker": worker.worker_id,
+        "owners": list(worker.worker_owners),
         "runner_running": _pid_running(runner_pid),
         "runner_pid": runner_pid,
+        "standby_running": _pid_running(standby_pid),
+        "standby_pid": standby_pid,
+        "heartbeat_age_sec": age,
+        "heartbeat_stale": age != -1 and age > worker.heartbeat_stale_sec,
+        "heartbeat_file": str(worker.heartbeat_file),
+    }
+
+
+def _worker_status_live(worker: ManagerConfig, supervised: dict[str, Any]) -> dict[str, Any]:
+    runner_pid = supervised.get("runner_pid")
+    standby_pid = supervised.get("standby_pid")
+    runner_live = query_control_socket(runner_socket_file(worker), "status") if runner_pid else None
+    age = int(supervised.get("tick_age_sec", -1))
+    if isinstance(runner_live, dict) and runner_live.get("heartbeat_age_sec", -1) != -1:
+        age = int(runner_live["heartbeat_age_sec"])
+    item = {
+        "worker": worker.worker_id,
+        "owners": list(worker.worker_owners),
+        "runner_running": bool(runner_pid),
+        "runner_pid": runner_pid,
+        "standby_running": bool(standby_pid) and _pid_running(standby_pid),
+        "standby_pid": standby_pid,
         "heartbeat_age_sec": age,
+        "heartbeat_stale": age != -1 and age > worker.heartbeat_stale_sec,
+        "heartbeat_file": str(worker.heartbeat_file),
+        "supervisor_state": supervised.get("state", ""),
+        "restarts": supervised.get("restarts", 0),
+    }
+    if isinstance(runner_live, dict):
+        item["live"] = runner_live
+    return item
+
+
+def _live_worker_statuses(config: ManagerConfig) -> tuple[int | None, list[dict[str, Any]]] | None:
+    """Worker status from the supervisor/runner control sockets; ``None`` falls back to files."""
+    if not config.control_socket:
+        return None
+    supervised = query_control_socket(supervisor_socket_file(config), "status")
+    if not isinstance(supervised, dict) or not isinstance(supervised.get("workers"), list):
+        return None
+    by_name = {str(item.get("worker", "")): item for item in supervised["workers"] if isinstance(item, dict)}
+    workers = [_worker_status_live(worker, by_name.get(worker.worker_id, {})) for worker in worker_configs(config)]
+    return supervised.get("supervisor_pid"), workers
+
+
+def status_snapshot(config: ManagerConfig) -> dict[str, Any]:
+    live = _live_worker_statuses(config)
+    if live is not None:
+        supervisor_pid, workers = live
+        supervisor_running = True
+        source = "socket"
+    else:
+        supervisor_pid = _read_pid(config.supervisor_pid_file)
+        workers = [_worker_status(worker) for worker in worker_configs(config)]
+        supervisor_running = _pid_running(supervisor_pid)
+        source = "files"
+    running = [item for item in workers if item["runner_running"]]
+    standbys = [item for item in workers if item["standby_running"]]
+    ages = [item["heartbeat_age_sec"] for item in workers if item["heartbeat_age_sec"] != -1]
+    lead = running[0] if running else workers[0]
+    return {
+        "supervisor_running": supervisor_running,
+        "supervisor_pid": supervisor_pid,
+        "source": source,
+        "runner_running": bool(running),
+        "runner_pid": lead["runner_pid"],
+        "standby_running": bool(standbys),
+        "standby_pid": (standbys[0] if standbys else workers[0])["standby_pid"],
+        # With several workers, report the stalest heartbeat.
+        "heartbeat_age_sec": max(ages) if ages else -1,
         "heartbeat_stale_threshold_sec": config.heartbeat_stale_sec,
+        "workers": workers,
         "state_file": str(config.state_file),
         "log_file": str(config.log_file),
     }
@@ -897,24 +1561,140 @@ def _safe_status_str(item: Any) -> str:
     return text if text else "unknown"
 
 
-def health_snapshot(config: ManagerConfig) -> dict[str, Any]:
-    state_counts = {"pending": 0, "in_progress": 0, "done": 0, "blocked": 0, "unknown": 0}
-    blocked_tasks: list[str] = []
+HEALTH_STATE_BUCKETS = ("pending", "in_progress", "done", "blocked", "unknown")
 
-    if config.state_file.exists():
-        try:
-            raw = json.loads(config.state_file.read_text(encoding="utf-8"))
-            if isinstance(raw, dict):
-                for task_id, item in raw.items():
-                    status = _safe_status_str(item)
-                    if status in state_counts:
-                        state_counts[status] += 1
-                    else:
-                        state_counts["unknown"] += 1
-                    if status == "blocked":
-                        blocked_tasks.append(str(task_id))
-        except Exception:
-            state_counts["unknown"] += 1
+
+def _file_fingerprint(path: Path) -> list[int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_ino, stat.st_mtime_ns, stat.st_size]
+
+
+@dataclass
+class _StateCountCache:
+    fingerprint: list[int] | None
+    counts: dict[str, int]
+    blocked: list[str]
+
+
+# health_snapshot caches keyed by state file / health file path.  Entries are
+# validated against (inode, mtime_ns, size) fingerprints before reuse.
+_STATE_COUNT_CACHE: dict[Path, _StateCountCache] = {}
+_HEALTH_CACHE: dict[Path, dict[str, Any]] = {}
+
+
+def _load_state_statuses(path: Path) -> dict[str, str] | None:
+    """Map task id to normalized status; ``None`` when the file cannot be parsed."""
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return None
+    if not isinstance(raw, dict):
+        return {}
+    return {str(task_id): _safe_status_str(item) for task_id, item in raw.items()}
+
+
+def _status_bucket(status: str) -> str:
+    return status if status in HEALTH_STATE_BUCKETS else "unknown"
+
+
+def _state_status_counts(state_file: Path) -> tuple[dict[str, int], list[str]]:
+    """Status counts and blocked ids; ``state.json`` is parsed only when its fingerprint changes."""
+    fingerprint = _file_fingerprint(state_file)
+    cached = _STATE_COUNT_CACHE.get(state_file)
+    if cached is not None and cached.fingerprint == fingerprint:
+        return dict(cached.counts), list(cached.blocked)
+
+    counts = {bucket: 0 for bucket in HEALTH_STATE_BUCKETS}
+    statuses: dict[str, str] | None = {}
+    if fingerprint is not None:
+        statuses = _load_state_statuses(state_file)
+    if statuses is None:
+        counts["unknown"] += 1
+    else:
+        for status in statuses.values():
+            counts[_status_bucket(status)] += 1
+    blocked = [task_id for task_id, status in (statuses or {}).items() if status == "blocked"]
+    _STATE_COUNT_CACHE[state_file] = _StateCountCache(fingerprint, counts, blocked)
+    return dict(counts), list(blocked)
+
+
+def _reusable_health(health_file: Path, inputs: dict[str, Any]) -> dict[str, Any] | None:
+    """Previous snapshot computed from identical inputs, from memory or ``health.json``."""
+    previous = _HEALTH_CACHE.get(health_file)
+    if previous is None:
+        previous = _read_json_dict(health_file)
+    if previous.get("inputs") != inputs or not isinstance(previous.get("state_counts"), dict):
+        return None
+    return previous
+
+
+# Snapshot fields that only change when something happened; heartbeat ages tick every second.
+_HEALTH_STABLE_KEYS = (
+    "state_counts",
+    "blocked_tasks",
+    "heartbeat_stale",
+    "stale_workers",
+    "budget",
+    "worker_budgets",
+    "inputs",
+)
+_WORKER_VOLATILE_KEYS = ("heartbeat_age_sec", "live")
+
+
+def _health_comparable(payload: dict[str, Any]) -> str:
+    status = payload.get("status") if isinstance(payload.get("status"), dict) else {}
+    projection = {key: payload.get(key) for key in _HEALTH_STABLE_KEYS}
+    projection["status"] = {
+        key: value for key, value in status.items() if key not in ("heartbeat_age_sec", "workers")
+    }
+    projection["workers"] = [
+        {key: value for key, value in item.items() if key not in _WORKER_VOLATILE_KEYS}
+        for item in status.get("workers", [])
+        if isinstance(item, dict)
+    ]
+    return json.dumps(projection, sort_keys=True, default=str)
+
+
+def health_snapshot(config: ManagerConfig, *, skip_unchanged_write: bool = False) -> dict[str, Any]:
+    """Build and persist ``health.json``.
+
+    Task counts and the budget report are reused while the input files'
+    fingerprints are unchanged (in-process, or across processes via the
+    ``inputs`` recorded in ``health.json``); a changed ``state.json`` is parsed
+    once.  With *skip_unchanged_write*, a snapshot whose stable fields (task
+    counts, blocked and stale sets, budgets, process state) match the file on
+    disk only refreshes the file's mtime; heartbeat ages alone never force a
+    rewrite.
+    """
+    health_file = config.artifacts_dir / "health.json"
+    inputs = {
+        "state_file": _file_fingerprint(config.state_file),
+        "budget_report_file": _file_fingerprint(config.budget_report_file),
+    }
+    state_counts = {bucket: 0 for bucket in HEALTH_STATE_BUCKETS}
+    blocked_tasks: list[str] = []
+    snapshot = status_snapshot(config)
+    live_runners = [item["live"] for item in snapshot["workers"] if isinstance(item.get("live"), dict)]
+    live_queue = next((item["queue"] for item in live_runners if isinstance(item.get("queue"), dict)), None)
+    previous = _reusable_health(health_file, inputs)
+
+    if live_queue is not None:
+        # A live runner holds the whole task map in memory; no need to parse state.json.
+        for name, count in dict(live_queue.get("counts", {})).items():
+            key = name if name in state_counts else "unknown"
+            state_counts[key] += int(count)
+        blocked_tasks.extend(str(task_id) for task_id in live_queue.get("blocked", []))
+    elif previous is not None:
+        for bucket in HEALTH_STATE_BUCKETS:
+            state_counts[bucket] = int(previous["state_counts"].get(bucket, 0))
+        blocked_tasks.extend(str(task_id) for task_id in previous.get("blocked_tasks", []))
+    else:
+        counts, blocked = _state_status_counts(config.state_file)
+        state_counts.update(counts)
+        blocked_tasks.extend(blocked)
 
     # Derive total deterministically from individual counts so it is always consistent.
     covered = state_counts["done"]
@@ -931,25 +1711,59 @@ def health_snapshot(config: ManagerConfig) -> dict[str, Any]:
     # Invariant: total must always equal covered + uncovered
     assert state_counts["total"] == state_counts["covered"] + state_counts["uncovered"]
 
-    status = status_snapshot(config)
-    heartbeat_age = int(status.get("heartbeat_age_sec", -1))
+    heartbeat_age = int(snapshot.get("heartbeat_age_sec", -1))
     stale = heartbeat_age != -1 and heartbeat_age > config.heartbeat_stale_sec
     out = {
         "timestamp": _now_iso(),
-        "status": status,
+        "status": snapshot,
         "state_counts": state_counts,
         "blocked_tasks": blocked_tasks,
         "heartbeat_stale": stale,
     }
-    if config.budget_report_file.exists():
+    out["stale_workers"] = [item["worker"] for item in snapshot["workers"] if item["worker"] and item["heartbeat_stale"]]
+    live_budgets = {item["worker"]: item["live"]["budget"] for item in snapshot["workers"] if "budget" in item.get("live", {})}
+    if "" in live_budgets:
+        out["budget"] = live_budgets[""]
+    elif previous is not None and "budget" in previous:
+        out["budget"] = previous["budget"]
+    elif config.budget_report_file.exists():
         try:
             out["budget"] = json.loads(config.budget_report_file.read_text(encoding="utf-8"))
         except Exception:
             out["budget"] = {"error": "invalid_budget_report"}
-    health_file = config.artifacts_dir / "health.json"
+    worker_budgets: dict[str, Any] = {}
+    for worker in worker_configs(config):
+        if not worker.worker_id:
+            continue
+        if worker.worker_id in live_budgets:
+            worker_budgets[worker.worker_id] = live_budgets[worker.worker_id]
+        elif worker.budget_report_file.exists():
+            worker_budgets[worker.worker_id] = _read_json_dict(worker.budget_report_file) or {"error": "invalid_budget_report"}
+    if worker_budgets:
+        out["worker_budgets"] = worker_budgets
+    out["inputs"] = inputs
     config.artifacts_dir.mkdir(parents=True, exist_ok=True)
-    health_file.write_text(json.dumps(out, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    # health.json is overwritten below; the series keeps its history.
+    record_health_history(
+        config.artifacts_dir / HISTORY_DIRNAME,
+        {
+            **{f"health.tasks.{bucket}": state_counts[bucket] for bucket in HEALTH_STATE_BUCKETS},
+            "health.heartbeat_age_sec": heartbeat_age,
+            "health.stale_workers": len(out["stale_workers"]),
+        },
+    )
+    written = True
+    if skip_unchanged_write and health_file.exists():
+        on_disk = _HEALTH_CACHE.get(health_file) or _read_json_dict(health_file)
+        if _health_comparable(on_disk) == _health_comparable(out):
+            # Keep the mtime fresh so staleness checks still see a live writer.
+            os.utime(health_file)
+            written = False
+    if written:
+        health_file.write_text(json.dumps(out, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        _HEALTH_CACHE[health_file] = dict(out)
     out["health_file"] = str(health_file)
+    out["health_file_written"] = written
     return out
 
 
@@ -1100,12 +1914,50 @@ def resilience_audit(config: ManagerConfig) -> dict[str, Any]:
         "total": len(checks),
     }
 
-def tail_logs(config: ManagerConfig, lines: int = 40) -> str:
+def worktree_pool_report(config: ManagerConfig, *, action: str = "status", size: int | None = None) -> dict[str, Any]:
+    """Inspect or maintain the runner's per-repo worktree pools (status, warm, heal, cleanup)."""
+    from .worktree_pool import WorktreePool, WorktreePoolError, pool_dir_for_repo
+
+    pool_size = config.worktree_pool_size if size is None else max(0, size)
+    pools: list[dict[str, Any]] = []
+    ok = True
+    for repo in dict.fromkeys((config.impl_repo, config.test_repo)):
+        pool = WorktreePool(
+            repo,
+            pool_dir_for_repo(config.artifacts_dir / "worktrees", repo),
+            pool_size,
+            lock_stale_sec=config.git_lock_stale_sec,
+        )
+        entry: dict[str, Any] = {"repo": str(repo), "action": action}
+        try:
+            if action == "warm":
+                entry["created"] = [str(path) for path in pool.warm()]
+            elif action == "heal":
+                entry["healed"] = pool.heal()
+            elif action == "cleanup":
+                entry["removed"] = [str(path) for path in pool.cleanup()]
+        except WorktreePoolError as err:
+            entry["error"] = str(err)
+            ok = False
+        entry["status"] = pool.status()
+        pools.append(entry)
+    return {"ok": ok, "timestamp": _now_iso(), "size": pool_size, "pools": pools}
+
+
+def tail_logs(config: ManagerConfig, lines: int = 40, *, from_line: int | None = None) -> str:
+    """Last *lines* log lines, or *lines* lines starting at zero-based *from_line*.
+
+    A plain tail seeks back from the end of the file.  ``from_line`` is served
+    from the sidecar line index (``runner.log.idx``) so repeated calls only
+    scan bytes appended since the previous one.
+    """
     if not config.log_file.exists():
         return ""
     try:
-        return _tail_file(config.log_file, lines)
-    except Exception:
+        if from_line is None:
+            return _tail_file(config.log_file, lines)
+        return "\n".join(LogIndex(config.log_file).read_lines(from_line, lines))
+    except OSError:
         return ""
 
 
@@ -1130,20 +1982,16 @@ def _tail_file(path: Path, lines: int) -> str:
 
     # For larger files, read chunks from the end until we have enough lines.
     chunk_size = max(4096, lines * 200)  # heuristic: ~200 bytes/line
-    collected: list[str] = []
+    data = b""
     with open(path, "rb") as fh:
         offset = file_size
-        while offset > 0 and len(collected) <= lines:
+        # One extra newline guarantees the first kept line is complete.
+        while offset > 0 and data.count(b"\n") <= lines:
             read_start = max(0, offset - chunk_size)
-            read_len = offset - read_start
             fh.seek(read_start)
-            chunk = fh.read(read_len)
-            decoded = chunk.decode("utf-8", errors="replace")
-            chunk_lines = decoded.splitlines()
-            # Merge partial leading line with what we already have
-            if collected and not decoded.endswith("\n"):
-                # First collected item may be a partial tail from the previous chunk
-                pass
-            collected = chunk_lines + collected
+            data = fh.read(offset - read_start) + data
             offset = read_start
+    collected = data.decode("utf-8", errors="replace").splitlines()
+    if offset > 0:
+        collected = collected[1:]
     return "\n".join(collected[-lines:])
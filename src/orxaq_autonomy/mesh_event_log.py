@@ -0,0 +1,316 @@
+"""Append-only, segmented mesh event log shared by every process on a host.
+
+``EventBus`` only reaches handlers in its own process, so runners and the
+dashboard could see each other's ``MeshEvent``s only through the ledger.
+``MeshCoordinator(event_log=...)`` now also appends every event it emits to
+a local log that other processes tail:
+
+- The log is a directory of append-only NDJSON segments named by the offset
+  of their first record (``00000000000000000042.ndjson``).  Each line is
+  ``{"offset": N, "writer": "<host>:<pid>", "event": {...}}``; offsets are
+  dense and increase across segments.
+- ``MeshEventLog.append`` takes an advisory lock on ``log.lock``, rolls to a
+  new segment past ``segment_bytes`` and drops the oldest segments beyond
+  ``max_segments``.  A segment is fsynced when it is rolled; records in the
+  active segment are only in the page cache, so a host crash (not a process
+  crash) can lose the newest ones.
+- ``MeshEventLog.read(offset)``: replay from any retained offset.
+- ``EventLogConsumer``: a named reader that keeps its byte position, so each
+  ``poll`` reads only new lines, and persists its committed offset under
+  ``cursors/`` for catch-up after a restart.
+
+Zero external dependencies -- uses only Python stdlib.
+"""
+
+from __future__ import annotations
+
+import bisect
+import contextlib
+import json
+import os
+import re
+import socket
+import threading
+import time
+from pathlib import Path
+from typing import Any, Iterator
+
+from .event_mesh import MeshEvent
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+
+EVENT_LOG_DIRNAME = "mesh_events"
+DEFAULT_SEGMENT_BYTES = 4 * 1024 * 1024
+DEFAULT_MAX_SEGMENTS = 8
+DEFAULT_POLL_INTERVAL_SEC = 0.05
+SEGMENT_SUFFIX = ".ndjson"
+_OFFSET_DIGITS = 20
+_TAIL_PROBE_BYTES = 64 * 1024
+_CONSUMER_NAME = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+def segment_name(base_offset: int) -> str:
+    return f"{base_offset:0{_OFFSET_DIGITS}d}{SEGMENT_SUFFIX}"
+
+
+def _parse(line: bytes) -> dict[str, Any] | None:
+    try:
+        record = json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    if not isinstance(record, dict) or not isinstance(record.get("offset"), int):
+        return None
+    return record
+
+
+def _event(record: dict[str, Any]) -> MeshEvent | None:
+    raw = record.get("event")
+    if not isinstance(raw, dict):
+        return None
+    return MeshEvent(
+        event_type=str(raw.get("event_type", "")),
+        source_node=str(raw.get("source_node", "")),
+        timestamp=str(raw.get("timestamp", "")),
+        payload=raw.get("payload", {}) if isinstance(raw.get("payload"), dict) else {},
+        event_id=str(raw.get("event_id", "")),
+    )
+
+
+class MeshEventLog:
+    """Append-only segmented event log in *directory*."""
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        max_segments: int = DEFAULT_MAX_SEGMENTS,
+    ) -> None:
+        self.directory = directory
+        self.segment_bytes = max(1, int(segment_bytes))
+        self.max_segments = max(1, int(max_segments))
+        self.writer_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._lock = threading.Lock()
+        # (segment base, segment size, next offset) as of this writer's last append.
+        self._tail: tuple[int, int, int] | None = None
+
+    # -- segments ----------------------------------------------------------
+
+    def segments(self) -> list[int]:
+        """Base offsets of the retained segments, oldest first."""
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return []
+        bases = []
+        for name in names:
+            stem = name[: -len(SEGMENT_SUFFIX)]
+            if name.endswith(SEGMENT_SUFFIX) and len(stem) == _OFFSET_DIGITS and stem.isdigit():
+                bases.append(int(stem))
+        return sorted(bases)
+
+    def segment_path(self, base_offset: int) -> Path:
+        return self.directory / segment_name(base_offset)
+
+    @contextlib.contextmanager
+    def _locked(self) -> Iterator[None]:
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(self.directory / "log.lock", "a") as handle:
+                if fcntl is not None:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+                yield
+
+    def _last_offset(self, handle: Any, size: int) -> int | None:
+        """Offset of the last complete record in an open segment."""
+        start = max(0, size - _TAIL_PROBE_BYTES)
+        handle.seek(start)
+        lines = handle.read(size - start).split(b"\n")
+        if start:
+            lines = lines[1:]
+        for line in reversed(lines[:-1]):
+            record = _parse(line)
+            if record is not None:
+                return int(record["offset"])
+        if start:
+            # Nothing decodable in the probe; fall back to a full scan.
+            handle.seek(0)
+            last = None
+            for line in handle:
+                record = _parse(line)
+                if record is not None:
+                    last = int(record["offset"])
+            return last
+        return None
+
+    # -- writing -----------------------------------------------------------
+
+    def append(self, event: MeshEvent) -> int:
+        """Append *event*; returns its offset.
+
+        The finished segment is fsynced on roll; the active one is not.
+        """
+        with self._locked():
+            bases = self.segments() or [0]
+            base = bases[-1]
+            with open(self.segment_path(base), "a+b") as handle:
+                size = handle.seek(0, os.SEEK_END)
+                if self._tail is not None and self._tail[:2] == (base, size):
+                    offset = self._tail[2]
+                else:
+                    last = self._last_offset(handle, size)
+                    offset = base if last is None else last + 1
+                torn = False
+                if size:
+                    handle.seek(size - 1)
+                    torn = handle.read(1) != b"\n"
+                if size >= self.segment_bytes:
+                    os.fsync(handle.fileno())
+            if size >= self.segment_bytes:
+                base, size, torn = offset, 0, False
+                bases.append(base)
+            line = json.dumps(
+                {"offset": offset, "writer": self.writer_id, "event": event.to_dict()},
+                sort_keys=True,
+                separators=(",", ":"),
+            ).encode("utf-8") + b"\n"
+            if torn:
+                # A writer died mid-line; keep the torn line on its own.
+                line = b"\n" + line
+            with open(self.segment_path(base), "ab") as handle:
+                handle.write(line)
+            self._tail = (base, size + len(line), offset + 1)
+            for old in bases[: -self.max_segments]:
+                with contextlib.suppress(OSError):
+                    self.segment_path(old).unlink()
+            return offset
+
+    # -- reading -----------------------------------------------------------
+
+    def read(self, offset: int = 0, *, limit: int = 1000) -> list[tuple[int, MeshEvent]]:
+        """Up to *limit* ``(offset, event)`` pairs starting at *offset*.
+
+        An *offset* older than the oldest retained segment starts there.
+        """
+        bases = self.segments()
+        index = max(0, bisect.bisect_right(bases, offset) - 1)
+        out: list[tuple[int, MeshEvent]] = []
+        for base in bases[index:]:
+            try:
+                handle = open(self.segment_path(base), "rb")
+            except OSError:
+                continue  # Pruned while we were reading.
+            with handle:
+                for line in handle:
+                    if not line.endswith(b"\n"):
+                        break
+                    record = _parse(line)
+                    if record is None or record["offset"] < offset:
+                        continue
+                    event = _event(record)
+                    if event is not None:
+                        out.append((record["offset"], event))
+                        if len(out) >= limit:
+                            return out
+        return out
+
+    def consumer(self, name: str) -> EventLogConsumer:
+        return EventLogConsumer(self, name)
+
+
+class EventLogConsumer:
+    """Named tailing reader with a persisted cursor.
+
+    ``poll`` continues from the byte position of its last read, moving to the
+    next segment when the current one is exhausted, so tailing costs only the
+    new bytes.  ``commit`` persists the next offset to read; a consumer
+    created later with the same name resumes there.
+    """
+
+    def __init__(self, log: MeshEventLog, name: str) -> None:
+        slug = _CONSUMER_NAME.sub("_", name).strip("._")
+        if not slug:
+            raise ValueError(f"invalid consumer name: {name!r}")
+        self.log = log
+        self.name = slug
+        self.cursor_path = log.directory / "cursors" / f"{slug}.json"
+        self.position = self._load_committed()
+        self._segment: int | None = None
+        self._byte_pos = 0
+
+    def _load_committed(self) -> int:
+        try:
+            payload = json.loads(self.cursor_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return 0
+        offset = payload.get("offset") if isinstance(payload, dict) else None
+        return offset if isinstance(offset, int) and offset >= 0 else 0
+
+    def seek(self, offset: int) -> None:
+        """Replay from *offset* on the next ``poll``."""
+        self.position = max(0, int(offset))
+        self._segment = None
+        self._byte_pos = 0
+
+    def commit(self, offset: int | None = None) -> None:
+        """Persist *offset* (default: everything polled so far) as consumed."""
+        value = self.position if offset is None else int(offset)
+        self.cursor_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.cursor_path.with_name(f".{self.cursor_path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"offset": value, "updated_at": time.time()}) + "\n", encoding="utf-8")
+        os.replace(tmp, self.cursor_path)
+
+    def _read_new(self, limit: int) -> list[tuple[int, MeshEvent]]:
+        out: list[tuple[int, MeshEvent]] = []
+        while len(out) < limit:
+            bases = self.log.segments()
+            if self._segment is None or self._segment not in bases:
+                # First poll, or our segment was pruned: locate the offset again.
+                self._segment = bases[max(0, bisect.bisect_right(bases, self.position) - 1)] if bases else None
+                self._byte_pos = 0
+                if self._segment is None:
+                    return out
+            try:
+                handle = open(self.log.segment_path(self._segment), "rb")
+            except OSError:
+                self._segment = None
+                continue
+            with handle:
+                handle.seek(self._byte_pos)
+                for line in handle:
+                    if not line.endswith(b"\n"):
+                        break  # Still being written.
+                    self._byte_pos += len(line)
+                    record = _parse(line)
+                    if record is None or record["offset"] < self.position:
+                        continue
+                    event = _event(record)
+                    self.position = record["offset"] + 1
+                    if event is not None:
+                        out.append((record["offset"], event))
+                        if len(out) >= limit:
+                            return out
+            later = [base for base in bases if base > self._segment]
+            if not later:
+                return out
+            self._segment, self._byte_pos = later[0], 0
+        return out
+
+    def poll(
+        self,
+        *,
+        limit: int = 1000,
+        timeout: float = 0.0,
+        interval: float = DEFAULT_POLL_INTERVAL_SEC,
+    ) -> list[tuple[int, MeshEvent]]:
+        """New ``(offset, event)`` pairs, waiting up to *timeout* for the first."""
+        deadline = time.monotonic() + timeout
+        while True:
+            events = self._read_new(limit)
+            if events or time.monotonic() >= deadline:
+                return events
+            time.sleep(interval)
@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import argparse
 import atexit
+import copy
 import datetime as dt
 import json
 import os
@@ -26,8 +27,18 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable
 
+from .control_socket import ControlServer
 from .protocols import MCPContextBundle, SkillProtocolSpec, load_mcp_context, load_skill_protocol
+from .swarm_orchestrator import TaskComplexity, classify_complexity
 from .task_queue import read_checkpoint, write_checkpoint
+from .worktree_pool import (
+    GIT_LOCK_BASENAMES,
+    WorktreeLease,
+    WorktreePool,
+    WorktreePoolError,
+    pool_dir_for_repo,
+    resolve_git_dir,
+)
 
 STATUS_PENDING = "pending"
 STATUS_IN_PROGRESS = "in_progress"
@@ -90,7 +101,6 @@ VALIDATION_FALLBACKS = {
 }
 
 TEST_COMMAND_HINTS = ("pytest", "make test")
-GIT_LOCK_BASENAMES = ("index.lock", "HEAD.lock", "packed-refs.lock")
 PR_URL_PATTERN = re.compile(r"https://github\.com/[^\s]+/pull/\d+", re.IGNORECASE)
 REVIEW_STATUS_PATTERN = re.compile(r"\breview_status\s*[:=]\s*(pass|passed|fail|failed)\b", re.IGNORECASE)
 REVIEW_SCORE_PATTERN = re.compile(r"\breview_score\s*[:=]\s*([0-9]{1,3})\b", re.IGNORECASE)
@@ -269,8 +279,8 @@ def has_running_git_processes() -> bool:
 
 
 def find_git_lock_files(repo: Path) -> list[Path]:
-    git_dir = repo / ".git"
-    if not git_dir.is_dir():
+    git_dir = resolve_git_dir(repo)
+    if git_dir is None:
         return []
     lock_files: list[Path] = []
     for name in GIT_LOCK_BASENAMES:
@@ -328,8 +338,8 @@ def get_repo_filetype_context(repo: Path, limit: int = 8) -> str:
 
 def repo_state_hints(repo: Path) -> list[str]:
     hints: list[str] = []
-    git_dir = repo / ".git"
-    if not git_dir.exists():
+    git_dir = resolve_git_dir(repo)
+    if git_dir is None:
         return hints
     if (git_dir / "MERGE_HEAD").exists():
         hints.append("Merge in progress detected (.git/MERGE_HEAD).")
@@ -353,6 +363,38 @@ def is_test_command(raw: str) -> bool:
     return any(hint in normalized for hint in TEST_COMMAND_HINTS)
 
 
+HEARTBEAT_FD_ENV = "ORXAQ_AUTONOMY_HEARTBEAT_FD"
+_heartbeat_tick_state: dict[str, int] = {}
+# Latest heartbeat payload, served from memory over the control socket.
+_last_heartbeat: dict[str, dict[str, Any]] = {}
+
+
+def send_heartbeat_tick(phase: str) -> None:
+    """Notify a supervising process over the inherited heartbeat pipe, if any.
+
+    Writes are non-blocking: a full or closed pipe is ignored because the
+    heartbeat file remains the durable fallback signal.
+    """
+    fd = _heartbeat_tick_state.get("fd")
+    if fd is None:
+        raw = os.environ.get(HEARTBEAT_FD_ENV, "").strip()
+        fd = int(raw) if raw.isdigit() else -1
+        if fd >= 0:
+            try:
+                os.set_blocking(fd, False)
+            except OSError:
+                fd = -1
+        _heartbeat_tick_state["fd"] = fd
+    if fd < 0:
+        return
+    try:
+        os.write(fd, f"{phase}\n".encode("utf-8"))
+    except BlockingIOError:
+        return
+    except OSError:
+        _heartbeat_tick_state["fd"] = -1
+
+
 def write_heartbeat(
     path: Path,
     *,
@@ -373,10 +415,41 @@ def write_heartbeat(
     if extra:
         payload.update(extra)
     _write_json(path, payload)
+    _last_heartbeat["payload"] = payload
+    send_heartbeat_tick(phase)
+
+
+_INPUT_CACHE: dict[Path, tuple[tuple[int, int, int], Any]] = {}
+
+
+def _read_json_cached(path: Path) -> Any:
+    """Parse *path* once per (inode, mtime, size); callers must treat the result as read-only."""
+    stat = path.stat()
+    key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    cached = _INPUT_CACHE.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    value = json.loads(_read_text(path))
+    _INPUT_CACHE[path] = (key, value)
+    return value
+
+
+def preload_inputs(*paths: Path) -> list[Path]:
+    """Warm the input cache for a standby runner; returns paths that were (re)parsed."""
+    refreshed: list[Path] = []
+    for path in paths:
+        before = _INPUT_CACHE.get(path)
+        try:
+            _read_json_cached(path)
+        except (OSError, ValueError):
+            continue
+        if _INPUT_CACHE.get(path) is not before:
+            refreshed.append(path)
+    return refreshed
 
 
 def load_tasks(path: Path) -> list[Task]:
-    raw = json.loads(_read_text(path))
+    raw = _read_json_cached(path)
     if not isinstance(raw, list):
         raise ValueError(f"Task file must be a JSON array: {path}")
     tasks: list[Task] = []
@@ -404,31 +477,39 @@ def load_tasks(path: Path) -> list[Task]:
 
 def load_state(path: Path, tasks: list[Task]) -> dict[str, dict[str, Any]]:
     if path.exists():
-        raw = json.loads(_read_text(path))
+        raw = _read_json_cached(path)
         if not isinstance(raw, dict):
             raise ValueError(f"State file must be a JSON object: {path}")
     else:
         raw = {}
 
-    out: dict[str, dict[str, Any]] = {}
-    for task in tasks:
-        entry = raw.get(task.id, {})
-        status = str(entry.get("status", STATUS_PENDING))
-        if status not in VALID_STATUSES:
-            status = STATUS_PENDING
-        if status == STATUS_IN_PROGRESS:
-            # Recover from interrupted runs without deadlocking task selection.
-            status = STATUS_PENDING
-        out[task.id] = {
-            "status": status,
-            "attempts": _safe_int(entry.get("attempts", 0), 0),
-            "retryable_failures": _safe_int(entry.get("retryable_failures", 0), 0),
-            "not_before": str(entry.get("not_before", "")),
-            "last_update": str(entry.get("last_update", "")),
-            "last_summary": str(entry.get("last_summary", "")),
-            "last_error": str(entry.get("last_error", "")),
-            "owner": task.owner,
-        }
+    return {task.id: _normalize_state_entry(raw.get(task.id, {}), task) for task in tasks}
+
+
+def _normalize_state_entry(entry: Any, task: Task, *, keep_live_claims: bool = False) -> dict[str, Any]:
+    if not isinstance(entry, dict):
+        entry = {}
+    status = str(entry.get("status", STATUS_PENDING))
+    if status not in VALID_STATUSES:
+        status = STATUS_PENDING
+    worker_pid = _safe_int(entry.get("worker_pid", 0), 0)
+    claimed = keep_live_claims and status == STATUS_IN_PROGRESS and _pid_is_running(worker_pid)
+    if status == STATUS_IN_PROGRESS and not claimed:
+        # Recover from interrupted runs without deadlocking task selection.
+        status = STATUS_PENDING
+    out = {
+        "status": status,
+        "attempts": _safe_int(entry.get("attempts", 0), 0),
+        "retryable_failures": _safe_int(entry.get("retryable_failures", 0), 0),
+        "not_before": str(entry.get("not_before", "")),
+        "last_update": str(entry.get("last_update", "")),
+        "last_summary": str(entry.get("last_summary", "")),
+        "last_error": str(entry.get("last_error", "")),
+        "owner": task.owner,
+    }
+    if entry.get("worker"):
+        out["worker"] = str(entry["worker"])
+        out["worker_pid"] = worker_pid
     return out
 
 
@@ -436,6 +517,107 @@ def save_state(path: Path, state: dict[str, dict[str, Any]]) -> None:
     _write_json(path, state)
 
 
+class StateFileMutex:
+    """Short-lived cross-process mutex for read-modify-write of a shared state file.
+
+    Only used when several runner workers share one state file.  A holder that
+    died or held the lock longer than ``stale_sec`` is broken.
+    """
+
+    def __init__(self, path: Path, *, stale_sec: float = 30.0, poll_sec: float = 0.05) -> None:
+        self.path = path
+        self.stale_sec = stale_sec
+        self.poll_sec = poll_sec
+
+    def _break_if_stale(self) -> None:
+        try:
+            age = time.time() - self.path.stat().st_mtime
+            raw = self.path.read_text(encoding="utf-8").strip()
+        except OSError:
+            return
+        holder = int(raw) if raw.isdigit() else 0
+        if age > self.stale_sec or (holder and not _pid_is_running(holder)):
+            self.path.unlink(missing_ok=True)
+
+    def __enter__(self) -> "StateFileMutex":
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        while True:
+            try:
+                fd = os.open(str(self.path), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                self._break_if_stale()
+                time.sleep(self.poll_sec)
+                continue
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(f"{os.getpid()}\n")
+            return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.path.unlink(missing_ok=True)
+
+
+def sync_shared_state(
+    path: Path,
+    state: dict[str, dict[str, Any]],
+    tasks: list[Task],
+    owned_ids: set[str],
+) -> None:
+    """Merge a worker's view with the shared state file; call while holding ``StateFileMutex``.
+
+    Entries in ``owned_ids`` (tasks this worker has claimed) are authoritative
+    locally; every other entry is adopted from disk, keeping in-progress claims
+    of live workers.  The merged map is written back.
+    """
+    raw = _read_json_cached(path) if path.exists() else {}
+    if not isinstance(raw, dict):
+        raw = {}
+    for task in tasks:
+        if task.id in owned_ids:
+            continue
+        state[task.id] = _normalize_state_entry(raw.get(task.id, {}), task, keep_live_claims=True)
+    save_state(path, state)
+
+
+def queue_stats(state: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    counts = {status: 0 for status in sorted(VALID_STATUSES)}
+    blocked: list[str] = []
+    for task_id, entry in list(state.items()):
+        status = str(entry.get("status", STATUS_PENDING))
+        counts[status] = counts.get(status, 0) + 1
+        if status == STATUS_BLOCKED:
+            blocked.append(task_id)
+    return {"counts": counts, "total": sum(counts.values()), "blocked": blocked}
+
+
+def claim_tasks(batch: list[Task], state: dict[str, dict[str, Any]], *, worker_id: str = "") -> None:
+    for member in batch:
+        member_state = state[member.id]
+        member_state["status"] = STATUS_IN_PROGRESS
+        member_state["last_update"] = _now_iso()
+        member_state["attempts"] = _safe_int(member_state.get("attempts", 0), 0) + 1
+        member_state["not_before"] = ""
+        if worker_id:
+            member_state["worker"] = worker_id
+            member_state["worker_pid"] = os.getpid()
+
+
+def other_workers_active(
+    tasks: list[Task],
+    state: dict[str, dict[str, Any]],
+    lane_ids: set[str],
+    worker_id: str,
+) -> bool:
+    """True while another worker holds a claim or has pending work outside this worker's lane."""
+    for task in tasks:
+        entry = state[task.id]
+        status = entry.get("status")
+        if status == STATUS_IN_PROGRESS and entry.get("worker") != worker_id:
+            return True
+        if status == STATUS_PENDING and task.id not in lane_ids:
+            return True
+    return False
+
+
 def apply_checkpoint_state(
     state: dict[str, dict[str, Any]],
     tasks: list[Task],
@@ -481,8 +663,7 @@ def _task_ready_now(entry: dict[str, Any], now: dt.datetime) -> bool:
     return now >= not_before
 
 
-def select_next_task(tasks: list[Task], state: dict[str, dict[str, Any]], now: dt.datetime | None = None) -> Task | None:
-    now = now or _now_utc()
+def _ready_tasks(tasks: list[Task], state: dict[str, dict[str, Any]], now: dt.datetime) -> list[Task]:
     ready: list[Task] = []
     for task in tasks:
         entry = state[task.id]
@@ -494,11 +675,44 @@ def select_next_task(tasks: list[Task], state: dict[str, dict[str, Any]], now: d
         if not task_dependencies_done(task, state):
             continue
         ready.append(task)
-    if not ready:
-        return None
     owner_rank = {"codex": 0, "gemini": 1}
     ready.sort(key=lambda t: (t.priority, owner_rank[t.owner], t.id))
-    return ready[0]
+    return ready
+
+
+def select_next_task(tasks: list[Task], state: dict[str, dict[str, Any]], now: dt.datetime | None = None) -> Task | None:
+    ready = _ready_tasks(tasks, state, now or _now_utc())
+    return ready[0] if ready else None
+
+
+def task_is_batchable(task: Task) -> bool:
+    """Only LOW-complexity tasks, judged across title, description and acceptance, may share a run."""
+    text = " ".join([task.title, task.description, *task.acceptance])
+    return classify_complexity(text) == TaskComplexity.LOW
+
+
+def select_task_batch(
+    tasks: list[Task],
+    state: dict[str, dict[str, Any]],
+    *,
+    max_batch_size: int,
+    now: dt.datetime | None = None,
+) -> list[Task]:
+    ready = _ready_tasks(tasks, state, now or _now_utc())
+    if not ready:
+        return []
+    lead = ready[0]
+    if max_batch_size <= 1 or not task_is_batchable(lead):
+        return [lead]
+    batch = [lead]
+    for candidate in ready[1:]:
+        if len(batch) >= max_batch_size:
+            break
+        # Owner decides the repository, so same owner means same checkout.
+        if candidate.owner != lead.owner or not task_is_batchable(candidate):
+            continue
+        batch.append(candidate)
+    return batch
 
 
 def soonest_pending_time(tasks: list[Task], state: dict[str, dict[str, Any]]) -> dt.datetime | None:
@@ -517,39 +731,34 @@ def soonest_pending_time(tasks: list[Task], state: dict[str, dict[str, Any]]) ->
     return soonest
 
 
-def build_agent_prompt(
-    task: Task,
+def _render_retry_context(retry_context: dict[str, Any] | None) -> str:
+    if not retry_context:
+        return ""
+    attempts = _safe_int(retry_context.get("attempts", 0), 0)
+    if attempts <= 1 and not retry_context.get("last_error"):
+        return ""
+    return (
+        "\nPrevious attempt context:\n"
+        f"- Attempts so far: {attempts}\n"
+        f"- Prior summary: {str(retry_context.get('last_summary', '')).strip()[:800]}\n"
+        f"- Prior blocker/error: {str(retry_context.get('last_error', '')).strip()[:1200]}\n"
+        "- Recovery directive: Continue from the current repository state and finish all acceptance criteria.\n"
+    )
+
+
+def _render_prompt_preamble(
     objective_text: str,
-    role: str,
-    repo_path: Path,
-    retry_context: dict[str, Any] | None,
-    repo_context: str,
     repo_hints: list[str],
     skill_protocol: SkillProtocolSpec,
     mcp_context: MCPContextBundle | None,
-) -> str:
-    acceptance = "\n".join(f"- {item}" for item in task.acceptance) or "- No explicit acceptance items"
-
-    continuation_block = ""
-    if retry_context:
-        attempts = _safe_int(retry_context.get("attempts", 0), 0)
-        if attempts > 1 or retry_context.get("last_error"):
-            continuation_block = (
-                "\nPrevious attempt context:\n"
-                f"- Attempts so far: {attempts}\n"
-                f"- Prior summary: {str(retry_context.get('last_summary', '')).strip()[:800]}\n"
-                f"- Prior blocker/error: {str(retry_context.get('last_error', '')).strip()[:1200]}\n"
-                "- Recovery directive: Continue from the current repository state and finish all acceptance criteria.\n"
-            )
-
+) -> tuple[str, str]:
     repo_hints_text = ""
     if repo_hints:
         hints = "\n".join(f"- {hint}" for hint in repo_hints)
         repo_hints_text = f"Repository state hints:\n{hints}\n"
     protocol_behaviors = "\n".join(f"- {item}" for item in skill_protocol.required_behaviors)
     mcp_context_text = mcp_context.render_context() + "\n" if mcp_context else ""
-
-    return (
+    preamble = (
         f"{objective_text.strip()}\n\n"
         f"Autonomy skill protocol:\n"
         f"- Name: {skill_protocol.name}\n"
@@ -558,6 +767,51 @@ def build_agent_prompt(
         f"- Required behaviors:\n{protocol_behaviors}\n"
         f"- File-type policy: {skill_protocol.filetype_policy}\n\n"
         f"{mcp_context_text}"
+    )
+    return preamble, repo_hints_text
+
+
+COMMON_EXECUTION_REQUIREMENTS = (
+    "- Do not ask for user nudges unless blocked by credentials, destructive actions, or true tradeoff decisions.\n"
+    "- Always create/switch to an issue-linked branch (`codex/issue-<id>-<topic>`) before edits.\n"
+    "- Add or update unit tests and run tests before every commit.\n"
+    "- Commit every validated logical change and push contiguous blocks of related commits.\n"
+    "- Open or update a pull request for each pushed block and include the PR URL in your report.\n"
+    "- Add a higher-level review to-do so reviewer lanes can process the pull request.\n"
+    "- If review fails, record the review score, create an urgent fix to-do, and pick up the urgent fix in the next cycle.\n"
+    "- Continue review/fix cycles without stalling until review passes and merge effectiveness is confirmed (branch gone).\n"
+    "- Run validation commands: `make lint` then `make test`.\n"
+    "- If a command fails transiently (rate limits/network/timeouts), retry with resilient fallbacks before giving up.\n"
+    "- Use non-interactive commands only (never wait for terminal prompts).\n"
+    "- Handle new/unknown file types safely: preserve binary formats, avoid destructive rewrites, and add `.gitattributes` entries when needed.\n"
+    "- If git locks or in-progress git states are detected, recover safely and continue.\n"
+)
+
+DELIVERY_MARKER_REQUIREMENTS = (
+    "- For implementation-owner output, include machine-readable markers in summary/next_actions:\n"
+    "  branch=<branch>, tests_pre_commit=<commands>, pr_url=<url>, higher_level_review_todo=<id>, "
+    "review_status=<passed|failed>, review_score=<0-100>, urgent_fix=<yes|no>, merge_effective=<branch_gone|pending>.\n"
+    "- status must be one of: done, partial, blocked.\n"
+)
+
+
+def build_agent_prompt(
+    task: Task,
+    objective_text: str,
+    role: str,
+    repo_path: Path,
+    retry_context: dict[str, Any] | None,
+    repo_context: str,
+    repo_hints: list[str],
+    skill_protocol: SkillProtocolSpec,
+    mcp_context: MCPContextBundle | None,
+) -> str:
+    acceptance = "\n".join(f"- {item}" for item in task.acceptance) or "- No explicit acceptance items"
+    continuation_block = _render_retry_context(retry_context)
+    preamble, repo_hints_text = _render_prompt_preamble(objective_text, repo_hints, skill_protocol, mcp_context)
+
+    return (
+        f"{preamble}"
         "Current autonomous task:\n"
         f"- Task ID: {task.id}\n"
         f"- Title: {task.title}\n"
@@ -572,24 +826,56 @@ def build_agent_prompt(
         "- Scope boundary: complete only the current autonomous task listed above.\n"
         "- Do not start another task in this run; return final JSON immediately after this task is done/partial/blocked.\n"
         "- Work fully autonomously for this task.\n"
-        "- Do not ask for user nudges unless blocked by credentials, destructive actions, or true tradeoff decisions.\n"
-        "- Always create/switch to an issue-linked branch (`codex/issue-<id>-<topic>`) before edits.\n"
-        "- Add or update unit tests and run tests before every commit.\n"
-        "- Commit every validated logical change and push contiguous blocks of related commits.\n"
-        "- Open or update a pull request for each pushed block and include the PR URL in your report.\n"
-        "- Add a higher-level review to-do so reviewer lanes can process the pull request.\n"
-        "- If review fails, record the review score, create an urgent fix to-do, and pick up the urgent fix in the next cycle.\n"
-        "- Continue review/fix cycles without stalling until review passes and merge effectiveness is confirmed (branch gone).\n"
-        "- Run validation commands: `make lint` then `make test`.\n"
-        "- If a command fails transiently (rate limits/network/timeouts), retry with resilient fallbacks before giving up.\n"
-        "- Use non-interactive commands only (never wait for terminal prompts).\n"
-        "- Handle new/unknown file types safely: preserve binary formats, avoid destructive rewrites, and add `.gitattributes` entries when needed.\n"
-        "- If git locks or in-progress git states are detected, recover safely and continue.\n"
+        f"{COMMON_EXECUTION_REQUIREMENTS}"
         "- Return ONLY JSON with keys: status, summary, commit, validations, next_actions, blocker.\n"
-        "- For implementation-owner output, include machine-readable markers in summary/next_actions:\n"
-        "  branch=<branch>, tests_pre_commit=<commands>, pr_url=<url>, higher_level_review_todo=<id>, "
-        "review_status=<passed|failed>, review_score=<0-100>, urgent_fix=<yes|no>, merge_effective=<branch_gone|pending>.\n"
-        "- status must be one of: done, partial, blocked.\n"
+        f"{DELIVERY_MARKER_REQUIREMENTS}"
+    )
+
+
+def build_batch_agent_prompt(
+    tasks: list[Task],
+    objective_text: str,
+    role: str,
+    repo_path: Path,
+    retry_contexts: dict[str, dict[str, Any]],
+    repo_context: str,
+    repo_hints: list[str],
+    skill_protocol: SkillProtocolSpec,
+    mcp_context: MCPContextBundle | None,
+) -> str:
+    preamble, repo_hints_text = _render_prompt_preamble(objective_text, repo_hints, skill_protocol, mcp_context)
+    task_blocks: list[str] = []
+    for idx, task in enumerate(tasks, start=1):
+        acceptance = "\n".join(f"  - {item}" for item in task.acceptance) or "  - No explicit acceptance items"
+        continuation = _render_retry_context(retry_contexts.get(task.id))
+        task_blocks.append(
+            f"{idx}. Task ID: {task.id}\n"
+            f"- Title: {task.title}\n"
+            f"- Description: {task.description}\n"
+            f"- Acceptance criteria:\n{acceptance}\n"
+            f"{continuation}"
+        )
+    task_ids = ", ".join(task.id for task in tasks)
+
+    return (
+        f"{preamble}"
+        f"Current autonomous task batch ({len(tasks)} small tasks):\n"
+        f"- Owner role: {role}\n"
+        f"- Repository path: {repo_path}\n"
+        f"- Repository file profile: {repo_context}\n"
+        f"{repo_hints_text}\n"
+        + "\n".join(task_blocks)
+        + "\n"
+        "Execution requirements:\n"
+        f"- Scope boundary: complete only the batched tasks listed above ({task_ids}), one after another.\n"
+        "- Keep each task's changes in its own commit so results can be attributed per task.\n"
+        "- A failure in one task must not stop work on the remaining tasks; report it and move on.\n"
+        "- Work fully autonomously for these tasks.\n"
+        f"{COMMON_EXECUTION_REQUIREMENTS}"
+        "- Return ONLY JSON with keys: tasks, usage.\n"
+        "- tasks must contain exactly one object per batched task with keys: "
+        "task_id, status, summary, commit, validations, next_actions, blocker.\n"
+        f"{DELIVERY_MARKER_REQUIREMENTS}"
     )
 
 
@@ -906,7 +1192,14 @@ def init_budget_state(
     return {
         "started_at": _now_iso(),
         "elapsed_sec": 0,
-        "totals": {"tokens": 0, "cost_usd": 0.0, "retry_events": 0},
+        "totals": {
+            "tokens": 0,
+            "cost_usd": 0.0,
+            "retry_events": 0,
+            "validation_runs": 0,
+            "validation_failures": 0,
+            "validation_sec": 0.0,
+        },
         "limits": {
             "max_runtime_sec": max(0, max_runtime_sec),
             "max_total_tokens": max(0, max_total_tokens),
@@ -935,6 +1228,14 @@ def increment_retry_events(budget: dict[str, Any]) -> None:
     totals["retry_events"] = _safe_int(totals.get("retry_events", 0), 0) + 1
 
 
+def record_validation_run(budget: dict[str, Any], *, duration_sec: float, ok: bool) -> None:
+    totals = budget.setdefault("totals", {})
+    totals["validation_runs"] = _safe_int(totals.get("validation_runs", 0), 0) + 1
+    if not ok:
+        totals["validation_failures"] = _safe_int(totals.get("validation_failures", 0), 0) + 1
+    totals["validation_sec"] = round(_safe_float(totals.get("validation_sec", 0.0), 0.0) + max(0.0, duration_sec), 3)
+
+
 def evaluate_budget_violations(budget: dict[str, Any]) -> list[str]:
     totals = budget.get("totals", {})
     limits = budget.get("limits", {})
@@ -961,6 +1262,114 @@ def evaluate_budget_violations(budget: dict[str, Any]) -> list[str]:
     return violations
 
 
+TESTING_OWNER_CONSTRAINTS = (
+    "\nTesting-owner constraints:\n"
+    "- Focus on tests/specs/benchmarks and validation depth.\n"
+    "- Avoid production code edits unless strictly required to keep tests executable.\n"
+)
+
+
+def _codex_exec_command(
+    *,
+    codex_cmd: str,
+    codex_model: str | None,
+    repo: Path,
+    schema_path: Path,
+    output_file: Path,
+    prompt: str,
+) -> list[str]:
+    cmd = [
+        codex_cmd,
+        "exec",
+        "--cd",
+        str(repo),
+        "--skip-git-repo-check",
+        "--dangerously-bypass-approvals-and-sandbox",
+        "--output-schema",
+        str(schema_path),
+        "--output-last-message",
+        str(output_file),
+        prompt,
+    ]
+    if codex_model:
+        cmd[2:2] = ["--model", codex_model]
+    return cmd
+
+
+def _gemini_command(*, gemini_cmd: str, gemini_model: str | None, prompt: str) -> list[str]:
+    cmd = [
+        gemini_cmd,
+        "--approval-mode",
+        "yolo",
+        "--output-format",
+        "text",
+        "-p",
+        prompt,
+    ]
+    if gemini_model:
+        cmd[1:1] = ["--model", gemini_model]
+    return cmd
+
+
+def build_batch_result_schema(single_schema: dict[str, Any]) -> dict[str, Any]:
+    """Wrap the per-task result schema so one agent run can report several tasks."""
+    properties = single_schema.get("properties", {})
+    properties = properties if isinstance(properties, dict) else {}
+    item = copy.deepcopy(single_schema)
+    item.pop("$schema", None)
+    item.pop("title", None)
+    item_properties = dict(properties)
+    usage_schema = item_properties.pop("usage", {"type": "object"})
+    item_properties["task_id"] = {"type": "string", "minLength": 1}
+    item["type"] = "object"
+    item["properties"] = item_properties
+    required = [str(key) for key in single_schema.get("required", []) if key != "usage"]
+    item["required"] = ["task_id", *required]
+    return {
+        "$schema": single_schema.get("$schema", "http://json-schema.org/draft-07/schema#"),
+        "title": "CodexAutonomyBatchResult",
+        "type": "object",
+        "required": ["tasks", "usage"],
+        "properties": {
+            "tasks": {"type": "array", "items": item},
+            "usage": copy.deepcopy(usage_schema),
+        },
+        "additionalProperties": False,
+    }
+
+
+def split_batch_outcome(tasks: list[Task], raw: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """Map a batch result back onto each task; missing entries count as partial progress."""
+    by_id: dict[str, dict[str, Any]] = {}
+    entries = raw.get("tasks", [])
+    for item in entries if isinstance(entries, list) else []:
+        if isinstance(item, dict) and str(item.get("task_id", "")).strip():
+            by_id.setdefault(str(item["task_id"]).strip(), item)
+
+    outcomes: dict[str, dict[str, Any]] = {}
+    for idx, task in enumerate(tasks):
+        item = dict(by_id.get(task.id, {}))
+        if not item:
+            item = {
+                "status": STATUS_PARTIAL,
+                "summary": "Batch result did not report this task",
+                "blocker": f"Missing entry for task_id={task.id} in batch output.",
+                "next_actions": [],
+            }
+        if idx == 0:
+            # Usage is reported once per invocation; attribute it to the lead task so it is counted exactly once.
+            for key in ("usage", "tokens", "total_tokens", "cost_usd"):
+                if key in raw and key not in item:
+                    item[key] = raw[key]
+        outcomes[task.id] = normalize_outcome(item)
+    return outcomes
+
+
+def _batch_failure(tasks: list[Task], summary: str, blocker: str) -> dict[str, dict[str, Any]]:
+    outcome = normalize_outcome({"status": STATUS_BLOCKED, "summary": summary, "blocker": blocker, "next_actions": []})
+    return {task.id: dict(outcome) for task in tasks}
+
+
 def run_codex_task(
     *,
     task: Task,
@@ -992,21 +1401,14 @@ def run_codex_task(
         mcp_context=mcp_context,
     )
 
-    cmd = [
-        codex_cmd,
-        "exec",
-        "--cd",
-        str(repo),
-        "--skip-git-repo-check",
-        "--dangerously-bypass-approvals-and-sandbox",
-        "--output-schema",
-        str(schema_path),
-        "--output-last-message",
-        str(output_file),
-        prompt,
-    ]
-    if codex_model:
-        cmd[2:2] = ["--model", codex_model]
+    cmd = _codex_exec_command(
+        codex_cmd=codex_cmd,
+        codex_model=codex_model,
+        repo=repo,
+        schema_path=schema_path,
+        output_file=output_file,
+        prompt=prompt,
+    )
 
     _print(f"Running Codex task {task.id}")
     result = run_command(cmd, cwd=repo, timeout_sec=timeout_sec, progress_callback=progress_callback)
@@ -1059,23 +1461,8 @@ def run_gemini_task(
         skill_protocol=skill_protocol,
         mcp_context=mcp_context,
     )
-    prompt += (
-        "\nTesting-owner constraints:\n"
-        "- Focus on tests/specs/benchmarks and validation depth.\n"
-        "- Avoid production code edits unless strictly required to keep tests executable.\n"
-    )
-
-    cmd = [
-        gemini_cmd,
-        "--approval-mode",
-        "yolo",
-        "--output-format",
-        "text",
-        "-p",
-        prompt,
-    ]
-    if gemini_model:
-        cmd[1:1] = ["--model", gemini_model]
+    prompt += TESTING_OWNER_CONSTRAINTS
+    cmd = _gemini_command(gemini_cmd=gemini_cmd, gemini_model=gemini_model, prompt=prompt)
 
     _print(f"Running Gemini task {task.id}")
     result = run_command(cmd, cwd=repo, timeout_sec=timeout_sec, progress_callback=progress_callback)
@@ -1100,6 +1487,111 @@ def run_gemini_task(
     return True, normalize_outcome(parsed)
 
 
+def run_codex_batch(
+    *,
+    tasks: list[Task],
+    repo: Path,
+    objective_text: str,
+    schema_path: Path,
+    output_dir: Path,
+    codex_cmd: str,
+    codex_model: str | None,
+    timeout_sec: int,
+    retry_contexts: dict[str, dict[str, Any]],
+    progress_callback: Callable[[int], None] | None,
+    repo_context: str,
+    repo_hints: list[str],
+    skill_protocol: SkillProtocolSpec,
+    mcp_context: MCPContextBundle | None,
+) -> tuple[bool, dict[str, dict[str, Any]]]:
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_file = output_dir / f"batch_{tasks[0].id}_codex_result.json"
+    try:
+        single_schema = json.loads(_read_text(schema_path))
+    except (OSError, json.JSONDecodeError):
+        single_schema = {}
+    batch_schema_path = output_dir / "codex_batch_result.schema.json"
+    _write_json(batch_schema_path, build_batch_result_schema(single_schema if isinstance(single_schema, dict) else {}))
+    prompt = build_batch_agent_prompt(
+        tasks,
+        objective_text,
+        role="implementation-owner",
+        repo_path=repo,
+        retry_contexts=retry_contexts,
+        repo_context=repo_context,
+        repo_hints=repo_hints,
+        skill_protocol=skill_protocol,
+        mcp_context=mcp_context,
+    )
+    cmd = _codex_exec_command(
+        codex_cmd=codex_cmd,
+        codex_model=codex_model,
+        repo=repo,
+        schema_path=batch_schema_path,
+        output_file=output_file,
+        prompt=prompt,
+    )
+
+    _print(f"Running Codex batch {', '.join(task.id for task in tasks)}")
+    result = run_command(cmd, cwd=repo, timeout_sec=timeout_sec, progress_callback=progress_callback)
+    if result.returncode != 0:
+        return False, _batch_failure(tasks, "Codex command failed", (result.stdout + "\n" + result.stderr).strip())
+
+    parsed = parse_json_text(output_file.read_text(encoding="utf-8")) if output_file.exists() else None
+    if parsed is None:
+        return False, _batch_failure(
+            tasks,
+            "Codex produced non-JSON final output",
+            "Expected JSON object in output-last-message file.",
+        )
+    return True, split_batch_outcome(tasks, parsed)
+
+
+def run_gemini_batch(
+    *,
+    tasks: list[Task],
+    repo: Path,
+    objective_text: str,
+    gemini_cmd: str,
+    gemini_model: str | None,
+    timeout_sec: int,
+    retry_contexts: dict[str, dict[str, Any]],
+    progress_callback: Callable[[int], None] | None,
+    repo_context: str,
+    repo_hints: list[str],
+    skill_protocol: SkillProtocolSpec,
+    mcp_context: MCPContextBundle | None,
+) -> tuple[bool, dict[str, dict[str, Any]]]:
+    prompt = build_batch_agent_prompt(
+        tasks,
+        objective_text,
+        role="test-owner",
+        repo_path=repo,
+        retry_contexts=retry_contexts,
+        repo_context=repo_context,
+        repo_hints=repo_hints,
+        skill_protocol=skill_protocol,
+        mcp_context=mcp_context,
+    )
+    prompt += TESTING_OWNER_CONSTRAINTS
+    cmd = _gemini_command(gemini_cmd=gemini_cmd, gemini_model=gemini_model, prompt=prompt)
+
+    _print(f"Running Gemini batch {', '.join(task.id for task in tasks)}")
+    result = run_command(cmd, cwd=repo, timeout_sec=timeout_sec, progress_callback=progress_callback)
+    if result.returncode != 0:
+        return False, _batch_failure(tasks, "Gemini command failed", (result.stdout + "\n" + result.stderr).strip())
+
+    parsed = parse_json_text(result.stdout)
+    if parsed is None:
+        parsed = {}
+    outcomes = split_batch_outcome(tasks, parsed)
+    if not isinstance(parsed.get("tasks"), list):
+        for outcome in outcomes.values():
+            outcome["summary"] = "Gemini batch output was not strict JSON; treating as partial"
+            outcome["raw_output"] = result.stdout.strip()
+    return True, outcomes
+
+
 def ensure_cli_exists(binary: str, role: str) -> None:
     if shutil.which(binary):
         return
@@ -1215,6 +1707,18 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument("--codex-model", default=None)
     parser.add_argument("--gemini-model", default=None)
     parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument(
+        "--worktree-pool-size",
+        type=int,
+        default=0,
+        help="Lease each task a pooled git worktree instead of the primary checkout (0 disables).",
+    )
+    parser.add_argument(
+        "--batch-max-tasks",
+        type=int,
+        default=1,
+        help="Group up to N ready LOW-complexity tasks with the same owner into one agent run (1 disables).",
+    )
     parser.add_argument("--validation-retries", type=int, default=1)
     parser.add_argument("--max-runtime-sec", type=int, default=0, help="Hard runtime budget in seconds (0 disables).")
     parser.add_argument("--max-total-tokens", type=int, default=0, help="Hard token budget across the run (0 disables).")
@@ -1240,6 +1744,21 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument("--run-id", default="", help="Optional run identifier for checkpoint naming.")
     parser.add_argument("--resume", default="", help="Resume from an existing checkpoint run id.")
     parser.add_argument("--checkpoint-dir", default="artifacts/checkpoints")
+    parser.add_argument(
+        "--worker-id",
+        default="",
+        help="Worker name when several runners share one state file (enables claim-based task selection).",
+    )
+    parser.add_argument(
+        "--control-socket",
+        default="",
+        help="Unix socket path serving live status/queue/budget JSON (empty disables).",
+    )
+    parser.add_argument(
+        "--owner-lanes",
+        default="",
+        help="Comma-separated task owners this worker may run (default: all).",
+    )
     args = parser.parse_args(argv)
 
     impl_repo = Path(args.impl_repo).resolve()
@@ -1278,6 +1797,25 @@ def main(argv: list[str] | None = None) -> int:
     lock.acquire()
     atexit.register(lock.release)
 
+    worktree_pools: dict[Path, WorktreePool] = {}
+    if args.worktree_pool_size > 0:
+        for repo in dict.fromkeys((impl_repo, test_repo)):
+            if resolve_git_dir(repo) is None:
+                continue
+            pool = WorktreePool(
+                repo,
+                pool_dir_for_repo(artifacts_dir / "worktrees", repo),
+                args.worktree_pool_size,
+                lock_stale_sec=args.git_lock_stale_sec,
+            )
+            pool.heal()
+            try:
+                pool.warm()
+            except WorktreePoolError as err:
+                _print(f"Worktree pool disabled for {repo}: {err}")
+                continue
+            worktree_pools[repo] = pool
+
     tasks = load_tasks(tasks_file)
     state = load_state(state_file, tasks)
     if resume_run_id:
@@ -1302,21 +1840,59 @@ def main(argv: list[str] | None = None) -> int:
         trace_enabled=bool(os.environ.get("ORXAQ_TRACE_ENABLED", "")),
     )
 
+    worker_id = args.worker_id.strip()
+    owner_lanes = {lane.strip() for lane in args.owner_lanes.split(",") if lane.strip()}
+    lane_tasks = [task for task in tasks if not owner_lanes or task.owner in owner_lanes]
+    lane_ids = {task.id for task in lane_tasks}
+    shared_state = bool(worker_id)
+    state_mutex = StateFileMutex(state_file.with_name(state_file.name + ".lock"))
+    owned_ids: set[str] = set()
+
     def persist(cycle: int) -> None:
-        save_state(state_file, state)
+        if shared_state:
+            with state_mutex:
+                sync_shared_state(state_file, state, tasks, owned_ids)
+        else:
+            save_state(state_file, state)
         write_checkpoint(path=checkpoint_file, run_id=run_id, cycle=cycle, state=state)
 
+    def live_status(_request: dict[str, Any]) -> dict[str, Any]:
+        heartbeat = _last_heartbeat.get("payload", {})
+        heartbeat_ts = _parse_iso(str(heartbeat.get("timestamp", "")))
+        return {
+            "pid": os.getpid(),
+            "run_id": run_id,
+            "worker": worker_id,
+            "owner_lanes": sorted(owner_lanes),
+            "phase": heartbeat.get("phase", ""),
+            "task_id": heartbeat.get("task_id", ""),
+            "heartbeat": heartbeat,
+            "heartbeat_age_sec": int((_now_utc() - heartbeat_ts).total_seconds()) if heartbeat_ts else -1,
+            "queue": queue_stats(state),
+            "budget": copy.deepcopy(budget_state),
+        }
+
+    if args.control_socket:
+        control = ControlServer(Path(args.control_socket).resolve(), {"status": live_status})
+        if control.start():
+            atexit.register(control.close)
+
     persist(0)
     _write_json(budget_report_file, budget_state)
 
-    _print(f"Starting autonomy runner with {len(tasks)} tasks (run_id={run_id})")
+    startup_extra: dict[str, Any] = {"tasks": len(tasks), "run_id": run_id, "checkpoint_file": str(checkpoint_file)}
+    if worker_id:
+        startup_extra.update({"worker": worker_id, "owner_lanes": sorted(owner_lanes), "lane_tasks": len(lane_tasks)})
+        _print(f"Starting autonomy runner worker {worker_id} with {len(lane_tasks)}/{len(tasks)} tasks (run_id={run_id})")
+    else:
+        _print(f"Starting autonomy runner with {len(tasks)} tasks (run_id={run_id})")
     write_heartbeat(
         heartbeat_file,
         phase="started",
         cycle=0,
         task_id=None,
         message="autonomy runner started",
-        extra={"tasks": len(tasks), "run_id": run_id, "checkpoint_file": str(checkpoint_file)},
+        extra=startup_extra,
     )
 
     for cycle in range(1, args.max_cycles + 1):
@@ -1336,7 +1912,7 @@ def main(argv: list[str] | None = None) -> int:
             )
             return 4
 
-        if all(state[t.id]["status"] == STATUS_DONE for t in tasks):
+        if all(state[t.id]["status"] == STATUS_DONE for t in lane_tasks):
             _print("All tasks are marked done.")
             persist(cycle)
             write_heartbeat(
@@ -1350,11 +1926,21 @@ def main(argv: list[str] | None = None) -> int:
             return 0
 
         now = _now_utc()
-        task = select_next_task(tasks, state, now=now)
-        if task is None:
-            soonest = soonest_pending_time(tasks, state)
-            pending = [t.id for t in tasks if state[t.id]["status"] == STATUS_PENDING]
-            blocked = [t.id for t in tasks if state[t.id]["status"] == STATUS_BLOCKED]
+        if shared_state:
+            # Claim atomically so concurrent workers never pick the same task.
+            with state_mutex:
+                sync_shared_state(state_file, state, tasks, owned_ids)
+                owned_ids.clear()
+                batch = select_task_batch(lane_tasks, state, now=now, max_batch_size=args.batch_max_tasks)
+                claim_tasks(batch, state, worker_id=worker_id)
+                owned_ids.update(member.id for member in batch)
+                save_state(state_file, state)
+        else:
+            batch = select_task_batch(tasks, state, now=now, max_batch_size=args.batch_max_tasks)
+        if not batch:
+            soonest = soonest_pending_time(lane_tasks, state)
+            pending = [t.id for t in lane_tasks if state[t.id]["status"] == STATUS_PENDING]
+            blocked = [t.id for t in lane_tasks if state[t.id]["status"] == STATUS_BLOCKED]
 
             if soonest is not None and soonest > now:
                 sleep_for = min(args.idle_sleep_sec, max(1, int((soonest - now).total_seconds())))
@@ -1369,6 +1955,18 @@ def main(argv: list[str] | None = None) -> int:
                 time.sleep(sleep_for)
                 continue
 
+            if shared_state and other_workers_active(tasks, state, lane_ids, worker_id):
+                write_heartbeat(
+                    heartbeat_file,
+                    phase="idle",
+                    cycle=cycle,
+                    task_id=None,
+                    message="waiting for other workers",
+                    extra={"pending": pending, "blocked": blocked},
+                )
+                time.sleep(max(1, args.idle_sleep_sec))
+                continue
+
             _print(f"No ready tasks remain. Pending={pending}, Blocked={blocked}")
             persist(cycle)
             write_heartbeat(
@@ -1381,328 +1979,393 @@ def main(argv: list[str] | None = None) -> int:
             )
             return 2
 
-        _print(f"Cycle {cycle}: selected task {task.id} ({task.owner})")
-        task_state = state[task.id]
-        task_state["status"] = STATUS_IN_PROGRESS
-        task_state["last_update"] = _now_iso()
-        task_state["attempts"] = _safe_int(task_state.get("attempts", 0), 0) + 1
-        task_state["not_before"] = ""
+        task = batch[0]
+        batch_ids = [member.id for member in batch]
+        if len(batch) > 1:
+            _print(f"Cycle {cycle}: selected batch {', '.join(batch_ids)} ({task.owner})")
+        else:
+            _print(f"Cycle {cycle}: selected task {task.id} ({task.owner})")
+        if not shared_state:
+            claim_tasks(batch, state)
         persist(cycle)
+        started_extra: dict[str, Any] = {"owner": task.owner, "attempts": state[task.id]["attempts"]}
+        if len(batch) > 1:
+            started_extra["batch"] = batch_ids
         write_heartbeat(
             heartbeat_file,
             phase="task_started",
             cycle=cycle,
             task_id=task.id,
-            message=f"running task {task.id}",
-            extra={"owner": task.owner, "attempts": task_state["attempts"]},
+            message=f"running task {task.id}" if len(batch) == 1 else f"running batch of {len(batch)} tasks",
+            extra=started_extra,
         )
 
         if args.dry_run:
-            _print(f"Dry run enabled; skipping execution for task {task.id}")
-            task_state["status"] = STATUS_PENDING
+            _print(f"Dry run enabled; skipping execution for {', '.join(batch_ids)}")
+            for member in batch:
+                state[member.id]["status"] = STATUS_PENDING
             persist(cycle)
             continue
 
-        owner_repo = impl_repo if task.owner == "codex" else test_repo
-        healed = heal_stale_git_locks(owner_repo, stale_after_sec=args.git_lock_stale_sec)
-        if healed:
-            _print(f"Removed stale git locks in {owner_repo}: {', '.join(str(x) for x in healed)}")
-        repo_context = get_repo_filetype_context(owner_repo)
-        repo_hints = repo_state_hints(owner_repo)
-        retry_context = {
-            "attempts": task_state.get("attempts", 0),
-            "last_summary": task_state.get("last_summary", ""),
-            "last_error": task_state.get("last_error", ""),
-        }
-
-        if task.owner == "gemini" and not owner_repo.exists():
-            outcome = normalize_outcome(
-                {
-                    "status": STATUS_BLOCKED,
-                    "summary": "Gemini task repository missing",
-                    "blocker": f"Test repo does not exist: {owner_repo}",
-                    "next_actions": [],
+        primary_repo = impl_repo if task.owner == "codex" else test_repo
+        pool = worktree_pools.get(primary_repo)
+        lease: WorktreeLease | None = None
+        if pool is not None:
+            try:
+                lease = pool.acquire(owner=f"{os.getpid()}:{task.id}")
+            except WorktreePoolError as err:
+                _print(f"Worktree lease failed for {primary_repo}: {err}; using primary checkout.")
+            else:
+                if lease is None:
+                    _print(f"No worktree available for {primary_repo}; using primary checkout.")
+        try:
+            owner_repo = lease.path if lease is not None else primary_repo
+            healed = heal_stale_git_locks(owner_repo, stale_after_sec=args.git_lock_stale_sec)
+            if healed:
+                _print(f"Removed stale git locks in {owner_repo}: {', '.join(str(x) for x in healed)}")
+            repo_context = get_repo_filetype_context(owner_repo)
+            repo_hints = repo_state_hints(owner_repo)
+            retry_contexts = {
+                member.id: {
+                    "attempts": state[member.id].get("attempts", 0),
+                    "last_summary": state[member.id].get("last_summary", ""),
+                    "last_error": state[member.id].get("last_error", ""),
                 }
-            )
-            ok = False
-        elif task.owner == "codex":
-            task_progress = lambda elapsed: write_heartbeat(
-                heartbeat_file,
-                phase="task_running",
-                cycle=cycle,
-                task_id=task.id,
-                message=f"task running for {elapsed}s",
-                extra={"owner": task.owner},
-            )
-            ok, outcome = run_codex_task(
-                task=task,
-                repo=owner_repo,
-                objective_text=objective_text,
-                schema_path=schema_file,
-                output_dir=artifacts_dir,
-                codex_cmd=args.codex_cmd,
-                codex_model=args.codex_model,
-                timeout_sec=args.agent_timeout_sec,
-                retry_context=retry_context,
-                progress_callback=task_progress,
-                repo_context=repo_context,
-                repo_hints=repo_hints,
-                skill_protocol=skill_protocol,
-                mcp_context=mcp_context,
-            )
-        else:
+                for member in batch
+            }
             task_progress = lambda elapsed: write_heartbeat(
                 heartbeat_file,
                 phase="task_running",
                 cycle=cycle,
                 task_id=task.id,
                 message=f"task running for {elapsed}s",
-                extra={"owner": task.owner},
-            )
-            ok, outcome = run_gemini_task(
-                task=task,
-                repo=owner_repo,
-                objective_text=objective_text,
-                gemini_cmd=args.gemini_cmd,
-                gemini_model=args.gemini_model,
-                timeout_sec=args.agent_timeout_sec,
-                retry_context=retry_context,
-                progress_callback=task_progress,
-                repo_context=repo_context,
-                repo_hints=repo_hints,
-                skill_protocol=skill_protocol,
-                mcp_context=mcp_context,
+                extra={"owner": task.owner, **({"batch": batch_ids} if len(batch) > 1 else {})},
             )
 
-        summarize_run(task=task, repo=owner_repo, outcome=outcome, report_dir=artifacts_dir)
-        used_tokens, used_cost_usd = extract_usage_metrics(outcome)
-        if used_tokens or used_cost_usd:
-            update_budget_usage(
-                budget_state,
-                task_id=task.id,
-                tokens=used_tokens,
-                cost_usd=used_cost_usd,
-            )
-            update_budget_elapsed(budget_state, run_started_monotonic)
-            evaluate_budget_violations(budget_state)
-            _write_json(budget_report_file, budget_state)
-        status = str(outcome.get("status", STATUS_BLOCKED)).lower()
-        blocker_text = str(outcome.get("blocker", ""))
-        summary_text = str(outcome.get("summary", ""))
-
-        if not ok or status == STATUS_BLOCKED:
-            if "lock" in blocker_text.lower() or "another git process" in blocker_text.lower():
-                healed_on_failure = heal_stale_git_locks(owner_repo, stale_after_sec=args.git_lock_stale_sec)
-                if healed_on_failure:
-                    healed_text = ", ".join(str(x) for x in healed_on_failure)
-                    blocker_text = f"{blocker_text}\nRecovered stale lock files: {healed_text}"
-                    _print(f"Recovered stale git lock(s) after failure: {healed_text}")
-            retryable = is_retryable_error(blocker_text)
-            attempts = _safe_int(task_state.get("attempts", 0), 0)
-            retryable_failures = _safe_int(task_state.get("retryable_failures", 0), 0)
-
-            if retryable and retryable_failures < args.max_retryable_blocked_retries:
-                increment_retry_events(budget_state)
-                update_budget_elapsed(budget_state, run_started_monotonic)
-                delay = schedule_retry(
-                    entry=task_state,
-                    summary=summary_text or "Transient blocker encountered.",
-                    error=blocker_text,
-                    retryable=True,
-                    backoff_base_sec=args.retry_backoff_base_sec,
-                    backoff_max_sec=args.retry_backoff_max_sec,
+            results: list[tuple[Task, bool, dict[str, Any]]]
+            if task.owner == "gemini" and not owner_repo.exists():
+                outcome = normalize_outcome(
+                    {
+                        "status": STATUS_BLOCKED,
+                        "summary": "Gemini task repository missing",
+                        "blocker": f"Test repo does not exist: {owner_repo}",
+                        "next_actions": [],
+                    }
                 )
-                _print(f"Task {task.id} retryable blocker; retry in {delay}s.")
-                write_heartbeat(
-                    heartbeat_file,
-                    phase="task_retry_scheduled",
-                    cycle=cycle,
-                    task_id=task.id,
-                    message=f"retryable blocker; retry in {delay}s",
-                    extra={"attempts": attempts, "retryable_failures": task_state["retryable_failures"]},
+                results = [(member, False, outcome) for member in batch]
+            elif len(batch) > 1 and task.owner == "codex":
+                ok, outcomes = run_codex_batch(
+                    tasks=batch,
+                    repo=owner_repo,
+                    objective_text=objective_text,
+                    schema_path=schema_file,
+                    output_dir=artifacts_dir,
+                    codex_cmd=args.codex_cmd,
+                    codex_model=args.codex_model,
+                    timeout_sec=args.agent_timeout_sec,
+                    retry_contexts=retry_contexts,
+                    progress_callback=task_progress,
+                    repo_context=repo_context,
+                    repo_hints=repo_hints,
+                    skill_protocol=skill_protocol,
+                    mcp_context=mcp_context,
                 )
-                evaluate_budget_violations(budget_state)
-                _write_json(budget_report_file, budget_state)
-            elif attempts < args.max_attempts:
-                increment_retry_events(budget_state)
-                update_budget_elapsed(budget_state, run_started_monotonic)
-                delay = schedule_retry(
-                    entry=task_state,
-                    summary=summary_text or "Blocked; retrying for autonomous recovery.",
-                    error=blocker_text,
-                    retryable=False,
-                    backoff_base_sec=max(5, min(60, args.retry_backoff_base_sec)),
-                    backoff_max_sec=max(60, min(600, args.retry_backoff_max_sec)),
+                results = [(member, ok, outcomes[member.id]) for member in batch]
+            elif len(batch) > 1:
+                ok, outcomes = run_gemini_batch(
+                    tasks=batch,
+                    repo=owner_repo,
+                    objective_text=objective_text,
+                    gemini_cmd=args.gemini_cmd,
+                    gemini_model=args.gemini_model,
+                    timeout_sec=args.agent_timeout_sec,
+                    retry_contexts=retry_contexts,
+                    progress_callback=task_progress,
+                    repo_context=repo_context,
+                    repo_hints=repo_hints,
+                    skill_protocol=skill_protocol,
+                    mcp_context=mcp_context,
                 )
-                _print(f"Task {task.id} blocked; retry in {delay}s (attempt {attempts}/{args.max_attempts}).")
-                write_heartbeat(
-                    heartbeat_file,
-                    phase="task_retry_scheduled",
-                    cycle=cycle,
-                    task_id=task.id,
-                    message=f"blocked; retry in {delay}s",
-                    extra={"attempts": attempts},
+                results = [(member, ok, outcomes[member.id]) for member in batch]
+            elif task.owner == "codex":
+                ok, outcome = run_codex_task(
+                    task=task,
+                    repo=owner_repo,
+                    objective_text=objective_text,
+                    schema_path=schema_file,
+                    output_dir=artifacts_dir,
+                    codex_cmd=args.codex_cmd,
+                    codex_model=args.codex_model,
+                    timeout_sec=args.agent_timeout_sec,
+                    retry_context=retry_contexts[task.id],
+                    progress_callback=task_progress,
+                    repo_context=repo_context,
+                    repo_hints=repo_hints,
+                    skill_protocol=skill_protocol,
+                    mcp_context=mcp_context,
                 )
-                evaluate_budget_violations(budget_state)
-                _write_json(budget_report_file, budget_state)
+                results = [(task, ok, outcome)]
             else:
-                mark_blocked(task_state, summary_text or "Task blocked", blocker_text or "agent command failed")
-                _print(f"Task {task.id} blocked: {task_state['last_error']}")
-                write_heartbeat(
-                    heartbeat_file,
-                    phase="task_blocked",
-                    cycle=cycle,
-                    task_id=task.id,
-                    message="task marked blocked",
-                    extra={"attempts": attempts, "error": task_state["last_error"][:300]},
+                ok, outcome = run_gemini_task(
+                    task=task,
+                    repo=owner_repo,
+                    objective_text=objective_text,
+                    gemini_cmd=args.gemini_cmd,
+                    gemini_model=args.gemini_model,
+                    timeout_sec=args.agent_timeout_sec,
+                    retry_context=retry_contexts[task.id],
+                    progress_callback=task_progress,
+                    repo_context=repo_context,
+                    repo_hints=repo_hints,
+                    skill_protocol=skill_protocol,
+                    mcp_context=mcp_context,
                 )
-            persist(cycle)
-            continue
-
-        if status == STATUS_DONE:
-            validation_repo = owner_repo if task.owner == "gemini" else impl_repo
-            valid, details = run_validations(
-                repo=validation_repo,
-                validate_commands=args.validate_command,
-                timeout_sec=args.validate_timeout_sec,
-                retries_per_command=args.validation_retries,
-                progress_callback=lambda cmd, elapsed: write_heartbeat(
-                    heartbeat_file,
-                    phase="task_validating",
-                    cycle=cycle,
-                    task_id=task.id,
-                    message=f"validation `{cmd}` running for {elapsed}s",
-                ),
-            )
-            if valid:
-                contract_ok, contract_details = evaluate_delivery_contract(task, outcome)
-                if not contract_ok:
+                results = [(task, ok, outcome)]
+
+            # Batched tasks share one checkout, so validation runs once per repo per cycle.
+            validation_cache: dict[Path, tuple[bool, str]] = {}
+            for task, ok, outcome in results:
+                task_state = state[task.id]
+                summarize_run(task=task, repo=owner_repo, outcome=outcome, report_dir=artifacts_dir)
+                used_tokens, used_cost_usd = extract_usage_metrics(outcome)
+                if used_tokens or used_cost_usd:
+                    update_budget_usage(
+                        budget_state,
+                        task_id=task.id,
+                        tokens=used_tokens,
+                        cost_usd=used_cost_usd,
+                    )
+                    update_budget_elapsed(budget_state, run_started_monotonic)
+                    evaluate_budget_violations(budget_state)
+                    _write_json(budget_report_file, budget_state)
+                status = str(outcome.get("status", STATUS_BLOCKED)).lower()
+                blocker_text = str(outcome.get("blocker", ""))
+                summary_text = str(outcome.get("summary", ""))
+
+                if not ok or status == STATUS_BLOCKED:
+                    if "lock" in blocker_text.lower() or "another git process" in blocker_text.lower():
+                        healed_on_failure = heal_stale_git_locks(owner_repo, stale_after_sec=args.git_lock_stale_sec)
+                        if healed_on_failure:
+                            healed_text = ", ".join(str(x) for x in healed_on_failure)
+                            blocker_text = f"{blocker_text}\nRecovered stale lock files: {healed_text}"
+                            _print(f"Recovered stale git lock(s) after failure: {healed_text}")
+                    retryable = is_retryable_error(blocker_text)
                     attempts = _safe_int(task_state.get("attempts", 0), 0)
-                    if attempts < args.max_attempts:
+                    retryable_failures = _safe_int(task_state.get("retryable_failures", 0), 0)
+
+                    if retryable and retryable_failures < args.max_retryable_blocked_retries:
+                        increment_retry_events(budget_state)
+                        update_budget_elapsed(budget_state, run_started_monotonic)
                         delay = schedule_retry(
                             entry=task_state,
-                            summary="Delivery contract unmet; retrying autonomously.",
-                            error=contract_details,
+                            summary=summary_text or "Transient blocker encountered.",
+                            error=blocker_text,
+                            retryable=True,
+                            backoff_base_sec=args.retry_backoff_base_sec,
+                            backoff_max_sec=args.retry_backoff_max_sec,
+                        )
+                        _print(f"Task {task.id} retryable blocker; retry in {delay}s.")
+                        write_heartbeat(
+                            heartbeat_file,
+                            phase="task_retry_scheduled",
+                            cycle=cycle,
+                            task_id=task.id,
+                            message=f"retryable blocker; retry in {delay}s",
+                            extra={"attempts": attempts, "retryable_failures": task_state["retryable_failures"]},
+                        )
+                        evaluate_budget_violations(budget_state)
+                        _write_json(budget_report_file, budget_state)
+                    elif attempts < args.max_attempts:
+                        increment_retry_events(budget_state)
+                        update_budget_elapsed(budget_state, run_started_monotonic)
+                        delay = schedule_retry(
+                            entry=task_state,
+                            summary=summary_text or "Blocked; retrying for autonomous recovery.",
+                            error=blocker_text,
                             retryable=False,
                             backoff_base_sec=max(5, min(60, args.retry_backoff_base_sec)),
                             backoff_max_sec=max(60, min(600, args.retry_backoff_max_sec)),
                         )
-                        _print(
-                            f"Task {task.id} unmet delivery contract; retry in {delay}s "
-                            f"(attempt {attempts}/{args.max_attempts})."
+                        _print(f"Task {task.id} blocked; retry in {delay}s (attempt {attempts}/{args.max_attempts}).")
+                        write_heartbeat(
+                            heartbeat_file,
+                            phase="task_retry_scheduled",
+                            cycle=cycle,
+                            task_id=task.id,
+                            message=f"blocked; retry in {delay}s",
+                            extra={"attempts": attempts},
                         )
+                        evaluate_budget_violations(budget_state)
+                        _write_json(budget_report_file, budget_state)
                     else:
-                        mark_blocked(task_state, "Delivery contract unmet after repeated retries.", contract_details)
-                        _print(f"Task {task.id} delivery contract unmet and is now blocked.")
-                    write_heartbeat(
-                        heartbeat_file,
-                        phase="task_contract_unmet",
-                        cycle=cycle,
-                        task_id=task.id,
-                        message="delivery contract evaluated",
-                        extra={"contract_ok": False},
-                    )
+                        mark_blocked(task_state, summary_text or "Task blocked", blocker_text or "agent command failed")
+                        _print(f"Task {task.id} blocked: {task_state['last_error']}")
+                        write_heartbeat(
+                            heartbeat_file,
+                            phase="task_blocked",
+                            cycle=cycle,
+                            task_id=task.id,
+                            message="task marked blocked",
+                            extra={"attempts": attempts, "error": task_state["last_error"][:300]},
+                        )
                     persist(cycle)
                     continue
 
-                task_state["status"] = STATUS_DONE
-                task_state["last_error"] = ""
-                task_state["last_summary"] = summary_text
-                task_state["retryable_failures"] = 0
-                task_state["not_before"] = ""
-                task_state["last_update"] = _now_iso()
-                _print(f"Task {task.id} done.")
-                write_heartbeat(
-                    heartbeat_file,
-                    phase="task_done",
-                    cycle=cycle,
-                    task_id=task.id,
-                    message="task completed and validated",
-                )
-            else:
-                retryable = is_retryable_error(details)
+                if status == STATUS_DONE:
+                    validation_repo = owner_repo
+                    if validation_repo not in validation_cache:
+                        validation_started = time.monotonic()
+                        validation_cache[validation_repo] = run_validations(
+                            repo=validation_repo,
+                            validate_commands=args.validate_command,
+                            timeout_sec=args.validate_timeout_sec,
+                            retries_per_command=args.validation_retries,
+                            progress_callback=lambda cmd, elapsed: write_heartbeat(
+                                heartbeat_file,
+                                phase="task_validating",
+                                cycle=cycle,
+                                task_id=task.id,
+                                message=f"validation `{cmd}` running for {elapsed}s",
+                            ),
+                        )
+                        record_validation_run(
+                            budget_state,
+                            duration_sec=time.monotonic() - validation_started,
+                            ok=validation_cache[validation_repo][0],
+                        )
+                    valid, details = validation_cache[validation_repo]
+                    if valid:
+                        contract_ok, contract_details = evaluate_delivery_contract(task, outcome)
+                        if not contract_ok:
+                            attempts = _safe_int(task_state.get("attempts", 0), 0)
+                            if attempts < args.max_attempts:
+                                delay = schedule_retry(
+                                    entry=task_state,
+                                    summary="Delivery contract unmet; retrying autonomously.",
+                                    error=contract_details,
+                                    retryable=False,
+                                    backoff_base_sec=max(5, min(60, args.retry_backoff_base_sec)),
+                                    backoff_max_sec=max(60, min(600, args.retry_backoff_max_sec)),
+                                )
+                                _print(
+                                    f"Task {task.id} unmet delivery contract; retry in {delay}s "
+                                    f"(attempt {attempts}/{args.max_attempts})."
+                                )
+                            else:
+                                mark_blocked(task_state, "Delivery contract unmet after repeated retries.", contract_details)
+                                _print(f"Task {task.id} delivery contract unmet and is now blocked.")
+                            write_heartbeat(
+                                heartbeat_file,
+                                phase="task_contract_unmet",
+                                cycle=cycle,
+                                task_id=task.id,
+                                message="delivery contract evaluated",
+                                extra={"contract_ok": False},
+                            )
+                            persist(cycle)
+                            continue
+
+                        task_state["status"] = STATUS_DONE
+                        task_state["last_error"] = ""
+                        task_state["last_summary"] = summary_text
+                        task_state["retryable_failures"] = 0
+                        task_state["not_before"] = ""
+                        task_state["last_update"] = _now_iso()
+                        _print(f"Task {task.id} done.")
+                        write_heartbeat(
+                            heartbeat_file,
+                            phase="task_done",
+                            cycle=cycle,
+                            task_id=task.id,
+                            message="task completed and validated",
+                        )
+                    else:
+                        retryable = is_retryable_error(details)
+                        attempts = _safe_int(task_state.get("attempts", 0), 0)
+                        if retryable:
+                            increment_retry_events(budget_state)
+                            update_budget_elapsed(budget_state, run_started_monotonic)
+                            delay = schedule_retry(
+                                entry=task_state,
+                                summary="Validation infrastructure failure; retry scheduled.",
+                                error=details,
+                                retryable=True,
+                                backoff_base_sec=args.retry_backoff_base_sec,
+                                backoff_max_sec=args.retry_backoff_max_sec,
+                            )
+                            _print(f"Task {task.id} validation failed transiently; retry in {delay}s.")
+                        elif attempts < args.max_attempts:
+                            increment_retry_events(budget_state)
+                            update_budget_elapsed(budget_state, run_started_monotonic)
+                            delay = schedule_retry(
+                                entry=task_state,
+                                summary="Validation failed after agent reported done.",
+                                error=details,
+                                retryable=False,
+                                backoff_base_sec=max(5, min(60, args.retry_backoff_base_sec)),
+                                backoff_max_sec=max(60, min(600, args.retry_backoff_max_sec)),
+                            )
+                            _print(
+                                f"Task {task.id} validation failed; retry in {delay}s "
+                                f"(attempt {attempts}/{args.max_attempts})."
+                            )
+                        else:
+                            mark_blocked(task_state, "Validation failed after repeated retries.", details)
+                            _print(f"Task {task.id} validation failed and is now blocked.")
+                        write_heartbeat(
+                            heartbeat_file,
+                            phase="task_validation",
+                            cycle=cycle,
+                            task_id=task.id,
+                            message="validation processed",
+                            extra={"validation_ok": valid},
+                        )
+                        evaluate_budget_violations(budget_state)
+                        _write_json(budget_report_file, budget_state)
+                    persist(cycle)
+                    continue
+
+                # Partial progress: keep momentum by rescheduling automatically with backoff.
                 attempts = _safe_int(task_state.get("attempts", 0), 0)
-                if retryable:
-                    increment_retry_events(budget_state)
-                    update_budget_elapsed(budget_state, run_started_monotonic)
-                    delay = schedule_retry(
-                        entry=task_state,
-                        summary="Validation infrastructure failure; retry scheduled.",
-                        error=details,
-                        retryable=True,
-                        backoff_base_sec=args.retry_backoff_base_sec,
-                        backoff_max_sec=args.retry_backoff_max_sec,
-                    )
-                    _print(f"Task {task.id} validation failed transiently; retry in {delay}s.")
-                elif attempts < args.max_attempts:
+                if attempts < args.max_attempts:
                     increment_retry_events(budget_state)
                     update_budget_elapsed(budget_state, run_started_monotonic)
                     delay = schedule_retry(
                         entry=task_state,
-                        summary="Validation failed after agent reported done.",
-                        error=details,
+                        summary=summary_text or "Partial progress; retry queued.",
+                        error=blocker_text,
                         retryable=False,
                         backoff_base_sec=max(5, min(60, args.retry_backoff_base_sec)),
                         backoff_max_sec=max(60, min(600, args.retry_backoff_max_sec)),
                     )
-                    _print(
-                        f"Task {task.id} validation failed; retry in {delay}s "
-                        f"(attempt {attempts}/{args.max_attempts})."
+                    _print(f"Task {task.id} partial; queued for retry in {delay}s.")
+                    write_heartbeat(
+                        heartbeat_file,
+                        phase="task_partial",
+                        cycle=cycle,
+                        task_id=task.id,
+                        message=f"partial; retry in {delay}s",
                     )
+                    evaluate_budget_violations(budget_state)
+                    _write_json(budget_report_file, budget_state)
                 else:
-                    mark_blocked(task_state, "Validation failed after repeated retries.", details)
-                    _print(f"Task {task.id} validation failed and is now blocked.")
-                write_heartbeat(
-                    heartbeat_file,
-                    phase="task_validation",
-                    cycle=cycle,
-                    task_id=task.id,
-                    message="validation processed",
-                    extra={"validation_ok": valid},
-                )
-                evaluate_budget_violations(budget_state)
-                _write_json(budget_report_file, budget_state)
-            persist(cycle)
-            continue
-
-        # Partial progress: keep momentum by rescheduling automatically with backoff.
-        attempts = _safe_int(task_state.get("attempts", 0), 0)
-        if attempts < args.max_attempts:
-            increment_retry_events(budget_state)
-            update_budget_elapsed(budget_state, run_started_monotonic)
-            delay = schedule_retry(
-                entry=task_state,
-                summary=summary_text or "Partial progress; retry queued.",
-                error=blocker_text,
-                retryable=False,
-                backoff_base_sec=max(5, min(60, args.retry_backoff_base_sec)),
-                backoff_max_sec=max(60, min(600, args.retry_backoff_max_sec)),
-            )
-            _print(f"Task {task.id} partial; queued for retry in {delay}s.")
-            write_heartbeat(
-                heartbeat_file,
-                phase="task_partial",
-                cycle=cycle,
-                task_id=task.id,
-                message=f"partial; retry in {delay}s",
-            )
-            evaluate_budget_violations(budget_state)
-            _write_json(budget_report_file, budget_state)
-        else:
-            mark_blocked(
-                task_state,
-                summary_text or "Partial task exceeded max attempts.",
-                blocker_text,
-            )
-            _print(f"Task {task.id} partial result exhausted retries and is now blocked.")
-            write_heartbeat(
-                heartbeat_file,
-                phase="task_blocked",
-                cycle=cycle,
-                task_id=task.id,
-                message="partial retries exhausted",
-            )
-        persist(cycle)
+                    mark_blocked(
+                        task_state,
+                        summary_text or "Partial task exceeded max attempts.",
+                        blocker_text,
+                    )
+                    _print(f"Task {task.id} partial result exhausted retries and is now blocked.")
+                    write_heartbeat(
+                        heartbeat_file,
+                        phase="task_blocked",
+                        cycle=cycle,
+                        task_id=task.id,
+                        message="partial retries exhausted",
+                    )
+                persist(cycle)
+        finally:
+            if pool is not None and lease is not None:
+                pool.release(lease)
 
     _print(f"Reached max cycles: {args.max_cycles}")
     persist(args.max_cycles)
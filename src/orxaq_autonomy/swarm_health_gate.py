@@ -15,6 +15,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from .health_history import HISTORY_DIRNAME, record_health_history
+
 
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -305,6 +307,12 @@ def generate_health_artifacts(
     md_path = output_dir / "swarm_health.md"
     md_path.write_text("\n".join(md_lines) + "\n", encoding="utf-8")
 
+    series: dict[str, Any] = {"swarm.score": health_report.get("score"), "swarm.gate_passed": int(gate_result.passed)}
+    for name, comp in components.items():
+        if isinstance(comp, dict):
+            series[f"swarm.component.{name}"] = comp.get("score")
+    record_health_history(output_dir / HISTORY_DIRNAME, series)
+
     return {
         "json": str(json_path),
         "markdown": str(md_path),
@@ -0,0 +1,179 @@
+"""Fleet-wide todo state fetched from peer dashboards.
+
+Runners on other machines serve their own dashboard; this dashboard pulls
+each peer's local task state and merges it with its own through
+``aggregate_distributed_todos``.
+
+- ``TodoFederation``: fetches ``/api/todos?scope=local`` from every peer
+  concurrently, each bounded by its own timeout, and keeps the last good
+  payload per peer so a slow or down node degrades to stale data instead of
+  a missing one -- for up to ``max_stale_sec``, after which its tasks are
+  dropped.  Requests that arrive while a fetch is in flight wait for it, and
+  report the peer as ``pending`` if it is still running at their deadline.
+- ``parse_peer_tasks``: accept either a peer ``/api/todos`` response or a
+  raw task-state mapping.
+
+Zero external dependencies -- uses only Python stdlib.
+"""
+
+from __future__ import annotations
+
+import json
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any
+from urllib import error as urllib_error
+from urllib import request as urllib_request
+
+
+DEFAULT_PEER_TIMEOUT_SEC = 2.0
+DEFAULT_PEER_CACHE_SEC = 5.0
+DEFAULT_PEER_MAX_STALE_SEC = 300.0
+MAX_PEER_RESPONSE_BYTES = 8 * 1024 * 1024
+
+
+def parse_peer_tasks(payload: Any) -> dict[str, Any]:
+    """Task state from a peer response: an ``/api/todos`` body or a raw mapping."""
+    if not isinstance(payload, dict):
+        raise ValueError("peer payload is not a JSON object")
+    tasks = payload.get("tasks") if "tasks" in payload else payload
+    if not isinstance(tasks, dict):
+        raise ValueError("peer payload has no task mapping")
+    return {str(task_id): data for task_id, data in tasks.items() if isinstance(data, dict)}
+
+
+def _peer_url(peer: str) -> str:
+    base = peer.strip().rstrip("/")
+    # A bare dashboard address means its local-only todos; anything else is used verbatim.
+    if "://" in base and base.count("/") == 2:
+        return f"{base}/api/todos?scope=local"
+    return base
+
+
+@dataclass
+class _PeerState:
+    tasks: dict[str, Any] | None = None
+    fetched_at: float = 0.0
+    checked_at: float = float("-inf")
+    latency_ms: int = 0
+    error: str = ""
+    # Cleared while a fetch is in flight; set once its result is recorded.
+    done: threading.Event = field(default_factory=lambda: _set_event())
+
+
+def _set_event() -> threading.Event:
+    event = threading.Event()
+    event.set()
+    return event
+
+
+class TodoFederation:
+    """Concurrent, cached todo fetches from a fixed set of peers."""
+
+    def __init__(
+        self,
+        peers: list[str],
+        *,
+        timeout_sec: float = DEFAULT_PEER_TIMEOUT_SEC,
+        cache_sec: float = DEFAULT_PEER_CACHE_SEC,
+        max_stale_sec: float = DEFAULT_PEER_MAX_STALE_SEC,
+    ) -> None:
+        self.peers = list(dict.fromkeys(peer.strip().rstrip("/") for peer in peers if peer.strip()))
+        self.timeout_sec = max(0.1, float(timeout_sec))
+        self.cache_sec = max(0.0, float(cache_sec))
+        self.max_stale_sec = max(0.0, float(max_stale_sec))
+        self._lock = threading.Lock()
+        self._states = {peer: _PeerState() for peer in self.peers}
+
+    def _fetch(self, peer: str) -> dict[str, Any]:
+        req = urllib_request.Request(
+            _peer_url(peer),
+            method="GET",
+            headers={"Accept": "application/json", "User-Agent": "orxaq-dashboard/federation"},
+        )
+        with urllib_request.urlopen(req, timeout=self.timeout_sec) as resp:  # nosec B310
+            raw = resp.read(MAX_PEER_RESPONSE_BYTES + 1)
+        if len(raw) > MAX_PEER_RESPONSE_BYTES:
+            raise ValueError("peer response too large")
+        return parse_peer_tasks(json.loads(raw.decode("utf-8")))
+
+    def collect(self) -> list[dict[str, Any]]:
+        """One row per peer; refetches peers whose cache expired, all at once."""
+        now = time.monotonic()
+        with self._lock:
+            due = [peer for peer in self.peers if now - self._states[peer].checked_at >= self.cache_sec]
+            # Claim them so concurrent requests wait on these fetches instead of refetching.
+            for peer in due:
+                self._states[peer].checked_at = now
+                self._states[peer].done = threading.Event()
+            in_flight = {peer: self._states[peer].done for peer in self.peers}
+
+        finished: queue.Queue[str] = queue.Queue()
+
+        def _worker(peer: str) -> None:
+            started = time.monotonic()
+            try:
+                tasks, error = self._fetch(peer), ""
+            except urllib_error.HTTPError as exc:
+                tasks, error = None, f"HTTP {exc.code}"
+            except (urllib_error.URLError, TimeoutError, OSError, ValueError) as exc:
+                tasks, error = None, str(getattr(exc, "reason", exc))[:200]
+            # Recorded even after the deadline, so a late answer still warms the cache.
+            self._record(peer, tasks, error, int((time.monotonic() - started) * 1000))
+            finished.put(peer)
+
+        for peer in due:
+            # Daemon threads: a peer that ignores its socket timeout cannot hold up shutdown.
+            threading.Thread(target=_worker, args=(peer,), name=f"todo-peer-{peer}", daemon=True).start()
+
+        deadline = time.monotonic() + self.timeout_sec + 0.5
+        pending = set(due)
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                pending.discard(finished.get(timeout=remaining))
+            except queue.Empty:
+                break
+        for peer in pending:
+            self._record(peer, None, "timeout", int(self.timeout_sec * 1000))
+        # Fetches another request started: wait for them under the same deadline.
+        for peer, done in in_flight.items():
+            if peer not in due:
+                done.wait(max(0.0, deadline - time.monotonic()))
+
+        with self._lock:
+            return [self._row(peer, self._states[peer]) for peer in self.peers]
+
+    def _record(self, peer: str, tasks: dict[str, Any] | None, error: str, latency_ms: int) -> None:
+        with self._lock:
+            state = self._states[peer]
+            state.error = error
+            state.latency_ms = latency_ms
+            if tasks is not None:
+                state.tasks = tasks
+                state.fetched_at = time.time()
+            state.done.set()
+
+    def _row(self, peer: str, state: _PeerState) -> dict[str, Any]:
+        # Never answered yet: still in flight, not failed.
+        pending = state.tasks is None and not state.error and not state.done.is_set()
+        age = time.time() - state.fetched_at
+        if state.tasks is not None and age > self.max_stale_sec:
+            state.tasks = None  # Too old to merge.
+        has_data = state.tasks is not None
+        return {
+            "node": peer,
+            "ok": has_data and not state.error,
+            "pending": pending,
+            # Served from the last good fetch because the latest one failed.
+            "stale": has_data and bool(state.error),
+            "error": state.error or ("" if has_data or pending else "expired"),
+            "age_sec": int(age) if has_data else -1,
+            "latency_ms": state.latency_ms,
+            "task_count": len(state.tasks or {}),
+            "tasks": dict(state.tasks or {}),
+        }
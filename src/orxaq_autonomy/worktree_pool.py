@@ -0,0 +1,351 @@
+"""Managed git worktree pool for parallel work in a single repository.
+
+Every agent task used to run against the one primary checkout, so two tasks
+targeting the same repository fought over ``.git/index.lock``.  A pool keeps a
+fixed number of linked worktrees per repository and leases them to tasks:
+
+- ``WorktreePool.warm``: create any missing slot worktrees ahead of time.
+- ``WorktreePool.acquire``: lease a free slot (cross-process safe: the lease
+  file is hard-linked into place with its pid already written) and reset it
+  to the primary checkout's ``HEAD``.
+- ``WorktreePool.release``: reset the slot and drop the lease.
+- ``WorktreePool.heal``: prune dead worktrees, expire leases held by dead
+  processes and remove stale git lock files inside slot git dirs.
+- ``WorktreePool.cleanup``: remove every slot worktree.
+
+Resets use ``git clean -fd`` (not ``-x``) so ignored build caches such as
+virtualenvs survive between leases and slots stay warm.
+
+Zero external dependencies -- uses only Python stdlib.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+
+GIT_LOCK_BASENAMES = ("index.lock", "HEAD.lock", "packed-refs.lock")
+# An unreadable lease (no pid) only expires after this long, by mtime.
+DEFAULT_LEASE_GRACE_SEC = 60
+
+
+class WorktreePoolError(RuntimeError):
+    """Raised when a pool slot cannot be prepared safely."""
+
+
+@dataclass(frozen=True)
+class WorktreeLease:
+    """A slot worktree leased to one task run."""
+    repo: Path
+    path: Path
+    slot: int
+    lease_file: Path
+    base_commit: str
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _pid_running(pid: int) -> bool:
+    if pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except OSError:
+        return False
+    return True
+
+
+def _git(repo: Path, *args: str, timeout_sec: int = 120) -> subprocess.CompletedProcess[str]:
+    env = os.environ.copy()
+    env["GIT_TERMINAL_PROMPT"] = "0"
+    try:
+        return subprocess.run(
+            ["git", "-C", str(repo), *args],
+            capture_output=True,
+            text=True,
+            check=False,
+            env=env,
+            timeout=timeout_sec,
+        )
+    except (OSError, subprocess.TimeoutExpired) as err:
+        return subprocess.CompletedProcess(["git", *args], returncode=124, stdout="", stderr=str(err))
+
+
+def resolve_git_dir(path: Path) -> Path | None:
+    """Return the git dir for a checkout, following ``.git`` files of linked worktrees."""
+    dot_git = path / ".git"
+    if dot_git.is_dir():
+        return dot_git
+    if not dot_git.is_file():
+        return None
+    try:
+        content = dot_git.read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    if not content.startswith("gitdir:"):
+        return None
+    git_dir = Path(content.split(":", 1)[1].strip())
+    if not git_dir.is_absolute():
+        git_dir = (path / git_dir).resolve()
+    return git_dir if git_dir.is_dir() else None
+
+
+def pool_dir_for_repo(root: Path, repo: Path) -> Path:
+    """Stable per-repository pool directory below *root*."""
+    resolved = repo.resolve()
+    digest = hashlib.sha1(str(resolved).encode("utf-8")).hexdigest()[:10]
+    return root / f"{resolved.name}-{digest}"
+
+
+class WorktreePool:
+    """Fixed-size pool of detached worktrees for one repository."""
+
+    def __init__(
+        self,
+        repo: Path,
+        pool_dir: Path,
+        size: int,
+        *,
+        lock_stale_sec: int = 300,
+        lease_grace_sec: int = DEFAULT_LEASE_GRACE_SEC,
+    ) -> None:
+        self.repo = repo.resolve()
+        self.pool_dir = pool_dir
+        self.size = max(0, int(size))
+        self.lock_stale_sec = max(0, int(lock_stale_sec))
+        self.lease_grace_sec = max(0, int(lease_grace_sec))
+
+    def slot_path(self, slot: int) -> Path:
+        return self.pool_dir / f"slot-{slot}"
+
+    def lease_path(self, slot: int) -> Path:
+        return self.pool_dir / f"slot-{slot}.lease"
+
+    def _base_commit(self) -> str:
+        result = _git(self.repo, "rev-parse", "HEAD")
+        if result.returncode != 0 or not result.stdout.strip():
+            raise WorktreePoolError(f"unable to resolve HEAD for {self.repo}: {result.stderr.strip()}")
+        return result.stdout.strip()
+
+    def _slot_is_worktree(self, slot: int) -> bool:
+        return resolve_git_dir(self.slot_path(slot)) is not None
+
+    def _ensure_slot(self, slot: int, base_commit: str) -> bool:
+        path = self.slot_path(slot)
+        if self._slot_is_worktree(slot):
+            return False
+        if path.exists():
+            # Leftover directory whose worktree metadata was pruned; rebuild it.
+            shutil.rmtree(path, ignore_errors=True)
+        self.pool_dir.mkdir(parents=True, exist_ok=True)
+        _git(self.repo, "worktree", "prune")
+        result = _git(self.repo, "worktree", "add", "--detach", "--force", str(path), base_commit)
+        if result.returncode != 0:
+            raise WorktreePoolError(f"git worktree add failed for {path}: {result.stderr.strip()}")
+        return True
+
+    def _reset_slot(self, slot: int, base_commit: str) -> None:
+        path = self.slot_path(slot)
+        for args in (
+            ("checkout", "--detach", "--force", base_commit),
+            ("reset", "--hard", base_commit),
+            ("clean", "-fd"),
+        ):
+            result = _git(path, *args)
+            if result.returncode != 0:
+                raise WorktreePoolError(f"git {' '.join(args)} failed in {path}: {result.stderr.strip()}")
+
+    def _read_lease(self, slot: int) -> dict[str, Any] | None:
+        path = self.lease_path(slot)
+        if not path.exists():
+            return None
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+        return payload if isinstance(payload, dict) else {}
+
+    def _lease_snapshot(self, slot: int) -> tuple[os.stat_result, bytes] | None:
+        try:
+            with open(self.lease_path(slot), "rb") as handle:
+                return os.fstat(handle.fileno()), handle.read()
+        except OSError:
+            return None
+
+    def _stale_lease(self, slot: int) -> tuple[int, int, bytes] | None:
+        """``(device, inode, content)`` of a lease no live process holds, else ``None``."""
+        snapshot = self._lease_snapshot(slot)
+        if snapshot is None:
+            return None
+        stat, content = snapshot
+        try:
+            payload = json.loads(content.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            payload = None
+        raw_pid = str(payload.get("pid", "")) if isinstance(payload, dict) else ""
+        if raw_pid.isdigit() and int(raw_pid) > 0:
+            if _pid_running(int(raw_pid)):
+                return None
+        elif time.time() - stat.st_mtime < self.lease_grace_sec:
+            # Empty or unparseable: treat as live until the grace period passes.
+            return None
+        return stat.st_dev, stat.st_ino, content
+
+    def _lease_is_stale(self, slot: int) -> bool:
+        return self._stale_lease(slot) is not None
+
+    def _expire_lease(self, slot: int, identity: tuple[int, int, bytes]) -> bool:
+        """Remove the lease only if it is still the file that was judged stale."""
+        snapshot = self._lease_snapshot(slot)
+        if snapshot is None or (snapshot[0].st_dev, snapshot[0].st_ino, snapshot[1]) != identity:
+            return False
+        self.lease_path(slot).unlink(missing_ok=True)
+        return True
+
+    def _link_lease(self, lease_file: Path, owner: str) -> bool:
+        """Create *lease_file* with its payload already inside; ``False`` if it exists."""
+        tmp = lease_file.with_name(f".{lease_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(
+            json.dumps({"pid": os.getpid(), "owner": owner, "leased_at": _now_iso()}, sort_keys=True) + "\n",
+            encoding="utf-8",
+        )
+        try:
+            os.link(tmp, lease_file)
+        except FileExistsError:
+            return False
+        finally:
+            tmp.unlink(missing_ok=True)
+        return True
+
+    def warm(self) -> list[Path]:
+        """Create missing slot worktrees; returns the paths that were created."""
+        if self.size <= 0:
+            return []
+        base_commit = self._base_commit()
+        created: list[Path] = []
+        for slot in range(self.size):
+            if self._ensure_slot(slot, base_commit):
+                created.append(self.slot_path(slot))
+        return created
+
+    def acquire(self, owner: str) -> WorktreeLease | None:
+        """Lease a free slot reset to the primary checkout's ``HEAD``; ``None`` when all are busy."""
+        if self.size <= 0:
+            return None
+        self.pool_dir.mkdir(parents=True, exist_ok=True)
+        base_commit = self._base_commit()
+        for slot in range(self.size):
+            lease_file = self.lease_path(slot)
+            stale = self._stale_lease(slot)
+            if stale is not None:
+                self._expire_lease(slot, stale)
+            if not self._link_lease(lease_file, owner):
+                continue
+            try:
+                self._ensure_slot(slot, base_commit)
+                self._heal_slot_locks(slot)
+                self._reset_slot(slot, base_commit)
+            except Exception:
+                lease_file.unlink(missing_ok=True)
+                raise
+            return WorktreeLease(
+                repo=self.repo,
+                path=self.slot_path(slot),
+                slot=slot,
+                lease_file=lease_file,
+                base_commit=base_commit,
+            )
+        return None
+
+    def release(self, lease: WorktreeLease) -> None:
+        """Reset the slot for the next task and drop the lease, even if the reset fails."""
+        try:
+            if self._slot_is_worktree(lease.slot):
+                self._reset_slot(lease.slot, lease.base_commit)
+        except WorktreePoolError:
+            # The next acquire resets again; a failed reset must not leak the lease.
+            pass
+        finally:
+            lease.lease_file.unlink(missing_ok=True)
+
+    def _heal_slot_locks(self, slot: int) -> list[Path]:
+        git_dir = resolve_git_dir(self.slot_path(slot))
+        if git_dir is None:
+            return []
+        removed: list[Path] = []
+        now = time.time()
+        for name in GIT_LOCK_BASENAMES:
+            lock_path = git_dir / name
+            try:
+                age = now - lock_path.stat().st_mtime
+            except FileNotFoundError:
+                continue
+            if age < self.lock_stale_sec:
+                continue
+            lock_path.unlink(missing_ok=True)
+            removed.append(lock_path)
+        return removed
+
+    def heal(self) -> dict[str, Any]:
+        """Prune dead worktrees, expire orphaned leases and clear stale slot locks."""
+        report: dict[str, Any] = {"pruned": False, "expired_leases": [], "removed_locks": [], "rebuilt_slots": []}
+        report["pruned"] = _git(self.repo, "worktree", "prune").returncode == 0
+        for slot in range(self.size):
+            stale = self._stale_lease(slot)
+            if stale is not None and self._expire_lease(slot, stale):
+                report["expired_leases"].append(slot)
+            path = self.slot_path(slot)
+            if path.exists() and not self._slot_is_worktree(slot):
+                shutil.rmtree(path, ignore_errors=True)
+                report["rebuilt_slots"].append(slot)
+            report["removed_locks"].extend(str(item) for item in self._heal_slot_locks(slot))
+        return report
+
+    def cleanup(self) -> list[Path]:
+        """Remove every slot worktree and lease; returns removed slot paths."""
+        removed: list[Path] = []
+        if not self.pool_dir.exists():
+            return removed
+        for path in sorted(self.pool_dir.glob("slot-*")):
+            if path.is_dir():
+                _git(self.repo, "worktree", "remove", "--force", str(path))
+                shutil.rmtree(path, ignore_errors=True)
+                removed.append(path)
+            elif path.suffix == ".lease":
+                path.unlink(missing_ok=True)
+        _git(self.repo, "worktree", "prune")
+        return removed
+
+    def status(self) -> dict[str, Any]:
+        slots: list[dict[str, Any]] = []
+        for slot in range(self.size):
+            lease = self._read_lease(slot)
+            slots.append(
+                {
+                    "slot": slot,
+                    "path": str(self.slot_path(slot)),
+                    "ready": self._slot_is_worktree(slot),
+                    "leased": lease is not None,
+                    "lease": lease or {},
+                    "lease_stale": self._lease_is_stale(slot),
+                }
+            )
+        return {
+            "repo": str(self.repo),
+            "pool_dir": str(self.pool_dir),
+            "size": self.size,
+            "leased": sum(1 for item in slots if item["leased"]),
+            "slots": slots,
+        }
@@ -0,0 +1,162 @@
+import os
+import pathlib
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from orxaq_autonomy import artifact_index
+
+
+def _touch(path: pathlib.Path, text: str = "{}\n") -> pathlib.Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+class ScanArtifactsTests(unittest.TestCase):
+    def test_single_pass_classifies_all_categories(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = pathlib.Path(td)
+            _touch(root / "health.json")
+            old = _touch(root / "autonomy" / "health.json")
+            os.utime(old, (time.time() - 3600, time.time() - 3600))
+            _touch(root / "autonomy" / "health.md")
+            _touch(root / "autonomy" / "W7_run.json")
+            _touch(root / "W_summary.md")
+            _touch(root / "autonomy" / "pr_review_snapshot.json")
+            _touch(root / "rpa_evidence" / "run-1" / "task-1" / "dom.html")
+            _touch(root / "rpa_evidence" / "run-1" / "task-1" / "deep" / "shot.png")
+            _touch(root / "notes" / "Wrun.json")
+
+            scan = artifact_index.scan_artifacts(root)
+
+            self.assertEqual(scan["health_json"], ["autonomy/health.json", "health.json"])
+            self.assertEqual(scan["health_md"], ["autonomy/health.md"])
+            self.assertEqual(scan["run_reports"], ["autonomy/W7_run.json"])
+            self.assertEqual(scan["run_summaries"], ["W_summary.md"])
+            self.assertEqual(scan["pr_review_snapshots"], ["autonomy/pr_review_snapshot.json"])
+            self.assertEqual(scan["evidence_dirs"], ["rpa_evidence/run-1/task-1"])
+            self.assertEqual(
+                scan["evidence_files"],
+                ["rpa_evidence/run-1/task-1/deep/shot.png", "rpa_evidence/run-1/task-1/dom.html"],
+            )
+            self.assertAlmostEqual(scan["newest_health_mtime"], (root / "health.json").stat().st_mtime)
+            self.assertEqual(scan["stats"]["files"], 9)
+            self.assertEqual(scan["errors"], [])
+
+    def test_ignore_rules_and_depth_limit(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = pathlib.Path(td)
+            _touch(root / ".git" / "health.json")
+            _touch(root / "cache" / "__pycache__" / "health.json")
+            _touch(root / "health.json.tmp")
+            _touch(root / "a" / "b" / "c" / "health.json")
+            _touch(root / "a" / "health.md")
+
+            scan = artifact_index.scan_artifacts(root, max_depth=2)
+            self.assertEqual(scan["health_json"], [])
+            self.assertEqual(scan["health_md"], ["a/health.md"])
+            self.assertEqual(scan["stats"]["skipped_dirs"], 1)
+
+            scan = artifact_index.scan_artifacts(root, ignore=())
+            self.assertEqual(
+                scan["health_json"],
+                [".git/health.json", "a/b/c/health.json", "cache/__pycache__/health.json"],
+            )
+
+    def test_evidence_file_cap_is_deterministic(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = pathlib.Path(td)
+            for index in reversed(range(30)):
+                _touch(root / "rpa_evidence" / "run-1" / f"task-{index:02d}" / "step.json")
+            first = artifact_index.scan_artifacts(root, evidence_file_limit=5)
+            second = artifact_index.scan_artifacts(root, evidence_file_limit=5)
+            self.assertEqual(first["evidence_files"], second["evidence_files"])
+            self.assertEqual(first["evidence_files"][0], "rpa_evidence/run-1/task-00/step.json")
+            self.assertEqual(len(first["evidence_files"]), 5)
+            self.assertEqual(len(first["evidence_dirs"]), 30)
+
+    def test_missing_root_reports_error(self):
+        with tempfile.TemporaryDirectory() as td:
+            scan = artifact_index.scan_artifacts(pathlib.Path(td) / "missing")
+            self.assertEqual(scan["health_json"], [])
+            self.assertEqual(len(scan["errors"]), 1)
+
+
+def _backdate_dirs(root: pathlib.Path, age_sec: float = 60.0) -> None:
+    stamp = time.time() - age_sec
+    for directory in [root, *[path for path in root.rglob("*") if path.is_dir()]]:
+        os.utime(directory, (stamp, stamp))
+
+
+class ArtifactIndexerTests(unittest.TestCase):
+    def test_refresh_relists_only_changed_directories(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = pathlib.Path(td)
+            for run in range(5):
+                _touch(root / "rpa_evidence" / f"run-{run}" / "task-1" / "step.json")
+            _touch(root / "health.json")
+            _backdate_dirs(root)
+            indexer = artifact_index.ArtifactIndexer(root, use_inotify=False)
+            self.assertTrue(indexer.refresh())
+            self.assertEqual(indexer.generation, 1)
+            self.assertEqual(indexer.snapshot()["stats"]["relisted_dirs"], 12)
+
+            self.assertFalse(indexer.refresh())
+            self.assertEqual(indexer.generation, 1)
+            self.assertEqual(indexer.snapshot()["stats"]["relisted_dirs"], 0)
+
+            _touch(root / "rpa_evidence" / "run-3" / "W3_run.json")
+            self.assertTrue(indexer.refresh())
+            snapshot = indexer.snapshot()
+            self.assertEqual(snapshot["generation"], 2)
+            self.assertEqual(snapshot["run_reports"], ["rpa_evidence/run-3/W3_run.json"])
+            self.assertEqual(snapshot["stats"]["relisted_dirs"], 1)
+
+            (root / "rpa_evidence" / "run-3" / "W3_run.json").unlink()
+            shutil.rmtree(root / "rpa_evidence" / "run-4")
+            self.assertTrue(indexer.refresh())
+            self.assertEqual(indexer.snapshot()["run_reports"], [])
+            self.assertEqual(len(indexer.snapshot()["evidence_dirs"]), 4)
+
+    def test_health_rewrite_in_place_bumps_generation(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = pathlib.Path(td)
+            health = _touch(root / "health.json")
+            os.utime(health, (time.time() - 3600, time.time() - 3600))
+            _backdate_dirs(root)
+            indexer = artifact_index.ArtifactIndexer(root, use_inotify=False)
+            indexer.refresh()
+            before = indexer.snapshot()["newest_health_mtime"]
+            os.utime(health, None)
+            self.assertTrue(indexer.refresh())
+            self.assertGreater(indexer.snapshot()["newest_health_mtime"], before)
+
+    def test_background_thread_picks_up_new_artifacts(self):
+        for use_inotify in (True, False):
+            with self.subTest(use_inotify=use_inotify), tempfile.TemporaryDirectory() as td:
+                root = pathlib.Path(td)
+                indexer = artifact_index.ArtifactIndexer(root, refresh_sec=0.1, use_inotify=use_inotify)
+                indexer.start()
+                try:
+                    generation = indexer.snapshot()["generation"]
+                    if not use_inotify:
+                        self.assertEqual(indexer.watch_mode, "poll")
+                    _touch(root / "nested" / "health.md")
+                    self.assertGreater(indexer.wait_for_change(generation, timeout=5), generation)
+                    self.assertEqual(indexer.snapshot()["health_md"], ["nested/health.md"])
+                finally:
+                    indexer.close()
+                self.assertFalse(indexer.running)
+
+
+if __name__ == "__main__":
+    unittest.main()
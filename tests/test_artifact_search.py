@@ -0,0 +1,194 @@
+import json
+import pathlib
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from http.server import ThreadingHTTPServer
+from unittest import mock
+from urllib import error as urllib_error
+from urllib import parse as urllib_parse
+from urllib import request as urllib_request
+
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from orxaq_autonomy import dashboard
+from orxaq_autonomy.artifact_search import ArtifactSearchIndex, artifact_kind, fts_query
+
+
+class ArtifactSearchHelpersTests(unittest.TestCase):
+    def test_artifact_kind(self):
+        self.assertEqual(artifact_kind("W12_A_summary.md"), "summary")
+        self.assertEqual(artifact_kind("autonomy/task-1_20260101_000000.md"), "report")
+        self.assertEqual(artifact_kind("W12_A_run.json"), "report")
+        self.assertEqual(artifact_kind("autonomy/swarm_health.md"), "health")
+        self.assertEqual(artifact_kind("autonomy/runner.log"), "log")
+        self.assertEqual(artifact_kind("health.json"), "")
+
+    def test_fts_query_quotes_terms(self):
+        self.assertEqual(fts_query('ModuleNotFoundError: "foo" time*'), '"ModuleNotFoundError:" """foo""" "time"*')
+        self.assertEqual(fts_query("  * "), "")
+
+
+class ArtifactSearchIndexTests(unittest.TestCase):
+    def setUp(self):
+        self._td = tempfile.TemporaryDirectory()
+        self.root = pathlib.Path(self._td.name) / "artifacts"
+        (self.root / "autonomy").mkdir(parents=True)
+        (self.root / "W1_summary.md").write_text("# W1\n\nAll validations passed.\n", encoding="utf-8")
+        (self.root / "autonomy" / "task-7_20260101_000000.md").write_text(
+            "# Autonomy Task Report: task-7\n\n- Status: blocked\n- Blocker: ModuleNotFoundError in pipeline\n",
+            encoding="utf-8",
+        )
+        evidence = self.root / "rpa_evidence" / "run-1" / "task-1"
+        evidence.mkdir(parents=True)
+        (evidence / "notes.txt").write_text("ModuleNotFoundError in evidence\n", encoding="utf-8")
+        self.index = ArtifactSearchIndex(self.root)
+
+    def tearDown(self):
+        self.index.close()
+        self._td.cleanup()
+
+    def test_ranked_hits_with_snippets_and_kind_filter(self):
+        self.assertEqual(self.index.sync()["indexed"], 2)
+        result = self.index.search("modulenotfounderror")
+        self.assertEqual([hit["path"] for hit in result["hits"]], ["autonomy/task-7_20260101_000000.md"])
+        self.assertIn("[ModuleNotFoundError]", result["hits"][0]["snippet"])
+        self.assertEqual(self.index.search("validations", kind="report")["hits"], [])
+        self.assertEqual(self.index.search("validation*", kind="summary")["count"], 1)
+
+    def test_sync_reindexes_changes_and_drops_deleted_files(self):
+        self.index.sync()
+        self.assertEqual(self.index.sync(), {"files": 2, "indexed": 0, "appended": 0, "removed": 0})
+        (self.root / "W1_summary.md").write_text("# W1\n\nValidation timed out.\n", encoding="utf-8")
+        (self.root / "autonomy" / "task-7_20260101_000000.md").unlink()
+        stats = self.index.sync()
+        self.assertEqual((stats["indexed"], stats["removed"]), (1, 1))
+        self.assertEqual(self.index.search("passed")["hits"], [])
+        self.assertEqual(self.index.search("ModuleNotFoundError")["hits"], [])
+        self.assertEqual(self.index.search("timed")["count"], 1)
+
+    def test_appended_log_indexes_only_its_tail(self):
+        log = self.root / "autonomy" / "runner.log"
+        log.write_text("cycle 1 ok\n" * 10, encoding="utf-8")
+        self.index.sync()
+        head_size = log.stat().st_size
+        with open(log, "a", encoding="utf-8") as handle:
+            handle.write("cycle 2 failed: disk quota exceeded\npartial li")
+        with mock.patch.object(
+            ArtifactSearchIndex, "_insert", autospec=True, side_effect=ArtifactSearchIndex._insert
+        ) as insert:
+            self.assertEqual(self.index.sync()["appended"], 1)
+        self.assertEqual([call.args[2] for call in insert.call_args_list], [head_size])
+
+        hit = self.index.search("quota")["hits"][0]
+        self.assertEqual((hit["path"], hit["kind"], hit["offset"]), ("autonomy/runner.log", "log", head_size))
+        self.assertEqual(self.index.search("partial")["hits"], [])
+
+        log.write_text("rotated fresh\n", encoding="utf-8")
+        self.index.sync()
+        self.assertEqual(self.index.search("quota")["hits"], [])
+        self.assertEqual(self.index.search("fresh")["hits"][0]["offset"], 0)
+
+    def test_search_does_not_wait_for_a_running_sync(self):
+        self.index.sync()
+        inside, release = threading.Event(), threading.Event()
+        original_insert = ArtifactSearchIndex._insert
+
+        def slow_insert(conn, rel, offset, body):
+            # Block inside the write transaction, after the new text is inserted.
+            original_insert(conn, rel, offset, body)
+            inside.set()
+            release.wait(5)
+
+        self.index._insert = slow_insert
+        (self.root / "W2_summary.md").write_text("# W2\n\nFlaky fixture.\n", encoding="utf-8")
+        syncing = threading.Thread(target=self.index.sync)
+        syncing.start()
+        try:
+            self.assertTrue(inside.wait(5))
+            started = time.monotonic()
+            self.assertEqual(self.index.search("pipeline")["count"], 1)
+            self.assertLess(time.monotonic() - started, 1.0)
+            self.assertEqual(self.index.search("flaky")["count"], 0)
+        finally:
+            release.set()
+            syncing.join(timeout=5)
+        self.assertEqual(self.index.search("flaky")["count"], 1)
+
+    def test_background_sync_survives_database_errors(self):
+        with mock.patch.object(self.index, "sync", side_effect=sqlite3.OperationalError("database is locked")):
+            self.index.start(interval_sec=0.05)
+            self.assertTrue(self.index.wait_synced(5))
+            deadline = time.monotonic() + 5
+            while self.index.sync_errors < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        self.assertGreaterEqual(self.index.sync_errors, 2)
+        self.assertTrue(self.index.running)
+        self.index.close()
+        self.assertFalse(self.index.running)
+
+    def test_dashboard_search_endpoint(self):
+        handler = dashboard.make_dashboard_handler(self.root, search_index=self.index)
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            query = urllib_parse.urlencode({"q": "pipeline blocked", "limit": "5"})
+            url = f"http://127.0.0.1:{server.server_port}/api/search?{query}"
+            with urllib_request.urlopen(url, timeout=5) as resp:
+                payload = json.loads(resp.read().decode("utf-8"))
+            self.assertEqual(payload["count"], 1)
+            self.assertEqual(payload["hits"][0]["kind"], "report")
+            self.assertIn("took_ms", payload)
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join(timeout=2)
+
+    def test_dashboard_search_syncs_off_the_request_thread(self):
+        sync_threads = []
+        original_sync = self.index.sync
+
+        def sync():
+            sync_threads.append(threading.current_thread().name)
+            return original_sync()
+
+        self.index.sync = sync
+        handler = dashboard.make_dashboard_handler(self.root, search_index=self.index)
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        base = f"http://127.0.0.1:{server.server_port}/api/search?"
+        try:
+            with urllib_request.urlopen(base + urllib_parse.urlencode({"q": "pipeline"}), timeout=5) as resp:
+                self.assertEqual(json.loads(resp.read().decode("utf-8"))["count"], 1)
+            (self.root / "W2_summary.md").write_text("# W2\n\nFlaky fixture.\n", encoding="utf-8")
+            self.index.request_sync()
+            deadline = time.monotonic() + 5
+            count = 0
+            while not count and time.monotonic() < deadline:
+                with urllib_request.urlopen(base + urllib_parse.urlencode({"q": "flaky"}), timeout=5) as resp:
+                    count = json.loads(resp.read().decode("utf-8"))["count"]
+            self.assertEqual(count, 1)
+            self.assertEqual(set(sync_threads), {"artifact-search-sync"})
+
+            with mock.patch.object(self.index, "search", side_effect=sqlite3.OperationalError("database is locked")):
+                with self.assertRaises(urllib_error.HTTPError) as ctx:
+                    urllib_request.urlopen(base + urllib_parse.urlencode({"q": "pipeline"}), timeout=5)
+            self.assertEqual(ctx.exception.code, 503)
+            self.assertIn(b"database is locked", ctx.exception.read())
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join(timeout=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,11 @@
+import io
+import json
 import pathlib
+import sqlite3
 import sys
 import tempfile
 import unittest
+from contextlib import redirect_stdout
 from unittest import mock
 
 
@@ -42,6 +46,52 @@ class CliTests(unittest.TestCase):
                 rc = cli.main(["--root", str(root), "status"])
             self.assertEqual(rc, 0)
 
+    def test_logs_command_searches_rotated_segments(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = pathlib.Path(td)
+            self._prep_root(root)
+            log = root / "artifacts" / "autonomy" / "runner.log"
+            log.parent.mkdir(parents=True, exist_ok=True)
+            log.write_text("alpha timeout\n", encoding="utf-8")
+            self.assertEqual(cli.main(["--root", str(root), "logs", "--rotate"]), 0)
+            log.write_text("beta ok\ngamma timeout\n", encoding="utf-8")
+            out = io.StringIO()
+            with redirect_stdout(out):
+                rc = cli.main(["--root", str(root), "logs", "--search", "timeout"])
+            self.assertEqual(rc, 0)
+            lines = out.getvalue().splitlines()
+            self.assertEqual(len(lines), 2)
+            self.assertTrue(lines[0].endswith(":1: alpha timeout"))
+            self.assertEqual(lines[1], "runner.log:2: gamma timeout")
+
+    def test_search_command_prints_ranked_hits(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = pathlib.Path(td)
+            self._prep_root(root)
+            artifacts = root / "artifacts"
+            (artifacts / "autonomy" / "runner.log").write_text("cycle 1 ok\ncycle 2 quota exceeded\n", encoding="utf-8")
+            (artifacts / "W3_summary.md").write_text("# W3\nquota raised\n", encoding="utf-8")
+            out = io.StringIO()
+            with redirect_stdout(out):
+                rc = cli.main(["--root", str(root), "search", "quota", "--artifacts-dir", str(artifacts), "--kind", "log"])
+            self.assertEqual(rc, 0)
+            self.assertEqual(out.getvalue().splitlines(), ["autonomy/runner.log@0: cycle 1 ok cycle 2 [quota] exceeded"])
+
+    def test_search_command_reports_unavailable_index(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = pathlib.Path(td)
+            self._prep_root(root)
+            out = io.StringIO()
+            with mock.patch(
+                "orxaq_autonomy.artifact_search.ArtifactSearchIndex.sync",
+                side_effect=sqlite3.OperationalError("database is locked"),
+            ), redirect_stdout(out):
+                rc = cli.main(["--root", str(root), "search", "quota", "--artifacts-dir", str(root / "artifacts")])
+            self.assertEqual(rc, 1)
+            self.assertEqual(
+                json.loads(out.getvalue()), {"ok": False, "error": "search index unavailable: database is locked"}
+            )
+
     def test_health_command(self):
         with tempfile.TemporaryDirectory() as td:
             root = pathlib.Path(td)
@@ -80,7 +130,7 @@ class CliTests(unittest.TestCase):
             root = pathlib.Path(td)
             self._prep_root(root)
             with mock.patch(
-                "orxaq_autonomy.cli.run_router_check",
+                "orxaq_autonomy.router.run_router_check",
                 return_value={"summary": {"overall_ok": True}, "providers": []},
             ) as check:
                 rc = cli.main(
@@ -105,7 +155,7 @@ class CliTests(unittest.TestCase):
             root = pathlib.Path(td)
             self._prep_root(root)
             with mock.patch(
-                "orxaq_autonomy.cli.apply_router_profile",
+                "orxaq_autonomy.router.apply_router_profile",
                 return_value={"ok": True, "profile": "local"},
             ) as apply_profile:
                 rc = cli.main(
@@ -130,7 +180,7 @@ class CliTests(unittest.TestCase):
             root = pathlib.Path(td)
             self._prep_root(root)
             with mock.patch(
-                "orxaq_autonomy.cli.run_rpa_schedule_from_config",
+                "orxaq_autonomy.rpa_scheduler.run_rpa_schedule_from_config",
                 return_value={"ok": True, "jobs_total": 0},
             ) as schedule:
                 rc = cli.main(
@@ -152,7 +202,7 @@ class CliTests(unittest.TestCase):
         with tempfile.TemporaryDirectory() as td:
             root = pathlib.Path(td)
             self._prep_root(root)
-            with mock.patch("orxaq_autonomy.cli.run_dashboard_server") as serve:
+            with mock.patch("orxaq_autonomy.dashboard.run_dashboard_server") as serve:
                 rc = cli.main(
                     [
                         "--root",
@@ -174,7 +224,7 @@ class CliTests(unittest.TestCase):
             root = pathlib.Path(td)
             self._prep_root(root)
             with mock.patch(
-                "orxaq_autonomy.cli.run_providers_check",
+                "orxaq_autonomy.providers.run_providers_check",
                 return_value={"summary": {"all_required_up": False}},
             ):
                 rc = cli.main(["--root", str(root), "providers-check", "--strict"])
@@ -1,7 +1,12 @@
+import io
 import json
+import os
 import pathlib
+import subprocess
 import sys
 import tempfile
+import threading
+import time
 import unittest
 from unittest import mock
 
@@ -11,7 +16,8 @@ SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
-from orxaq_autonomy import manager
+from orxaq_autonomy import control_socket, manager
+from orxaq_autonomy.health_history import HISTORY_DIRNAME, HealthHistory
 
 
 class ManagerTests(unittest.TestCase):
@@ -72,6 +78,89 @@ class ManagerTests(unittest.TestCase):
             self.assertIn("heartbeat_age_sec", snap)
             self.assertIn("supervisor_running", snap)
 
+    def test_runner_lanes_build_isolated_worker_configs(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = self._build_root(pathlib.Path(td))
+            (root / ".env.autonomy").write_text(
+                "OPENAI_API_KEY=test\nGEMINI_API_KEY=test\nORXAQ_AUTONOMY_RUNNER_LANES=codex,gemini\n",
+                encoding="utf-8",
+            )
+            cfg = manager.ManagerConfig.from_root(root)
+            workers = manager.worker_configs(cfg)
+            self.assertEqual([w.worker_id for w in workers], ["codex", "gemini"])
+            self.assertNotEqual(workers[0].runner_pid_file, workers[1].runner_pid_file)
+            self.assertNotEqual(workers[0].heartbeat_file, cfg.heartbeat_file)
+            argv = manager.runner_argv(workers[1])
+            self.assertEqual(argv[argv.index("--worker-id") + 1], "gemini")
+            self.assertEqual(argv[argv.index("--owner-lanes") + 1], "gemini")
+            self.assertEqual(argv[argv.index("--lock-file") + 1], str(workers[1].lock_file))
+            self.assertEqual(manager.worker_config(cfg, "codex").worker_owners, ("codex",))
+            with self.assertRaises(ValueError):
+                manager.worker_config(cfg, "missing")
+
+    def test_generic_runner_workers_and_status_reports_each_worker(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = self._build_root(pathlib.Path(td))
+            (root / ".env.autonomy").write_text(
+                "OPENAI_API_KEY=test\nGEMINI_API_KEY=test\nORXAQ_AUTONOMY_RUNNER_WORKERS=3\n",
+                encoding="utf-8",
+            )
+            cfg = manager.ManagerConfig.from_root(root)
+            workers = manager.worker_configs(cfg)
+            self.assertEqual([w.worker_id for w in workers], ["w1", "w2", "w3"])
+            self.assertNotIn("--owner-lanes", manager.runner_argv(workers[0]))
+            workers[1].heartbeat_file.parent.mkdir(parents=True, exist_ok=True)
+            workers[1].heartbeat_file.write_text(
+                json.dumps({"timestamp": "2000-01-01T00:00:00+00:00"}), encoding="utf-8"
+            )
+            snap = manager.status_snapshot(cfg)
+            self.assertEqual([item["worker"] for item in snap["workers"]], ["w1", "w2", "w3"])
+            self.assertTrue(snap["workers"][1]["heartbeat_stale"])
+            self.assertGreater(snap["heartbeat_age_sec"], cfg.heartbeat_stale_sec)
+            health = manager.health_snapshot(cfg)
+            self.assertEqual(health["stale_workers"], ["w2"])
+            self.assertTrue(health["heartbeat_stale"])
+
+    @unittest.skipUnless(control_socket.CONTROL_SOCKET_SUPPORTED, "AF_UNIX not available")
+    def test_status_and_health_prefer_control_sockets(self):
+        with tempfile.TemporaryDirectory(dir="/tmp") as td:
+            root = self._build_root(pathlib.Path(td))
+            cfg = manager.ManagerConfig.from_root(root)
+            self.assertIn(str(manager.runner_socket_file(cfg)), manager.runner_argv(cfg))
+            supervisor = control_socket.ControlServer(
+                manager.supervisor_socket_file(cfg),
+                {"status": lambda _req: {"supervisor_pid": 42, "workers": [{"worker": "", "runner_pid": 43, "state": "running", "tick_age_sec": 1}]}},
+            )
+            runner_server = control_socket.ControlServer(
+                manager.runner_socket_file(cfg),
+                {
+                    "status": lambda _req: {
+                        "phase": "task_started",
+                        "heartbeat_age_sec": 2,
+                        "queue": {"counts": {"pending": 2, "done": 1, "blocked": 1}, "blocked": ["b"]},
+                        "budget": {"tokens": 5},
+                    }
+                },
+            )
+            supervisor.start()
+            runner_server.start()
+            try:
+                snap = manager.status_snapshot(cfg)
+                health = manager.health_snapshot(cfg)
+            finally:
+                supervisor.close()
+                runner_server.close()
+
+            self.assertEqual(snap["source"], "socket")
+            self.assertEqual(snap["supervisor_pid"], 42)
+            self.assertEqual(snap["runner_pid"], 43)
+            self.assertEqual(snap["heartbeat_age_sec"], 2)
+            self.assertEqual(snap["workers"][0]["live"]["phase"], "task_started")
+            self.assertEqual(health["state_counts"]["total"], 4)
+            self.assertEqual(health["blocked_tasks"], ["b"])
+            self.assertEqual(health["budget"], {"tokens": 5})
+            self.assertEqual(manager.status_snapshot(cfg)["source"], "files")
+
     def test_install_keepalive_windows_command_is_user_space(self):
         with tempfile.TemporaryDirectory() as td:
             root = self._build_root(pathlib.Path(td))
@@ -137,6 +226,82 @@ class ManagerTests(unittest.TestCase):
             self.assertFalse(payload["clean"])
             self.assertEqual(len(payload["checks"]), 2)
 
+    def test_preflight_runs_checks_concurrently_and_reports_latency(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = self._build_root(pathlib.Path(td))
+            cfg = manager.ManagerConfig.from_root(root)
+
+            def _slow_clean(repo):
+                time.sleep(0.3)
+                return True, "ok"
+
+            with mock.patch("orxaq_autonomy.manager.shutil.which", return_value="/usr/bin/true"), mock.patch(
+                "orxaq_autonomy.manager._has_codex_auth",
+                side_effect=lambda env: time.sleep(0.3) or True,
+            ), mock.patch("orxaq_autonomy.manager._repo_is_clean", side_effect=_slow_clean):
+                started = time.monotonic()
+                payload = manager.preflight(cfg, require_clean=True)
+                elapsed = time.monotonic() - started
+            self.assertLess(elapsed, 0.8)
+            self.assertTrue(payload["clean"])
+            self.assertEqual(
+                [row["name"] for row in payload["runtime_checks"]],
+                ["codex_cli", "gemini_cli", "codex_auth", "gemini_auth"],
+            )
+            self.assertGreaterEqual(payload["checks"][0]["latency_ms"], 250)
+            self.assertIn("elapsed_ms", payload)
+
+    def test_preflight_deadline_fails_hung_check(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = self._build_root(pathlib.Path(td))
+            with mock.patch.dict(os.environ, {"ORXAQ_AUTONOMY_PREFLIGHT_DEADLINE_SEC": "1"}):
+                cfg = manager.ManagerConfig.from_root(root)
+            release = threading.Event()
+            with mock.patch("orxaq_autonomy.manager.ensure_runtime"), mock.patch(
+                "orxaq_autonomy.manager._repo_is_clean",
+                side_effect=lambda repo: release.wait(5) or (True, "ok"),
+            ):
+                started = time.monotonic()
+                payload = manager.preflight(cfg, require_clean=True)
+                elapsed = time.monotonic() - started
+            release.set()
+            self.assertLess(elapsed, 2.5)
+            self.assertFalse(payload["clean"])
+            self.assertIn("timed out", payload["checks"][0]["message"])
+
+    def test_preflight_never_caches_clean_git_status(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = self._build_root(pathlib.Path(td))
+            for name in ("impl", "test"):
+                repo = pathlib.Path(td) / name
+                repo.mkdir()
+                subprocess.run(["git", "init", "-q", str(repo)], check=True)
+            impl = pathlib.Path(td) / "impl"
+            (impl / "f").write_text("one\n", encoding="utf-8")
+            git = ["git", "-C", str(impl), "-c", "user.name=t", "-c", "user.email=t@example.com"]
+            subprocess.run([*git, "add", "f"], check=True)
+            subprocess.run([*git, "commit", "-q", "-m", "init"], check=True)
+            env = {"ORXAQ_IMPL_REPO": str(impl), "ORXAQ_TEST_REPO": str(pathlib.Path(td) / "test")}
+            with mock.patch.dict(os.environ, env):
+                cfg = manager.ManagerConfig.from_root(root)
+            with mock.patch("orxaq_autonomy.manager.ensure_runtime"):
+                first = manager.preflight(cfg, require_clean=True)
+                # Editing a tracked file touches neither .git/index nor HEAD.
+                (impl / "f").write_text("two\n", encoding="utf-8")
+                second = manager.preflight(cfg, require_clean=True)
+            self.assertTrue(first["clean"])
+            self.assertFalse(second["clean"])
+            self.assertEqual([row["cached"] for row in first["checks"] + second["checks"]], [False] * 4)
+
+    def test_preflight_check_with_none_fingerprint_is_not_cached(self):
+        with tempfile.TemporaryDirectory() as td:
+            cfg = manager.ManagerConfig.from_root(self._build_root(pathlib.Path(td)))
+            run = mock.Mock(return_value=(True, "ok"))
+            check = manager._PreflightCheck("probe", run, cache_key="probe", fingerprint=lambda: None)
+            rows = manager._run_preflight_checks(cfg, [check]) + manager._run_preflight_checks(cfg, [check])
+            self.assertEqual([row["cached"] for row in rows], [False, False])
+            self.assertEqual(run.call_count, 2)
+
     def test_install_keepalive_macos_uses_launch_agent(self):
         with tempfile.TemporaryDirectory() as td:
             root = self._build_root(pathlib.Path(td))
@@ -184,6 +349,11 @@ class ManagerTests(unittest.TestCase):
             self.assertEqual(snapshot["state_counts"]["blocked"], 1)
             self.assertTrue(pathlib.Path(snapshot["health_file"]).exists())
 
+            history = HealthHistory(cfg.artifacts_dir / HISTORY_DIRNAME)
+            manager.health_snapshot(cfg)
+            points = history.query("health.tasks.blocked", resolution="raw")["points"]
+            self.assertEqual([point[1] for point in points], [1.0, 1.0])
+
     def test_supervise_foreground_restarts_after_failure(self):
         with tempfile.TemporaryDirectory() as td:
             root = self._build_root(pathlib.Path(td))
@@ -220,6 +390,144 @@ class ManagerTests(unittest.TestCase):
             self.assertEqual(rc, 0)
             self.assertEqual(len(popen_calls), 2)
 
+    def test_supervise_foreground_runs_one_runner_per_lane(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = self._build_root(pathlib.Path(td))
+            (root / ".env.autonomy").write_text(
+                "OPENAI_API_KEY=test\nGEMINI_API_KEY=test\nORXAQ_AUTONOMY_RUNNER_LANES=codex,gemini\n",
+                encoding="utf-8",
+            )
+            cfg = manager.ManagerConfig.from_root(root)
+
+            class _Child:
+                def __init__(self, pid: int, rc: int) -> None:
+                    self.pid = pid
+                    self._rc = rc
+
+                def wait(self) -> int:
+                    return self._rc
+
+            launches: list[str] = []
+            lock = manager.threading.Lock()
+
+            def fake_popen(argv, **kwargs):
+                with lock:
+                    worker = argv[argv.index("--worker") + 1]
+                    launches.append(worker)
+                    # The gemini worker crashes once and is restarted on its own.
+                    rc = 1 if worker == "gemini" and launches.count("gemini") == 1 else 0
+                    return _Child(pid=300 + len(launches), rc=rc)
+
+            with mock.patch("orxaq_autonomy.manager.ensure_runtime"), mock.patch(
+                "orxaq_autonomy.manager.subprocess.Popen", side_effect=fake_popen
+            ), mock.patch("orxaq_autonomy.manager._pid_running", return_value=False), mock.patch(
+                "orxaq_autonomy.manager.time.sleep"
+            ):
+                rc = manager.supervise_foreground(cfg)
+
+            self.assertEqual(rc, 0)
+            self.assertEqual(sorted(launches), ["codex", "gemini", "gemini"])
+
+    def test_supervise_foreground_promotes_warm_standby_without_backoff(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = self._build_root(pathlib.Path(td))
+            (root / ".env.autonomy").write_text(
+                "OPENAI_API_KEY=test\nGEMINI_API_KEY=test\nORXAQ_AUTONOMY_WARM_STANDBY=1\n",
+                encoding="utf-8",
+            )
+            cfg = manager.ManagerConfig.from_root(root)
+            self.assertTrue(cfg.warm_standby)
+
+            class _Child:
+                def __init__(self, pid: int, rc: int, standby: bool) -> None:
+                    self.pid = pid
+                    self._rc = rc
+                    self.stdin = mock.Mock() if standby else None
+
+                def poll(self):
+                    return None
+
+                def wait(self) -> int:
+                    return self._rc
+
+            launched: list[str] = []
+
+            def fake_popen(argv, **kwargs):
+                launched.append(argv[-1])
+                standby = argv[-1] == "standby"
+                # First runner crashes; the promoted standby then finishes cleanly.
+                rc = 1 if len(launched) == 1 else 0
+                return _Child(pid=200 + len(launched), rc=rc, standby=standby)
+
+            clock = iter([0.0, 120.0, 120.0, 240.0])
+            with mock.patch("orxaq_autonomy.manager.ensure_runtime"), mock.patch(
+                "orxaq_autonomy.manager.subprocess.Popen", side_effect=fake_popen
+            ), mock.patch("orxaq_autonomy.manager._pid_running", return_value=False), mock.patch(
+                "orxaq_autonomy.manager.time.monotonic", side_effect=lambda: next(clock)
+            ), mock.patch("orxaq_autonomy.manager.time.sleep") as sleep, mock.patch(
+                "orxaq_autonomy.manager._terminate_pid"
+            ):
+                rc = manager.supervise_foreground(cfg)
+
+            self.assertEqual(rc, 0)
+            self.assertEqual(launched, ["run", "standby", "standby"])
+            sleep.assert_not_called()
+
+    @unittest.skipIf(manager.os.name == "nt", "heartbeat pipe is POSIX-only")
+    def test_heartbeat_channel_records_ticks_and_eof(self):
+        channel = manager.HeartbeatChannel()
+        try:
+            env: dict[str, str] = {}
+            kwargs = channel.popen_kwargs(env)
+            self.assertEqual(kwargs["pass_fds"], (channel.write_fd,))
+            self.assertEqual(env[manager.HEARTBEAT_FD_ENV], str(channel.write_fd))
+            self.assertFalse(channel.wait(0.01))
+
+            manager.os.write(channel.write_fd, b"running\n")
+            self.assertTrue(channel.wait(1.0))
+            self.assertIsNotNone(channel.last_tick)
+
+            channel.detach_writer()
+            self.assertFalse(channel.wait(1.0))
+            self.assertTrue(channel.closed)
+            self.assertFalse(channel.active)
+        finally:
+            channel.close()
+
+    def test_supervised_heartbeat_age_falls_back_to_file_mtime(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = self._build_root(pathlib.Path(td))
+            cfg = manager.ManagerConfig.from_root(root)
+            self.assertEqual(manager._supervised_heartbeat_age_sec(cfg, None), -1)
+            cfg.heartbeat_file.parent.mkdir(parents=True, exist_ok=True)
+            cfg.heartbeat_file.write_text("{}", encoding="utf-8")
+            old = manager.time.time() - 500
+            manager.os.utime(cfg.heartbeat_file, (old, old))
+            self.assertGreaterEqual(manager._supervised_heartbeat_age_sec(cfg, None), 499)
+
+    def test_standby_foreground_exits_when_supervisor_pipe_closes(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = self._build_root(pathlib.Path(td))
+            cfg = manager.ManagerConfig.from_root(root)
+            with mock.patch("orxaq_autonomy.manager.ensure_runtime"), mock.patch(
+                "orxaq_autonomy.manager.sys.stdin", io.StringIO("")
+            ), mock.patch("orxaq_autonomy.manager._run_runner") as run_runner:
+                rc = manager.standby_foreground(cfg)
+            self.assertEqual(rc, 0)
+            run_runner.assert_not_called()
+            self.assertFalse(cfg.standby_pid_file.exists())
+
+    def test_standby_foreground_runs_runner_when_promoted(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = self._build_root(pathlib.Path(td))
+            cfg = manager.ManagerConfig.from_root(root)
+            with mock.patch("orxaq_autonomy.manager.ensure_runtime"), mock.patch(
+                "orxaq_autonomy.manager.sys.stdin", io.StringIO("promote\n")
+            ), mock.patch("orxaq_autonomy.manager._run_runner", return_value=7) as run_runner:
+                rc = manager.standby_foreground(cfg)
+            self.assertEqual(rc, 7)
+            run_runner.assert_called_once_with(cfg)
+
     def test_autonomy_stop_writes_report_with_required_sections(self):
         with tempfile.TemporaryDirectory() as td:
             root = self._build_root(pathlib.Path(td))
@@ -347,6 +655,81 @@ class ManagerTests(unittest.TestCase):
             # "not-a-dict" falls into unknown; None and 42 become "none" and "42" -> unknown
             self.assertGreaterEqual(counts["unknown"], 2)
 
+    def _health_state(self, root: pathlib.Path, statuses: dict) -> None:
+        payload = {task_id: {"status": status} for task_id, status in statuses.items()}
+        (root / "state" / "state.json").write_text(json.dumps(payload), encoding="utf-8")
+
+    def test_health_snapshot_reuses_counts_until_state_changes(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = self._build_root(pathlib.Path(td))
+            cfg = manager.ManagerConfig.from_root(root)
+            self._health_state(root, {"a": "done", "b": "pending", "c": "blocked"})
+            with mock.patch(
+                "orxaq_autonomy.manager._load_state_statuses", wraps=manager._load_state_statuses
+            ) as load:
+                first = manager.health_snapshot(cfg)
+                second = manager.health_snapshot(cfg)
+                self.assertEqual(load.call_count, 1)
+                self.assertEqual(first["state_counts"], second["state_counts"])
+
+                self._health_state(root, {"a": "done", "b": "done", "d": "pending"})
+                third = manager.health_snapshot(cfg)
+                self.assertEqual(load.call_count, 2)
+            self.assertEqual(third["state_counts"]["done"], 2)
+            self.assertEqual(third["state_counts"]["pending"], 1)
+            self.assertEqual(third["state_counts"]["blocked"], 0)
+            self.assertEqual(third["state_counts"]["total"], 3)
+            self.assertEqual(third["blocked_tasks"], [])
+
+    def test_health_snapshot_reuses_persisted_health_across_processes(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = self._build_root(pathlib.Path(td))
+            cfg = manager.ManagerConfig.from_root(root)
+            self._health_state(root, {"a": "blocked"})
+            manager.health_snapshot(cfg)
+            manager._STATE_COUNT_CACHE.clear()
+            manager._HEALTH_CACHE.clear()
+            with mock.patch("orxaq_autonomy.manager._load_state_statuses") as load:
+                again = manager.health_snapshot(cfg)
+            load.assert_not_called()
+            self.assertEqual(again["blocked_tasks"], ["a"])
+
+    def test_health_snapshot_skips_identical_rewrite(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = self._build_root(pathlib.Path(td))
+            cfg = manager.ManagerConfig.from_root(root)
+            self._health_state(root, {"a": "done"})
+            first = manager.health_snapshot(cfg, skip_unchanged_write=True)
+            self.assertTrue(first["health_file_written"])
+            health_file = pathlib.Path(first["health_file"])
+            written = health_file.read_text(encoding="utf-8")
+            old = manager.time.time() - 100
+            manager.os.utime(health_file, (old, old))
+
+            second = manager.health_snapshot(cfg, skip_unchanged_write=True)
+            self.assertFalse(second["health_file_written"])
+            self.assertEqual(health_file.read_text(encoding="utf-8"), written)
+            self.assertGreater(health_file.stat().st_mtime, old + 50)
+
+            self._health_state(root, {"a": "pending"})
+            third = manager.health_snapshot(cfg, skip_unchanged_write=True)
+            self.assertTrue(third["health_file_written"])
+
+    def test_health_snapshot_skip_ignores_heartbeat_age(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = self._build_root(pathlib.Path(td))
+            cfg = manager.ManagerConfig.from_root(root)
+            self._health_state(root, {"a": "done"})
+            cfg.heartbeat_file.write_text(json.dumps({"timestamp": manager._now_iso()}), encoding="utf-8")
+            written = []
+            for age in (0, 1, 2, cfg.heartbeat_stale_sec + 1):
+                with mock.patch("orxaq_autonomy.manager._heartbeat_age_sec", return_value=age):
+                    snapshot = manager.health_snapshot(cfg, skip_unchanged_write=True)
+                self.assertEqual(snapshot["status"]["heartbeat_age_sec"], age)
+                written.append(snapshot["health_file_written"])
+            # Only the first write and the transition to stale change stable fields.
+            self.assertEqual(written, [True, False, False, True])
+
     def test_tail_logs_bounded_memory_for_large_file(self):
         with tempfile.TemporaryDirectory() as td:
             root = self._build_root(pathlib.Path(td))
@@ -358,9 +741,12 @@ class ManagerTests(unittest.TestCase):
             with open(cfg.log_file, "w", encoding="utf-8") as f:
                 for i in range(count):
                     f.write(f"[line-{i:04d}] {line}")
-            result = manager.tail_logs(cfg, lines=10)
+            with mock.patch("orxaq_autonomy.manager.LogIndex") as index:
+                result = manager.tail_logs(cfg, lines=10)
+            index.assert_not_called()
             result_lines = result.strip().splitlines()
             self.assertEqual(len(result_lines), 10)
+            self.assertEqual(result_lines[0], f"[line-0490] {line.strip()}")
             self.assertIn("[line-0499]", result_lines[-1])
 
     def test_tail_logs_small_file_returns_all_lines(self):
@@ -389,6 +775,34 @@ class ManagerTests(unittest.TestCase):
             result = manager.tail_logs(cfg, lines=10)
             self.assertEqual(result, "")
 
+    def test_tail_logs_reads_window_from_line_index(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = self._build_root(pathlib.Path(td))
+            cfg = manager.ManagerConfig.from_root(root)
+            cfg.log_file.parent.mkdir(parents=True, exist_ok=True)
+            cfg.log_file.write_text("".join(f"row-{i}\n" for i in range(700)), encoding="utf-8")
+            self.assertEqual(manager.tail_logs(cfg, lines=2, from_line=256), "row-256\nrow-257")
+            self.assertTrue(cfg.log_file.with_name("runner.log.idx").exists())
+            self.assertEqual(manager.tail_logs(cfg, lines=1), "row-699")
+
+    def test_supervisor_log_rotates_when_size_exceeded(self):
+        with tempfile.TemporaryDirectory() as td:
+            log_path = pathlib.Path(td) / "runner.log"
+            log = manager.SupervisorLog(log_path, max_bytes=64, keep_segments=1)
+            try:
+                self.assertIsNone(log.rotate_if_due())
+                for i in range(5):
+                    log.write(f"message {i}")
+                segment = log.rotate_if_due()
+                self.assertIsNotNone(segment)
+                self.assertEqual(list(pathlib.Path(td).glob("runner.log.*.gz")), [segment])
+                log.write("after rotation")
+            finally:
+                log.close()
+            lines = log_path.read_text(encoding="utf-8").splitlines()
+            self.assertIn("rotated log into", lines[0])
+            self.assertIn("after rotation", lines[-1])
+
     def test_autonomy_stop_files_issue_with_sanitized_payload(self):
         with tempfile.TemporaryDirectory() as td:
             root = self._build_root(pathlib.Path(td))
@@ -355,6 +355,320 @@ class RuntimeSafeguardTests(unittest.TestCase):
         self.assertTrue(any("cost budget exceeded" in item for item in violations))
         self.assertTrue(any("retry budget exceeded" in item for item in violations))
 
+    def test_record_validation_run_accumulates_totals(self):
+        budget = runner.init_budget_state(
+            max_runtime_sec=0,
+            max_total_tokens=0,
+            max_total_cost_usd=0.0,
+            max_total_retries=0,
+            trace_enabled=False,
+        )
+        runner.record_validation_run(budget, duration_sec=1.25, ok=True)
+        runner.record_validation_run(budget, duration_sec=0.5, ok=False)
+        totals = budget["totals"]
+        self.assertEqual((totals["validation_runs"], totals["validation_failures"]), (2, 1))
+        self.assertAlmostEqual(totals["validation_sec"], 1.75)
+        self.assertEqual(runner.evaluate_budget_violations(budget), [])
+
+
+
+def _pending_entry(owner: str) -> dict:
+    return {
+        "status": runner.STATUS_PENDING,
+        "attempts": 0,
+        "retryable_failures": 0,
+        "not_before": "",
+        "last_update": "",
+        "last_summary": "",
+        "last_error": "",
+        "owner": owner,
+    }
+
+
+@unittest.skipIf(os.name == "nt", "heartbeat pipe is POSIX-only")
+class HeartbeatTickTests(unittest.TestCase):
+    def setUp(self):
+        runner._heartbeat_tick_state.clear()
+        self.addCleanup(runner._heartbeat_tick_state.clear)
+
+    def test_write_heartbeat_sends_tick_over_inherited_fd(self):
+        read_fd, write_fd = os.pipe()
+        self.addCleanup(os.close, read_fd)
+        self.addCleanup(os.close, write_fd)
+        with tempfile.TemporaryDirectory() as td, mock.patch.dict(
+            os.environ, {runner.HEARTBEAT_FD_ENV: str(write_fd)}
+        ):
+            runner.write_heartbeat(pathlib.Path(td) / "heartbeat.json", phase="running", cycle=1, task_id="a", message="m")
+        self.assertEqual(os.read(read_fd, 4096), b"running\n")
+
+    def test_tick_disables_itself_when_pipe_is_gone(self):
+        read_fd, write_fd = os.pipe()
+        os.close(read_fd)
+        self.addCleanup(os.close, write_fd)
+        with mock.patch.dict(os.environ, {runner.HEARTBEAT_FD_ENV: str(write_fd)}):
+            runner.send_heartbeat_tick("running")
+        self.assertEqual(runner._heartbeat_tick_state["fd"], -1)
+
+    def test_tick_is_noop_without_supervisor(self):
+        with mock.patch.dict(os.environ, {}, clear=True):
+            runner.send_heartbeat_tick("running")
+        self.assertEqual(runner._heartbeat_tick_state["fd"], -1)
+
+
+class InputCacheTests(unittest.TestCase):
+    def test_preload_inputs_reparses_only_changed_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = pathlib.Path(tmp) / "state.json"
+            path.write_text(json.dumps({"a": {"status": "done"}}), encoding="utf-8")
+            self.assertEqual(runner.preload_inputs(path), [path])
+            self.assertEqual(runner.preload_inputs(path), [])
+
+            tmp_path = pathlib.Path(tmp) / "state.json.tmp"
+            tmp_path.write_text(json.dumps({"a": {"status": "blocked"}}), encoding="utf-8")
+            os.replace(tmp_path, path)
+            self.assertEqual(runner.preload_inputs(path), [path])
+            tasks = [runner.Task("a", "codex", 1, "A", "A", [], [])]
+            self.assertEqual(runner.load_state(path, tasks)["a"]["status"], runner.STATUS_BLOCKED)
+
+    def test_preload_inputs_ignores_missing_files(self):
+        self.assertEqual(runner.preload_inputs(pathlib.Path("/nonexistent/state.json")), [])
+
+
+class SharedStateTests(unittest.TestCase):
+    def _tasks(self):
+        return [
+            runner.Task("a", "codex", 1, "A", "a", [], []),
+            runner.Task("b", "codex", 2, "B", "b", [], []),
+            runner.Task("c", "gemini", 3, "C", "c", ["a"], []),
+        ]
+
+    def test_workers_claim_disjoint_tasks_and_merge_updates(self):
+        tasks = self._tasks()
+        with tempfile.TemporaryDirectory() as td:
+            state_file = pathlib.Path(td) / "state.json"
+            first = runner.load_state(state_file, tasks)
+            second = runner.load_state(state_file, tasks)
+
+            runner.sync_shared_state(state_file, first, tasks, set())
+            claimed = runner.select_task_batch(tasks, first, max_batch_size=1)
+            runner.claim_tasks(claimed, first, worker_id="w1")
+            first_owned = {task.id for task in claimed}
+            runner.save_state(state_file, first)
+
+            runner.sync_shared_state(state_file, second, tasks, set())
+            other = runner.select_task_batch(tasks, second, max_batch_size=1)
+            runner.claim_tasks(other, second, worker_id="w2")
+            second_owned = {task.id for task in other}
+            runner.save_state(state_file, second)
+            self.assertEqual([task.id for task in claimed], ["a"])
+            self.assertEqual([task.id for task in other], ["b"])
+
+            first["a"]["status"] = runner.STATUS_DONE
+            runner.sync_shared_state(state_file, first, tasks, first_owned)
+            second["b"]["status"] = runner.STATUS_DONE
+            runner.sync_shared_state(state_file, second, tasks, second_owned)
+
+            merged = json.loads(state_file.read_text(encoding="utf-8"))
+            self.assertEqual(merged["a"]["status"], runner.STATUS_DONE)
+            self.assertEqual(merged["b"]["status"], runner.STATUS_DONE)
+            self.assertEqual(merged["a"]["worker"], "w1")
+
+    def test_dead_worker_claims_are_released(self):
+        tasks = self._tasks()
+        entry = dict(_pending_entry("codex"), status=runner.STATUS_IN_PROGRESS, worker="w1", worker_pid=999999)
+        with mock.patch.object(runner, "_pid_is_running", return_value=False):
+            normalized = runner._normalize_state_entry(entry, tasks[0], keep_live_claims=True)
+        self.assertEqual(normalized["status"], runner.STATUS_PENDING)
+
+    def test_other_workers_active_tracks_foreign_lanes_and_claims(self):
+        tasks = self._tasks()
+        state = {task.id: _pending_entry(task.owner) for task in tasks}
+        self.assertTrue(runner.other_workers_active(tasks, state, {"c"}, "gemini"))
+        state["a"]["status"] = runner.STATUS_DONE
+        state["b"]["status"] = runner.STATUS_DONE
+        self.assertFalse(runner.other_workers_active(tasks, state, {"c"}, "gemini"))
+        state["b"].update(status=runner.STATUS_IN_PROGRESS, worker="codex")
+        self.assertTrue(runner.other_workers_active(tasks, state, {"c"}, "gemini"))
+
+    def test_queue_stats_counts_statuses_for_control_socket(self):
+        tasks = self._tasks()
+        state = {task.id: _pending_entry(task.owner) for task in tasks}
+        state["b"]["status"] = runner.STATUS_BLOCKED
+        stats = runner.queue_stats(state)
+        self.assertEqual(stats["counts"][runner.STATUS_PENDING], 2)
+        self.assertEqual(stats["total"], 3)
+        self.assertEqual(stats["blocked"], ["b"])
+
+    def test_state_file_mutex_breaks_lock_of_dead_holder(self):
+        with tempfile.TemporaryDirectory() as td:
+            lock_path = pathlib.Path(td) / "state.json.lock"
+            lock_path.write_text("999999\n", encoding="utf-8")
+            with mock.patch.object(runner, "_pid_is_running", return_value=False):
+                with runner.StateFileMutex(lock_path, poll_sec=0.01):
+                    self.assertEqual(lock_path.read_text(encoding="utf-8").strip(), str(os.getpid()))
+            self.assertFalse(lock_path.exists())
+
+
+class BatchingTests(unittest.TestCase):
+    def _tasks(self):
+        return [
+            runner.Task("a", "codex", 1, "Read config", "List stale keys", [], ["status reported"]),
+            runner.Task("b", "codex", 2, "Check docs", "Verify links", [], []),
+            runner.Task("c", "codex", 3, "Refactor scheduler", "Implement new policy", [], []),
+            runner.Task("d", "gemini", 4, "Read logs", "Count warnings", [], []),
+            runner.Task("e", "codex", 5, "Grep for todo", "Search markers", [], []),
+        ]
+
+    def test_select_task_batch_disabled_returns_single_task(self):
+        tasks = self._tasks()
+        state = {task.id: _pending_entry(task.owner) for task in tasks}
+        batch = runner.select_task_batch(tasks, state, max_batch_size=1)
+        self.assertEqual([task.id for task in batch], ["a"])
+
+    def test_select_task_batch_groups_low_complexity_same_owner(self):
+        tasks = self._tasks()
+        state = {task.id: _pending_entry(task.owner) for task in tasks}
+        batch = runner.select_task_batch(tasks, state, max_batch_size=3)
+        # "c" is not LOW complexity and "d" belongs to another owner.
+        self.assertEqual([task.id for task in batch], ["a", "b", "e"])
+
+    def test_select_task_batch_keeps_complex_lead_alone(self):
+        tasks = self._tasks()
+        state = {task.id: _pending_entry(task.owner) for task in tasks}
+        state["a"]["status"] = runner.STATUS_DONE
+        state["b"]["status"] = runner.STATUS_DONE
+        batch = runner.select_task_batch(tasks, state, max_batch_size=5)
+        self.assertEqual([task.id for task in batch], ["c"])
+
+    def test_build_batch_result_schema_wraps_task_schema(self):
+        single = {
+            "title": "CodexAutonomyResult",
+            "type": "object",
+            "required": ["status", "summary", "usage"],
+            "properties": {"status": {"type": "string"}, "summary": {"type": "string"}, "usage": {"type": "object"}},
+            "additionalProperties": False,
+        }
+        schema = runner.build_batch_result_schema(single)
+        item = schema["properties"]["tasks"]["items"]
+        self.assertEqual(schema["required"], ["tasks", "usage"])
+        self.assertEqual(item["required"], ["task_id", "status", "summary"])
+        self.assertNotIn("usage", item["properties"])
+        self.assertIn("task_id", item["properties"])
+        self.assertEqual(schema["properties"]["usage"], {"type": "object"})
+
+    def test_split_batch_outcome_maps_results_and_usage_once(self):
+        tasks = self._tasks()[:2]
+        raw = {
+            "tasks": [
+                {"task_id": "b", "status": "done", "summary": "b ok", "commit": "abc"},
+                {"task_id": "a", "status": "blocked", "summary": "a stuck", "blocker": "timeout"},
+            ],
+            "usage": {"total_tokens": 90},
+        }
+        outcomes = runner.split_batch_outcome(tasks, raw)
+        self.assertEqual(outcomes["a"]["status"], runner.STATUS_BLOCKED)
+        self.assertEqual(outcomes["b"]["status"], runner.STATUS_DONE)
+        self.assertEqual(outcomes["b"]["commit"], "abc")
+        self.assertEqual(runner.extract_usage_metrics(outcomes["a"])[0], 90)
+        self.assertEqual(runner.extract_usage_metrics(outcomes["b"])[0], 0)
+
+    def test_split_batch_outcome_missing_entry_is_partial(self):
+        tasks = self._tasks()[:2]
+        outcomes = runner.split_batch_outcome(tasks, {"tasks": [{"task_id": "a", "status": "done"}]})
+        self.assertEqual(outcomes["b"]["status"], runner.STATUS_PARTIAL)
+        self.assertIn("task_id=b", outcomes["b"]["blocker"])
+
+    def test_main_runs_batch_once_and_updates_each_task(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = pathlib.Path(tmp)
+            impl_repo = root / "impl"
+            config_dir = root / "config"
+            artifacts_dir = root / "artifacts"
+            for path in (impl_repo, config_dir, artifacts_dir):
+                path.mkdir()
+            tasks = [
+                {"id": "a", "owner": "codex", "priority": 1, "title": "Read config", "description": "List keys"},
+                {"id": "b", "owner": "codex", "priority": 2, "title": "Check docs", "description": "Verify links"},
+            ]
+            (config_dir / "tasks.json").write_text(json.dumps(tasks), encoding="utf-8")
+            (config_dir / "objective.md").write_text("objective", encoding="utf-8")
+            (config_dir / "codex_result.schema.json").write_text("{}", encoding="utf-8")
+            state_file = root / "state.json"
+            argv = [
+                "--impl-repo", str(impl_repo),
+                "--test-repo", str(root / "test"),
+                "--tasks-file", str(config_dir / "tasks.json"),
+                "--state-file", str(state_file),
+                "--objective-file", str(config_dir / "objective.md"),
+                "--codex-schema", str(config_dir / "codex_result.schema.json"),
+                "--artifacts-dir", str(artifacts_dir),
+                "--heartbeat-file", str(artifacts_dir / "heartbeat.json"),
+                "--lock-file", str(artifacts_dir / "runner.lock"),
+                "--checkpoint-dir", str(root / "checkpoints"),
+                "--skill-protocol-file", "",
+                "--max-cycles", "1",
+                "--batch-max-tasks", "4",
+            ]
+            outcomes = {
+                "a": runner.normalize_outcome({"status": "partial", "summary": "half"}),
+                "b": runner.normalize_outcome({"status": "blocked", "summary": "no", "blocker": "bad input"}),
+            }
+            with mock.patch.object(runner, "ensure_cli_exists"), mock.patch.object(
+                runner, "run_codex_batch", return_value=(True, outcomes)
+            ) as batch_run, mock.patch.object(runner, "run_codex_task") as single_run:
+                rc = runner.main(argv)
+
+            self.assertEqual(rc, 3)
+            batch_run.assert_called_once()
+            single_run.assert_not_called()
+            self.assertEqual([task.id for task in batch_run.call_args.kwargs["tasks"]], ["a", "b"])
+            state = json.loads(state_file.read_text(encoding="utf-8"))
+            self.assertEqual(state["a"]["status"], runner.STATUS_PENDING)
+            self.assertEqual(state["a"]["last_summary"], "half")
+            self.assertEqual(state["b"]["status"], runner.STATUS_PENDING)
+            self.assertEqual(state["b"]["last_error"], "bad input")
+            self.assertEqual(state["a"]["attempts"], 1)
+            self.assertEqual(state["b"]["attempts"], 1)
+
+    def test_main_releases_worktree_lease_when_task_raises(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = pathlib.Path(tmp)
+            impl_repo = root / "impl"
+            config_dir = root / "config"
+            artifacts_dir = root / "artifacts"
+            for path in (impl_repo, config_dir, artifacts_dir):
+                path.mkdir()
+            tasks = [{"id": "a", "owner": "codex", "priority": 1, "title": "Read config", "description": "List keys"}]
+            (config_dir / "tasks.json").write_text(json.dumps(tasks), encoding="utf-8")
+            (config_dir / "objective.md").write_text("objective", encoding="utf-8")
+            (config_dir / "codex_result.schema.json").write_text("{}", encoding="utf-8")
+            argv = [
+                "--impl-repo", str(impl_repo),
+                "--test-repo", str(root / "test"),
+                "--tasks-file", str(config_dir / "tasks.json"),
+                "--state-file", str(root / "state.json"),
+                "--objective-file", str(config_dir / "objective.md"),
+                "--codex-schema", str(config_dir / "codex_result.schema.json"),
+                "--artifacts-dir", str(artifacts_dir),
+                "--heartbeat-file", str(artifacts_dir / "heartbeat.json"),
+                "--lock-file", str(artifacts_dir / "runner.lock"),
+                "--checkpoint-dir", str(root / "checkpoints"),
+                "--skill-protocol-file", "",
+                "--max-cycles", "1",
+                "--worktree-pool-size", "1",
+            ]
+            pool = mock.Mock()
+            lease = mock.Mock(path=impl_repo)
+            pool.acquire.return_value = lease
+            with mock.patch.object(runner, "ensure_cli_exists"), mock.patch.object(
+                runner, "resolve_git_dir", return_value=impl_repo / ".git"
+            ), mock.patch.object(runner, "WorktreePool", return_value=pool), mock.patch.object(
+                runner, "run_codex_task", side_effect=RuntimeError("agent crashed")
+            ):
+                with self.assertRaises(RuntimeError):
+                    runner.main(argv)
+            pool.release.assert_called_once_with(lease)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,72 @@
+import os
+import pathlib
+import sys
+import tempfile
+import unittest
+
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from orxaq_autonomy import control_socket
+
+
+@unittest.skipUnless(control_socket.CONTROL_SOCKET_SUPPORTED, "AF_UNIX not available")
+class ControlSocketTests(unittest.TestCase):
+    def setUp(self):
+        # Keep socket paths short; AF_UNIX paths are length-limited.
+        self._tmp = tempfile.TemporaryDirectory(dir="/tmp")
+        self.path = pathlib.Path(self._tmp.name) / "ctl.sock"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_query_returns_handler_data(self):
+        calls = []
+
+        def _status(request):
+            calls.append(request)
+            return {"phase": "running", "queue": {"total": 3}}
+
+        server = control_socket.ControlServer(self.path, {"status": _status})
+        self.assertTrue(server.start())
+        try:
+            data = control_socket.query_control_socket(self.path, "status", verbose=True)
+            self.assertEqual(data, {"phase": "running", "queue": {"total": 3}})
+            self.assertEqual(calls[0]["verbose"], True)
+            self.assertEqual(control_socket.query_control_socket(self.path, "ping"), {"pid": os.getpid()})
+            self.assertEqual(self.path.stat().st_mode & 0o777, 0o600)
+        finally:
+            server.close()
+        self.assertFalse(self.path.exists())
+
+    def test_query_returns_none_for_unknown_command_or_failing_handler(self):
+        def _boom(_request):
+            raise RuntimeError("boom")
+
+        server = control_socket.ControlServer(self.path, {"status": _boom})
+        server.start()
+        try:
+            self.assertIsNone(control_socket.query_control_socket(self.path, "status"))
+            self.assertIsNone(control_socket.query_control_socket(self.path, "missing"))
+        finally:
+            server.close()
+
+    def test_query_returns_none_without_server(self):
+        self.assertIsNone(control_socket.query_control_socket(self.path))
+        self.path.write_text("", encoding="utf-8")
+        self.assertIsNone(control_socket.query_control_socket(self.path))
+
+    def test_start_replaces_stale_socket_file_and_rejects_long_paths(self):
+        self.path.write_text("stale", encoding="utf-8")
+        server = control_socket.ControlServer(self.path, {})
+        self.assertTrue(server.start())
+        server.close()
+        long_path = pathlib.Path(self._tmp.name) / ("x" * 120) / "ctl.sock"
+        self.assertFalse(control_socket.ControlServer(long_path, {}).start())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+import gzip
 import json
 import os
 import pathlib
@@ -6,6 +7,9 @@ import tempfile
 import threading
 import time
 import unittest
+import zlib
+from unittest import mock
+from http import client as http_client
 from http.server import ThreadingHTTPServer
 from urllib import error as urllib_error
 from urllib import request as urllib_request
@@ -17,6 +21,8 @@ if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
 from orxaq_autonomy import dashboard
+from orxaq_autonomy.artifact_index import ArtifactIndexer
+from orxaq_autonomy.dashboard_stream import DashboardEventHub
 
 
 class DashboardTests(unittest.TestCase):
@@ -226,6 +232,370 @@ class DashboardTests(unittest.TestCase):
                 thread.join(timeout=2)
 
 
+    def test_api_status_uses_status_provider(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = pathlib.Path(td) / "artifacts"
+            root.mkdir(parents=True, exist_ok=True)
+
+            handler = dashboard.make_dashboard_handler(root, lambda: {"source": "socket", "runner_running": True})
+            server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            try:
+                base = f"http://127.0.0.1:{server.server_port}"
+                with urllib_request.urlopen(f"{base}/api/status", timeout=5) as resp:
+                    payload = json.loads(resp.read().decode("utf-8"))
+                self.assertEqual(payload, {"runner_running": True, "source": "socket"})
+            finally:
+                server.shutdown()
+                server.server_close()
+                thread.join(timeout=2)
+
+    def test_index_routes_served_from_shared_indexer(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = pathlib.Path(td) / "artifacts"
+            root.mkdir(parents=True, exist_ok=True)
+            self._write_fixture_artifacts(root)
+            indexer = ArtifactIndexer(root, use_inotify=False)
+            indexer.start()
+
+            handler = dashboard.make_dashboard_handler(root, indexer=indexer)
+            server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            try:
+                base = f"http://127.0.0.1:{server.server_port}"
+                with mock.patch("orxaq_autonomy.artifact_index._walk") as walk:
+                    for _ in range(3):
+                        with urllib_request.urlopen(f"{base}/api/index", timeout=5) as resp:
+                            payload = json.loads(resp.read().decode("utf-8"))
+                    walk.assert_not_called()
+                self.assertEqual(payload["generation"], 1)
+                self.assertIn("W12_A_run.json", payload["run_reports"])
+            finally:
+                server.shutdown()
+                server.server_close()
+                thread.join(timeout=2)
+                indexer.close()
+
+    def test_log_viewer_serves_indexed_line_window(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = pathlib.Path(td) / "artifacts"
+            root.mkdir(parents=True, exist_ok=True)
+            (root / "runner.log").write_text("".join(f"entry-{i}\n" for i in range(600)), encoding="utf-8")
+
+            handler = dashboard.make_dashboard_handler(root)
+            server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            try:
+                base = f"http://127.0.0.1:{server.server_port}"
+                with urllib_request.urlopen(f"{base}/file/runner.log?tail=2", timeout=5) as resp:
+                    body = resp.read().decode("utf-8")
+                self.assertIn("<pre>entry-598\nentry-599</pre>", body)
+
+                with urllib_request.urlopen(f"{base}/file/runner.log?line=300&count=2", timeout=5) as resp:
+                    body = resp.read().decode("utf-8")
+                self.assertIn("<pre>entry-300\nentry-301</pre>", body)
+
+                with self.assertRaises(urllib_error.HTTPError) as ctx:
+                    urllib_request.urlopen(f"{base}/file/runner.log?line=abc", timeout=5)
+                self.assertEqual(ctx.exception.code, 400)
+                ctx.exception.close()
+                # The read-only viewer keeps its index in memory.
+                self.assertFalse((root / "runner.log.idx").exists())
+            finally:
+                server.shutdown()
+                server.server_close()
+                thread.join(timeout=2)
+
+    def test_slow_log_index_scan_does_not_block_other_logs(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = pathlib.Path(td) / "artifacts"
+            root.mkdir(parents=True, exist_ok=True)
+            (root / "big.log").write_text("big\n", encoding="utf-8")
+            (root / "small.log").write_text("small\n", encoding="utf-8")
+            scanning, release = threading.Event(), threading.Event()
+            original_refresh = dashboard.LogIndex.refresh
+
+            def refresh(index):
+                if index.log_path.name == "big.log":
+                    scanning.set()
+                    release.wait(5)
+                return original_refresh(index)
+
+            handler = dashboard.make_dashboard_handler(root)
+            server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            base = f"http://127.0.0.1:{server.server_port}"
+            slow = threading.Thread(
+                target=lambda: urllib_request.urlopen(f"{base}/file/big.log?tail=1", timeout=10).close()
+            )
+            try:
+                with mock.patch.object(dashboard.LogIndex, "refresh", refresh):
+                    slow.start()
+                    self.assertTrue(scanning.wait(5))
+                    with urllib_request.urlopen(f"{base}/file/small.log?tail=1", timeout=2) as resp:
+                        self.assertIn("<pre>small</pre>", resp.read().decode("utf-8"))
+                    release.set()
+                    slow.join(timeout=5)
+            finally:
+                release.set()
+                server.shutdown()
+                server.server_close()
+                thread.join(timeout=2)
+
+    def test_event_stream_pushes_new_artifacts(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = pathlib.Path(td) / "artifacts"
+            root.mkdir(parents=True, exist_ok=True)
+            indexer = ArtifactIndexer(root, refresh_sec=0.1, use_inotify=False)
+            hub = DashboardEventHub(indexer, poll_sec=0.1)
+
+            handler = dashboard.make_dashboard_handler(root, indexer=indexer, event_hub=hub)
+            server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            try:
+                base = f"http://127.0.0.1:{server.server_port}"
+                with urllib_request.urlopen(f"{base}/api/stream", timeout=5) as resp:
+                    self.assertEqual(resp.headers["Content-Type"], "text/event-stream; charset=utf-8")
+                    self.assertEqual(resp.readline(), b"retry: 3000\n")
+                    resp.readline()
+                    self.assertEqual(resp.readline(), b"id: 0\n")
+                    self.assertEqual(resp.readline(), b"event: hello\n")
+                    resp.readline()
+                    resp.readline()
+                    self.assertEqual(hub.subscriber_count, 1)
+
+                    (root / "W3_run.json").write_text("{}\n", encoding="utf-8")
+                    self.assertEqual(resp.readline(), b"id: 1\n")
+                    self.assertEqual(resp.readline(), b"event: artifacts\n")
+                    data = json.loads(resp.readline().decode("utf-8")[len("data: ") :])
+                    self.assertEqual(data["added"], {"run_reports": ["W3_run.json"]})
+                    hub.close()
+                    self.assertEqual(resp.read(), b"\n")
+            finally:
+                hub.close()
+                server.shutdown()
+                server.server_close()
+                thread.join(timeout=2)
+                indexer.close()
+
+    def test_conditional_get_and_compression(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = pathlib.Path(td) / "artifacts"
+            root.mkdir(parents=True, exist_ok=True)
+            self._write_fixture_artifacts(root)
+            evidence = root / "rpa_evidence" / "run-1" / "task-1" / "shot.png"
+            evidence.write_bytes(b"\x89PNG" + b"\x00" * 2048)
+            for block in range(20):
+                (root / f"W{block}_run.json").write_text("{}\n", encoding="utf-8")
+            indexer = ArtifactIndexer(root, use_inotify=False)
+            indexer.start()
+
+            handler = dashboard.make_dashboard_handler(root, indexer=indexer)
+            server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            conn = http_client.HTTPConnection("127.0.0.1", server.server_port, timeout=5)
+
+            def get(path, **headers):
+                conn.request("GET", path, headers=headers)
+                resp = conn.getresponse()
+                return resp, resp.read()
+
+            try:
+                resp, body = get("/", **{"Accept-Encoding": "br;q=1, gzip;q=0.8"})
+                self.assertEqual(resp.status, 200)
+                self.assertEqual(resp.getheader("Content-Encoding"), "gzip")
+                self.assertEqual(resp.getheader("Vary"), "Accept-Encoding")
+                self.assertIn(b"Orxaq Autonomy Dashboard", gzip.decompress(body))
+                etag = resp.getheader("ETag")
+                self.assertTrue(etag.startswith(f'W/"index-{dashboard._ETAG_NONCE}-1-'))
+
+                resp, body = get("/", **{"If-None-Match": etag})
+                self.assertEqual((resp.status, body), (304, b""))
+                self.assertEqual(resp.getheader("ETag"), etag)
+
+                # A restarted dashboard also starts at generation 1 but must not match.
+                with mock.patch.object(dashboard, "_ETAG_NONCE", "restarted"):
+                    resp, body = get("/", **{"If-None-Match": etag})
+                self.assertEqual(resp.status, 200)
+
+                resp, body = get("/api/index", **{"Accept-Encoding": "gzip;q=0, deflate"})
+                self.assertEqual(resp.getheader("Content-Encoding"), "deflate")
+                self.assertIn("run_reports", json.loads(zlib.decompress(body)))
+
+                (root / "W99_run.json").write_text("{}\n", encoding="utf-8")
+                indexer.refresh()
+                resp, _ = get("/api/index", **{"If-None-Match": etag})
+                self.assertEqual(resp.status, 200)
+                self.assertNotEqual(resp.getheader("ETag"), etag)
+
+                resp, body = get("/file/rpa_evidence/run-1/task-1/shot.png", **{"Accept-Encoding": "gzip"})
+                self.assertEqual(resp.status, 200)
+                self.assertIsNone(resp.getheader("Content-Encoding"))
+                self.assertEqual(len(body), 2052)
+                self.assertIn("immutable", resp.getheader("Cache-Control"))
+                file_etag = resp.getheader("ETag")
+                last_modified = resp.getheader("Last-Modified")
+
+                resp, body = get("/file/rpa_evidence/run-1/task-1/shot.png", **{"If-Modified-Since": last_modified})
+                self.assertEqual((resp.status, body), (304, b""))
+                resp, _ = get("/file/rpa_evidence/run-1/task-1/shot.png", **{"If-None-Match": f'"x", {file_etag}'})
+                self.assertEqual(resp.status, 304)
+
+                resp, _ = get("/file/health.md")
+                self.assertEqual(resp.getheader("Cache-Control"), "no-cache")
+                resp, _ = get("/file/health.md", **{"If-None-Match": resp.getheader("ETag")})
+                self.assertEqual(resp.status, 304)
+            finally:
+                conn.close()
+                server.shutdown()
+                server.server_close()
+                thread.join(timeout=2)
+                indexer.close()
+
+    def test_file_ranges_and_paginated_viewer(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = pathlib.Path(td) / "artifacts"
+            root.mkdir(parents=True, exist_ok=True)
+            blob = bytes(range(256)) * 64
+            (root / "trace.bin").write_bytes(blob)
+            (root / "big.log").write_text("".join(f"entry-{i:06d}\n" for i in range(30000)), encoding="utf-8")
+
+            handler = dashboard.make_dashboard_handler(root)
+            server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            conn = http_client.HTTPConnection("127.0.0.1", server.server_port, timeout=5)
+
+            def get(path, **headers):
+                conn.request("GET", path, headers=headers)
+                resp = conn.getresponse()
+                return resp, resp.read()
+
+            try:
+                resp, body = get("/file/trace.bin")
+                self.assertEqual((resp.status, body), (200, blob))
+                self.assertEqual(resp.getheader("Accept-Ranges"), "bytes")
+                etag = resp.getheader("ETag")
+
+                resp, body = get("/file/trace.bin", Range="bytes=100-199")
+                self.assertEqual((resp.status, body), (206, blob[100:200]))
+                self.assertEqual(resp.getheader("Content-Range"), f"bytes 100-199/{len(blob)}")
+
+                resp, body = get("/file/trace.bin", Range="bytes=-10", **{"If-Range": etag})
+                self.assertEqual((resp.status, body), (206, blob[-10:]))
+                resp, body = get("/file/trace.bin", Range="bytes=-10", **{"If-Range": '"stale"'})
+                self.assertEqual((resp.status, len(body)), (200, len(blob)))
+                resp, body = get("/file/trace.bin", Range="bytes=0-1,5-6")
+                self.assertEqual(resp.status, 200)
+
+                resp, _ = get("/file/trace.bin", Range=f"bytes={len(blob)}-")
+                self.assertEqual(resp.status, 416)
+                self.assertEqual(resp.getheader("Content-Range"), f"bytes */{len(blob)}")
+
+                resp, body = get("/file/big.log?raw=1", Range="bytes=0-12")
+                self.assertEqual((resp.status, body), (206, b"entry-000000\n"))
+                self.assertEqual(resp.getheader("Content-Type"), "text/plain; charset=utf-8")
+
+                resp, body = get("/file/big.log")
+                page = body.decode("utf-8")
+                self.assertIn("entry-029999", page)
+                self.assertNotIn("entry-000000", page)
+                self.assertLess(len(body), dashboard.VIEWER_PAGE_BYTES + 4096)
+                self.assertIn("rel='prev'", page)
+                self.assertNotIn("rel='next'", page)
+
+                resp, body = get("/file/big.log?offset=0")
+                page = body.decode("utf-8")
+                self.assertIn("<pre>entry-000000\n", page)
+                self.assertIn("rel='next'", page)
+                self.assertNotIn("rel='prev'", page)
+
+                resp, _ = get("/file/big.log?offset=abc")
+                self.assertEqual(resp.status, 400)
+            finally:
+                conn.close()
+                server.shutdown()
+                server.server_close()
+                thread.join(timeout=2)
+
+    def test_dashboard_html_subscribes_to_event_stream(self):
+        html_text = dashboard.render_dashboard_html({})
+        self.assertIn('id="live-status"', html_text)
+        self.assertIn('aria-live="polite"', html_text)
+        self.assertIn("new EventSource('/api/stream')", html_text)
+
+    def test_render_dashboard_html_rerenders_only_changed_sections(self):
+        payload = {"run_reports": ["W1_run.json"], "lane_status": [{"lane": "lane-a", "status": "ok"}]}
+        with mock.patch.object(
+            dashboard, "_render_file_links", wraps=dashboard._render_file_links
+        ) as links, mock.patch.object(
+            dashboard, "render_lane_status_section", wraps=dashboard.render_lane_status_section
+        ) as lanes:
+            first = dashboard.render_dashboard_html(payload)
+            self.assertEqual((links.call_count, lanes.call_count), (7, 1))
+            self.assertEqual(dashboard.render_dashboard_html(payload), first)
+            self.assertEqual((links.call_count, lanes.call_count), (7, 1))
+
+            payload["run_reports"] = ["W1_run.json", "W2_run.json"]
+            html_text = dashboard.render_dashboard_html(payload)
+            self.assertEqual((links.call_count, lanes.call_count), (8, 1))
+            self.assertIn("W2_run.json", html_text)
+
+    def test_page_render_shared_within_index_generation(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = pathlib.Path(td) / "artifacts"
+            root.mkdir(parents=True, exist_ok=True)
+            self._write_fixture_artifacts(root)
+            for index in range(20):
+                (root / f"W{index}_run.json").write_text("{}\n", encoding="utf-8")
+            indexer = ArtifactIndexer(root, use_inotify=False)
+            indexer.start()
+            handler = dashboard.make_dashboard_handler(root, indexer=indexer)
+            server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+
+            def fetch(encoding: str) -> bytes:
+                conn = http_client.HTTPConnection("127.0.0.1", server.server_port, timeout=5)
+                try:
+                    conn.request("GET", "/", headers={"Accept-Encoding": encoding})
+                    resp = conn.getresponse()
+                    self.assertEqual(resp.status, 200)
+                    body = resp.read()
+                    return gzip.decompress(body) if resp.getheader("Content-Encoding") == "gzip" else body
+                finally:
+                    conn.close()
+
+            try:
+                with mock.patch.object(
+                    dashboard, "render_dashboard_html", wraps=dashboard.render_dashboard_html
+                ) as render, mock.patch.object(dashboard, "_compress", wraps=dashboard._compress) as compress:
+                    plain = fetch("identity")
+                    self.assertEqual(fetch("gzip"), plain)
+                    self.assertEqual(fetch("gzip"), plain)
+                    self.assertEqual((render.call_count, compress.call_count), (1, 1))
+
+                    (root / "W99_run.json").write_text("{}\n", encoding="utf-8")
+                    self.assertTrue(indexer.refresh())
+                    self.assertIn(b"W99_run.json", fetch("identity"))
+                    self.assertEqual(render.call_count, 2)
+
+                    with mock.patch.object(dashboard, "PAGE_CACHE_TTL_SEC", 0):
+                        fetch("identity")
+                    self.assertEqual(render.call_count, 3)
+            finally:
+                server.shutdown()
+                server.server_close()
+                thread.join(timeout=2)
+                indexer.close()
+
+
 class DistributedTodoAggregationTests(unittest.TestCase):
     """Tests for distributed todo aggregation (Issue #17)."""
 
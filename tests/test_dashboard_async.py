@@ -0,0 +1,147 @@
+import asyncio
+import json
+import os
+import pathlib
+import socket
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from http import client as http_client
+from unittest import mock
+
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from orxaq_autonomy import dashboard
+from orxaq_autonomy.artifact_index import ArtifactIndexer
+from orxaq_autonomy.dashboard_async import AsyncDashboardServer
+from orxaq_autonomy.dashboard_stream import DashboardEventHub
+
+
+class AsyncDashboardServerTests(unittest.TestCase):
+    def setUp(self):
+        self._td = tempfile.TemporaryDirectory()
+        self.root = pathlib.Path(self._td.name) / "artifacts"
+        self.root.mkdir(parents=True)
+        (self.root / "health.json").write_text('{"ok": true}\n', encoding="utf-8")
+        self.blob = bytes(range(256)) * 512
+        (self.root / "trace.bin").write_bytes(self.blob)
+        self.indexer = ArtifactIndexer(self.root, refresh_sec=0.1, use_inotify=False)
+        self.hub = DashboardEventHub(self.indexer, poll_sec=0.1)
+        handler = dashboard.make_dashboard_handler(self.root, indexer=self.indexer, event_hub=self.hub)
+        self.server = AsyncDashboardServer(("127.0.0.1", 0), handler, max_connections=3, workers=2)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.hub.close()
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join(timeout=5)
+        self.indexer.close()
+        self._td.cleanup()
+
+    def _conn(self):
+        return http_client.HTTPConnection("127.0.0.1", self.server.server_port, timeout=5)
+
+    def test_keep_alive_reuses_one_connection(self):
+        conn = self._conn()
+        try:
+            conn.request("GET", "/api/index")
+            resp = conn.getresponse()
+            payload = json.loads(resp.read())
+            self.assertEqual(resp.version, 11)
+            self.assertEqual(payload["health_json"], ["health.json"])
+            sock = conn.sock
+
+            conn.request("GET", "/", headers={"If-None-Match": resp.getheader("ETag")})
+            resp = conn.getresponse()
+            self.assertEqual((resp.status, resp.read()), (304, b""))
+
+            conn.request("GET", "/file/missing.json")
+            resp = conn.getresponse()
+            self.assertEqual(resp.status, 404)
+            resp.read()
+            self.assertIs(conn.sock, sock)
+        finally:
+            conn.close()
+
+    def test_files_stream_through_the_event_loop(self):
+        conn = self._conn()
+        try:
+            conn.request("GET", "/file/trace.bin")
+            resp = conn.getresponse()
+            self.assertEqual(resp.read(), self.blob)
+
+            conn.request("GET", "/file/trace.bin", headers={"Range": "bytes=1000-1999"})
+            resp = conn.getresponse()
+            self.assertEqual((resp.status, resp.read()), (206, self.blob[1000:2000]))
+        finally:
+            conn.close()
+
+    @unittest.skipUnless(os.path.isdir("/proc/self/fd"), "needs /proc/self/fd")
+    def test_deferred_file_descriptor_is_closed_when_drain_fails(self):
+        def open_fds():
+            return len(os.listdir("/proc/self/fd"))
+
+        conn = self._conn()
+        conn.request("GET", "/file/trace.bin")
+        conn.getresponse().read()
+        conn.close()
+        baseline = open_fds()
+        with mock.patch.object(asyncio.StreamWriter, "drain", side_effect=ConnectionResetError):
+            for _ in range(5):
+                with socket.create_connection(("127.0.0.1", self.server.server_port), timeout=5) as sock:
+                    sock.sendall(b"GET /file/trace.bin HTTP/1.1\r\nHost: dashboard\r\n\r\n")
+                    while sock.recv(65536):
+                        pass
+            deadline = time.monotonic() + 5
+            while self.server.active_connections and time.monotonic() < deadline:
+                time.sleep(0.01)
+        self.assertLessEqual(open_fds(), baseline)
+
+    def test_event_stream_is_served_on_the_loop(self):
+        with socket.create_connection(("127.0.0.1", self.server.server_port), timeout=5) as sock:
+            sock.sendall(b"GET /api/stream HTTP/1.1\r\nHost: dashboard\r\n\r\n")
+            stream = sock.makefile("rb")
+            self.assertEqual(stream.readline(), b"HTTP/1.1 200 OK\r\n")
+            while stream.readline() != b"\r\n":
+                pass
+            self.assertEqual(stream.readline(), b"retry: 3000\n")
+            stream.readline()
+            self.assertEqual(stream.readline(), b"id: 0\n")
+            self.assertEqual(stream.readline(), b"event: hello\n")
+
+            (self.root / "W5_run.json").write_text("{}\n", encoding="utf-8")
+            lines = []
+            while b"event: artifacts\n" not in lines:
+                lines.append(stream.readline())
+            data = json.loads(stream.readline()[len(b"data: ") :])
+            self.assertEqual(data["added"], {"run_reports": ["W5_run.json"]})
+            self.assertEqual(self.hub.subscriber_count, 1)
+            stream.close()
+
+    def test_connection_limit_returns_503(self):
+        held = [socket.create_connection(("127.0.0.1", self.server.server_port), timeout=5) for _ in range(3)]
+        try:
+            deadline = time.monotonic() + 5
+            while self.server.active_connections < 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            conn = self._conn()
+            conn.request("GET", "/api/index")
+            resp = conn.getresponse()
+            self.assertEqual(resp.status, 503)
+            self.assertEqual(resp.getheader("Retry-After"), "1")
+            conn.close()
+        finally:
+            for sock in held:
+                sock.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+import json
+import pathlib
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import ThreadingHTTPServer
+from unittest import mock
+from urllib import request as urllib_request
+
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from orxaq_autonomy import dashboard
+from orxaq_autonomy.dashboard_metrics import DashboardMetrics, LatencyHistogram
+from orxaq_autonomy.dashboard_stream import DashboardEventHub
+
+
+def _samples(text: str) -> dict[str, float]:
+    return {
+        line.rsplit(" ", 1)[0]: float(line.rsplit(" ", 1)[1])
+        for line in text.splitlines()
+        if line and not line.startswith("#")
+    }
+
+
+class DashboardMetricsTests(unittest.TestCase):
+    def setUp(self):
+        self._td = tempfile.TemporaryDirectory()
+        self.root = pathlib.Path(self._td.name)
+        self.state_file = self.root / "state.json"
+        self.state_file.write_text(
+            json.dumps(
+                {
+                    "a": {"status": "done", "attempts": 1},
+                    "b": {"status": "pending", "attempts": 3},
+                    "c": {"status": "done", "attempts": 2},
+                }
+            ),
+            encoding="utf-8",
+        )
+        self.budget_file = self.root / "budget.json"
+        self.budget_file.write_text(
+            json.dumps(
+                {
+                    "elapsed_sec": 120,
+                    "totals": {
+                        "tokens": 5000,
+                        "cost_usd": 0.25,
+                        "retry_events": 3,
+                        "validation_runs": 2,
+                        "validation_failures": 1,
+                        "validation_sec": 4.5,
+                    },
+                    "limits": {"max_total_tokens": 10000, "max_total_cost_usd": 1.0},
+                }
+            ),
+            encoding="utf-8",
+        )
+        self.routing_log = self.root / "swarm_routing_decisions.ndjson"
+        self.hub = DashboardEventHub(
+            status_provider=lambda: {"heartbeat_age_sec": 7, "runner_running": True},
+            state_file=self.state_file,
+            health_provider=lambda: {"grade": "healthy", "score": 92},
+        )
+        self.metrics = DashboardMetrics(self.hub, budget_file=self.budget_file, routing_log=self.routing_log)
+
+    def tearDown(self):
+        self.hub.close()
+        self._td.cleanup()
+
+    def test_render_exports_hub_budget_and_validation_state(self):
+        text = self.metrics.render()
+        samples = _samples(text)
+        self.assertIn("# TYPE orxaq_tasks gauge", text)
+        self.assertEqual(samples['orxaq_tasks{status="done"}'], 2)
+        self.assertEqual(samples['orxaq_tasks{status="pending"}'], 1)
+        self.assertEqual(samples["orxaq_task_retries"], 3)
+        self.assertEqual(samples["orxaq_heartbeat_age_seconds"], 7)
+        self.assertEqual(samples['orxaq_health_score{grade="healthy"}'], 92)
+        self.assertEqual(samples['orxaq_budget_used{resource="tokens"}'], 5000)
+        self.assertEqual(samples['orxaq_budget_limit{resource="cost_usd"}'], 1)
+        self.assertEqual(samples["orxaq_retry_events_total"], 3)
+        self.assertEqual(samples["orxaq_validation_duration_seconds_sum"], 4.5)
+        self.assertEqual(samples["orxaq_validation_duration_seconds_count"], 2)
+
+    def test_budget_report_reparsed_only_when_it_changes(self):
+        self.metrics.render()
+        with mock.patch("orxaq_autonomy.dashboard_metrics.json.loads", wraps=json.loads) as loads:
+            self.metrics.render()
+            loads.assert_not_called()
+        budget = json.loads(self.budget_file.read_text(encoding="utf-8"))
+        budget["totals"]["tokens"] = 6000
+        self.budget_file.write_text(json.dumps(budget) + "\n", encoding="utf-8")
+        self.assertEqual(_samples(self.metrics.render())['orxaq_budget_used{resource="tokens"}'], 6000)
+
+    def test_routing_log_is_read_incrementally(self):
+        decision = {"selected_tier": "local", "deferred": False}
+        with open(self.routing_log, "w", encoding="utf-8") as handle:
+            handle.write(json.dumps(decision) + "\n")
+            handle.write(json.dumps({"selected_tier": "cloud"}) + "\n")
+            handle.write('{"selected_tier": "lo')
+        samples = _samples(self.metrics.render())
+        self.assertEqual(samples['orxaq_routing_decisions_total{tier="local",deferred="false"}'], 1)
+        self.assertEqual(samples['orxaq_routing_decisions_total{tier="cloud",deferred="false"}'], 1)
+
+        with open(self.routing_log, "a", encoding="utf-8") as handle:
+            handle.write('cal", "deferred": true}\n')
+        samples = _samples(self.metrics.render())
+        self.assertEqual(samples['orxaq_routing_decisions_total{tier="local",deferred="true"}'], 1)
+        self.assertEqual(samples['orxaq_routing_decisions_total{tier="local",deferred="false"}'], 1)
+
+        self.routing_log.write_text(json.dumps(decision) + "\n", encoding="utf-8")
+        samples = _samples(self.metrics.render())
+        self.assertEqual(samples['orxaq_routing_decisions_total{tier="local",deferred="false"}'], 1)
+        self.assertNotIn('orxaq_routing_decisions_total{tier="cloud",deferred="false"}', samples)
+
+    def test_latency_histogram_buckets_are_cumulative(self):
+        histogram = LatencyHistogram(buckets=(0.1, 1.0))
+        histogram.observe("/", 0.05)
+        histogram.observe("/", 0.5)
+        histogram.observe("/", 3.0)
+        samples = _samples("\n".join(histogram.render("latency")))
+        self.assertEqual(samples['latency_bucket{route="/",le="0.1"}'], 1)
+        self.assertEqual(samples['latency_bucket{route="/",le="1"}'], 2)
+        self.assertEqual(samples['latency_bucket{route="/",le="+Inf"}'], 3)
+        self.assertEqual(samples['latency_count{route="/"}'], 3)
+        self.assertEqual(samples['latency_sum{route="/"}'], 3.55)
+
+    def test_metrics_endpoint_records_request_latency(self):
+        artifacts = self.root / "artifacts"
+        artifacts.mkdir()
+        handler = dashboard.make_dashboard_handler(artifacts, event_hub=self.hub, metrics=self.metrics)
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            base = f"http://127.0.0.1:{server.server_port}"
+            with urllib_request.urlopen(f"{base}/api/index", timeout=5) as resp:
+                resp.read()
+            with urllib_request.urlopen(f"{base}/metrics", timeout=5) as resp:
+                self.assertTrue(resp.headers["Content-Type"].startswith("text/plain; version=0.0.4"))
+                samples = _samples(resp.read().decode("utf-8"))
+            self.assertEqual(samples['orxaq_dashboard_request_duration_seconds_count{route="/api/index"}'], 1)
+            self.assertEqual(samples['orxaq_tasks{status="done"}'], 2)
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join(timeout=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
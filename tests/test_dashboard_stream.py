@@ -0,0 +1,130 @@
+import json
+import os
+import pathlib
+import sys
+import tempfile
+import time
+import unittest
+
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from orxaq_autonomy.artifact_index import ArtifactIndexer
+from orxaq_autonomy.dashboard_stream import DashboardEventHub, format_sse
+
+
+def _events(subscription) -> list[tuple[str, dict]]:
+    out = []
+    while not subscription.empty():
+        raw = subscription.get_nowait()
+        if raw is None:
+            out.append(("<closed>", {}))
+            continue
+        fields = dict(line.split(": ", 1) for line in raw.decode("utf-8").strip().splitlines())
+        out.append((fields["event"], json.loads(fields["data"])))
+    return out
+
+
+class FormatSseTests(unittest.TestCase):
+    def test_frames_single_line_json(self):
+        raw = format_sse(7, "task", {"b": 1, "a": "x\ny"})
+        self.assertEqual(raw, b'id: 7\nevent: task\ndata: {"a":"x\\ny","b":1}\n\n')
+
+
+class DashboardEventHubTests(unittest.TestCase):
+    def test_poll_once_publishes_changes_from_every_source(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = pathlib.Path(td)
+            artifacts = root / "artifacts"
+            artifacts.mkdir()
+            state_file = root / "state.json"
+            state_file.write_text(json.dumps({"t1": {"status": "pending"}}), encoding="utf-8")
+            status = {"heartbeat_age_sec": 40, "runner_running": True, "supervisor_running": True}
+            health = {"grade": "A", "score": 95}
+            indexer = ArtifactIndexer(artifacts, use_inotify=False)
+            indexer.refresh()
+            hub = DashboardEventHub(
+                indexer,
+                status_provider=lambda: dict(status),
+                state_file=state_file,
+                health_provider=lambda: dict(health),
+            )
+            self.assertEqual(hub.poll_once(), 0)
+            self.assertEqual(hub.poll_once(), 0)
+
+            (artifacts / "W1_run.json").write_text("{}\n", encoding="utf-8")
+            indexer.refresh()
+            status["heartbeat_age_sec"] = 2
+            state_file.write_text(
+                json.dumps({"t1": {"status": "done"}, "t2": {"status": "in_progress"}}), encoding="utf-8"
+            )
+            os.utime(state_file, (time.time() + 5, time.time() + 5))
+            health.update(grade="B", score=80)
+            self.assertEqual(hub.poll_once(), 4)
+
+            events = {}
+            for _, encoded in hub._history:
+                fields = dict(line.split(": ", 1) for line in encoded.decode("utf-8").strip().splitlines())
+                events[fields["event"]] = json.loads(fields["data"])
+            self.assertEqual(events["artifacts"]["added"], {"run_reports": ["W1_run.json"]})
+            self.assertEqual(events["heartbeat"]["heartbeat_age_sec"], 2)
+            self.assertEqual(
+                events["task"]["transitions"],
+                [{"task_id": "t1", "from": "pending", "to": "done"}, {"task_id": "t2", "from": "", "to": "in_progress"}],
+            )
+            self.assertEqual(events["health"], {"grade": "B", "score": 80, "previous_grade": "A"})
+
+            # An older heartbeat with unchanged flags is not news.
+            status["heartbeat_age_sec"] = 3
+            self.assertEqual(hub.poll_once(), 0)
+            status["runner_running"] = False
+            self.assertEqual(hub.poll_once(), 1)
+
+    def test_watcher_thread_streams_to_subscribers(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = pathlib.Path(td)
+            indexer = ArtifactIndexer(root, refresh_sec=0.1, use_inotify=False)
+            health = {"grade": "A", "score": 95}
+            hub = DashboardEventHub(indexer, health_provider=lambda: dict(health), poll_sec=0.1)
+            subscription = hub.subscribe()
+            try:
+                self.assertTrue(indexer.running)
+                hello = _events(subscription)
+                self.assertEqual(hello, [("hello", {"generation": 1, "heartbeat": None, "health": health, "subscribers": 1})])
+                (root / "health.md").write_text("# ok\n", encoding="utf-8")
+                deadline = time.monotonic() + 5
+                received = []
+                while time.monotonic() < deadline and not received:
+                    time.sleep(0.05)
+                    received = _events(subscription)
+                self.assertEqual(received[0][0], "artifacts")
+                self.assertEqual(received[0][1]["added"], {"health_md": ["health.md"]})
+            finally:
+                hub.close()
+                indexer.close()
+            self.assertEqual(_events(subscription), [("<closed>", {})])
+
+    def test_replay_after_last_event_id_and_bounded_queue(self):
+        hub = DashboardEventHub(subscriber_queue=3, poll_sec=60)
+        try:
+            first = hub.publish("task", {"n": 1})
+            hub.publish("task", {"n": 2})
+            resumed = hub.subscribe(last_event_id=first)
+            self.assertEqual([data.get("n") for _, data in _events(resumed)], [None, 2])
+
+            slow = hub.subscribe()
+            for n in range(3, 8):
+                hub.publish("task", {"n": n})
+            self.assertEqual([data["n"] for _, data in _events(slow)], [5, 6, 7])
+            self.assertEqual(hub.subscriber_count, 2)
+            hub.unsubscribe(slow)
+            self.assertEqual(hub.subscriber_count, 1)
+        finally:
+            hub.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
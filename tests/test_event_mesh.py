@@ -2,15 +2,19 @@ import json
 import pathlib
 import sys
 import tempfile
+import threading
 import unittest
+from unittest import mock
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
+from orxaq_autonomy import event_mesh
 from orxaq_autonomy.event_mesh import (
     EventBus,
+    EventHistory,
     EventType,
     GitHubLedger,
     LedgerEntry,
@@ -140,6 +144,152 @@ class TestEventBus(unittest.TestCase):
             timestamp="2026-01-01T00:00:00+00:00",
         ))
         self.assertEqual(len(calls), 1)
+        errors = {name.rsplit(".", 1)[-1]: counters["errors"] for name, counters in bus.stats().items()}
+        self.assertEqual(errors, {"bad_handler": 1, "good_handler": 0})
+
+
+def _heartbeat(index: int) -> MeshEvent:
+    return MeshEvent(
+        event_type=EventType.HEARTBEAT,
+        source_node=f"n{index}",
+        timestamp="2026-01-01T00:00:00+00:00",
+        payload={"index": index},
+    )
+
+
+class TestEventHistory(unittest.TestCase):
+    def _event(self, event_type, node, index):
+        return MeshEvent(event_type=event_type, source_node=node, timestamp="t", payload={"index": index})
+
+    def test_ring_evicts_oldest_and_keeps_indexes_in_step(self):
+        history = EventHistory(maxlen=4)
+        for index in range(6):
+            kind = EventType.HEARTBEAT if index % 2 == 0 else EventType.TASK_COMPLETED
+            self.assertEqual(history.append(self._event(kind, f"n{index % 3}", index)), index + 1)
+        self.assertEqual((len(history), history.last_sequence), (4, 6))
+        self.assertEqual([e.payload["index"] for e in history.events()], [2, 3, 4, 5])
+        self.assertEqual(history.counts_by_type(), {"heartbeat": 2, "task_completed": 2})
+        self.assertEqual([e.payload["index"] for e in history.last(5, node="n0")], [3])
+        self.assertEqual(history.last(1, node="n9"), [])
+
+    def test_cursor_and_last_k_queries(self):
+        history = EventHistory(maxlen=100)
+        for index in range(10):
+            kind = EventType.HEARTBEAT if index < 7 else EventType.TASK_FAILED
+            history.append(self._event(kind, "a" if index % 2 else "b", index))
+        self.assertEqual([seq for seq, _ in history.since(7)], [8, 9, 10])
+        self.assertEqual([seq for seq, _ in history.since(0, limit=2)], [1, 2])
+        self.assertEqual(history.since(10), [])
+        self.assertEqual([seq for seq, _ in history.since(3, event_type=EventType.HEARTBEAT, node="a")], [4, 6])
+        self.assertEqual([e.payload["index"] for e in history.last(2, event_type="heartbeat")], [5, 6])
+        self.assertEqual([e.payload["index"] for e in history.last(2, event_type="task_failed", node="b")], [8])
+
+    def test_bus_exposes_history_queries(self):
+        bus = EventBus(max_history=3)
+        for index in range(5):
+            bus.publish(_heartbeat(index))
+        self.assertEqual((bus.history_size, bus.last_sequence), (3, 5))
+        self.assertEqual([e.payload["index"] for e in bus.last_events(2, event_type=EventType.HEARTBEAT)], [3, 4])
+        self.assertEqual([seq for seq, _ in bus.events_since(4)], [5])
+
+
+class TestAsyncEventBus(unittest.TestCase):
+    def test_slow_handler_does_not_block_publish(self):
+        bus = EventBus(dispatch="async")
+        release = threading.Event()
+        fast, slow = [], []
+        bus.subscribe(EventType.HEARTBEAT, lambda e: (release.wait(5), slow.append(e)))
+        bus.subscribe(EventType.HEARTBEAT, fast.append)
+        try:
+            for i in range(3):
+                bus.publish(_heartbeat(i))
+            with mock.patch.object(event_mesh.time, "sleep") as sleep:
+                self.assertTrue(bus.flush(timeout=0.5) is False)
+            sleep.assert_not_called()
+            self.assertEqual(slow, [])
+            release.set()
+            self.assertTrue(bus.flush(timeout=5))
+            self.assertEqual([e.payload["index"] for e in fast], [0, 1, 2])
+            self.assertEqual([e.payload["index"] for e in slow], [0, 1, 2])
+            for counters in bus.stats().values():
+                self.assertEqual((counters["delivered"], counters["queue_depth"], counters["dropped"]), (3, 0, 0))
+        finally:
+            bus.close()
+
+    def test_drop_oldest_overflow(self):
+        bus = EventBus(dispatch="async", queue_size=2)
+        started, release = threading.Event(), threading.Event()
+        seen = []
+
+        def handler(event):
+            started.set()
+            release.wait(5)
+            seen.append(event.payload["index"])
+
+        bus.subscribe(EventType.HEARTBEAT, handler)
+        try:
+            bus.publish(_heartbeat(0))
+            self.assertTrue(started.wait(5))
+            for i in range(1, 6):
+                bus.publish(_heartbeat(i))
+            (counters,) = bus.stats().values()
+            self.assertEqual((counters["queue_depth"], counters["dropped"]), (2, 3))
+            release.set()
+            self.assertTrue(bus.flush(timeout=5))
+            self.assertEqual(seen, [0, 4, 5])
+        finally:
+            bus.close()
+
+    def test_block_overflow_times_out_and_counts_drop(self):
+        bus = EventBus(dispatch="async", queue_size=1, overflow="block", block_timeout_sec=0.05)
+        started, release = threading.Event(), threading.Event()
+        bus.subscribe(EventType.HEARTBEAT, lambda e: (started.set(), release.wait(5)))
+        try:
+            bus.publish(_heartbeat(0))
+            self.assertTrue(started.wait(5))
+            bus.publish(_heartbeat(1))
+            bus.publish(_heartbeat(2))
+            (counters,) = bus.stats().values()
+            self.assertEqual((counters["queue_depth"], counters["dropped"]), (1, 1))
+            release.set()
+            self.assertTrue(bus.flush(timeout=5))
+            self.assertEqual(next(iter(bus.stats().values()))["delivered"], 2)
+        finally:
+            bus.close()
+
+    def test_closed_bus_counts_late_publishes_and_rejects_subscribers(self):
+        bus = EventBus(dispatch="async")
+        seen = []
+        bus.subscribe(EventType.HEARTBEAT, seen.append)
+        bus.publish(_heartbeat(0))
+        bus.close()
+        bus.publish(_heartbeat(1))
+        (counters,) = bus.stats().values()
+        self.assertEqual((counters["delivered"], counters["dropped"]), (1, 1))
+        self.assertEqual([e.payload["index"] for e in seen], [0])
+        self.assertTrue(bus.flush(timeout=1))
+        with self.assertRaises(RuntimeError):
+            bus.subscribe(EventType.HEARTBEAT, seen.append)
+        self.assertEqual(len(bus.stats()), 1)
+
+    def test_rejects_unknown_modes(self):
+        with self.assertRaises(ValueError):
+            EventBus(dispatch="threads")
+        with self.assertRaises(ValueError):
+            EventBus(dispatch="async", overflow="drop_newest")
+
+    def test_coordinator_with_async_bus(self):
+        with tempfile.TemporaryDirectory() as td:
+            bus = EventBus(dispatch="async")
+            coord = MeshCoordinator(ledger_path=pathlib.Path(td) / "ledger.json", bus=bus)
+            try:
+                coord.register_node(MeshNode(node_id="n1"))
+                coord.emit_task_completed("n1", "t-1")
+                self.assertTrue(bus.flush(timeout=5))
+                actions = [entry.action for entry in coord.ledger.read()]
+                self.assertIn("task_completed", actions)
+            finally:
+                bus.close()
 
 
 class TestGitHubLedger(unittest.TestCase):
@@ -195,6 +345,82 @@ class TestGitHubLedger(unittest.TestCase):
             ledger = GitHubLedger(path)
             self.assertEqual(ledger.read(), [])
 
+    def _entry(self, i):
+        return LedgerEntry(entry_id=f"e{i}", node_id="n1", action="heartbeat", timestamp=f"t{i}")
+
+    def test_appends_ndjson_lines_and_compacts(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = pathlib.Path(td) / "ledger.json"
+            ledger = GitHubLedger(path, max_entries=4)
+            for i in range(3):
+                ledger.append(self._entry(i))
+            lines = path.read_text(encoding="utf-8").splitlines()
+            self.assertEqual([json.loads(line)["entry_id"] for line in lines], ["e0", "e1", "e2"])
+            for i in range(3, 10):
+                ledger.append(self._entry(i))
+            # Compaction once the file passes 2 * max_entries lines bounds it.
+            self.assertLessEqual(len(path.read_text(encoding="utf-8").splitlines()), 8)
+            self.assertEqual([e.entry_id for e in ledger.read()], ["e6", "e7", "e8", "e9"])
+            self.assertEqual([e.entry_id for e in ledger.read(last=2)], ["e8", "e9"])
+            ledger.compact()
+            self.assertEqual(len(path.read_text(encoding="utf-8").splitlines()), 4)
+
+    def test_short_lived_ledgers_still_compact(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = pathlib.Path(td) / "ledger.json"
+            for i in range(20):
+                GitHubLedger(path, max_entries=4).append(self._entry(i))
+            self.assertLessEqual(len(path.read_text(encoding="utf-8").splitlines()), 8)
+            self.assertEqual([e.entry_id for e in GitHubLedger(path, max_entries=4).read()], ["e16", "e17", "e18", "e19"])
+
+    def test_compaction_estimates_line_count_past_the_head_probe(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = pathlib.Path(td) / "ledger.json"
+            ledger = GitHubLedger(path, max_entries=10)
+            ledger._HEAD_PROBE = 256
+            for i in range(50):
+                ledger.append(self._entry(i))
+            self.assertLessEqual(len(path.read_text(encoding="utf-8").splitlines()), 21)
+            self.assertEqual(ledger.read()[-1].entry_id, "e49")
+
+    def test_read_last_tails_across_blocks_and_skips_partial_line(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = pathlib.Path(td) / "ledger.json"
+            ledger = GitHubLedger(path, max_entries=1000)
+            ledger._TAIL_BLOCK = 64
+            for i in range(50):
+                ledger.append(self._entry(i))
+            with open(path, "ab") as handle:
+                handle.write(b'{"entry_id": "half')
+            self.assertEqual([e.entry_id for e in ledger.read(last=3)], ["e47", "e48", "e49"])
+            self.assertEqual(ledger.count(), 50)
+
+    def test_migrates_legacy_json_array(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = pathlib.Path(td) / "ledger.json"
+            path.write_text(json.dumps([self._entry(i).to_dict() for i in range(2)], indent=2), encoding="utf-8")
+            ledger = GitHubLedger(path)
+            self.assertEqual([e.entry_id for e in ledger.read()], ["e0", "e1"])
+            ledger.append(self._entry(2))
+            lines = path.read_text(encoding="utf-8").splitlines()
+            self.assertEqual([json.loads(line)["entry_id"] for line in lines], ["e0", "e1", "e2"])
+
+    def test_concurrent_appends_from_separate_ledgers_are_not_lost(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = pathlib.Path(td) / "ledger.json"
+            writers = [GitHubLedger(path, max_entries=1000) for _ in range(4)]
+
+            def write(index, ledger):
+                for i in range(25):
+                    ledger.append(self._entry(index * 100 + i))
+
+            threads = [threading.Thread(target=write, args=item) for item in enumerate(writers)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=10)
+            self.assertEqual(GitHubLedger(path, max_entries=1000).count(), 100)
+
 
 class TestMeshCoordinator(unittest.TestCase):
     def test_register_and_query_nodes(self):
@@ -254,6 +480,8 @@ class TestMeshCoordinator(unittest.TestCase):
             self.assertIn("stale_nodes", snap)
             self.assertIn("event_history_size", snap)
             self.assertEqual(snap["total_nodes"], 1)
+            self.assertEqual(snap["last_event_sequence"], 1)
+            self.assertEqual(snap["event_counts"], {"node_joined": 1})
 
     def test_event_bus_history_captured_by_coordinator(self):
         with tempfile.TemporaryDirectory() as td:
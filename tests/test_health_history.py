@@ -0,0 +1,124 @@
+import json
+import pathlib
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from http.server import ThreadingHTTPServer
+from urllib import error as urllib_error
+from urllib import request as urllib_request
+
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from orxaq_autonomy import dashboard
+from orxaq_autonomy.health_history import HISTORY_DIRNAME, HealthHistory
+from orxaq_autonomy.health_monitor import CollaborationHealthMonitor
+from orxaq_autonomy.swarm_health_gate import evaluate_health_gate, generate_health_artifacts
+
+T0 = 1_800_000_000.0  # A whole hour, so bucket boundaries are easy to reason about.
+
+
+class HealthHistoryTests(unittest.TestCase):
+    def setUp(self):
+        self._td = tempfile.TemporaryDirectory()
+        self.directory = pathlib.Path(self._td.name) / HISTORY_DIRNAME
+
+    def tearDown(self):
+        self._td.cleanup()
+
+    def test_samples_fold_into_minute_and_hour_buckets(self):
+        history = HealthHistory(self.directory)
+        for offset, value in ((0, 10), (30, 20), (61, 90), (3601, 50)):
+            history.record("health.score", value, timestamp=T0 + offset)
+
+        raw = history.query("health.score", start=T0, end=T0 + 7200, resolution="raw")
+        self.assertEqual([point[1] for point in raw["points"]], [10, 20, 90, 50])
+
+        minute = history.query("health.score", start=T0, end=T0 + 7200, resolution="minute")
+        self.assertEqual(
+            minute["points"],
+            [[T0, 10, 20, 15, 2], [T0 + 60, 90, 90, 90, 1], [T0 + 3600, 50, 50, 50, 1]],
+        )
+        hour = history.query("health.score", start=T0 + 1800, end=T0 + 7200, resolution="hour")
+        self.assertEqual(hour["points"], [[T0, 10, 90, 40, 3], [T0 + 3600, 50, 50, 50, 1]])
+        self.assertEqual(history.metrics(), ["health.score"])
+
+    def test_rings_wrap_without_growing_and_auto_picks_resolution(self):
+        history = HealthHistory(self.directory, capacity={"raw": 8, "minute": 4, "hour": 4})
+        for index in range(20):
+            history.record("swarm.score", index, timestamp=T0 + index * 60)
+        size = history.path_for("swarm.score").stat().st_size
+        history.record("swarm.score", 99, timestamp=T0 + 20 * 60)
+        self.assertEqual(history.path_for("swarm.score").stat().st_size, size)
+
+        recent = history.query("swarm.score", start=T0 + 17 * 60, end=T0 + 20 * 60)
+        self.assertEqual(recent["resolution"], "raw")
+        self.assertEqual([point[1] for point in recent["points"]], [17, 18, 19, 99])
+
+        # Raw and minute rings no longer reach back to T0; the hour ring still does.
+        full = history.query("swarm.score", start=T0, end=T0 + 20 * 60)
+        self.assertEqual(full["resolution"], "hour")
+        self.assertEqual(full["points"], [[T0, 0, 99, round(sum(range(20), 99) / 21, 6), 21]])
+
+    def test_auto_uses_raw_ring_for_short_unwrapped_history(self):
+        history = HealthHistory(self.directory)
+        now = time.time()
+        for index in range(30):
+            history.record("score", index, timestamp=now - 600 + index * 20)
+        result = history.query("score")
+        self.assertEqual(result["resolution"], "raw")
+        self.assertEqual([point[1] for point in result["points"]], list(range(30)))
+
+    def test_unknown_metric_and_resolution(self):
+        history = HealthHistory(self.directory)
+        self.assertEqual(history.query("missing")["points"], [])
+        with self.assertRaises(ValueError):
+            history.query("missing", resolution="week")
+
+    def test_health_writers_append_to_history(self):
+        output_dir = pathlib.Path(self._td.name)
+        CollaborationHealthMonitor(output_dir=output_dir).check(state={"a": {"status": "done"}})
+        generate_health_artifacts(
+            health_report={"score": 88.0, "components": {"providers": {"score": 100.0, "weight": 0.3}}},
+            gate_result=evaluate_health_gate(score=88.0, min_score=50.0),
+            output_dir=output_dir,
+        )
+        history = HealthHistory(self.directory)
+        self.assertIn("collaboration.score", history.metrics())
+        self.assertIn("swarm.component.providers", history.metrics())
+        self.assertEqual(history.query("swarm.score", resolution="raw")["points"][0][1], 88.0)
+
+    def test_dashboard_serves_history_ranges(self):
+        history = HealthHistory(self.directory)
+        for offset in range(5):
+            history.record("health.score", 80 + offset, timestamp=T0 + offset * 30)
+        artifacts = pathlib.Path(self._td.name) / "artifacts"
+        artifacts.mkdir()
+        handler = dashboard.make_dashboard_handler(artifacts, health_history=history)
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            base = f"http://127.0.0.1:{server.server_port}/api/health/history"
+            with urllib_request.urlopen(base, timeout=5) as resp:
+                self.assertEqual(json.loads(resp.read())["metrics"], ["health.score"])
+            query = f"?metric=health.score&start={T0 + 30}&end={T0 + 90}&resolution=raw"
+            with urllib_request.urlopen(base + query, timeout=5) as resp:
+                payload = json.loads(resp.read())
+            self.assertEqual([point[1] for point in payload["points"]], [81, 82, 83])
+            with self.assertRaises(urllib_error.HTTPError) as ctx:
+                urllib_request.urlopen(base + "?metric=health.score&resolution=week", timeout=5)
+            self.assertEqual(ctx.exception.code, 400)
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join(timeout=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,6 +10,7 @@ SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
+from orxaq_autonomy.health_history import HISTORY_DIRNAME, HealthHistory
 from orxaq_autonomy.health_monitor import (
     CollaborationHealthMonitor,
     DegradationSignal,
@@ -241,6 +242,16 @@ class TestDashboardHealthStatus(unittest.TestCase):
             result = dashboard_health_status(state_file=state_file, heartbeat_age_sec=10)
             self.assertIn("grade", result)
 
+    def test_output_dir_records_health_history(self):
+        with tempfile.TemporaryDirectory() as td:
+            out = pathlib.Path(td)
+            state_file = out / "state.json"
+            state_file.write_text(json.dumps({"t1": {"status": "done"}}), encoding="utf-8")
+            result = dashboard_health_status(state_file=state_file, heartbeat_age_sec=10, output_dir=out)
+            history = HealthHistory(out / HISTORY_DIRNAME)
+            self.assertIn("collaboration.score", history.metrics())
+            self.assertEqual(history.query("collaboration.score", resolution="raw")["points"][0][1], result["score"])
+
     def test_handles_malformed_state_file(self):
         with tempfile.TemporaryDirectory() as td:
             state_file = pathlib.Path(td) / "state.json"
@@ -0,0 +1,75 @@
+import os
+import pathlib
+import sys
+import tempfile
+import unittest
+
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from orxaq_autonomy import import_profile
+
+
+# Modules that keepalive-driven commands must not drag in at startup.
+HEAVY_MODULES = (
+    "orxaq_autonomy.dashboard",
+    "orxaq_autonomy.gitops",
+    "orxaq_autonomy.router",
+    "orxaq_autonomy.providers",
+    "orxaq_autonomy.rpa_scheduler",
+    "orxaq_autonomy.health_monitor",
+    "orxaq_autonomy.autopilot_cleanup",
+    "http.server",
+    "sqlite3",
+)
+IMPORT_BUDGET_MS = float(os.environ.get("ORXAQ_AUTONOMY_IMPORT_BUDGET_MS", "750"))
+
+
+class ParseImporttimeTests(unittest.TestCase):
+    def test_parse_rows_and_depth(self):
+        stderr = "\n".join(
+            [
+                "import time: self [us] | cumulative | imported package",
+                "import time:       120 |        120 |   _io",
+                "import time:       300 |       1500 | orxaq_autonomy.cli",
+                "import time:      1200 |       1200 |     orxaq_autonomy.manager",
+                "unrelated warning",
+            ]
+        )
+        rows = import_profile.parse_importtime(stderr)
+        self.assertEqual([row["module"] for row in rows], ["_io", "orxaq_autonomy.cli", "orxaq_autonomy.manager"])
+        self.assertEqual([row["depth"] for row in rows], [1, 0, 2])
+        self.assertEqual(rows[1]["cumulative_us"], 1500)
+
+
+class HotCommandImportBudgetTests(unittest.TestCase):
+    def _root(self, td: str) -> pathlib.Path:
+        root = pathlib.Path(td)
+        (root / "config").mkdir(parents=True, exist_ok=True)
+        (root / "state").mkdir(parents=True, exist_ok=True)
+        artifacts = root / "artifacts" / "autonomy"
+        artifacts.mkdir(parents=True, exist_ok=True)
+        # A live supervisor pid makes `ensure` a no-op instead of spawning one.
+        (artifacts / "supervisor.pid").write_text(str(os.getpid()), encoding="utf-8")
+        return root
+
+    def test_hot_commands_stay_within_import_budget(self):
+        env = {key: value for key, value in os.environ.items() if not key.startswith("ORXAQ_")}
+        with tempfile.TemporaryDirectory() as td:
+            root = self._root(td)
+            for command in ("status", "ensure", "health"):
+                with self.subTest(command=command):
+                    report = import_profile.profile_cli_imports(["--root", str(root), command], cwd=root, env=env)
+                    self.assertEqual(report["returncode"], 0)
+                    self.assertIn("orxaq_autonomy.manager", report["package_modules"])
+                    loaded = set(report["modules"])
+                    self.assertEqual([name for name in HEAVY_MODULES if name in loaded], [])
+                    self.assertLess(report["total_ms"], IMPORT_BUDGET_MS)
+                    self.assertTrue(report["top_modules"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+import gzip
+import pathlib
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from orxaq_autonomy import log_segments
+
+
+def _write_lines(path: pathlib.Path, start: int, count: int) -> None:
+    with path.open("a", encoding="utf-8") as handle:
+        for i in range(start, start + count):
+            handle.write(f"line-{i:05d}\n")
+
+
+class LogIndexTests(unittest.TestCase):
+    def test_read_lines_and_tail_use_sparse_offsets(self):
+        with tempfile.TemporaryDirectory() as td:
+            log = pathlib.Path(td) / "runner.log"
+            _write_lines(log, 0, 1000)
+            index = log_segments.LogIndex(log, stride=64)
+            self.assertEqual(index.line_count(), 1000)
+            self.assertEqual(index.read_lines(130, 3), ["line-00130", "line-00131", "line-00132"])
+            self.assertEqual(index.tail(2), ["line-00998", "line-00999"])
+            self.assertEqual(index.read_lines(1000, 5), [])
+            self.assertTrue(log_segments.index_path_for(log).exists())
+
+    def test_refresh_is_incremental_and_counts_partial_last_line(self):
+        with tempfile.TemporaryDirectory() as td:
+            log = pathlib.Path(td) / "runner.log"
+            _write_lines(log, 0, 10)
+            self.assertEqual(log_segments.LogIndex(log, stride=4).line_count(), 10)
+            scanned = log_segments.LogIndex(log, stride=4).refresh()["scanned_offset"]
+            _write_lines(log, 10, 5)
+            with log.open("a", encoding="utf-8") as handle:
+                handle.write("partial")
+            index = log_segments.LogIndex(log, stride=4)
+            data = index.refresh()
+            self.assertGreater(data["scanned_offset"], scanned)
+            self.assertEqual(index.line_count(), 16)
+            self.assertEqual(index.tail(2), ["line-00014", "partial"])
+
+    def test_truncated_log_rebuilds_index(self):
+        with tempfile.TemporaryDirectory() as td:
+            log = pathlib.Path(td) / "runner.log"
+            _write_lines(log, 0, 50)
+            log_segments.LogIndex(log, stride=8).refresh()
+            log.write_text("fresh-0\nfresh-1\n", encoding="utf-8")
+            index = log_segments.LogIndex(log, stride=8)
+            self.assertEqual(index.line_count(), 2)
+            self.assertEqual(index.tail(5), ["fresh-0", "fresh-1"])
+
+    def test_in_memory_index_writes_no_sidecar_and_stays_incremental(self):
+        with tempfile.TemporaryDirectory() as td:
+            log = pathlib.Path(td) / "runner.log"
+            _write_lines(log, 0, 20)
+            index = log_segments.LogIndex(log, stride=4, persist=False)
+            self.assertEqual(index.line_count(), 20)
+            scanned = index.refresh()["scanned_offset"]
+            _write_lines(log, 20, 2)
+            self.assertEqual(index.tail(1), ["line-00021"])
+            self.assertGreater(index.refresh()["scanned_offset"], scanned)
+            self.assertFalse(log_segments.index_path_for(log).exists())
+
+
+class RotationTests(unittest.TestCase):
+    def test_rotate_gzips_truncates_and_prunes(self):
+        with tempfile.TemporaryDirectory() as td:
+            log = pathlib.Path(td) / "runner.log"
+            segments = []
+            for batch in range(3):
+                _write_lines(log, batch * 10, 10)
+                segments.append(log_segments.rotate_log(log, keep_segments=2))
+            self.assertEqual(log.stat().st_size, 0)
+            remaining = log_segments.list_segments(log)
+            self.assertEqual(remaining, segments[1:])
+            with gzip.open(remaining[-1], "rt", encoding="utf-8") as handle:
+                self.assertEqual(handle.read().splitlines()[0], "line-00020")
+            self.assertIsNone(log_segments.rotate_log(log))
+
+    def test_append_handle_continues_after_rotation(self):
+        with tempfile.TemporaryDirectory() as td:
+            log = pathlib.Path(td) / "runner.log"
+            with log.open("a", encoding="utf-8") as writer:
+                writer.write("before\n")
+                writer.flush()
+                log_segments.rotate_log(log)
+                writer.write("after\n")
+            self.assertEqual(log.read_text(encoding="utf-8"), "after\n")
+
+    def test_maybe_rotate_by_size_and_age(self):
+        with tempfile.TemporaryDirectory() as td:
+            log = pathlib.Path(td) / "runner.log"
+            _write_lines(log, 0, 10)
+            self.assertIsNone(log_segments.maybe_rotate(log, max_bytes=10_000))
+            self.assertIsNotNone(log_segments.maybe_rotate(log, max_bytes=50))
+            _write_lines(log, 10, 1)
+            started = log_segments.LogIndex(log).started_at()
+            self.assertIsNone(log_segments.maybe_rotate(log, max_age_sec=60, now=started + 30))
+            self.assertIsNotNone(log_segments.maybe_rotate(log, max_age_sec=60, now=started + 61))
+            self.assertEqual(len(log_segments.list_segments(log)), 2)
+
+    def test_maybe_rotate_age_check_does_not_rewrite_the_sidecar(self):
+        with tempfile.TemporaryDirectory() as td:
+            log = pathlib.Path(td) / "runner.log"
+            _write_lines(log, 0, 10)
+            self.assertIsNone(log_segments.maybe_rotate(log, max_age_sec=60))
+            self.assertTrue(log_segments.index_path_for(log).exists())
+            with mock.patch.object(log_segments.LogIndex, "_save") as save:
+                for i in range(3):
+                    _write_lines(log, 10 + i, 1)
+                    self.assertIsNone(log_segments.maybe_rotate(log, max_age_sec=60))
+            save.assert_not_called()
+
+    def test_rotation_appends_late_bytes_after_racing_writes(self):
+        with tempfile.TemporaryDirectory() as td:
+            log = pathlib.Path(td) / "runner.log"
+            _write_lines(log, 0, 2)
+            original_replace = log_segments.os.replace
+            original_append = log_segments._append_bytes
+
+            def replace(src, dst):
+                _write_lines(log, 2, 1)  # Lands after the copy loop saw a stable size.
+                original_replace(src, dst)
+
+            def append_bytes(path, data):
+                _write_lines(log, 3, 1)  # Lands between the truncate and the write-back.
+                original_append(path, data)
+
+            with mock.patch.object(log_segments.os, "replace", replace), mock.patch.object(
+                log_segments, "_append_bytes", append_bytes
+            ):
+                segment = log_segments.rotate_log(log)
+            with gzip.open(segment, "rt", encoding="utf-8") as handle:
+                self.assertEqual(handle.read().splitlines(), ["line-00000", "line-00001"])
+            self.assertEqual(log.read_text(encoding="utf-8").splitlines(), ["line-00003", "line-00002"])
+
+    def test_search_spans_segments_and_active_log(self):
+        with tempfile.TemporaryDirectory() as td:
+            log = pathlib.Path(td) / "runner.log"
+            log.write_text("task alpha failed\nok\n", encoding="utf-8")
+            segment = log_segments.rotate_log(log)
+            log.write_text("ok\ntask beta FAILED\n", encoding="utf-8")
+
+            found = log_segments.search_logs(log, "failed", ignore_case=True)
+            self.assertEqual(
+                [(item["file"], item["line"]) for item in found],
+                [(segment.name, 1), ("runner.log", 2)],
+            )
+            self.assertEqual(len(log_segments.search_logs(log, r"task \w+", regex=True, max_results=1)), 1)
+            self.assertEqual(log_segments.search_logs(log, "failed"), found[:1])
+
+
+if __name__ == "__main__":
+    unittest.main()
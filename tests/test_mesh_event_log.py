@@ -0,0 +1,147 @@
+import json
+import pathlib
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+from unittest import mock
+
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from orxaq_autonomy.event_mesh import EventType, MeshCoordinator, MeshEvent, MeshNode
+from orxaq_autonomy.mesh_event_log import MeshEventLog, segment_name
+
+
+def _event(index: int) -> MeshEvent:
+    return MeshEvent(
+        event_type=EventType.HEARTBEAT,
+        source_node="n1",
+        timestamp="2026-01-01T00:00:00+00:00",
+        payload={"index": index},
+    )
+
+
+class MeshEventLogTests(unittest.TestCase):
+    def setUp(self):
+        self._td = tempfile.TemporaryDirectory()
+        self.directory = pathlib.Path(self._td.name) / "mesh_events"
+
+    def tearDown(self):
+        self._td.cleanup()
+
+    def test_append_assigns_dense_offsets_and_replays(self):
+        log = MeshEventLog(self.directory)
+        self.assertEqual([log.append(_event(i)) for i in range(5)], [0, 1, 2, 3, 4])
+        replay = log.read(2)
+        self.assertEqual([offset for offset, _ in replay], [2, 3, 4])
+        self.assertEqual(replay[0][1].payload, {"index": 2})
+        self.assertEqual(replay[0][1].event_type, "heartbeat")
+        self.assertEqual(len(log.read(0, limit=2)), 2)
+        # A second writer instance continues the sequence from the file.
+        self.assertEqual(MeshEventLog(self.directory).append(_event(5)), 5)
+
+    def test_segments_roll_and_oldest_are_pruned(self):
+        log = MeshEventLog(self.directory, segment_bytes=200, max_segments=2)
+        for i in range(12):
+            log.append(_event(i))
+        bases = log.segments()
+        self.assertEqual(len(bases), 2)
+        self.assertTrue((self.directory / segment_name(bases[-1])).exists())
+        replay = log.read(0)
+        self.assertEqual(replay[0][0], bases[0])
+        self.assertEqual([offset for offset, _ in replay], list(range(bases[0], 12)))
+
+    def test_finished_segments_are_fsynced_on_roll(self):
+        log = MeshEventLog(self.directory, segment_bytes=200)
+        with mock.patch("orxaq_autonomy.mesh_event_log.os.fsync") as fsync:
+            for i in range(2):
+                log.append(_event(i))
+            fsync.assert_not_called()
+            while len(log.segments()) < 2:
+                log.append(_event(len(log.read(0))))
+        self.assertEqual(fsync.call_count, 1)
+
+    def test_torn_line_is_isolated(self):
+        log = MeshEventLog(self.directory)
+        log.append(_event(0))
+        with open(log.segment_path(0), "ab") as handle:
+            handle.write(b'{"offset": 1, "event": {"tor')
+        self.assertEqual(MeshEventLog(self.directory).append(_event(1)), 1)
+        self.assertEqual([event.payload["index"] for _, event in log.read(0)], [0, 1])
+
+    def test_consumer_tails_incrementally_and_resumes_from_commit(self):
+        log = MeshEventLog(self.directory, segment_bytes=300)
+        consumer = log.consumer("dashboard")
+        self.assertEqual(consumer.poll(), [])
+        for i in range(3):
+            log.append(_event(i))
+        self.assertEqual([offset for offset, _ in consumer.poll(limit=2)], [0, 1])
+        consumer.commit()
+        for i in range(3, 8):
+            log.append(_event(i))
+        self.assertEqual([offset for offset, _ in consumer.poll()], [2, 3, 4, 5, 6, 7])
+
+        restarted = log.consumer("dashboard")
+        self.assertEqual(restarted.position, 2)
+        self.assertEqual([offset for offset, _ in restarted.poll()], [2, 3, 4, 5, 6, 7])
+        restarted.seek(6)
+        self.assertEqual([offset for offset, _ in restarted.poll()], [6, 7])
+        committed = json.loads((self.directory / "cursors" / "dashboard.json").read_text(encoding="utf-8"))
+        self.assertEqual(committed["offset"], 2)
+
+    def test_consumer_sees_events_from_another_process(self):
+        log = MeshEventLog(self.directory)
+        consumer = log.consumer("runner-b")
+        script = textwrap.dedent(
+            f"""
+            import pathlib, sys
+            sys.path.insert(0, {str(SRC)!r})
+            from orxaq_autonomy.event_mesh import MeshCoordinator, MeshNode
+            from orxaq_autonomy.mesh_event_log import MeshEventLog
+            coord = MeshCoordinator(
+                ledger_path=pathlib.Path({self._td.name!r}) / "ledger.json",
+                event_log=MeshEventLog(pathlib.Path({str(self.directory)!r})),
+            )
+            coord.register_node(MeshNode(node_id="remote"))
+            coord.emit_task_completed("remote", "t-9")
+            """
+        )
+        subprocess.run([sys.executable, "-c", script], check=True, timeout=30)
+        events = consumer.poll(timeout=5)
+        self.assertEqual(
+            [(event.event_type, event.source_node) for _, event in events],
+            [("node_joined", "remote"), ("task_completed", "remote")],
+        )
+
+    def test_coordinator_appends_emitted_events(self):
+        log = MeshEventLog(self.directory)
+        coord = MeshCoordinator(ledger_path=pathlib.Path(self._td.name) / "ledger.json", event_log=log)
+        coord.register_node(MeshNode(node_id="a"))
+        coord.heartbeat("a")
+        coord.emit_task_claimed("a", "t-1")
+        self.assertEqual(
+            [event.event_type for _, event in log.read(0)],
+            ["node_joined", "heartbeat", "task_claimed"],
+        )
+        self.assertEqual(coord.bus.history_size, 3)
+
+    def test_coordinator_publishes_when_the_log_cannot_be_written(self):
+        log = MeshEventLog(self.directory)
+        coord = MeshCoordinator(ledger_path=pathlib.Path(self._td.name) / "ledger.json", event_log=log)
+        with mock.patch.object(log, "append", side_effect=OSError(28, "No space left on device")):
+            coord.register_node(MeshNode(node_id="a"))
+            coord.heartbeat("a")
+        self.assertEqual(coord.bus.history_size, 2)
+        self.assertEqual(coord.ledger.read()[0].action, "node_joined")
+        snap = coord.snapshot()
+        self.assertEqual(snap["event_log_errors"], 2)
+        self.assertIn("No space left on device", snap["event_log_last_error"])
+
+
+if __name__ == "__main__":
+    unittest.main()
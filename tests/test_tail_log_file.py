@@ -10,7 +10,7 @@ SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
-from orxaq_autonomy.dashboard import tail_log_file
+from orxaq_autonomy.dashboard import read_text_window, tail_log_file
 
 
 class TailLogFileTests(unittest.TestCase):
@@ -88,5 +88,47 @@ class TailLogFileTests(unittest.TestCase):
             self.assertEqual(lines, [])
 
 
+class ReadTextWindowTests(unittest.TestCase):
+    def _write(self, td: str) -> pathlib.Path:
+        p = pathlib.Path(td) / "paged.log"
+        p.write_text("".join(f"line-{i:03d}\n" for i in range(100)), encoding="utf-8")
+        return p
+
+    def test_pages_align_to_lines_and_chain(self):
+        with tempfile.TemporaryDirectory() as td:
+            p = self._write(td)
+            first = read_text_window(p, 0, max_bytes=95)
+            self.assertEqual(first["lines"], [f"line-{i:03d}" for i in range(10)])
+            self.assertEqual((first["start"], first["end"], first["size"]), (0, 90, 900))
+
+            # An offset inside a line skips to the next line start.
+            middle = read_text_window(p, 95, max_bytes=95)
+            self.assertEqual(middle["start"], 99)
+            self.assertEqual(middle["lines"][0], "line-011")
+
+            collected, offset = [], 0
+            while offset < 900:
+                window = read_text_window(p, offset, max_bytes=95)
+                collected.extend(window["lines"])
+                offset = window["end"]
+            self.assertEqual(collected, [f"line-{i:03d}" for i in range(100)])
+
+    def test_default_offset_is_last_page(self):
+        with tempfile.TemporaryDirectory() as td:
+            p = self._write(td)
+            window = read_text_window(p, max_bytes=95)
+            self.assertEqual(window["lines"], [f"line-{i:03d}" for i in range(90, 100)])
+            self.assertEqual(window["lines"], tail_log_file(p, max_bytes=95))
+            self.assertEqual(window["end"], 900)
+
+    def test_line_longer_than_page_is_cut(self):
+        with tempfile.TemporaryDirectory() as td:
+            p = pathlib.Path(td) / "wide.log"
+            p.write_text("x" * 50 + "\nend\n", encoding="utf-8")
+            window = read_text_window(p, 10, max_bytes=20)
+            self.assertEqual((window["start"], window["end"]), (10, 30))
+            self.assertEqual(window["lines"], ["x" * 20])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,173 @@
+import json
+import pathlib
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib import request as urllib_request
+
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from orxaq_autonomy import dashboard
+from orxaq_autonomy.todo_federation import TodoFederation, parse_peer_tasks
+
+
+def _serve(handler) -> tuple[ThreadingHTTPServer, str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+def _stop(server: ThreadingHTTPServer) -> None:
+    server.shutdown()
+    server.server_close()
+
+
+def _slow_handler(delay_sec: float):
+    class SlowHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):  # noqa: A002
+            return
+
+        def do_GET(self):  # noqa: N802
+            time.sleep(delay_sec)
+            body = json.dumps({"tasks": {"slow-1": {"status": "done", "last_update": "2026-01-01T00:00:00+00:00"}}})
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body.encode("utf-8"))
+
+    return SlowHandler
+
+
+class ParsePeerTasksTests(unittest.TestCase):
+    def test_accepts_todos_response_or_raw_state(self):
+        task = {"status": "pending"}
+        self.assertEqual(parse_peer_tasks({"tasks": {"a": task}, "total": 1}), {"a": task})
+        self.assertEqual(parse_peer_tasks({"a": task, "b": "junk"}), {"a": task})
+        with self.assertRaises(ValueError):
+            parse_peer_tasks([task])
+
+
+class TodoFederationTests(unittest.TestCase):
+    def _peer_dashboard(self, td: str, name: str, tasks: dict) -> tuple[ThreadingHTTPServer, str]:
+        root = pathlib.Path(td) / name
+        (root / "artifacts").mkdir(parents=True)
+        state_file = root / "state.json"
+        state_file.write_text(json.dumps(tasks), encoding="utf-8")
+        return _serve(dashboard.make_dashboard_handler(root / "artifacts", state_file=state_file))
+
+    def test_fetches_peers_concurrently_and_falls_back_to_cache(self):
+        with tempfile.TemporaryDirectory() as td:
+            slow_a, url_a = _serve(_slow_handler(0.4))
+            slow_b, url_b = _serve(_slow_handler(0.4))
+            federation = TodoFederation([url_a, url_b, url_a + "/"], timeout_sec=2, cache_sec=0)
+            try:
+                started = time.monotonic()
+                rows = federation.collect()
+                self.assertLess(time.monotonic() - started, 0.75)
+                self.assertEqual([row["node"] for row in rows], [url_a, url_b])
+                self.assertTrue(all(row["ok"] and row["task_count"] == 1 for row in rows))
+            finally:
+                _stop(slow_a)
+
+            rows = federation.collect()
+            _stop(slow_b)
+            down = rows[0]
+            self.assertFalse(down["ok"])
+            self.assertTrue(down["stale"])
+            self.assertTrue(down["error"])
+            self.assertEqual(down["tasks"], {"slow-1": {"status": "done", "last_update": "2026-01-01T00:00:00+00:00"}})
+            self.assertTrue(rows[1]["ok"])
+
+    def test_concurrent_request_waits_for_in_flight_fetch(self):
+        slow, url = _serve(_slow_handler(0.4))
+        try:
+            federation = TodoFederation([url], timeout_sec=2, cache_sec=60)
+            first: list = []
+            thread = threading.Thread(target=lambda: first.extend(federation.collect()))
+            thread.start()
+            time.sleep(0.1)
+            rows = federation.collect()
+            thread.join(timeout=5)
+            self.assertEqual([(row["ok"], row["pending"], row["task_count"]) for row in rows], [(True, False, 1)])
+            self.assertTrue(first[0]["ok"])
+
+            # Still in flight past a request's deadline: pending, not failed.
+            federation._states[url].done.clear()
+            federation._states[url].tasks = None
+            federation._states[url].error = ""
+            federation.timeout_sec = 0.1
+            row = federation.collect()[0]
+            self.assertEqual((row["ok"], row["pending"], row["error"]), (False, True, ""))
+        finally:
+            _stop(slow)
+
+    def test_cached_payload_expires_after_max_stale(self):
+        slow, url = _serve(_slow_handler(0))
+        try:
+            federation = TodoFederation([url], timeout_sec=2, cache_sec=0, max_stale_sec=60)
+            self.assertTrue(federation.collect()[0]["ok"])
+        finally:
+            _stop(slow)
+        row = federation.collect()[0]
+        self.assertTrue(row["stale"])
+        federation._states[url].fetched_at -= 120
+        row = federation.collect()[0]
+        self.assertEqual((row["ok"], row["stale"], row["tasks"], row["age_sec"]), (False, False, {}, -1))
+        self.assertTrue(row["error"])
+
+    def test_slow_peer_is_cut_off_by_timeout(self):
+        slow, url = _serve(_slow_handler(1.5))
+        try:
+            federation = TodoFederation([url, "http://127.0.0.1:9"], timeout_sec=0.3, cache_sec=0)
+            started = time.monotonic()
+            rows = federation.collect()
+            self.assertLess(time.monotonic() - started, 1.2)
+            self.assertEqual([row["ok"] for row in rows], [False, False])
+            self.assertEqual([row["stale"] for row in rows], [False, False])
+            self.assertEqual(rows[0]["age_sec"], -1)
+        finally:
+            _stop(slow)
+
+    def test_dashboard_merges_local_and_peer_todos(self):
+        with tempfile.TemporaryDirectory() as td:
+            now = "2026-10-01T00:00:00+00:00"
+            peer, peer_url = self._peer_dashboard(td, "peer", {"remote-1": {"status": "pending", "last_update": now}})
+            gone, gone_url = self._peer_dashboard(td, "gone", {})
+            _stop(gone)
+            local_root = pathlib.Path(td) / "local"
+            (local_root / "artifacts").mkdir(parents=True)
+            state_file = local_root / "state.json"
+            state_file.write_text(json.dumps({"local-1": {"status": "done", "last_update": now}}), encoding="utf-8")
+            federation = TodoFederation([peer_url, gone_url], timeout_sec=1, cache_sec=0)
+            server, url = _serve(
+                dashboard.make_dashboard_handler(local_root / "artifacts", state_file=state_file, todo_federation=federation)
+            )
+            try:
+                with urllib_request.urlopen(f"{url}/api/todos", timeout=5) as resp:
+                    payload = json.loads(resp.read().decode("utf-8"))
+                self.assertEqual(sorted(payload["tasks"]), ["local-1", "remote-1"])
+                self.assertEqual((payload["covered"], payload["uncovered"]), (1, 1))
+                self.assertEqual([row["node"] for row in payload["nodes"]], ["local", peer_url, gone_url])
+                self.assertEqual([row["ok"] for row in payload["nodes"]], [True, True, False])
+                self.assertTrue(payload["degraded"])
+
+                with urllib_request.urlopen(f"{url}/api/todos?scope=local", timeout=5) as resp:
+                    payload = json.loads(resp.read().decode("utf-8"))
+                self.assertEqual(list(payload["tasks"]), ["local-1"])
+                self.assertFalse(payload["degraded"])
+            finally:
+                _stop(server)
+                _stop(peer)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+import json
+import os
+import pathlib
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from orxaq_autonomy import runner, worktree_pool
+
+
+def _git(repo: pathlib.Path, *args: str) -> None:
+    subprocess.run(["git", "-C", str(repo), *args], check=True, capture_output=True, text=True)
+
+
+@unittest.skipIf(shutil.which("git") is None, "git not installed")
+class WorktreePoolTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = pathlib.Path(self._tmp.name)
+        self.repo = self.tmp / "repo"
+        self.repo.mkdir()
+        _git(self.repo, "init", "-q")
+        _git(self.repo, "config", "user.email", "ci@example.com")
+        _git(self.repo, "config", "user.name", "ci")
+        (self.repo / "README.md").write_text("hello\n", encoding="utf-8")
+        _git(self.repo, "add", "README.md")
+        _git(self.repo, "commit", "-q", "-m", "init")
+        self.pool = worktree_pool.WorktreePool(self.repo, self.tmp / "pool", 2, lock_stale_sec=0)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_warm_creates_linked_worktrees(self):
+        created = self.pool.warm()
+        self.assertEqual(len(created), 2)
+        for path in created:
+            self.assertTrue((path / "README.md").exists())
+            self.assertTrue((path / ".git").is_file())
+        self.assertEqual(self.pool.warm(), [])
+
+    def test_acquire_leases_distinct_slots_until_exhausted(self):
+        first = self.pool.acquire("a")
+        second = self.pool.acquire("b")
+        self.assertIsNotNone(first)
+        self.assertIsNotNone(second)
+        self.assertNotEqual(first.path, second.path)
+        self.assertIsNone(self.pool.acquire("c"))
+        self.pool.release(first)
+        third = self.pool.acquire("c")
+        self.assertEqual(third.slot, first.slot)
+
+    def test_release_resets_slot_to_primary_head(self):
+        lease = self.pool.acquire("a")
+        (lease.path / "README.md").write_text("dirty\n", encoding="utf-8")
+        (lease.path / "scratch.txt").write_text("tmp\n", encoding="utf-8")
+        self.pool.release(lease)
+        self.assertEqual((lease.path / "README.md").read_text(encoding="utf-8"), "hello\n")
+        self.assertFalse((lease.path / "scratch.txt").exists())
+        self.assertFalse(lease.lease_file.exists())
+
+    def test_heal_expires_dead_leases_and_locks(self):
+        self.pool.warm()
+        self.pool.lease_path(0).write_text(json.dumps({"pid": 999999}), encoding="utf-8")
+        git_dir = worktree_pool.resolve_git_dir(self.pool.slot_path(1))
+        lock = git_dir / "index.lock"
+        lock.write_text("", encoding="utf-8")
+        old = time.time() - 60
+        os.utime(lock, (old, old))
+
+        report = self.pool.heal()
+
+        self.assertEqual(report["expired_leases"], [0])
+        self.assertIn(str(lock), report["removed_locks"])
+        self.assertFalse(lock.exists())
+
+    def test_acquire_skips_empty_lease_until_grace_expires(self):
+        self.pool.pool_dir.mkdir(parents=True)
+        self.pool.lease_path(0).write_text("", encoding="utf-8")
+        lease = self.pool.acquire("a")
+        self.assertEqual(lease.slot, 1)
+        self.assertEqual(self.pool.lease_path(0).read_text(encoding="utf-8"), "")
+        self.assertIsNone(self.pool.acquire("b"))
+
+        old = time.time() - worktree_pool.DEFAULT_LEASE_GRACE_SEC - 1
+        os.utime(self.pool.lease_path(0), (old, old))
+        reclaimed = self.pool.acquire("b")
+        self.assertEqual(reclaimed.slot, 0)
+        self.assertEqual(json.loads(reclaimed.lease_file.read_text(encoding="utf-8"))["owner"], "b")
+
+    def test_expire_lease_keeps_a_replaced_lease(self):
+        self.pool.pool_dir.mkdir(parents=True)
+        self.pool.lease_path(0).write_text(json.dumps({"pid": 999999}), encoding="utf-8")
+        stale = self.pool._stale_lease(0)
+        self.assertIsNotNone(stale)
+        # Another runner expired it and leased the slot in between.
+        self.pool.lease_path(0).unlink()
+        self.pool.lease_path(0).write_text(json.dumps({"pid": os.getpid()}), encoding="utf-8")
+        self.assertFalse(self.pool._expire_lease(0, stale))
+        self.assertTrue(self.pool.lease_path(0).exists())
+
+    def test_acquire_rebuilds_slot_with_missing_metadata(self):
+        self.pool.warm()
+        shutil.rmtree(self.pool.slot_path(0))
+        self.pool.slot_path(0).mkdir()
+        lease = self.pool.acquire("a")
+        self.assertEqual(lease.slot, 0)
+        self.assertTrue((lease.path / "README.md").exists())
+
+    def test_cleanup_removes_worktrees(self):
+        self.pool.warm()
+        removed = self.pool.cleanup()
+        self.assertEqual(len(removed), 2)
+        self.assertFalse(self.pool.slot_path(0).exists())
+        listing = subprocess.run(
+            ["git", "-C", str(self.repo), "worktree", "list"], capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(len(listing.strip().splitlines()), 1)
+
+    def test_runner_finds_lock_files_inside_linked_worktree(self):
+        lease = self.pool.acquire("a")
+        git_dir = worktree_pool.resolve_git_dir(lease.path)
+        (git_dir / "index.lock").write_text("", encoding="utf-8")
+        self.assertEqual(runner.find_git_lock_files(lease.path), [git_dir / "index.lock"])
+
+
+if __name__ == "__main__":
+    unittest.main()